@@ -78,3 +78,27 @@ class ArrayFree:
         for i in range(len(self.allocs)):
             self.allocs[i] = None
         wp.synchronize_device("cuda:0")
+
+
+class CpuArrayTemporaries:
+    """Benchmark allocating and freeing CPU temporaries with and without the CPU memory pool."""
+
+    params = ([False, True], [1024, 4 * 1024 * 1024])
+    param_names = ["mempool", "size"]
+
+    repeat = 10
+    number = 1
+
+    def setup(self, mempool, size):
+        wp.init()
+        self.saved_setting = wp.is_mempool_enabled("cpu")
+        wp.set_mempool_enabled("cpu", mempool)
+        # warm up the pool
+        self.time_zeros(mempool, size)
+
+    def teardown(self, mempool, size):
+        wp.set_mempool_enabled("cpu", self.saved_setting)
+
+    def time_zeros(self, mempool, size):
+        for _ in range(100):
+            wp.zeros(size, dtype=float, device="cpu")
@@ -0,0 +1,74 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Startup cost of short-lived processes that use Warp.
+
+Each sample runs in a fresh interpreter, so it includes the full cost of
+``import warp``: loading the native libraries and registering the built-in
+functions. The ``lazy_builtins`` parameter sets ``WARP_LAZY_BUILTINS``, which
+defers the registration of each built-in until it is first used (see
+:attr:`warp.config.lazy_builtins`).
+
+- ``timeraw_import`` — ``import warp`` only.
+- ``timeraw_first_launch`` — import, then initialize the runtime and launch a
+  small kernel on the CPU. The kernel cache is populated by ``setup``, so the
+  launch loads the cached module instead of compiling it.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+
+_KERNEL_SOURCE = textwrap.dedent(
+    """
+    import warp as wp
+
+    @wp.kernel
+    def saxpy(a: float, x: wp.array(dtype=float), y: wp.array(dtype=float)):
+        i = wp.tid()
+        y[i] = a * x[i] + wp.sin(y[i])
+
+    x = wp.ones(1024, dtype=float, device="cpu")
+    y = wp.zeros(1024, dtype=float, device="cpu")
+    wp.launch(saxpy, dim=1024, inputs=[2.0, x, y], device="cpu")
+    wp.synchronize_device("cpu")
+    """
+)
+
+# kernels need their source on disk, so the launch runs from a module in a scratch directory
+_MODULE_DIR = os.path.join(tempfile.gettempdir(), "warp_asv_import_time")
+_MODULE_NAME = "warp_asv_first_launch"
+
+
+class ImportTime:
+    """Time ``import warp`` and the first kernel launch in a new process."""
+
+    repeat = 10
+    number = 1
+    timeout = 600.0
+
+    params = [False, True]
+    param_names = ["lazy_builtins"]
+
+    def setup(self, lazy_builtins):
+        # the environment is inherited by the processes running the timed code
+        os.environ["WARP_LAZY_BUILTINS"] = "1" if lazy_builtins else "0"
+
+        os.makedirs(_MODULE_DIR, exist_ok=True)
+        with open(os.path.join(_MODULE_DIR, _MODULE_NAME + ".py"), "w") as f:
+            f.write(_KERNEL_SOURCE)
+
+        # warm up the kernel cache and the bytecode of the warp package
+        code = self.timeraw_first_launch(lazy_builtins)
+        subprocess.run([sys.executable, "-c", code], check=True, capture_output=True)
+
+    def teardown(self, lazy_builtins):
+        os.environ.pop("WARP_LAZY_BUILTINS", None)
+
+    def timeraw_import(self, lazy_builtins):
+        return "import warp"
+
+    def timeraw_first_launch(self, lazy_builtins):
+        return f"import sys; sys.path.insert(0, {_MODULE_DIR!r}); import {_MODULE_NAME}"
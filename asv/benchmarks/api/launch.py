@@ -197,3 +197,83 @@ class GraphLaunch:
     def time_ten_graph_on_stream(self):
         for _ in range(10):
             wp.capture_launch(self.graph, stream=self.stream)
+
+
+class BatchLaunch:
+    """Replay many small recorded launches one at a time and with ``wp.launch_batch()``.
+
+    Each launch increments its own small array, which keeps the device work
+    negligible so that the timings reflect the per-launch overhead.
+    """
+
+    params = (["cpu", "cuda:0"], [16, 256])
+    param_names = ["device", "num_launches"]
+    number = 100
+
+    def setup(self, device, num_launches):
+        wp.init()
+        if device != "cpu" and not wp.is_cuda_available():
+            raise NotImplementedError("CUDA is not available")
+
+        wp.load_module(device=device)
+        self.device = device
+        self.arrays = [wp.zeros(64, dtype=float, device=device) for _ in range(num_launches)]
+        self.cmds = [wp.launch(inc_kernel, (64,), inputs=[a], device=device, record_cmd=True) for a in self.arrays]
+
+        # build the cached batch commands outside of the timed region
+        wp.launch_batch(self.cmds)
+        wp.synchronize_device(device)
+
+    def teardown(self, device, num_launches):
+        wp.synchronize_device(device)
+
+    def time_standard_launches(self, device, num_launches):
+        for a in self.arrays:
+            wp.launch(inc_kernel, (64,), inputs=[a], device=self.device)
+
+    def time_launch_objects(self, device, num_launches):
+        for cmd in self.cmds:
+            cmd.launch()
+
+    def time_launch_batch(self, device, num_launches):
+        wp.launch_batch(self.cmds)
+
+
+@wp.kernel
+def axpy_kernel(alpha: float, x: wp.array(dtype=float), y: wp.array(dtype=float)):
+    tid = wp.tid()
+    y[tid] = y[tid] + alpha * x[tid]
+
+
+class LaunchSetParam:
+    """Update the parameters of a recorded launch between replays.
+
+    Mirrors a fixed-topology simulation step that swaps a double-buffered array
+    and changes a scalar before each launch. The arrays are small so that the
+    timings reflect the cost of the parameter updates and of the launch itself.
+    """
+
+    params = ["cpu", "cuda:0"]
+    param_names = ["device"]
+    number = 1000
+
+    def setup(self, device):
+        wp.init()
+        if device != "cpu" and not wp.is_cuda_available():
+            raise NotImplementedError("CUDA is not available")
+
+        wp.load_module(device=device)
+        self.buffers = [wp.zeros(64, dtype=float, device=device) for _ in range(2)]
+        self.y = wp.zeros(64, dtype=float, device=device)
+        self.cmd = wp.launch(axpy_kernel, (64,), inputs=[1.0, self.buffers[0], self.y], device=device, record_cmd=True)
+        self.step = 0
+        wp.synchronize_device(device)
+
+    def teardown(self, device):
+        wp.synchronize_device(device)
+
+    def time_set_param_launch(self, device):
+        self.step += 1
+        self.cmd.set_param_at_index(0, 0.5 * self.step)
+        self.cmd.set_param_at_index(1, self.buffers[self.step % 2])
+        self.cmd.launch()
@@ -112,3 +112,34 @@ class BvhBuild:
     def time_build(self, asset_data, method, asset):
         _bvh = wp.Bvh(self.lowers, self.uppers, constructor=method)
         wp.synchronize_device(self.device)
+
+
+class BvhBuildCpuThreads:
+    """Thread scaling of the CPU top-down constructors on a large random scene."""
+
+    params = (["sah", "median"], [1, 2, 4, 8])
+    param_names = ["method", "num_threads"]
+
+    repeat = 10
+    number = 1
+
+    def setup(self, method, num_threads):
+        wp.init()
+        self.device = wp.get_device("cpu")
+
+        rng = np.random.default_rng(123)
+        num_items = 1_000_000
+        centers = rng.uniform(-100.0, 100.0, size=(num_items, 3))
+        extents = rng.uniform(0.01, 0.5, size=(num_items, 3))
+
+        self.lowers = wp.array(centers - extents, dtype=wp.vec3, device=self.device)
+        self.uppers = wp.array(centers + extents, dtype=wp.vec3, device=self.device)
+
+        self.saved_num_threads = wp.config.cpu_num_threads
+        wp.config.cpu_num_threads = num_threads
+
+    def teardown(self, method, num_threads):
+        wp.config.cpu_num_threads = self.saved_num_threads
+
+    def time_build(self, method, num_threads):
+        _bvh = wp.Bvh(self.lowers, self.uppers, constructor=method)
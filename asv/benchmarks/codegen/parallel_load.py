@@ -0,0 +1,93 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Load-time scaling of ``wp.force_load()`` with the number of worker threads.
+
+Programs that declare many ``module="unique"`` kernels load one Warp module
+per kernel. ``wp.force_load(max_workers=N)`` loads these modules on a thread
+pool: the native compile of each module always runs concurrently, and the
+Python-side codegen of modules that do not share ``@wp.func`` dependencies
+runs concurrently as well, since codegen only holds the locks of the module
+being built and of the modules it references.
+
+Two workloads are timed for each worker count:
+
+- ``time_load_independent`` — every module only calls built-ins, so codegen of
+  all modules can overlap.
+- ``time_load_shared_helper`` — every module calls the same ``@wp.func``
+  helper, so codegen serializes on the helper's module while the native
+  compiles still overlap.
+
+The kernel cache is cleared before each sample so that every module runs
+codegen and native compilation. On interpreters with a GIL the Python codegen
+stages still take turns; the codegen concurrency only shows up as a speedup on
+free-threaded builds. The benchmark runs on the CPU device and needs no GPU.
+"""
+
+import itertools
+
+import warp as wp
+
+from ..benchmarks_utils import clear_kernel_cache
+
+NUM_MODULES = 16
+
+_kernel_ids = itertools.count()
+
+
+@wp.func
+def shared_helper(x: float, k: int) -> float:
+    s = float(0.0)
+    for i in range(4):
+        s = s + wp.sin(x + float(i)) * wp.cos(x * float(k))
+    return wp.sqrt(wp.abs(s) + 1.0)
+
+
+def make_independent_kernel(idx: int):
+    @wp.kernel(module="unique")
+    def independent(x: wp.array(dtype=wp.float32), y: wp.array(dtype=wp.float32)):
+        i = wp.tid()
+        s = float(0.0)
+        for j in range(4):
+            s = s + wp.sin(x[i] + float(j)) * wp.cos(x[i] * float(idx))
+        y[i] = wp.sqrt(wp.abs(s) + 1.0)
+
+    return independent
+
+
+def make_shared_helper_kernel(idx: int):
+    @wp.kernel(module="unique")
+    def shared(x: wp.array(dtype=wp.float32), y: wp.array(dtype=wp.float32)):
+        i = wp.tid()
+        y[i] = shared_helper(x[i], idx)
+
+    return shared
+
+
+class ParallelModuleLoad:
+    """Time cold loads of ``NUM_MODULES`` unique modules on the CPU by worker count."""
+
+    repeat = 3
+    number = 1
+    timeout = 600.0
+
+    params = [1, 2, 4, 8]
+    param_names = ["max_workers"]
+
+    def setup(self, max_workers):
+        wp.init()
+        clear_kernel_cache()
+
+        # kernels with distinct closure constants hash to distinct modules
+        self.independent = [make_independent_kernel(next(_kernel_ids)).module for _ in range(NUM_MODULES)]
+        self.shared = [make_shared_helper_kernel(next(_kernel_ids)).module for _ in range(NUM_MODULES)]
+
+    def teardown(self, max_workers):
+        for module in self.independent + self.shared:
+            module.unload()
+
+    def time_load_independent(self, max_workers):
+        wp.force_load(device="cpu", modules=self.independent, max_workers=max_workers)
+
+    def time_load_shared_helper(self, max_workers):
+        wp.force_load(device="cpu", modules=self.shared, max_workers=max_workers)
@@ -0,0 +1,83 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy as np
+
+import warp as wp
+import warp.sparse as wps
+
+
+def _make_power_law_matrix(nrow: int, ncol: int, block_type, device, seed: int = 42):
+    """Matrix whose row lengths follow a power law, with a few very long rows."""
+    rng = np.random.default_rng(seed)
+    lengths = np.minimum(ncol, (rng.pareto(1.2, size=nrow) + 1.0).astype(np.int32) * 2)
+    rows = np.repeat(np.arange(nrow, dtype=np.int32), lengths)
+    cols = rng.integers(0, ncol, size=rows.shape[0], dtype=np.int32)
+
+    block_shape = getattr(block_type, "_shape_", (1, 1))
+    values = rng.random(size=(rows.shape[0], *block_shape)).astype(np.float32)
+
+    mat = wps.bsr_zeros(nrow, ncol, block_type, device=device)
+    wps.bsr_set_from_triplets(
+        mat,
+        wp.array(rows, dtype=int, device=device),
+        wp.array(cols, dtype=int, device=device),
+        wp.array(values.reshape(-1, *block_shape) if block_type != float else values.flatten(), device=device),
+    )
+    return mat
+
+
+class BsrMvPowerLawRows:
+    """Compare compressed-row and sliced ELLPACK matrix-vector products on irregular row lengths."""
+
+    params = (["csr", "sell"], ["float", "mat33"])
+    param_names = ["layout", "block_type"]
+
+    rounds = 1
+    repeat = 2
+    number = 20
+
+    def setup(self, layout, block_type):
+        wp.init()
+        self.device = wp.get_device("cuda:0")
+
+        block_type = float if block_type == "float" else wp.mat33
+        with wp.ScopedDevice(self.device):
+            mat = _make_power_law_matrix(131072, 131072, block_type, self.device)
+            self._mat = wps.BsrSellLayout(mat, use_sell=True) if layout == "sell" else mat
+
+            self._x = wp.ones(shape=mat.shape[1], dtype=wp.float32)
+            self._y = wp.zeros(shape=mat.shape[0], dtype=wp.float32)
+
+            wps.bsr_mv(self._mat, self._x, self._y, alpha=1.0, beta=0.0)
+            with wp.ScopedCapture() as capture:
+                wps.bsr_mv(self._mat, self._x, self._y, alpha=1.0, beta=0.0)
+            self._graph = capture.graph
+
+        wp.synchronize_device(self.device)
+
+    def time_cuda(self, layout, block_type):
+        wp.capture_launch(self._graph)
+        wp.synchronize_device(self.device)
+
+
+class BsrSellLayoutBuild:
+    """Test building the sliced ELLPACK layout of a matrix with irregular row lengths."""
+
+    rounds = 1
+    repeat = 2
+    number = 5
+
+    def setup(self):
+        wp.init()
+        self.device = wp.get_device("cuda:0")
+
+        with wp.ScopedDevice(self.device):
+            self._mat = _make_power_law_matrix(131072, 131072, float, self.device)
+            wps.BsrSellLayout(self._mat)
+
+        wp.synchronize_device(self.device)
+
+    def time_cuda(self):
+        wps.BsrSellLayout(self._mat, use_sell=True)
+        wp.synchronize_device(self.device)
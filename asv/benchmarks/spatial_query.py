@@ -649,3 +649,62 @@ class BvhRayQuery:
     def time_mesh_ray_vs_aabb_query(self, resolution, leaf_size, device, bvh_constructor):
         wp.capture_launch(self.cuda_graph_mesh_ray_vs_aabb)
         wp.synchronize_device()
+
+
+class MeshBatchedQuery:
+    """Batched ray and closest-point queries of a mesh on the CPU, with incoherent queries."""
+
+    params = [["bunny", "rocks"], [False, True]]
+    param_names = ["asset", "reorder"]
+
+    number = 5
+    timeout = 120
+
+    def setup(self, asset, reorder):
+        from pxr import Usd, UsdGeom
+
+        global seed
+
+        wp.init()
+        self.device = wp.get_device("cpu")
+
+        asset_stage = Usd.Stage.Open(os.path.join(get_asset_directory(), f"{asset}.usd"))
+        mesh_geom = UsdGeom.Mesh(asset_stage.GetPrimAtPath(f"/root/{asset}"))
+
+        points = np.array(mesh_geom.GetPointsAttr().Get())
+        indices = np.array(mesh_geom.GetFaceVertexIndicesAttr().Get())
+        bb_min, bb_max = points.min(axis=0), points.max(axis=0)
+
+        rng = np.random.default_rng(seed)
+        seed = seed + 1
+
+        self.mesh = wp.Mesh(
+            points=wp.array(points, dtype=wp.vec3, device=self.device),
+            indices=wp.array(indices, dtype=int, device=self.device),
+        )
+
+        # depth sensors around the mesh casting rays towards random targets, in shuffled order
+        center = 0.5 * (bb_min + bb_max)
+        sensors = center + (bb_max - bb_min) * rng.uniform(-1.5, 1.5, size=(8, 3))
+        origins = sensors[rng.integers(0, len(sensors), size=NUM_QUERY_POINTS)]
+        targets = rng.uniform(bb_min, bb_max, size=(NUM_QUERY_POINTS, 3))
+        directions = targets - origins
+        directions /= np.linalg.norm(directions, axis=1, keepdims=True)
+
+        self.origins = wp.array(origins, dtype=wp.vec3, device=self.device)
+        self.directions = wp.array(directions, dtype=wp.vec3, device=self.device)
+        self.query_points = wp.array(
+            rng.uniform(bb_min, bb_max, size=(NUM_QUERY_POINTS, 3)), dtype=wp.vec3, device=self.device
+        )
+
+        # warm up run
+        self.mesh.query_rays(self.origins, self.directions, reorder=reorder)
+        self.mesh.query_points(self.query_points, reorder=reorder)
+
+    @skip_benchmark_if(USD_AVAILABLE is False)
+    def time_query_rays(self, asset, reorder):
+        self.mesh.query_rays(self.origins, self.directions, reorder=reorder)
+
+    @skip_benchmark_if(USD_AVAILABLE is False)
+    def time_query_points(self, asset, reorder):
+        self.mesh.query_points(self.query_points, reorder=reorder)
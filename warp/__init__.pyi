@@ -91,6 +91,10 @@ from warp._src.context import is_cubql_available as is_cubql_available
 from warp._src.context import is_cuda_available as is_cuda_available
 from warp._src.build import clear_kernel_cache as clear_kernel_cache
 from warp._src.build import clear_lto_cache as clear_lto_cache
+from warp._src.kernel_cache import kernel_cache_stats as kernel_cache_stats
+from warp._src.kernel_cache import trim_kernel_cache as trim_kernel_cache
+from warp._src.kernel_cache import KernelCacheBackend as KernelCacheBackend
+from warp._src.kernel_cache import LocalDirectoryCacheBackend as LocalDirectoryCacheBackend
 from warp._src.context import print_diagnostics as print_diagnostics
 from warp._src.codegen import WarpCodegenAttributeError as WarpCodegenAttributeError
 from warp._src.codegen import WarpCodegenError as WarpCodegenError
@@ -115,6 +119,7 @@ from warp._src.context import Function as Function
 from warp._src.context import Launch as Launch
 from warp._src.context import Module as Module
 from warp._src.context import launch as launch
+from warp._src.context import launch_batch as launch_batch
 from warp._src.context import launch_tiled as launch_tiled
 from warp._src.context import get_suggested_block_size as get_suggested_block_size
 from warp._src.context import synchronize as synchronize
@@ -173,6 +178,7 @@ from warp._src.context import is_peer_access_enabled as is_peer_access_enabled
 from warp._src.context import set_peer_access_enabled as set_peer_access_enabled
 from warp._src.context import MemoryKind as MemoryKind
 from warp._src.context import Allocator as Allocator
+from warp._src.context import CpuMempoolAllocator as CpuMempoolAllocator
 from warp._src.context import CudaManagedAllocator as CudaManagedAllocator
 from warp._src.context import get_device_allocator as get_device_allocator
 from warp._src.context import set_cuda_allocator as set_cuda_allocator
@@ -197,6 +203,11 @@ from warp._src.utils import TimingResult as TimingResult
 from warp._src.utils import timing_begin as timing_begin
 from warp._src.utils import timing_end as timing_end
 from warp._src.utils import timing_print as timing_print
+from warp._src.utils import timing_export_chrome_trace as timing_export_chrome_trace
+from warp._src.utils import LaunchStats as LaunchStats
+from warp._src.utils import get_launch_stats as get_launch_stats
+from warp._src.utils import reset_launch_stats as reset_launch_stats
+from warp._src.utils import print_launch_stats as print_launch_stats
 from warp._src.utils import ScopedMemoryTracker as ScopedMemoryTracker
 from warp._src.context import print_memory_report as print_memory_report
 from warp._src.utils import TIMING_KERNEL as TIMING_KERNEL
@@ -204,6 +215,7 @@ from warp._src.utils import TIMING_KERNEL_BUILTIN as TIMING_KERNEL_BUILTIN
 from warp._src.utils import TIMING_MEMCPY as TIMING_MEMCPY
 from warp._src.utils import TIMING_MEMSET as TIMING_MEMSET
 from warp._src.utils import TIMING_GRAPH as TIMING_GRAPH
+from warp._src.utils import TIMING_MODULE_LOAD as TIMING_MODULE_LOAD
 from warp._src.utils import TIMING_ALL as TIMING_ALL
 from warp._src.context import cuda_profiler_start as cuda_profiler_start
 from warp._src.context import cuda_profiler_stop as cuda_profiler_stop
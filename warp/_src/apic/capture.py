@@ -518,6 +518,7 @@ class APICapture:
                 "module_exec": module_exec,
                 "binary_path": binary_path,
                 "binary_filename": output_name,
+                "meta_filename": module._get_meta_name(block_dim=module_exec.block_dim),
             }
 
         kernel_key = kernel.key
@@ -542,4 +543,6 @@ class APICapture:
                 "forward_smem_bytes": hooks.forward_smem_bytes,
                 "backward_smem_bytes": hooks.backward_smem_bytes,
                 "block_dim": module_exec.block_dim,
+                # whether the loaded kernel exported range entry points for multithreaded CPU launches
+                "cpu_threaded": hooks.forward_range is not None,
             }
@@ -125,6 +125,7 @@ def build_cpu(
     pch_dir=None,
     block_dim=256,
     enable_tiles_in_stack_memory=True,
+    enable_cpu_atomics=False,
 ):
     with open(cpp_path, "rb") as cpp:
         src = cpp.read()
@@ -133,6 +134,9 @@ def build_cpu(
     obj_path = obj_path.encode("utf-8")
 
     flags_list = extra_flags.split()
+    if enable_cpu_atomics:
+        # atomics are compiled as read-modify-write sequences unless kernels may run on several threads
+        flags_list.append("-DWP_ENABLE_CPU_ATOMICS")
     flags_array = (ctypes.c_char_p * (len(flags_list) + 1))(*[f.encode("utf-8") for f in flags_list], None)
 
     pch_dir_bytes = pch_dir.encode("utf-8") if pch_dir else None
@@ -210,7 +214,8 @@ def init_kernel_cache(path=None):
 def clear_kernel_cache() -> None:
     """Clear the kernel cache directory of previously generated source code and compiler artifacts.
 
-    Only directories beginning with ``wp_`` will be deleted.
+    Only directories beginning with ``wp_`` and the reference recipes used to speed up module
+    hashing will be deleted.
     This function only clears the cache for the current Warp version.
     LTO artifacts are not affected.
     """
@@ -229,6 +234,9 @@ def clear_kernel_cache() -> None:
             # Remove the directory and its contents
             shutil.rmtree(item_path, ignore_errors=True)
 
+    warp._src.kernel_cache.reset_index(warp.config.kernel_cache_dir)
+    warp._src.kernel_cache.reset_references(warp.config.kernel_cache_dir)
+
 
 def clear_lto_cache() -> None:
     """Clear the LTO cache directory of previously generated LTO code.
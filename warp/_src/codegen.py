@@ -31,8 +31,9 @@ from warp._src.logger import log_debug, log_warning
 from warp._src.types import *
 
 # used as a globally accessible copy
-# of current compile options (block_dim) etc
-options = {}
+# of current compile options (block_dim) etc,
+# a _ThreadLocalOptions instance assigned below
+options = None
 
 # Extraction products shared across Adjoints of one code object, populated
 # lazily by Adjoint.__init__ (see _SharedFunctionSource).
@@ -335,6 +336,21 @@ class StructInstance:
         return tuple(npvalue)
 
 
+def _reference_path(node) -> tuple[str, ...] | None:
+    """Return the dotted path of a ``Name`` or of a chain of ``Attribute`` nodes rooted at a ``Name``.
+
+    Nodes with the same path resolve to the same object in reference scans, ``None`` is
+    returned for other expressions.
+    """
+    attributes = []
+    while isinstance(node, ast.Attribute):
+        attributes.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return None
+    return (node.id, *reversed(attributes))
+
+
 def _is_tid_call(node) -> bool:
     """Return True if ``node`` is an AST call to ``wp.tid()``."""
     return isinstance(node, ast.Call) and hasattr(node.func, "attr") and node.func.attr == "tid"
@@ -1362,6 +1378,15 @@ def resolve_reference_call_func(adj, call_node, callable_arg_values=None):
     return func
 
 
+def has_callable_params(func) -> bool:
+    """Return whether an overload or template of the user function ``func`` has ``wp.Function`` parameters."""
+    for ovl in (func, *func.user_overloads.values(), *func.user_templates.values()):
+        for arg_type in ovl.input_types.values():
+            if warp._src.types.is_warp_function_annotation(arg_type):
+                return True
+    return False
+
+
 def iter_call_callable_arg_targets(adj, func, call_node, callable_arg_values=None):
     """Yield Warp function targets passed to ``wp.Function`` parameters.
 
@@ -1380,6 +1405,10 @@ def iter_call_callable_arg_targets(adj, func, call_node, callable_arg_values=Non
     if not isinstance(func, warp._src.context.Function) or func.is_builtin():
         return
 
+    # the arguments only need to be resolved if some overload takes functions
+    if not has_callable_params(func):
+        return
+
     arg_types, kwarg_types, resolved = resolve_call_arg_types(adj, call_node, callable_arg_values)
     if resolved:
         overload = func.get_overload(arg_types, kwarg_types)
@@ -1537,16 +1566,9 @@ def get_arg_value(arg: Any) -> Any:
     return arg
 
 
-# Re-entrant lock guarding mutation and reading of shared per-Adjoint
-# state. ``@wp.func`` helpers share one ``Adjoint`` object across every
-# module that references them; ``Adjoint.build`` rewrites ``adj.blocks``,
-# ``adj.symbols``, ``adj.variables``, ``adj.deferred_static_expressions``
-# from scratch, and ``ModuleBuilder.codegen`` later reads those same
-# fields. Holding this lock across the full build+emit window in
-# ``Module._compile`` stops a parallel ``Module.load`` (e.g. from
-# ``wp.force_load(max_workers > 1)``) from clobbering the state mid-emit.
-# Re-entrant so ``Module._compile`` -> ``ModuleBuilder.build_kernel`` ->
-# ``Adjoint.build`` on the same thread doesn't deadlock.
+# Re-entrant lock guarding codegen for functions that do not belong to any
+# module. Module codegen is guarded by per-module locks instead, see
+# ``run_with_codegen_locks()``.
 _codegen_lock = threading.RLock()
 
 
@@ -1572,6 +1594,142 @@ def synchronized(rlock: threading.RLock | None = None):
     return decorator
 
 
+# ``@wp.func`` helpers share one ``Adjoint`` object across every module that
+# references them; ``Adjoint.build`` rewrites ``adj.blocks``, ``adj.symbols``,
+# ``adj.variables``, ``adj.deferred_static_expressions`` from scratch, and
+# ``ModuleBuilder.codegen`` / ``ModuleHasher`` later read those same fields.
+#
+# Codegen for a module only touches the adjoints of its own kernels and
+# functions and of functions defined in the modules it references, so each
+# module carries its own lock and codegen holds the locks of the module and of
+# its transitive references. Modules without shared dependencies can then run
+# codegen concurrently (e.g. ``wp.force_load(max_workers > 1)``), while modules
+# sharing a helper still serialize on that helper's module.
+#
+# All locks of a codegen scope are acquired up front in a fixed order, so
+# threads cannot deadlock. When codegen reaches a function of a module outside
+# the held scope (a dependency not recorded in ``Module.references``, e.g. one
+# only reachable through a ``wp.static()`` expression), the attempt is
+# abandoned with ``_CodegenScopeMiss``, the module is remembered as an extra
+# dependency, and codegen restarts with the larger scope.
+
+
+class _GlobalCodegenScope:
+    """Stand-in codegen scope for functions that do not belong to a module."""
+
+    def __init__(self):
+        self.codegen_lock = _codegen_lock
+        self.codegen_lock_order = -1
+        self.references = ()
+        self.codegen_dependencies = set()
+
+
+_global_codegen_scope = _GlobalCodegenScope()
+
+# orders module locks, see Module.__init__()
+codegen_lock_order_counter = itertools.count()
+
+# scopes whose locks are held by the current thread, or None outside codegen
+_codegen_thread_state = threading.local()
+
+
+class _CodegenScopeMiss(BaseException):
+    """Raised when codegen reaches a module whose lock is not held by the current thread.
+
+    Derives from ``BaseException`` so that the ``except Exception`` handlers of
+    the code generator do not intercept it.
+    """
+
+    def __init__(self, scope):
+        super().__init__(scope)
+        self.scope = scope
+
+
+def _get_codegen_scopes(scope) -> list:
+    scopes = {}
+    stack = [scope]
+    while stack:
+        s = stack.pop()
+        if id(s) in scopes:
+            continue
+        scopes[id(s)] = s
+        stack.extend(tuple(s.references))
+        stack.extend(tuple(s.codegen_dependencies))
+    return sorted(scopes.values(), key=lambda s: s.codegen_lock_order)
+
+
+def require_codegen_scope(module) -> None:
+    """Check that codegen running on this thread may access the adjoints of ``module``."""
+    held = getattr(_codegen_thread_state, "held", None)
+    if held is None:
+        return
+
+    scope = module if module is not None else _global_codegen_scope
+    if id(scope) not in held:
+        raise _CodegenScopeMiss(scope)
+
+
+def run_with_codegen_locks(module, func, *args, **kwargs):
+    """Call ``func`` while holding the codegen locks of ``module`` and its dependencies.
+
+    Nested calls from within the held scope run directly. ``func`` may be
+    called several times if it reaches modules outside the scope, so it must
+    be restartable.
+    """
+    scope = module if module is not None else _global_codegen_scope
+
+    held = getattr(_codegen_thread_state, "held", None)
+    if held is not None:
+        if id(scope) not in held:
+            raise _CodegenScopeMiss(scope)
+        return func(*args, **kwargs)
+
+    while True:
+        scopes = _get_codegen_scopes(scope)
+        for s in scopes:
+            s.codegen_lock.acquire()
+        _codegen_thread_state.held = {id(s) for s in scopes}
+        try:
+            return func(*args, **kwargs)
+        except _CodegenScopeMiss as e:
+            # retry with the missing module included in the scope
+            scope.codegen_dependencies.add(e.scope)
+        finally:
+            _codegen_thread_state.held = None
+            for s in reversed(scopes):
+                s.codegen_lock.release()
+
+
+class _ThreadLocalOptions(Mapping):
+    """Builder options of the adjoint being built on the current thread.
+
+    Exposed as ``warp._src.codegen.options`` for built-ins that depend on
+    module options (e.g. ``block_dim``) while concurrent codegen runs on other
+    threads.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def set(self, value: Mapping) -> None:
+        self._local.value = value
+
+    def _get(self) -> Mapping:
+        return getattr(self._local, "value", {})
+
+    def __getitem__(self, key):
+        return self._get()[key]
+
+    def __iter__(self):
+        return iter(self._get())
+
+    def __len__(self):
+        return len(self._get())
+
+
+options = _ThreadLocalOptions()
+
+
 class SlotAccessPlan(NamedTuple):
     """Result of classifying an array-rooted composite-component write LHS.
 
@@ -1950,7 +2108,6 @@ class Adjoint:
         return "".join(lines[start:end]), code.co_firstlineno
 
     # generate function ssa form and adjoint
-    @synchronized(_codegen_lock)
     def build(adj, builder, default_builder_options=None, callable_arg_values=None):
         # arg Var read/write flags are held during module rebuilds, so we reset here even when skipping a build
         for arg in adj.args:
@@ -1973,8 +2130,7 @@ class Adjoint:
         else:
             adj.builder_options = default_builder_options
 
-        global options
-        options = adj.builder_options
+        options.set(adj.builder_options)
 
         adj.deterministic.begin_build(adj.builder_options)
 
@@ -5788,13 +5944,21 @@ class Adjoint:
                     shared.reference_nodes = adj._reference_nodes
         return adj._reference_nodes
 
-    def get_references(adj) -> tuple[dict[str, Any], dict[Any, Any], dict[warp._src.context.Function, Any]]:
+    def get_references(
+        adj, recipe: list | None = None
+    ) -> tuple[dict[str, Any], dict[Any, Any], dict[warp._src.context.Function, Any]]:
         """Traverse ``adj.tree`` for referenced constants, types, and user-defined functions.
 
         As a side effect, also sets ``adj.kernel_dim`` (the thread-grid dimension inferred from
         ``wp.tid()``). It is folded into this traversal rather than walked separately because
         ``get_references`` already visits every ``Assign`` and runs for every adjoint during
         module hashing -- which precedes any code generation or launch that reads ``kernel_dim``.
+
+        Args:
+            recipe: If not ``None``, receives the ``[index, shared]`` pairs of the reference nodes
+                that :meth:`get_references_from_recipe` needs to resolve to reproduce the result.
+                Nodes resolving the same name or path as an earlier node are left out, ``shared``
+                marks the calls that stand for the other calls of the same callee.
         """
 
         local_variables = set()  # Track local variables appearing on the LHS so we know when variables are shadowed
@@ -5805,38 +5969,39 @@ class Adjoint:
         max_dim = 0  # thread-grid dimension, inferred from wp.tid() unpack arity
         callable_arg_values = getattr(adj, "callable_arg_values", None) or {}
 
+        # names and paths already recorded in the recipe, which resolve the same way again
+        recorded = set()
+
+        # closure variables are looked up for every name, gather them once
+        closure_vars = get_closure_vars(adj.func)
+
         # Shared single traversal (see reference_nodes); resolved here at hash time.
-        for node in adj.reference_nodes():
-            if isinstance(node, ast.Name) and node.id not in local_variables:
-                # look up in closure/global variables
-                obj = adj.resolve_external_reference(node.id)
-                if warp._src.types.is_value(obj):
-                    constants[node.id] = obj
-
-            elif isinstance(node, ast.Attribute):
-                obj, path = adj.resolve_static_expression(node, eval_types=False)
-                if warp._src.types.is_value(obj):
-                    constants[".".join(path)] = obj
-
-            elif isinstance(node, ast.Call):
-                func = resolve_reference_call_func(adj, node, callable_arg_values)
-
-                if isinstance(func, warp._src.context.Function) and not func.is_builtin():
-                    # calling user-defined function
-                    functions[func] = None
-
-                    # Function targets are passed as values, so they must be
-                    # added explicitly to the function reference set. Built-in
-                    # targets are hash inputs too, but they are filtered out by
-                    # module dependency discovery because they have no module.
-                    for callable_func in iter_call_callable_arg_targets(adj, func, node, callable_arg_values):
-                        functions[callable_func] = None
-                elif isinstance(func, Struct):
-                    # calling struct constructor
-                    types[func] = None
-                elif warp._src.types.type_is_value(func):
-                    # calling value type constructor
-                    types[func] = None
+        for index, node in enumerate(adj.reference_nodes()):
+            if isinstance(node, ast.Name):
+                if node.id in local_variables:
+                    continue
+
+                if recipe is not None:
+                    if ("name", node.id) in recorded:
+                        continue
+                    recorded.add(("name", node.id))
+                    recipe.append([index, False])
+
+            elif recipe is not None and isinstance(node, ast.Attribute):
+                path = _reference_path(node)
+                if path is None:
+                    # only attributes of names resolve to an object
+                    continue
+                if ("attr", path) in recorded:
+                    continue
+                recorded.add(("attr", path))
+                recipe.append([index, False])
+
+            elif recipe is not None and isinstance(node, ast.Call):
+                call_path = _reference_path(node.func)
+                if ("call", call_path) in recorded:
+                    # resolves like the recorded call of the same callee
+                    continue
 
             elif isinstance(node, ast.Assign):
                 # Infer the thread-grid dimension from `i[, j, ...] = wp.tid()` unpack arity.
@@ -5844,15 +6009,12 @@ class Adjoint:
                     target = node.targets[0]
                     max_dim = max(max_dim, len(target.elts) if isinstance(target, ast.Tuple) else 1)
 
-                # A function bound to a local (`f = mod.func`) or to several locals via tuple
-                # unpacking (`f, g = mod.a, mod.b`) is referenced only through the local(s)
-                # afterwards, so it would otherwise be missed here and left out of the module
-                # hash. Register each bound function explicitly to keep the hash sound.
-                rhs_nodes = node.value.elts if isinstance(node.value, ast.Tuple) else [node.value]
-                for rhs_node in rhs_nodes:
-                    rhs_func, _ = adj.resolve_static_expression(rhs_node, eval_types=False)
-                    if isinstance(rhs_func, warp._src.context.Function) and not rhs_func.is_builtin():
-                        functions[rhs_func] = None
+                if recipe is not None:
+                    rhs_nodes = node.value.elts if isinstance(node.value, ast.Tuple) else [node.value]
+                    rhs_paths = {("rhs", path) for path in map(_reference_path, rhs_nodes) if path is not None}
+                    if not rhs_paths <= recorded:
+                        recorded |= rhs_paths
+                        recipe.append([index, False])
 
                 # Add the LHS names to the local_variables so we know any subsequent uses are shadowed
                 lhs = node.targets[0]
@@ -5863,9 +6025,109 @@ class Adjoint:
                 elif isinstance(lhs, ast.Name):
                     local_variables.add(lhs.id)
 
+            depends_on_args = adj._add_node_references(
+                node, constants, types, functions, callable_arg_values, closure_vars
+            )
+
+            if recipe is not None and isinstance(node, ast.Call):
+                if depends_on_args or call_path is None:
+                    # the functions passed as arguments depend on the call itself
+                    recipe.append([index, False])
+                else:
+                    recorded.add(("call", call_path))
+                    recipe.append([index, True])
+
         adj.kernel_dim = max_dim if max_dim > 0 else 1
         return constants, types, functions
 
+    def get_references_from_recipe(
+        adj, recipe: list, kernel_dim: int
+    ) -> tuple[dict[str, Any], dict[Any, Any], dict[warp._src.context.Function, Any]] | None:
+        """Resolve the references of a recipe recorded by :meth:`get_references` for the same source.
+
+        Only the recorded nodes are resolved, so the result is the same as :meth:`get_references`.
+        Returns ``None`` if a call standing for other calls of the same callee now resolves to a
+        function taking ``wp.Function`` parameters, whose references depend on the arguments of
+        each call, or if the recipe does not match the tree. :meth:`get_references` must be used
+        instead in that case.
+        """
+
+        constants: dict[str, Any] = {}
+        types: dict[Struct | type, Any] = {}
+        functions: dict[warp._src.context.Function, Any] = {}
+        callable_arg_values = getattr(adj, "callable_arg_values", None) or {}
+
+        closure_vars = get_closure_vars(adj.func)
+
+        nodes = adj.reference_nodes()
+        for index, shared in recipe:
+            if not 0 <= index < len(nodes):
+                return None
+
+            depends_on_args = adj._add_node_references(
+                nodes[index], constants, types, functions, callable_arg_values, closure_vars
+            )
+            if depends_on_args and shared:
+                return None
+
+        adj.kernel_dim = kernel_dim
+        return constants, types, functions
+
+    def _add_node_references(adj, node, constants, types, functions, callable_arg_values, closure_vars) -> bool:
+        """Resolve a reference node of :meth:`get_references` into the given dictionaries.
+
+        Returns:
+            Whether the references of ``node`` depend on its arguments, i.e. whether it calls a
+            user-defined function taking ``wp.Function`` parameters.
+        """
+        if isinstance(node, ast.Name):
+            # look up in closure/global variables, like resolve_external_reference()
+            name = node.id
+            obj = closure_vars[name] if name in closure_vars else adj.func.__globals__.get(name)
+            if obj is not None and warp._src.types.is_value(obj):
+                constants[name] = obj
+
+        elif isinstance(node, ast.Attribute):
+            obj, path = adj.resolve_static_expression(node, eval_types=False)
+            if warp._src.types.is_value(obj):
+                constants[".".join(path)] = obj
+
+        elif isinstance(node, ast.Call):
+            func = resolve_reference_call_func(adj, node, callable_arg_values)
+
+            if isinstance(func, warp._src.context.Function) and not func.is_builtin():
+                # calling user-defined function
+                functions[func] = None
+
+                # Function targets are passed as values, so they must be
+                # added explicitly to the function reference set. Built-in
+                # targets are hash inputs too, but they are filtered out by
+                # module dependency discovery because they have no module.
+                if not has_callable_params(func):
+                    return False
+                for callable_func in iter_call_callable_arg_targets(adj, func, node, callable_arg_values):
+                    functions[callable_func] = None
+                return True
+            elif isinstance(func, Struct):
+                # calling struct constructor
+                types[func] = None
+            elif warp._src.types.type_is_value(func):
+                # calling value type constructor
+                types[func] = None
+
+        elif isinstance(node, ast.Assign):
+            # A function bound to a local (`f = mod.func`) or to several locals via tuple
+            # unpacking (`f, g = mod.a, mod.b`) is referenced only through the local(s)
+            # afterwards, so it would otherwise be missed here and left out of the module
+            # hash. Register each bound function explicitly to keep the hash sound.
+            rhs_nodes = node.value.elts if isinstance(node.value, ast.Tuple) else [node.value]
+            for rhs_node in rhs_nodes:
+                rhs_func, _ = adj.resolve_static_expression(rhs_node, eval_types=False)
+                if isinstance(rhs_func, warp._src.context.Function) and not rhs_func.is_builtin():
+                    functions[rhs_func] = None
+
+        return False
+
 
 # ----------------
 # code generation
@@ -6214,6 +6476,50 @@ WP_API void {name}_cpu_backward(
 
 """
 
+# Range entry points used by multithreaded CPU launches (see warp.config.cpu_num_threads).
+# They are only emitted for kernels that do not use tile storage, so they can run
+# concurrently on disjoint sub-ranges of the launch without sharing any state.
+cpu_module_template_forward_range = """
+
+extern "C" {{
+
+WP_API void {name}_cpu_forward_range(
+    wp::launch_bounds_t<{launch_ndim}> *dim,
+    wp_args_{name} *_wp_args,
+    size_t task_begin,
+    size_t task_end)
+{{
+    for (size_t task_index = task_begin; task_index < task_end; ++task_index)
+    {{
+        {name}_cpu_kernel_forward(*dim, task_index, _wp_args);
+    }}
+}}
+
+}} // extern C
+
+"""
+
+cpu_module_template_backward_range = """
+
+extern "C" {{
+
+WP_API void {name}_cpu_backward_range(
+    wp::launch_bounds_t<{launch_ndim}> *dim,
+    wp_args_{name} *_wp_args,
+    wp_args_{name} *_wp_adj_args,
+    size_t task_begin,
+    size_t task_end)
+{{
+    for (size_t task_index = task_begin; task_index < task_end; ++task_index)
+    {{
+        {name}_cpu_kernel_backward(*dim, task_index, _wp_args, _wp_adj_args);
+    }}
+}}
+
+}} // extern C
+
+"""
+
 
 # converts a constant Python value to equivalent C-repr
 def constant_str(value):
@@ -7026,5 +7332,44 @@ def codegen_module(kernel, device, options):
     if options["enable_backward"]:
         template += cpu_module_template_backward
 
+    if options.get("enable_cpu_atomics") and kernel_supports_cpu_threads(kernel):
+        template += cpu_module_template_forward_range
+
+        if options["enable_backward"]:
+            template += cpu_module_template_backward_range
+
     s = template.format(**template_fmt_args)
     return s
+
+
+def kernel_supports_cpu_threads(kernel) -> bool:
+    """Return whether a CPU kernel's launch range can be split across threads.
+
+    Tile code on the CPU allocates from a single block of storage per launch that is
+    reached through a shared pointer, so kernels that use tiles, directly or through
+    the functions they call, always run serially.
+    """
+    adj = kernel.adj
+    if adj.get_total_required_shared() > 0 or adj.max_required_extra_shared_memory_backward > 0:
+        return False
+
+    visited = set()
+    stack = [adj]
+    while stack:
+        a = stack.pop()
+        if id(a) in visited:
+            continue
+        visited.add(id(a))
+
+        for var in a.variables:
+            var_type = strip_reference(var.type)
+            if is_tile(var_type) or is_tile_stack(var_type):
+                return False
+
+        for callee in a.called_user_functions:
+            stack.append(callee.adj)
+            for extra_fn in (callee.custom_grad_func, callee.custom_replay_func):
+                if extra_fn is not None:
+                    stack.append(extra_fn.adj)
+
+    return True
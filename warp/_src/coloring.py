@@ -22,6 +22,16 @@ class GraphColoringAlgorithm(enum.IntEnum):
     GREEDY = 1
     """Degree-ordered greedy coloring algorithm."""
 
+    PARALLEL = 2
+    """Degree-ordered greedy coloring computed speculatively on multiple CPU threads.
+
+    Nodes are colored concurrently and adjacent nodes that picked the same color are
+    colored again until no conflicts remain (Gebremedhin-Manne). The number of threads
+    is set by :attr:`warp.config.cpu_num_threads`. With a single thread this gives the
+    same coloring as :attr:`GREEDY`; with more threads the coloring may vary from run
+    to run.
+    """
+
 
 def graph_coloring_assign(
     edges: wp.array,
@@ -48,7 +58,7 @@ def graph_coloring_assign(
         The number of colors used in the coloring.
 
     See Also:
-        :func:`graph_coloring_balance`.
+        :func:`graph_coloring_balance`, :func:`graph_coloring_repair`.
     """
     from warp._src.context import runtime  # noqa: PLC0415
 
@@ -82,6 +92,7 @@ def graph_coloring_assign(
         edges.__ctype__(),
         int(algorithm),
         node_colors.__ctype__(),
+        wp.config.cpu_num_threads,
     )
 
     if color_count < 0:
@@ -90,6 +101,97 @@ def graph_coloring_assign(
     return color_count
 
 
+def graph_coloring_repair(
+    edges: wp.array,
+    node_colors: wp.array,
+    changed_edges: wp.array | None = None,
+) -> int:
+    """Repair a graph coloring after a local change of the graph topology.
+
+    Instead of coloring the whole graph again after edges or nodes are added, e.g. when
+    a mesh is torn or remeshed, only the nodes that invalidate the existing coloring are
+    recolored: nodes with a negative color, and one endpoint of each edge of
+    ``changed_edges`` whose endpoints share a color. All other nodes keep their colors.
+    The recolored nodes are colored with the speculative parallel algorithm of
+    :attr:`GraphColoringAlgorithm.PARALLEL`, using :attr:`warp.config.cpu_num_threads` threads.
+
+    Removing edges never invalidates a coloring, so only the added edges need to be passed
+    in ``changed_edges``. The repaired coloring can then be balanced again with
+    :func:`graph_coloring_balance`.
+
+    Args:
+        edges: A 2D array of shape ``(edge_count, 2)`` containing all edges of the updated
+            graph. Must be a CPU array with ``int32`` dtype.
+        node_colors: A 1D array of shape ``(node_count,)`` containing the previous color
+            assignments, with negative values for nodes that have no color yet. Will be
+            modified in-place with the repaired coloring. Must be a CPU array with ``int32`` dtype.
+        changed_edges: A 2D array of shape ``(changed_edge_count, 2)`` with the edges added
+            since ``node_colors`` was computed. Must be a CPU array with ``int32`` dtype.
+            If ``None``, every edge of ``edges`` is checked for conflicts.
+
+    Returns:
+        The number of colors used in the repaired coloring, i.e. the largest color plus one.
+        Some colors below this count may end up unused.
+
+    Example:
+
+        .. code-block:: python
+
+            import warp as wp
+
+            edges = wp.array([[0, 1], [1, 2], [2, 3]], dtype=wp.int32, device="cpu")
+            colors = wp.empty(4, dtype=wp.int32, device="cpu")
+            color_count = wp.utils.graph_coloring_assign(edges, colors)
+
+            # connect nodes 0 and 2, and only recolor around the new edge
+            new_edges = wp.array([[0, 2]], dtype=wp.int32, device="cpu")
+            edges = wp.array([[0, 1], [1, 2], [2, 3], [0, 2]], dtype=wp.int32, device="cpu")
+            color_count = wp.utils.graph_coloring_repair(edges, colors, new_edges)
+
+    See Also:
+        :func:`graph_coloring_assign`, :func:`graph_coloring_balance`.
+    """
+    from warp._src.context import runtime  # noqa: PLC0415
+
+    if changed_edges is None:
+        changed_edges = edges
+
+    if not edges.device.is_cpu or not changed_edges.device.is_cpu:
+        raise RuntimeError("edges arrays must be on the CPU")
+    if not node_colors.device.is_cpu:
+        raise RuntimeError("node_colors array must be on the CPU")
+
+    for name, array in (("edges", edges), ("changed_edges", changed_edges)):
+        if array.dtype != wp.int32:
+            raise RuntimeError(f"{name} array must have dtype int32, got {type_repr(array.dtype)}")
+        if array.ndim != 2:
+            raise RuntimeError(f"{name} array must be 2-dimensional, got {array.ndim} dimensions")
+        if array.shape[1] != 2:
+            raise RuntimeError(f"{name} array must have shape (edge_count, 2), got shape {array.shape}")
+    if node_colors.dtype != wp.int32:
+        raise RuntimeError(f"node_colors array must have dtype int32, got {type_repr(node_colors.dtype)}")
+    if node_colors.ndim != 1:
+        raise RuntimeError(f"node_colors array must be 1-dimensional, got {node_colors.ndim} dimensions")
+
+    node_count = node_colors.shape[0]
+
+    if node_count == 0:
+        raise RuntimeError("Cannot color an empty graph")
+
+    color_count = runtime.core.wp_graph_coloring_repair(
+        node_count,
+        edges.__ctype__(),
+        changed_edges.__ctype__(),
+        node_colors.__ctype__(),
+        wp.config.cpu_num_threads,
+    )
+
+    if color_count < 0:
+        raise RuntimeError("Graph coloring repair failed")
+
+    return color_count
+
+
 def graph_coloring_balance(
     edges: wp.array,
     node_colors: wp.array,
@@ -24,6 +24,7 @@ import sys
 import tempfile
 import textwrap
 import threading
+import time
 import types
 import weakref
 from collections.abc import Callable, Iterable, Mapping, Sequence
@@ -64,9 +65,10 @@ import numpy as np
 import warp
 import warp._src.build
 import warp._src.codegen
+import warp._src.kernel_cache
 import warp._src.module_registry
 import warp.config
-from warp._src.codegen import WarpCodegenError, WarpCodegenTypeError, _codegen_lock, synchronized
+from warp._src.codegen import WarpCodegenError, WarpCodegenTypeError, run_with_codegen_locks, synchronized
 from warp._src.logger import LOG_DEBUG, LOG_WARNING, get_logger, log_debug, log_error, log_info, log_warning
 from warp._src.texture import Texture1D, Texture2D, Texture3D, texture1d_t, texture2d_t, texture3d_t
 from warp._src.types import LAUNCH_MAX_DIMS, Array, LaunchBounds, array_t, launch_bounds_t, type_repr
@@ -180,6 +182,24 @@ class det_counter_buf_t(ctypes.Structure):
     ]
 
 
+class launch_command_t(ctypes.Structure):
+    """A kernel launch submitted by :func:`launch_batch`, mirrors ``launch_command_t`` in ``warp.h``."""
+
+    _fields_ = (
+        ("kernel", ctypes.c_void_p),
+        ("kernel_range", ctypes.c_void_p),
+        ("bounds", ctypes.c_void_p),
+        ("args", ctypes.c_void_p),
+        ("adj_args", ctypes.c_void_p),
+        ("dim", ctypes.c_size_t),
+        ("max_blocks", ctypes.c_int),
+        ("block_dim", ctypes.c_int),
+        ("grid_stride", ctypes.c_int),
+        ("cluster_dim", ctypes.c_int),
+        ("shared_memory_bytes", ctypes.c_int),
+    )
+
+
 function_key_counts: dict[str, int] = {}
 
 
@@ -664,7 +684,7 @@ class Function:
         return call_builtin_from_desc(desc, bound_args)
 
     def build(self, builder: ModuleBuilder | None, default_builder_options=None):
-        self.adj.build(builder, default_builder_options)
+        run_with_codegen_locks(self.module, self.adj.build, builder, default_builder_options)
 
         # complete the function return type after we have analyzed it (inferred from return statement in ast)
         if not self.value_func:
@@ -896,10 +916,17 @@ class KernelHooks:
         backward_smem_bytes=0,
         cluster_dim=1,
         det_launch_meta: DeterministicMeta | None = None,
+        forward_range=None,
+        backward_range=None,
     ):
         self.forward = forward
         self.backward = backward
 
+        # CPU entry points that process a sub-range of the launch, used to split
+        # launches across threads; None when the kernel must run serially.
+        self.forward_range = forward_range
+        self.backward_range = backward_range
+
         self.forward_smem_bytes = forward_smem_bytes
         self.backward_smem_bytes = backward_smem_bytes
 
@@ -1414,7 +1441,7 @@ def func_grad(forward_fn):
                 # note that we do not have a ModuleBuilder instance here at this wrapping stage, hence we
                 # have to create a dummy builder; inject output_arch since tile built-in dispatch reads it
                 builder = ModuleBuilder(Module("dummy", None), f.module.options | {"output_arch": None})
-                f.adj.build(builder)
+                run_with_codegen_locks(f.module, f.adj.build, builder)
             expected_args = list(f.input_types.items())
             if f.adj.return_var is not None:
                 expected_args += [(f"adj_ret_{var.label}", var.type) for var in f.adj.return_var]
@@ -1983,8 +2010,91 @@ def overload(kernel: Kernel | Callable, arg_types: dict[str, Any] | list[Any] |
         raise RuntimeError("wp.overload() called with invalid argument!")
 
 
+class _BuiltinFunctionTable(dict):
+    """Mapping of built-in function names to the head of their overload lists.
+
+    When :attr:`warp.config.lazy_builtins` is enabled, ``add_builtin()`` records its
+    arguments instead of registering the function, and the recorded calls of a name
+    are replayed in order the first time the name is looked up, so overload order
+    and exports match eager registration. Enumerating the table registers all
+    pending built-ins.
+    """
+
+    def __init__(self):
+        super().__init__()
+        # name -> list of deferred add_builtin() (args, kwargs)
+        self.pending: dict[str, list[tuple[tuple, dict]]] = {}
+        self.lock = threading.RLock()
+
+    def defer(self, key: str, args: tuple, kwargs: dict) -> bool:
+        """Record an ``add_builtin()`` call to be replayed on first lookup, return whether it was deferred."""
+        with self.lock:
+            calls = self.pending.get(key)
+            if calls is None:
+                if not warp.config.lazy_builtins or dict.__contains__(self, key):
+                    return False
+                calls = self.pending[key] = []
+            calls.append((args, kwargs))
+            return True
+
+    def materialize(self, key: str) -> bool:
+        """Register the deferred overloads of ``key``, return whether ``key`` is a built-in."""
+        with self.lock:
+            calls = self.pending.pop(key, None)
+            if calls is not None:
+                # names that the ``warp`` package assigned after the built-in was recorded
+                # would have overwritten the eager export, so they are kept
+                existing = vars(warp).get(key)
+                shadowed = existing is not None and getattr(existing, "__name__", None) != "_overload_dummy"
+                for args, kwargs in calls:
+                    _register_builtin(*args, **(kwargs | {"export": False} if shadowed else kwargs))
+            return dict.__contains__(self, key)
+
+    def materialize_all(self) -> None:
+        while self.pending:
+            self.materialize(next(iter(self.pending)))
+
+    # while built-ins are pending, lookups go through the lock so that no thread
+    # sees a partially registered overload list
+
+    def __getitem__(self, key):
+        if self.pending:
+            self.materialize(key)
+        return super().__getitem__(key)
+
+    def __contains__(self, key):
+        if self.pending:
+            return self.materialize(key)
+        return super().__contains__(key)
+
+    def get(self, key, default=None):
+        if self.pending:
+            self.materialize(key)
+        return super().get(key, default)
+
+    def __iter__(self):
+        self.materialize_all()
+        return super().__iter__()
+
+    def __len__(self):
+        self.materialize_all()
+        return super().__len__()
+
+    def keys(self):
+        self.materialize_all()
+        return super().keys()
+
+    def values(self):
+        self.materialize_all()
+        return super().values()
+
+    def items(self):
+        self.materialize_all()
+        return super().items()
+
+
 # native functions that are part of the Warp API
-builtin_functions: dict[str, Function] = {}
+builtin_functions: dict[str, Function] = _BuiltinFunctionTable()
 
 
 def get_generic_vtypes():
@@ -2077,6 +2187,47 @@ def add_builtin(
             specify whether an adjoint parameter corresponding to the return
             value should be included in the signature of the backward function.
     """
+    args = (key, input_types, constraint, value_type, value_func, export_func, dispatch_func, lto_dispatch_func)
+    kwargs = {
+        "doc": doc,
+        "namespace": namespace,
+        "variadic": variadic,
+        "initializer_list_func": initializer_list_func,
+        "export": export,
+        "group": group,
+        "hidden": hidden,
+        "skip_replay": skip_replay,
+        "is_differentiable": is_differentiable,
+        "native_func": native_func,
+        "defaults": defaults,
+        "require_original_output_arg": require_original_output_arg,
+    }
+    if not builtin_functions.defer(key, args, kwargs):
+        _register_builtin(*args, **kwargs)
+
+
+def _register_builtin(
+    key: str,
+    input_types: dict[str, type | TypeVar] | None = None,
+    constraint: Callable[[Mapping[str, type]], bool] | None = None,
+    value_type: type | None = None,
+    value_func: Callable | None = None,
+    export_func: Callable | None = None,
+    dispatch_func: Callable | None = None,
+    lto_dispatch_func: Callable | None = None,
+    doc: str = "",
+    namespace: str = "wp::",
+    variadic: bool = False,
+    initializer_list_func=None,
+    export: bool = True,
+    group: str = "Other",
+    hidden: bool = False,
+    skip_replay: bool = False,
+    is_differentiable: bool = True,
+    native_func: str | None = None,
+    defaults: dict[str, Any] | None = None,
+    require_original_output_arg: bool = False,
+):
     if input_types is None:
         input_types = {}
 
@@ -2183,7 +2334,7 @@ def add_builtin(
                     continue
 
                 # finally we can generate a function call for these concrete types:
-                add_builtin(
+                _register_builtin(
                     key,
                     input_types=concrete_arg_types,
                     value_type=return_type,
@@ -2262,6 +2413,8 @@ def register_api_function(
     function.group = group
     function.hidden = hidden
 
+    # replace any deferred overloads in the same order as eager registration
+    builtin_functions.materialize(function.key)
     builtin_functions[function.key] = function
 
 
@@ -2482,10 +2635,26 @@ def _verify_library_version(lib, library_name: str, version_symbol: str, expecte
 # using get_hash().  In addition, the ModuleHasher takes care of filtering out
 # duplicate kernels for codegen (see get_unique_kernels()).
 class ModuleHasher:
-    def __init__(self, kernels, options):
+    def __init__(self, kernels, options, previous: ModuleHasher | None = None):
+        """Hash the given kernels and module options.
+
+        Args:
+            kernels: Live kernels of the module.
+            options: Resolved module options.
+            previous: A hasher of another ``block_dim`` variant of the same, unmodified module.
+              Kernel and function digests do not depend on the module options, so they are
+              reused instead of traversing the adjoints again.
+        """
         # cache function hashes to avoid hashing multiple times
         self.function_hashes = {}  # (function: hash)
 
+        # cache kernel hashes, reused by hashers of other block_dim variants
+        self.kernel_hashes = {}  # (kernel: hash)
+
+        if previous is not None:
+            self.function_hashes.update(previous.function_hashes)
+            self.kernel_hashes.update(previous.kernel_hashes)
+
         # avoid recursive spiral of doom (e.g., function calling an overload of itself)
         self.functions_in_progress = set()
 
@@ -2549,18 +2718,22 @@ class ModuleHasher:
         # save the module hash
         self.hash = ch.digest()
 
+        warp._src.kernel_cache.flush_reference_recipes()
+
     def hash_kernel(self, kernel: Kernel, default_grid_stride: bool) -> bytes:
         # NOTE: We only hash non-generic kernels, so we don't traverse kernel overloads here.
 
-        ch = hashlib.sha256()
-        self._hash_kernel_identity(ch, kernel)
+        h = self.kernel_hashes.get(kernel)
+        if h is None:
+            ch = hashlib.sha256()
+            self._hash_kernel_identity(ch, kernel)
+            h = ch.digest()
+            self.kernel_hashes[kernel] = h
 
         # Record the resolved grid_stride for launches to read. No separate salt: an explicit choice
         # rides on kernel.options, an inherited default on the "default_grid_stride" module option.
         kernel.grid_stride = warp._src.codegen.resolve_grid_stride(kernel.options, default_grid_stride)
 
-        h = ch.digest()
-
         self.unique_kernels[h] = kernel
 
         return h
@@ -2600,6 +2773,9 @@ class ModuleHasher:
         if h is not None:
             return h
 
+        # the adjoints of func may only be read while holding its module's codegen lock
+        warp._src.codegen.require_codegen_scope(func.module)
+
         self.functions_in_progress.add(func)
 
         ch = hashlib.sha256()
@@ -2689,7 +2865,7 @@ class ModuleHasher:
         # dicts, custom classes) captured by closures are not included in the hash.
         # Users should wrap such values with wp.static() to make them visible.
         # find referenced constants, types, and functions
-        constants, types, functions = adj.get_references()
+        constants, types, functions = self.get_references(adj)
 
         # hash referenced constants
         for name, value in constants.items():
@@ -2719,6 +2895,30 @@ class ModuleHasher:
 
         return ch.digest()
 
+    @staticmethod
+    def get_references(adj: warp._src.codegen.Adjoint):
+        """Find the references of ``adj``, using the recipe of its source from the kernel cache if any.
+
+        A recipe only lists the reference nodes to resolve, the references themselves are
+        resolved again every time, so rebinding a global or closure variable still changes
+        the hash.
+        """
+        # only adjoints whose tree is parsed from their source alone share it, see _SharedFunctionSource
+        if adj._shared_source is None or getattr(adj, "callable_arg_values", None):
+            return adj.get_references()
+
+        key = warp._src.kernel_cache.reference_recipe_key(adj.source)
+        recipe = warp._src.kernel_cache.get_reference_recipe(adj.filename, key)
+        if recipe is not None:
+            references = adj.get_references_from_recipe(recipe["nodes"], recipe["kernel_dim"])
+            if references is not None:
+                return references
+
+        nodes = []
+        references = adj.get_references(recipe=nodes)
+        warp._src.kernel_cache.put_reference_recipe(adj.filename, key, nodes, adj.kernel_dim)
+        return references
+
     def get_constant_bytes(self, value) -> bytes:
         if isinstance(value, int):
             # this also handles builtins.bool
@@ -2973,6 +3173,11 @@ class ModuleBuilder:
                 backward_smem_bytes = 0
             meta[name + "_cuda_kernel_backward_smem_bytes"] = backward_smem_bytes
 
+            # whether range entry points were generated for multithreaded CPU launches
+            meta[name + "_cpu_kernel_threaded"] = bool(
+                options.get("enable_cpu_atomics") and warp._src.codegen.kernel_supports_cpu_threads(kernel)
+            )
+
         return meta
 
     def _codegen_functions(self, functions, device, forward_only=False, reverse_only=False):
@@ -3241,7 +3446,34 @@ class ModuleExec:
             else:
                 backward = None
 
-            hooks = KernelHooks(forward, backward, det_launch_meta=self.det_launch_meta_map.get(name))
+            det_launch_meta = self.det_launch_meta_map.get(name)
+
+            # launches that record deterministic scatter operations run serially
+            forward_range = None
+            backward_range = None
+            if self.meta.get(name + "_cpu_kernel_threaded", False) and not (
+                det_launch_meta is not None and det_launch_meta.needs_deterministic
+            ):
+                # raw addresses, passed to the native thread pool rather than called from Python
+                forward_range = (
+                    runtime.llvm.wp_lookup(self.handle.encode("utf-8"), (name + "_cpu_forward_range").encode("utf-8"))
+                    or None
+                )
+                if options["enable_backward"]:
+                    backward_range = (
+                        runtime.llvm.wp_lookup(
+                            self.handle.encode("utf-8"), (name + "_cpu_backward_range").encode("utf-8")
+                        )
+                        or None
+                    )
+
+            hooks = KernelHooks(
+                forward,
+                backward,
+                det_launch_meta=det_launch_meta,
+                forward_range=forward_range,
+                backward_range=backward_range,
+            )
 
         self.kernel_hooks[name] = hooks
         return hooks
@@ -3351,6 +3583,14 @@ class Module:
         self.references = set()  # modules whose content we depend on
         self.dependents = set()  # modules that depend on our content
 
+        # Guards codegen and hashing of the functions and kernels in this module.
+        # Locks are acquired in ``codegen_lock_order`` together with the locks of
+        # the referenced modules, see ``warp._src.codegen.run_with_codegen_locks()``.
+        self.codegen_lock = threading.RLock()
+        self.codegen_lock_order = next(warp._src.codegen.codegen_lock_order_counter)
+        # modules reached during codegen that are not listed in ``references``
+        self.codegen_dependencies = set()
+
     def resolve_options(self, config, block_dim: int | None = None) -> dict:
         """Return a fully-resolved copy of the module options.
 
@@ -3415,6 +3655,7 @@ class Module:
         options["llvm_cuda"] = config.llvm_cuda
         options["use_precompiled_headers"] = config.use_precompiled_headers
         options["verify_autograd_array_access"] = config.verify_autograd_array_access
+        options["enable_cpu_atomics"] = config.cpu_num_threads != 1
 
         # Resolve None-means-autodetect for enable_tiles_in_stack_memory
         enable_tiles = config.enable_tiles_in_stack_memory
@@ -3598,19 +3839,20 @@ class Module:
             if isinstance(arg.type, warp._src.codegen.Struct) and arg.type.module is not None:
                 add_ref(arg.type.module)
 
-    @synchronized(_codegen_lock)
     def hash_module(self) -> bytes:
         """Get the hash of the module for the current block_dim.
 
         This function always creates a new ``ModuleHasher`` and computes the hash.
         """
+        return run_with_codegen_locks(self, self._hash_module)
+
+    def _hash_module(self) -> bytes:
         block_dim = self.options["block_dim"]
         options = self.resolve_options(warp.config)
         self.hashers[block_dim] = ModuleHasher(self._get_live_kernels(), options)
         self.resolved_options[block_dim] = options
         return self.hashers[block_dim].get_hash()
 
-    @synchronized(_codegen_lock)
     def get_module_hash(self, block_dim: int | None = None) -> bytes:
         """Get the hash of the module for a block_dim variant.
 
@@ -3625,25 +3867,32 @@ class Module:
         # ``wp.static`` expressions; ``ModuleHasher`` reads the
         # resulting adjoint blocks via ``hash_adjoint``). The two
         # operations are stages of one logical "compute module hash"
-        # critical section, so they live in a single ``_codegen_lock``
-        # block. Splitting the lock per stage opens a window where
-        # another thread can re-run ``adj.build`` on a shared helper
-        # and clobber the state this thread is about to hash.
+        # critical section, so they run under a single acquisition of the
+        # codegen locks of this module and its dependencies. Splitting the
+        # lock per stage opens a window where another thread can re-run
+        # ``adj.build`` on a shared helper and clobber the state this
+        # thread is about to hash.
         if self.has_unresolved_static_expressions or block_dim not in self.hashers:
-            with _codegen_lock:
-                if self.has_unresolved_static_expressions:
-                    options = self.resolve_options(warp.config, block_dim=block_dim)
-                    builder_options = options | {"output_arch": None, "block_dim": block_dim}
-                    _ = ModuleBuilder(self, builder_options)
-                    self.has_unresolved_static_expressions = False
-
-                if block_dim not in self.hashers:
-                    options = self.resolve_options(warp.config, block_dim=block_dim)
-                    self.hashers[block_dim] = ModuleHasher(self._get_live_kernels(), options)
-                    self.resolved_options[block_dim] = options
+            run_with_codegen_locks(self, self._build_module_hasher, block_dim)
 
         return self.hashers[block_dim].get_hash()
 
+    def _build_module_hasher(self, block_dim: int):
+        # digests of another variant are only valid while the adjoints are unchanged
+        previous = next(iter(self.hashers.values()), None)
+
+        if self.has_unresolved_static_expressions:
+            options = self.resolve_options(warp.config, block_dim=block_dim)
+            builder_options = options | {"output_arch": None, "block_dim": block_dim}
+            _ = ModuleBuilder(self, builder_options)
+            self.has_unresolved_static_expressions = False
+            previous = None
+
+        if block_dim not in self.hashers:
+            options = self.resolve_options(warp.config, block_dim=block_dim)
+            self.hashers[block_dim] = ModuleHasher(self._get_live_kernels(), options, previous=previous)
+            self.resolved_options[block_dim] = options
+
     def _snapshot_deterministic_metadata(
         self, block_dim: int, options: dict, rebuild: bool
     ) -> dict[str, DeterministicMeta]:
@@ -3660,13 +3909,16 @@ class Module:
             return {}
 
         builder_options = options | {"output_arch": None}
-        snapshot = {}
-        with _codegen_lock:
+
+        def snapshot_kernels():
+            snapshot = {}
             for kernel in hasher.get_unique_kernels():
                 if rebuild:
                     kernel.adj.build(None, builder_options)
                 snapshot[kernel.get_mangled_name()] = kernel.adj.det_meta
-        return snapshot
+            return snapshot
+
+        return run_with_codegen_locks(self, snapshot_kernels)
 
     def _use_ptx(self, device) -> bool:
         return device.get_cuda_output_format(self.options.get("cuda_output")) == "ptx"
@@ -3763,7 +4015,6 @@ class Module:
         """
         return f"{self.get_module_identifier(block_dim=block_dim)}.meta"
 
-    @synchronized(_codegen_lock)
     def _run_codegen(self, options: dict, is_cpu: bool) -> tuple[str, str, dict, list, list]:
         """Run the Python-side codegen window.
 
@@ -3771,12 +4022,16 @@ class Module:
         source, its file extension, the metadata dict, and snapshots of the
         builder's LTO-IR and fatbin collections.
 
-        Held under ``_codegen_lock`` so concurrent ``Module._compile`` callers
-        cannot interleave ``adj.build`` writes and ``codegen()`` reads on a
-        shared ``@wp.func``'s Adjoint state. The expensive NVRTC / NVCC /
-        Clang invocation runs after this returns, so N modules still compile
-        in parallel -- only the cheap codegen window serialises.
+        Held under the codegen locks of this module and the modules it
+        references, so concurrent ``Module._compile`` callers cannot
+        interleave ``adj.build`` writes and ``codegen()`` reads on a shared
+        ``@wp.func``'s Adjoint state, while modules without shared
+        dependencies run codegen concurrently. The expensive NVRTC / NVCC /
+        Clang invocation runs after this returns and is never serialised.
         """
+        return run_with_codegen_locks(self, self._run_codegen_locked, options, is_cpu)
+
+    def _run_codegen_locked(self, options: dict, is_cpu: bool) -> tuple[str, str, dict, list, list]:
         builder = ModuleBuilder(
             self,
             options,
@@ -3799,6 +4054,7 @@ class Module:
         output_arch: int | None = None,
         use_ptx: bool | None = None,
         options: dict | None = None,
+        timings: dict[str, float] | None = None,
     ) -> bool:
         """Compile this module for a specific device.
 
@@ -3814,6 +4070,8 @@ class Module:
                 auto-determined from the device and architecture.
             options: Resolved module options dict. If ``None``, resolved from
                 current config.
+            timings: If not ``None``, receives the time in seconds spent in
+                Python codegen under the ``"codegen"`` key.
 
         Returns:
             ``True`` if compilation was performed, ``False`` if a cached
@@ -3885,17 +4143,29 @@ class Module:
         else:
             output_dir = os.fspath(output_dir)
 
+        # only module directories of the kernel cache are tracked by the cache index
+        use_kernel_cache = warp.config.kernel_cache_dir is not None and os.path.dirname(
+            os.path.normpath(output_dir)
+        ) == os.path.normpath(warp.config.kernel_cache_dir)
+
+        # modules with stripped hashes are not content-addressed, keep them out of shared backends
+        cache_files = [output_name, self._get_meta_name(block_dim=active_block_dim)]
+        backend_files = cache_files if use_kernel_cache and not self.options["strip_hash"] else []
+
         # Skip compilation if the binary and metadata are already cached
         # (forced rebuild when verifying autograd array access)
-        if (
-            warp.config.cache_kernels
-            and not options.get("verify_autograd_array_access", False)
-            and os.path.exists(os.path.join(output_dir, output_name))
-            and os.path.exists(os.path.join(output_dir, self._get_meta_name(block_dim=active_block_dim)))
-        ):
-            return False
+        if warp.config.cache_kernels and not options.get("verify_autograd_array_access", False):
+            if all(os.path.exists(os.path.join(output_dir, file_name)) for file_name in cache_files):
+                if use_kernel_cache:
+                    warp._src.kernel_cache.record_hit(output_dir)
+                return False
+
+            if backend_files and warp._src.kernel_cache.fetch_from_backend(
+                output_dir, backend_files, self.get_module_hash(active_block_dim)
+            ):
+                return False
 
-        # Python codegen window -- runs serialised under ``_codegen_lock``
+        # Python codegen window -- runs under the module's codegen locks
         # inside ``_run_codegen``. Snapshots all builder state needed by
         # the native compile below, so the native step (the dominant cost)
         # runs unlocked and parallelises across N modules.
@@ -3907,7 +4177,10 @@ class Module:
         # ``failed_builds`` the next ``Module.load`` on the same device
         # short-circuits with ``return None`` and subsequent unrelated
         # kernels in the same module silently fail to launch.
+        codegen_start = time.perf_counter()
         source_str, source_code_ext, meta, ltoir_values, fatbin_values = self._run_codegen(options, is_cpu)
+        if timings is not None:
+            timings["codegen"] = time.perf_counter() - codegen_start
 
         meta_path = os.path.join(output_dir, self._get_meta_name(block_dim=active_block_dim))
 
@@ -3951,6 +4224,7 @@ class Module:
                         pch_dir=runtime.get_clang_pch_dir() if options["use_precompiled_headers"] else None,
                         block_dim=options["block_dim"],
                         enable_tiles_in_stack_memory=options["enable_tiles_in_stack_memory"],
+                        enable_cpu_atomics=options["enable_cpu_atomics"],
                     )
             else:
                 # generate PTX or CUBIN
@@ -4040,6 +4314,11 @@ class Module:
             # clean up build_dir used for this process regardless
             shutil.rmtree(build_dir, ignore_errors=True)
 
+            if use_kernel_cache:
+                warp._src.kernel_cache.record_store(
+                    output_dir, backend_files, self.get_module_hash(active_block_dim) if backend_files else None
+                )
+
         return True
 
     def load(
@@ -4075,8 +4354,11 @@ class Module:
         if (device.context, active_block_dim) in self.failed_builds:
             return None
 
+        load_start_ns = time.perf_counter_ns()
+        hash_start = time.perf_counter()
         module_hash = self.get_module_hash(active_block_dim)
         options = self.resolved_options[active_block_dim]
+        timings = {"hash": time.perf_counter() - hash_start, "codegen": 0.0, "compile": 0.0}
 
         # use a unique module path using the module short hash
         module_name_short = self.get_module_identifier(active_block_dim)
@@ -4124,11 +4406,15 @@ class Module:
                 meta_path = os.path.join(module_dir, self._get_meta_name(block_dim=active_block_dim))
                 binary_path = os.path.join(module_dir, output_name)
 
+                compile_start = time.perf_counter()
                 try:
-                    compiled = self._compile(device, module_dir, output_name, output_arch, options=options)
+                    compiled = self._compile(
+                        device, module_dir, output_name, output_arch, options=options, timings=timings
+                    )
                 except Exception as e:
                     module_load_timer.extra_msg = " (error)"
                     raise e
+                timings["compile"] = time.perf_counter() - compile_start - timings["codegen"]
 
                 module_load_timer.extra_msg = " (compiled)" if compiled else " (cached)"
 
@@ -4137,6 +4423,8 @@ class Module:
             # -----------------------------------------------------------
             # Load CPU or CUDA binary
 
+            load_start = time.perf_counter()
+
             if os.path.exists(meta_path):
                 with open(meta_path) as meta_file:
                     meta = json.load(meta_file)
@@ -4172,6 +4460,18 @@ class Module:
                     module_load_timer.extra_msg = " (error)"
                     raise Exception(f"Failed to load CUDA module '{self.name}' ({module_load_diagnostics})")
 
+            timings["load"] = time.perf_counter() - load_start
+            warp._src.kernel_cache.record_load_timings(timings)
+
+            if warp.config.verbose or warp.config.log_level <= warp.LOG_DEBUG:
+                breakdown = ", ".join(f"{phase} {seconds * 1000.0:.2f} ms" for phase, seconds in timings.items())
+                module_load_timer.extra_msg = f"{module_load_timer.extra_msg[:-1]}; {breakdown})"
+
+        if _cpu_timing_state is not None:
+            _record_cpu_activity(
+                warp._src.utils.TIMING_MODULE_LOAD, device, f"module load {self.name}", load_start_ns, module=self.name
+            )
+
         return module_exec
 
     def unload(self):
@@ -4375,6 +4675,144 @@ class CpuPinnedAllocator:
         runtime.core.wp_free_pinned(ptr)
 
 
+# Smallest block handed out by the CPU memory pool, in bytes
+_CPU_MEMPOOL_MIN_BLOCK_SIZE = 256
+
+# Number of size classes between two consecutive powers of two, bounding the padding to 25%
+_CPU_MEMPOOL_SIZE_CLASSES_PER_OCTAVE = 4
+
+# Bytes of free blocks that the CPU memory pool keeps cached by default
+_CPU_MEMPOOL_DEFAULT_RELEASE_THRESHOLD = 256 * 1024 * 1024
+
+
+def _cpu_mempool_block_size(size_in_bytes: int) -> int:
+    """Size class of an allocation request, rounded up to one of the binned block sizes."""
+    if size_in_bytes <= _CPU_MEMPOOL_MIN_BLOCK_SIZE:
+        return _CPU_MEMPOOL_MIN_BLOCK_SIZE
+    octave_bits = (_CPU_MEMPOOL_SIZE_CLASSES_PER_OCTAVE - 1).bit_length()
+    granularity = 1 << ((size_in_bytes - 1).bit_length() - 1 - octave_bits)
+    return (size_in_bytes + granularity - 1) & ~(granularity - 1)
+
+
+class CpuMempoolAllocator:
+    """Caching allocator for host memory, binning blocks by size class.
+
+    Deallocated blocks are kept in per-size-class free lists and handed back to later allocations
+    of the same class, avoiding the system allocator and the page faults of fresh memory in loops
+    that repeatedly create temporary arrays. Requests are rounded up to one of four size classes
+    per power of two. Cached blocks are returned to the system once their total size exceeds the
+    release threshold, when the pool stops being the allocator of its device, and at shutdown.
+
+    The pool of the CPU device is used once enabled with :func:`set_mempool_enabled` or
+    :class:`ScopedMempool`, and is configured through :func:`set_mempool_release_threshold`.
+    Separate pools can be installed with :func:`set_device_allocator`.
+
+    Args:
+        device: The CPU device.
+        release_threshold: Number of bytes of free blocks to keep cached.
+    """
+
+    deallocate_requires_context_guard = False
+    memory_kind = MemoryKind.HOST
+
+    def __init__(self, device, release_threshold: int = _CPU_MEMPOOL_DEFAULT_RELEASE_THRESHOLD):
+        if not isinstance(device, Device):
+            device = get_device(device)
+        if not device.is_cpu:
+            raise ValueError(f"CpuMempoolAllocator requires a CPU device, got '{device}'")
+        self.device = device
+
+        # arrays may be garbage collected while the pool is being updated on the same thread
+        self._lock = threading.RLock()
+        self._free_blocks: dict[int, list[int]] = {}
+        self._release_threshold = max(int(release_threshold), 0)
+        self._used_mem_current = 0
+        self._used_mem_high = 0
+        self._cached_mem = 0
+
+        weakref.finalize(self, CpuMempoolAllocator._free_blocks_to_system, self._free_blocks)
+
+    @property
+    def release_threshold(self) -> int:
+        """Number of bytes of free blocks kept cached before they are returned to the system."""
+        return self._release_threshold
+
+    @release_threshold.setter
+    def release_threshold(self, threshold: int):
+        with self._lock:
+            self._release_threshold = max(int(threshold), 0)
+            self._trim(self._release_threshold)
+
+    @property
+    def used_mem_current(self) -> int:
+        """Number of bytes of the blocks currently allocated from the pool."""
+        return self._used_mem_current
+
+    @property
+    def used_mem_high(self) -> int:
+        """High-water mark of :attr:`used_mem_current`."""
+        return self._used_mem_high
+
+    @property
+    def reserved_mem_current(self) -> int:
+        """Number of bytes held by the pool, including cached free blocks."""
+        return self._used_mem_current + self._cached_mem
+
+    def allocate(self, size_in_bytes):
+        block_size = _cpu_mempool_block_size(size_in_bytes)
+        with self._lock:
+            free_blocks = self._free_blocks.get(block_size)
+            if free_blocks:
+                ptr = free_blocks.pop()
+                self._cached_mem -= block_size
+            else:
+                ptr = runtime.core.wp_alloc_host(block_size, None)
+                if not ptr:
+                    # release the cached blocks and try again
+                    self._trim(0)
+                    ptr = runtime.core.wp_alloc_host(block_size, None)
+                    if not ptr:
+                        raise RuntimeError(f"Failed to allocate {size_in_bytes} bytes on device '{self.device}'")
+
+            self._used_mem_current += block_size
+            self._used_mem_high = max(self._used_mem_high, self._used_mem_current)
+
+        _set_alloc_tag_if_tracking(ptr)
+        return ptr
+
+    def deallocate(self, ptr, size_in_bytes):
+        block_size = _cpu_mempool_block_size(size_in_bytes)
+        with self._lock:
+            self._used_mem_current -= block_size
+            # blocks freed after the pool was disabled or replaced are not cached
+            if self._cached_mem + block_size > self._release_threshold or self.device.get_allocator() is not self:
+                runtime.core.wp_free_host(ptr)
+            else:
+                self._free_blocks.setdefault(block_size, []).append(ptr)
+                self._cached_mem += block_size
+
+    def release(self):
+        """Return all cached free blocks to the system."""
+        with self._lock:
+            self._trim(0)
+
+    def _trim(self, threshold: int):
+        # free the largest blocks first
+        for block_size in sorted(self._free_blocks, reverse=True):
+            free_blocks = self._free_blocks[block_size]
+            while free_blocks and self._cached_mem > threshold:
+                runtime.core.wp_free_host(free_blocks.pop())
+                self._cached_mem -= block_size
+
+    @staticmethod
+    def _free_blocks_to_system(free_blocks: dict[int, list[int]]):
+        # called at shutdown or when the pool is garbage collected
+        for blocks in free_blocks.values():
+            for ptr in blocks:
+                runtime.core.wp_free_host(ptr)
+        free_blocks.clear()
+
+
 class CudaDefaultAllocator:
     deallocate_requires_context_guard = True
     memory_kind = MemoryKind.CUDA_DEVICE
@@ -4839,7 +5277,8 @@ class Device:
         is_cubin_supported (bool): Indicates whether Warp's version of NVRTC can directly
             generate CUDA binary files (cubin) for this device's architecture. ``False`` for CPU devices.
         is_mempool_supported (bool): Indicates whether the device supports using the ``cuMemAllocAsync`` and
-            ``cuMemPool`` family of APIs for stream-ordered memory allocations. ``False`` for CPU devices.
+            ``cuMemPool`` family of APIs for stream-ordered memory allocations. ``True`` for CPU devices,
+            which use a :class:`CpuMempoolAllocator`.
         is_ipc_supported (Optional[bool]): Indicates whether the device supports IPC.
 
             - ``True`` if supported.
@@ -4887,7 +5326,7 @@ class Device:
             self.is_cpu_gpu_atomic_supported = False
             self.is_managed_memory_supported = False
             self.is_concurrent_managed_access_supported = False
-            self.is_mempool_supported = False
+            self.is_mempool_supported = True
             self.is_mempool_enabled = False
             self.is_ipc_supported = False  # TODO: Support IPC for CPU arrays
             self.is_cubin_supported = False
@@ -4900,6 +5339,10 @@ class Device:
 
             self.default_allocator = CpuDefaultAllocator(self)
             self.pinned_allocator = CpuPinnedAllocator(self)
+            self.mempool_allocator = CpuMempoolAllocator(self)
+            self.current_allocator = self.default_allocator
+
+            self._custom_allocator = None
 
         elif ordinal >= 0 and ordinal < runtime.core.wp_cuda_device_get_count():
             # CUDA device
@@ -4980,24 +5423,20 @@ class Device:
     def get_allocator(self, pinned: bool = False):
         """Get the memory allocator for this device.
 
-        For CUDA devices, returns the custom allocator if one has been set via
-        :func:`set_device_allocator` or :func:`set_cuda_allocator`, otherwise
-        returns the device's current built-in allocator.
+        Returns the custom allocator if one has been set via :func:`set_device_allocator`
+        (or :func:`set_cuda_allocator` for CUDA devices), otherwise returns the device's
+        current built-in allocator, which depends on whether memory pools are enabled.
 
         Args:
             pinned: If ``True``, an allocator for pinned memory will be
               returned. Only applicable to CPU devices; ignored on CUDA
               devices.
         """
-        if self.is_cuda:
-            if self._custom_allocator is not None:
-                return self._custom_allocator
-            return self.current_allocator
-        else:
-            if pinned:
-                return self.pinned_allocator
-            else:
-                return self.default_allocator
+        if pinned and self.is_cpu:
+            return self.pinned_allocator
+        if self._custom_allocator is not None:
+            return self._custom_allocator
+        return self.current_allocator
 
     def _init_streams(self):
         """Initialize the device's current stream and the device's null stream."""
@@ -5888,6 +6327,25 @@ class Runtime:
                 ctypes.POINTER(APICLaunchInfo),  # apic_info
             ]
             self.core.wp_cpu_launch_kernel.restype = None
+            self.core.wp_cpu_launch_kernel_range.argtypes = [
+                ctypes.c_void_p,  # func
+                ctypes.c_void_p,  # bounds
+                ctypes.c_void_p,  # args
+                ctypes.c_void_p,  # adj_args
+                ctypes.c_size_t,  # size
+                ctypes.c_int,  # num_threads
+                ctypes.c_size_t,  # chunk_size
+            ]
+            self.core.wp_cpu_launch_kernel_range.restype = None
+            self.core.wp_cpu_launch_kernel_batch.argtypes = [
+                ctypes.POINTER(launch_command_t),  # commands
+                ctypes.c_int,  # count
+                ctypes.c_int,  # num_threads
+                ctypes.c_size_t,  # chunk_size
+            ]
+            self.core.wp_cpu_launch_kernel_batch.restype = None
+            self.core.wp_cpu_get_hardware_concurrency.argtypes = []
+            self.core.wp_cpu_get_hardware_concurrency.restype = ctypes.c_int
             self.core.wp_apic_register_cpu_kernel.argtypes = [
                 ctypes.c_void_p,
                 ctypes.c_char_p,  # kernel_key
@@ -5896,10 +6354,22 @@ class Runtime:
                 ctypes.c_void_p,
             ]
             self.core.wp_apic_register_cpu_kernel.restype = None
+            self.core.wp_apic_register_cpu_kernel_range.argtypes = [
+                ctypes.c_void_p,
+                ctypes.c_char_p,  # kernel_key
+                ctypes.c_char_p,  # module_hash
+                ctypes.c_void_p,
+                ctypes.c_void_p,
+            ]
+            self.core.wp_apic_register_cpu_kernel_range.restype = None
             self.core.wp_apic_cpu_replay_state.argtypes = [ctypes.c_void_p]
             self.core.wp_apic_cpu_replay_state.restype = ctypes.c_bool
             self.core.wp_apic_cpu_replay_graph.argtypes = [ctypes.c_void_p]
             self.core.wp_apic_cpu_replay_graph.restype = ctypes.c_bool
+            self.core.wp_apic_cpu_replay_state_concurrent.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_size_t]
+            self.core.wp_apic_cpu_replay_state_concurrent.restype = ctypes.c_bool
+            self.core.wp_apic_cpu_replay_graph_concurrent.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_size_t]
+            self.core.wp_apic_cpu_replay_graph_concurrent.restype = ctypes.c_bool
 
             # APIC serialization bindings
             self.core.wp_apic_register_module.argtypes = [
@@ -5956,6 +6426,14 @@ class Runtime:
                 ctypes.c_void_p,
             ]
             self.core.wp_apic_register_loaded_cpu_kernel.restype = None
+            self.core.wp_apic_register_loaded_cpu_kernel_range.argtypes = [
+                ctypes.c_void_p,
+                ctypes.c_char_p,
+                ctypes.c_char_p,
+                ctypes.c_void_p,
+                ctypes.c_void_p,
+            ]
+            self.core.wp_apic_register_loaded_cpu_kernel_range.restype = None
             self.core.wp_apic_get_num_kernels.argtypes = [ctypes.c_void_p]
             self.core.wp_apic_get_num_kernels.restype = ctypes.c_int
             self.core.wp_apic_get_kernel_key.argtypes = [ctypes.c_void_p, ctypes.c_int]
@@ -6378,6 +6856,7 @@ class Runtime:
                 ctypes.c_int,
                 ctypes.c_void_p,
                 ctypes.c_int,
+                ctypes.c_int,
             ]
 
             self.core.wp_bvh_create_device.restype = ctypes.c_uint64
@@ -6395,7 +6874,7 @@ class Runtime:
             self.core.wp_bvh_destroy_device.argtypes = [ctypes.c_uint64]
 
             self.core.wp_bvh_refit_host.argtypes = [ctypes.c_uint64]
-            self.core.wp_bvh_rebuild_host.argtypes = [ctypes.c_uint64, ctypes.c_int]
+            self.core.wp_bvh_rebuild_host.argtypes = [ctypes.c_uint64, ctypes.c_int, ctypes.c_int]
             self.core.wp_bvh_refit_device.argtypes = [ctypes.c_uint64]
             self.core.wp_bvh_rebuild_device.argtypes = [ctypes.c_uint64]
 
@@ -6410,6 +6889,7 @@ class Runtime:
                 ctypes.c_int,
                 ctypes.c_void_p,
                 ctypes.c_int,
+                ctypes.c_int,
             ]
 
             self.core.wp_mesh_create_device.restype = ctypes.c_uint64
@@ -6452,6 +6932,9 @@ class Runtime:
                 ctypes.c_double,
                 ctypes.c_void_p,
                 ctypes.c_void_p,
+                ctypes.c_int,
+                ctypes.c_bool,
+                ctypes.c_void_p,
             ]
             self.core.wp_hash_grid_reserve_host.argtypes = [
                 ctypes.c_uint64,
@@ -7336,6 +7819,13 @@ class Runtime:
                 ctypes.c_void_p,  # const APICLaunchInfo* (NULL when not recording)
             ]
             self.core.wp_cuda_launch_kernel.restype = ctypes.c_size_t
+            self.core.wp_cuda_launch_kernel_batch.argtypes = [
+                ctypes.c_void_p,  # context
+                ctypes.POINTER(launch_command_t),  # commands
+                ctypes.c_int,  # count
+                ctypes.c_void_p,  # stream
+            ]
+            self.core.wp_cuda_launch_kernel_batch.restype = ctypes.c_int
 
             self.core.wp_cuda_graphics_map.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
             self.core.wp_cuda_graphics_map.restype = ctypes.c_bool
@@ -7379,9 +7869,19 @@ class Runtime:
                 warp._src.types.array_t,
                 ctypes.c_int,
                 warp._src.types.array_t,
+                ctypes.c_int,
             ]
             self.core.wp_graph_coloring.restype = ctypes.c_int
 
+            self.core.wp_graph_coloring_repair.argtypes = [
+                ctypes.c_int,
+                warp._src.types.array_t,
+                warp._src.types.array_t,
+                warp._src.types.array_t,
+                ctypes.c_int,
+            ]
+            self.core.wp_graph_coloring_repair.restype = ctypes.c_int
+
             self.core.wp_balance_coloring.argtypes = [
                 ctypes.c_int,
                 warp._src.types.array_t,
@@ -8168,7 +8668,10 @@ def _is_graph_capture_allocation_enabled(device: DeviceLike) -> bool:
 
 
 def is_mempool_supported(device: DeviceLike) -> bool:
-    """Check if CUDA memory pool allocators are available on the device.
+    """Check if memory pool allocators are available on the device.
+
+    CUDA devices may support stream-ordered memory pools, while the CPU device always
+    supports its :class:`CpuMempoolAllocator`.
 
     Parameters:
         device: The :class:`~warp._src.context.Device` or device identifier
@@ -8184,7 +8687,7 @@ def is_mempool_supported(device: DeviceLike) -> bool:
 
 
 def is_mempool_enabled(device: DeviceLike) -> bool:
-    """Check if CUDA memory pool allocators are enabled on the device.
+    """Check if memory pool allocators are enabled on the device.
 
     Parameters:
         device: The :class:`~warp._src.context.Device` or device identifier
@@ -8263,9 +8766,11 @@ def get_cuda_max_cluster_dim(
 
 
 def set_mempool_enabled(device: DeviceLike, enable: bool) -> None:
-    """Enable or disable CUDA memory pool allocators on the device.
+    """Enable or disable memory pool allocators on the device.
 
     Pooled allocators are typically faster and allow allocating memory during graph capture.
+    On the CPU device, the pool is a :class:`CpuMempoolAllocator` caching freed blocks, which is disabled
+    by default.
 
     They should generally be enabled, but there is a rare caveat.  Copying data between different GPUs
     may fail during graph capture if the memory was allocated using pooled allocators and memory pool
@@ -8284,18 +8789,16 @@ def set_mempool_enabled(device: DeviceLike, enable: bool) -> None:
 
     device = runtime.get_device(device)
 
-    if device.is_cuda:
-        if enable:
-            if not device.is_mempool_supported:
-                raise RuntimeError(f"Device {device} does not support memory pools")
-            device.current_allocator = device.mempool_allocator
-            device.is_mempool_enabled = True
-        else:
-            device.current_allocator = device.default_allocator
-            device.is_mempool_enabled = False
+    if enable:
+        if not device.is_mempool_supported:
+            raise RuntimeError(f"Device {device} does not support memory pools")
+        device.current_allocator = device.mempool_allocator
+        device.is_mempool_enabled = True
     else:
-        if enable:
-            raise ValueError("Memory pools are only supported on CUDA devices")
+        device.current_allocator = device.default_allocator
+        device.is_mempool_enabled = False
+        if device.is_cpu:
+            device.mempool_allocator.release()
 
 
 def set_cuda_allocator(allocator: Allocator | None) -> None:
@@ -8319,18 +8822,18 @@ def set_cuda_allocator(allocator: Allocator | None) -> None:
 
 
 def set_device_allocator(device: DeviceLike, allocator: Allocator | None) -> None:
-    """Set the memory allocator for a specific CUDA device.
+    """Set the memory allocator for a specific device.
 
-    Pass ``None`` to restore the built-in allocator.
+    Pass ``None`` to restore the built-in allocator. On the CPU device, the allocator is not used
+    for pinned arrays.
 
     Args:
-        device: The CUDA device.
-        allocator: An :class:`Allocator`-compatible object, or ``None``.
+        device: The device.
+        allocator: An :class:`Allocator`-compatible object, such as a :class:`CpuMempoolAllocator`
+            for the CPU device, or ``None``.
     """
     init()
     device = runtime.get_device(device)
-    if not device.is_cuda:
-        raise RuntimeError("Custom allocators are only supported on CUDA devices")
     _validate_allocator(allocator)
     device._custom_allocator = allocator
 
@@ -8338,11 +8841,9 @@ def set_device_allocator(device: DeviceLike, allocator: Allocator | None) -> Non
 def get_device_allocator(device: DeviceLike) -> Allocator:
     """Get the current effective memory allocator for a device.
 
-    For CUDA devices, returns the custom allocator if one has been set via
-    :func:`set_device_allocator` or :func:`set_cuda_allocator`, otherwise
-    returns the device's current built-in allocator.
-
-    For CPU devices, returns the default host memory allocator.
+    Returns the custom allocator if one has been set via :func:`set_device_allocator`
+    (or :func:`set_cuda_allocator` for CUDA devices), otherwise returns the device's
+    current built-in allocator.
 
     Args:
         device: The device to query.
@@ -8355,12 +8856,22 @@ def get_device_allocator(device: DeviceLike) -> Allocator:
     return device.get_allocator()
 
 
+def _get_cpu_mempool(device: Device) -> CpuMempoolAllocator:
+    """Memory pool of a CPU device, or the pool installed with :func:`set_device_allocator`."""
+    allocator = device.get_allocator()
+    if isinstance(allocator, CpuMempoolAllocator):
+        return allocator
+    return device.mempool_allocator
+
+
 def set_mempool_release_threshold(device: DeviceLike, threshold: int | float) -> None:
-    """Set the CUDA memory pool release threshold on the device.
+    """Set the memory pool release threshold on the device.
 
     This is the amount of reserved memory to hold onto before trying to release memory back to the OS.
-    When more than this amount of bytes is held by the memory pool, the allocator will try to release
-    memory back to the OS on the next call to stream, event, or device synchronize.
+    When more than this amount of bytes is held by a CUDA memory pool, the allocator will try to release
+    memory back to the OS on the next call to stream, event, or device synchronize. On the CPU device,
+    this is the amount of freed memory cached by the :class:`CpuMempoolAllocator`, and lowering the
+    threshold immediately releases the excess.
 
     Values between 0 and 1 are interpreted as fractions of available memory.  For example, 0.5 means
     half of the device's physical memory.  Greater values are interpreted as an absolute number of bytes.
@@ -8374,7 +8885,6 @@ def set_mempool_release_threshold(device: DeviceLike, threshold: int | float) ->
           specifying the desired release threshold.
 
     Raises:
-        ValueError: If ``device`` is not a CUDA device.
         RuntimeError: If ``device`` is a CUDA device, but does not support memory pools.
         RuntimeError: Failed to set the memory pool release threshold.
     """
@@ -8383,9 +8893,6 @@ def set_mempool_release_threshold(device: DeviceLike, threshold: int | float) ->
 
     device = runtime.get_device(device)
 
-    if not device.is_cuda:
-        raise ValueError("Memory pools are only supported on CUDA devices")
-
     if not device.is_mempool_supported:
         raise RuntimeError(f"Device {device} does not support memory pools")
 
@@ -8394,12 +8901,16 @@ def set_mempool_release_threshold(device: DeviceLike, threshold: int | float) ->
     elif threshold > 0 and threshold <= 1:
         threshold = int(threshold * device.total_memory)
 
+    if device.is_cpu:
+        _get_cpu_mempool(device).release_threshold = threshold
+        return
+
     if not runtime.core.wp_cuda_device_set_mempool_release_threshold(device.ordinal, threshold):
         raise RuntimeError(f"Failed to set memory pool release threshold for device {device}")
 
 
 def get_mempool_release_threshold(device: DeviceLike = None) -> int:
-    """Get the CUDA memory pool release threshold on the device.
+    """Get the memory pool release threshold on the device.
 
     Parameters:
         device: The :class:`~warp._src.context.Device` or device identifier
@@ -8410,7 +8921,6 @@ def get_mempool_release_threshold(device: DeviceLike = None) -> int:
         The memory pool release threshold in bytes.
 
     Raises:
-        ValueError: If ``device`` is not a CUDA device.
         RuntimeError: If ``device`` is a CUDA device, but does not support memory pools.
     """
 
@@ -8418,12 +8928,12 @@ def get_mempool_release_threshold(device: DeviceLike = None) -> int:
 
     device = runtime.get_device(device)
 
-    if not device.is_cuda:
-        raise ValueError("Memory pools are only supported on CUDA devices")
-
     if not device.is_mempool_supported:
         raise RuntimeError(f"Device {device} does not support memory pools")
 
+    if device.is_cpu:
+        return _get_cpu_mempool(device).release_threshold
+
     return runtime.core.wp_cuda_device_get_mempool_release_threshold(device.ordinal)
 
 
@@ -8439,7 +8949,6 @@ def get_mempool_used_mem_current(device: DeviceLike = None) -> int:
         The amount of memory used in bytes.
 
     Raises:
-        ValueError: If ``device`` is not a CUDA device.
         RuntimeError: If ``device`` is a CUDA device, but does not support memory pools.
     """
 
@@ -8447,17 +8956,17 @@ def get_mempool_used_mem_current(device: DeviceLike = None) -> int:
 
     device = runtime.get_device(device)
 
-    if not device.is_cuda:
-        raise ValueError("Memory pools are only supported on CUDA devices")
-
     if not device.is_mempool_supported:
         raise RuntimeError(f"Device {device} does not support memory pools")
 
+    if device.is_cpu:
+        return _get_cpu_mempool(device).used_mem_current
+
     return runtime.core.wp_cuda_device_get_mempool_used_mem_current(device.ordinal)
 
 
 def get_mempool_used_mem_high(device: DeviceLike = None) -> int:
-    """Get the application's memory usage high-water mark from the device's CUDA memory pool.
+    """Get the application's memory usage high-water mark from the device's memory pool.
 
     Parameters:
         device: The :class:`~warp._src.context.Device` or device identifier
@@ -8468,7 +8977,6 @@ def get_mempool_used_mem_high(device: DeviceLike = None) -> int:
         The high-water mark of memory used from the memory pool in bytes.
 
     Raises:
-        ValueError: If ``device`` is not a CUDA device.
         RuntimeError: If ``device`` is a CUDA device, but does not support memory pools.
     """
 
@@ -8476,12 +8984,12 @@ def get_mempool_used_mem_high(device: DeviceLike = None) -> int:
 
     device = runtime.get_device(device)
 
-    if not device.is_cuda:
-        raise ValueError("Memory pools are only supported on CUDA devices")
-
     if not device.is_mempool_supported:
         raise RuntimeError(f"Device {device} does not support memory pools")
 
+    if device.is_cpu:
+        return _get_cpu_mempool(device).used_mem_high
+
     return runtime.core.wp_cuda_device_get_mempool_used_mem_high(device.ordinal)
 
 
@@ -9879,6 +10387,70 @@ def _build_cpu_args_structs(kernel, hooks, params, adjoint):
     return args, adj_args
 
 
+class _CpuTimingState:
+    """Host activities recorded between :func:`warp.timing_begin` and :func:`warp.timing_end`.
+
+    CPU kernels run synchronously, so their elapsed time is the host time spent in the native call.
+    The time is measured in Python around the call, so it includes the ctypes dispatch overhead.
+    Like the native CUDA timing state, nested timing ranges form a stack and only the innermost one
+    receives the records.
+    """
+
+    def __init__(self, flags: int, parent: _CpuTimingState | None):
+        self.flags = flags
+        self.parent = parent
+        self.origin_ns = time.perf_counter_ns()
+        # (device, name, flag, start_ns, end_ns, dim, module) tuples
+        self.records = []
+
+
+# innermost active CPU timing state, or None if timing is not active
+_cpu_timing_state: _CpuTimingState | None = None
+
+
+def _record_cpu_activity(flag: int, device, name: str, start_ns: int, dim=None, module=None):
+    """Record a host activity started at ``start_ns`` and ending now, if ``flag`` is being timed."""
+    state = _cpu_timing_state
+    if state is not None and state.flags & flag:
+        state.records.append((device, name, flag, start_ns, time.perf_counter_ns(), dim, module))
+
+
+def _record_cpu_launch(kernel, bounds, adjoint: bool, device, start_ns: int):
+    direction = "backward" if adjoint else "forward"
+    dim = tuple(bounds.shape)
+    if bounds.coord_mult != 1:
+        # launch dimensions beyond those of the kernel are folded into a single extent
+        dim += (bounds.coord_mult,)
+    _record_cpu_activity(
+        warp._src.utils.TIMING_KERNEL,
+        device,
+        f"{direction} kernel {kernel.key}",
+        start_ns,
+        dim=dim,
+        module=kernel.module.name,
+    )
+
+
+# launch statistics accumulated while `warp.config.collect_launch_stats` is enabled, keyed by
+# (module name, kernel key, device alias), as [launches, threads, pack_ns, kernel_ns, timed_launches] lists
+_launch_stats: dict[tuple[str, str, str], list[int]] = {}
+_launch_stats_lock = threading.Lock()
+
+
+def _record_launch_stats(kernel, device, size: int, pack_ns: int, kernel_ns: int | None):
+    key = (kernel.module.name, kernel.key, device.alias)
+    with _launch_stats_lock:
+        entry = _launch_stats.get(key)
+        if entry is None:
+            entry = _launch_stats[key] = [0, 0, 0, 0, 0]
+        entry[0] += 1
+        entry[1] += size
+        entry[2] += pack_ns
+        if kernel_ns is not None:
+            entry[3] += kernel_ns
+            entry[4] += 1
+
+
 # invoke a CPU kernel by passing the parameters as a ctypes structure
 def invoke(kernel, hooks, params: Sequence[Any], adjoint: bool):
     # Build cache key from parameter types
@@ -9898,12 +10470,12 @@ def invoke(kernel, hooks, params: Sequence[Any], adjoint: bool):
             setattr(args, field[0], params[1 + i])
 
         if not adjoint:
-            hooks.forward(ctypes.byref(params[0]), ctypes.byref(args))
+            _invoke_cpu_forward(hooks, params[0], args)
         else:
             adj_args = AdjArgsStruct()
             for i, field in enumerate(adj_fields):
                 setattr(adj_args, field[0], params[1 + len(fields) + i])
-            hooks.backward(ctypes.byref(params[0]), ctypes.byref(args), ctypes.byref(adj_args))
+            _invoke_cpu_backward(hooks, params[0], args, adj_args)
         return
 
     # Slow path: build struct types and cache them
@@ -9922,7 +10494,7 @@ def invoke(kernel, hooks, params: Sequence[Any], adjoint: bool):
 
     if not adjoint:
         kernel._invoke_cache[cache_key] = (ArgsStruct, fields)
-        hooks.forward(ctypes.byref(params[0]), ctypes.byref(args))
+        _invoke_cpu_forward(hooks, params[0], args)
 
     # for adjoint kernels the adjoint arguments are passed through a second struct
     else:
@@ -9941,7 +10513,39 @@ def invoke(kernel, hooks, params: Sequence[Any], adjoint: bool):
             setattr(adj_args, name, params[1 + len(fields) + i])
 
         kernel._invoke_cache[cache_key] = (ArgsStruct, AdjArgsStruct, fields, adj_fields)
-        hooks.backward(ctypes.byref(params[0]), ctypes.byref(args), ctypes.byref(adj_args))
+        _invoke_cpu_backward(hooks, params[0], args, adj_args)
+
+
+def _invoke_cpu_forward(hooks, bounds, args):
+    num_threads = warp.config.cpu_num_threads
+    if num_threads != 1 and hooks.forward_range is not None:
+        runtime.core.wp_cpu_launch_kernel_range(
+            hooks.forward_range,
+            ctypes.byref(bounds),
+            ctypes.byref(args),
+            None,
+            bounds.size,
+            num_threads,
+            warp.config.cpu_chunk_size,
+        )
+    else:
+        hooks.forward(ctypes.byref(bounds), ctypes.byref(args))
+
+
+def _invoke_cpu_backward(hooks, bounds, args, adj_args):
+    num_threads = warp.config.cpu_num_threads
+    if num_threads != 1 and hooks.backward_range is not None:
+        runtime.core.wp_cpu_launch_kernel_range(
+            hooks.backward_range,
+            ctypes.byref(bounds),
+            ctypes.byref(args),
+            ctypes.byref(adj_args),
+            bounds.size,
+            num_threads,
+            warp.config.cpu_chunk_size,
+        )
+    else:
+        hooks.backward(ctypes.byref(bounds), ctypes.byref(args), ctypes.byref(adj_args))
 
 
 def _build_cuda_kernel_params(params: Sequence[Any]):
@@ -9949,6 +10553,27 @@ def _build_cuda_kernel_params(params: Sequence[Any]):
     return (ctypes.c_void_p * len(kernel_args))(*kernel_args)
 
 
+def _apic_register_cpu_kernel(apic_capture, kernel: Kernel, module_exec, hooks: KernelHooks) -> None:
+    """Register the entry points of a CPU kernel with an APIC capture for byte-stream replay.
+
+    The range entry points are only available for kernels that can run on several
+    threads, which also lets concurrent graph replays overlap their launches with
+    other launches (see :attr:`warp.config.cpu_graph_serial_replay`).
+    """
+    key = (kernel.key if isinstance(kernel.key, str) else kernel.key.decode("utf-8")).encode("utf-8")
+    module_hash = apic_capture._hash_to_str(module_exec.module_hash).encode("utf-8")
+    runtime.core.wp_apic_register_cpu_kernel(
+        apic_capture.apic_state,
+        key,
+        module_hash,
+        ctypes.cast(hooks.forward, ctypes.c_void_p) if hooks.forward else None,
+        ctypes.cast(hooks.backward, ctypes.c_void_p) if hooks.backward else None,
+    )
+    runtime.core.wp_apic_register_cpu_kernel_range(
+        apic_capture.apic_state, key, module_hash, hooks.forward_range, hooks.backward_range
+    )
+
+
 def _raise_cuda_launch_error(kernel: Kernel, device: Device) -> None:
     """Raise a RuntimeError describing a failed CUDA kernel launch.
 
@@ -10063,6 +10688,87 @@ class Launch:
         self.fwd_args = fwd_args
         self.adj_args = adj_args
 
+        # native command used by launch_batch(), rebuilt when the launch changes
+        self._batch_command = None
+        self._batch_state = None
+
+        self._build_param_buffers()
+
+    def _build_param_buffers(self):
+        """Pack the kernel parameters into persistent buffers and resolve their slots.
+
+        On the CPU the buffers are the ``ArgsStruct`` (and ``AdjArgsStruct``) instances
+        passed to the kernel entry point, on CUDA they form a single block that
+        ``params_addr`` points into. Every non-struct entry of ``params`` is replaced
+        by a view of its slot, so updating a parameter is a single write into the
+        buffer and replaying the launch does not re-pack any arguments.
+
+        Struct parameters keep referencing their ``wp.struct`` instance so that
+        in-place edits of its fields are picked up by the next launch.
+        """
+        params = self.params
+        slots = [None] * len(params)
+        struct_refresh = []
+
+        if self.device.is_cpu:
+            buffers = _build_cpu_args_structs(self.kernel, self.hooks, params, self.adjoint)
+            num_args = len(self.kernel.adj.args)
+            for i in range(1, len(params)):
+                buf = buffers[(i - 1) // num_args]
+                label = self.kernel.adj.args[(i - 1) % num_args].label
+                if self._is_struct_param(i):
+                    struct_refresh.append((buf, label, i))
+                else:
+                    slots[i] = (buf, label, type(params[i]))
+        else:
+            indices = [i for i in range(1, len(params)) if not self._is_struct_param(i)]
+            ParamBlock = type(
+                "ParamBlock", (ctypes.Structure,), {"_fields_": [(f"p{i}", type(params[i])) for i in indices]}
+            )
+            buf = ParamBlock()
+            buffers = (buf,)
+            for i in indices:
+                setattr(buf, f"p{i}", params[i])
+                slots[i] = (buf, f"p{i}", type(params[i]))
+
+        for i, slot in enumerate(slots):
+            if slot is not None:
+                buf, name, ctype = slot
+                params[i] = ctype.from_buffer(buf, getattr(type(buf), name).offset)
+                if self.params_addr:
+                    self.params_addr[i] = ctypes.c_void_p(ctypes.addressof(params[i]))
+
+        self._param_buffers = buffers
+        self._param_slots = slots
+        self._struct_refresh = struct_refresh
+
+    def _refresh_struct_params(self):
+        # struct arguments are updated in place through their ``wp.struct`` instances
+        params = self.params
+        for buf, label, params_index in self._struct_refresh:
+            setattr(buf, label, params[params_index])
+
+    def _is_struct_param(self, params_index: int) -> bool:
+        num_args = len(self.kernel.adj.args)
+        return isinstance(self.kernel.adj.args[(params_index - 1) % num_args].type, warp._src.codegen.Struct)
+
+    def _write_param(self, params_index: int, carg: Any):
+        """Store a packed parameter value, writing it directly into its slot when possible."""
+        slot = self._param_slots[params_index]
+        if slot is not None and slot[2] is type(carg):
+            setattr(slot[0], slot[1], carg)
+            return
+
+        self.params[params_index] = carg
+
+        if slot is None:
+            # struct parameter, the buffers read it through ``params`` on each launch
+            if self.params_addr:
+                self.params_addr[params_index] = ctypes.c_void_p(ctypes.addressof(carg))
+        else:
+            # the packed type changed, so the slot layout must be resolved again
+            self._build_param_buffers()
+
     def set_dim(self, dim: int | list[int] | tuple[int, ...]):
         """Set the launch dimensions.
 
@@ -10121,11 +10827,7 @@ class Launch:
         else:
             params_index = index + 1
 
-        self.params[params_index] = carg
-
-        # for CUDA kernels we need to update the address to each arg
-        if self.params_addr:
-            self.params_addr[params_index] = ctypes.c_void_p(ctypes.addressof(carg))
+        self._write_param(params_index, carg)
 
         # Keep the retained original args in sync with the packed params. Under an
         # APIC capture, build_launch_info derives data-pointer relocations from the
@@ -10158,14 +10860,9 @@ class Launch:
             params_index = index + 1
 
         if isinstance(value, ctypes.Structure):
-            # not sure how to directly assign struct->struct without reallocating using ctypes
-            self.params[params_index] = value
-
-            # for CUDA kernels we need to update the address to each arg
-            if self.params_addr:
-                self.params_addr[params_index] = ctypes.c_void_p(ctypes.addressof(value))
-
+            self._write_param(params_index, value)
         else:
+            # scalars are written in place into their slot of the parameter buffer
             self.params[params_index].__init__(value)
 
         # Keep fwd_args in sync so _apic_record_cpu() does not see a stale warp
@@ -10220,6 +10917,49 @@ class Launch:
         for i, v in enumerate(values):
             self.set_param_at_index_from_ctype(i, v)
 
+    def _get_batch_command(self) -> launch_command_t:
+        """Return the native command that replays this launch in :func:`launch_batch`.
+
+        The command is cached until the parameters, the launch bounds, or the launch
+        configuration change.
+        """
+        state = (self.bounds, self._param_buffers, self.max_blocks, self.block_dim, self.adjoint)
+        if self._batch_command is not None and self._batch_state == state:
+            self._refresh_struct_params()
+            return self._batch_command
+
+        command = launch_command_t()
+        command.dim = self.bounds.size
+
+        if self.device.is_cpu:
+            self._refresh_struct_params()
+            args, adj_args = self._param_buffers
+            if self.adjoint:
+                command.kernel = ctypes.cast(self.hooks.backward, ctypes.c_void_p).value
+                command.kernel_range = self.hooks.backward_range
+                command.adj_args = ctypes.addressof(adj_args)
+            else:
+                command.kernel = ctypes.cast(self.hooks.forward, ctypes.c_void_p).value
+                command.kernel_range = self.hooks.forward_range
+            command.bounds = ctypes.addressof(self.bounds)
+            command.args = ctypes.addressof(args)
+        else:
+            if self.adjoint:
+                command.kernel = self.hooks.backward
+                command.shared_memory_bytes = self.hooks.backward_smem_bytes
+            else:
+                command.kernel = self.hooks.forward
+                command.shared_memory_bytes = self.hooks.forward_smem_bytes
+            command.args = ctypes.addressof(self.params_addr)
+            command.max_blocks = self.max_blocks
+            command.block_dim = self.block_dim
+            command.grid_stride = int(self.grid_stride)
+            command.cluster_dim = self.cluster_dim
+
+        self._batch_command = command
+        self._batch_state = state
+        return command
+
     def _apic_record_cpu(self) -> None:
         """Record this launch as an APIC_OP_KERNEL_LAUNCH during a CPU capture.
 
@@ -10245,15 +10985,7 @@ class Launch:
             adj_args=self.adj_args if self.adjoint else None,
         )
         func = self.hooks.backward if self.adjoint else self.hooks.forward
-        key_str = self.kernel.key if isinstance(self.kernel.key, str) else self.kernel.key.decode("utf-8")
-        module_hash_str = apic_capture._hash_to_str(self.module_exec.module_hash)
-        runtime.core.wp_apic_register_cpu_kernel(
-            apic_capture.apic_state,
-            key_str.encode("utf-8"),
-            module_hash_str.encode("utf-8"),
-            ctypes.cast(self.hooks.forward, ctypes.c_void_p) if self.hooks.forward else None,
-            ctypes.cast(self.hooks.backward, ctypes.c_void_p) if self.hooks.backward else None,
-        )
+        _apic_register_cpu_kernel(apic_capture, self.kernel, self.module_exec, self.hooks)
         runtime.core.wp_cpu_launch_kernel(
             ctypes.cast(func, ctypes.c_void_p),
             ctypes.byref(self.bounds),
@@ -10268,6 +11000,10 @@ class Launch:
         Args:
             stream: The stream to launch on.
         """
+        stats_start_ns = time.perf_counter_ns() if warp.config.collect_launch_stats else 0
+        pack_ns = 0
+        kernel_ns = None
+
         apic_capture = _get_apic_capture_for_device(self.device)
         if self.device.is_cpu:
             if apic_capture is not None:
@@ -10282,8 +11018,20 @@ class Launch:
                         "Use wp.launch() to create a capturable launch command."
                     )
                 self._apic_record_cpu()
+                if stats_start_ns:
+                    pack_ns = time.perf_counter_ns() - stats_start_ns
             else:
-                invoke(self.kernel, self.hooks, self.params, self.adjoint)
+                self._refresh_struct_params()
+                start_ns = time.perf_counter_ns() if stats_start_ns or _cpu_timing_state is not None else 0
+                if self.adjoint:
+                    _invoke_cpu_backward(self.hooks, self.bounds, *self._param_buffers)
+                else:
+                    _invoke_cpu_forward(self.hooks, self.bounds, self._param_buffers[0])
+                if start_ns:
+                    kernel_ns = time.perf_counter_ns() - start_ns
+                    pack_ns = start_ns - stats_start_ns
+                    if _cpu_timing_state is not None:
+                        _record_cpu_launch(self.kernel, self.bounds, self.adjoint, self.device, start_ns)
         else:
             if stream is None:
                 stream = self.device.stream
@@ -10316,6 +11064,9 @@ class Launch:
                 )
                 apic_info_ptr = ctypes.byref(apic_info)
 
+            if stats_start_ns:
+                pack_ns = time.perf_counter_ns() - stats_start_ns
+
             if self.adjoint:
                 if runtime.core.wp_cuda_launch_kernel(
                     self.device.context,
@@ -10347,6 +11098,9 @@ class Launch:
                 ):
                     _raise_cuda_launch_error(self.kernel, self.device)
 
+        if stats_start_ns:
+            _record_launch_stats(self.kernel, self.device, self.bounds.size, pack_ns, kernel_ns)
+
 
 def _cuda_grid_blocks(total_dim_size: int, block_dim: int) -> int:
     """Number of thread blocks a launch of ``total_dim_size`` threads needs at ``block_dim``.
@@ -10585,6 +11339,9 @@ def launch(
                     f"@wp.kernel(grid_stride=True) to launch dimensions this large."
                 )
 
+        stats_start_ns = time.perf_counter_ns() if warp.config.collect_launch_stats else 0
+        kernel_ns = None
+
         bounds = _build_launch_bounds_from_tuple(dim, kernel.adj.kernel_dim)
 
         # first param is the number of threads
@@ -10604,6 +11361,9 @@ def launch(
         pack_args(fwd_args, params, adjoint=False)
         pack_args(adj_args, params, adjoint=True)
 
+        if stats_start_ns:
+            pack_ns = time.perf_counter_ns() - stats_start_ns
+
         # Deterministic mode: redirect to the launcher that supplies the hidden
         # deterministic buffers. Backward kernels use the same path so generated
         # tape adjoints can reduce gradient atomics in a fixed order.
@@ -10711,15 +11471,7 @@ def launch(
                 )
                 func = hooks.backward if adjoint else hooks.forward
                 # Register kernel function pointer for byte-stream replay
-                key_str = kernel.key if isinstance(kernel.key, str) else kernel.key.decode("utf-8")
-                module_hash_str = apic_capture._hash_to_str(module_exec.module_hash)
-                runtime.core.wp_apic_register_cpu_kernel(
-                    apic_capture.apic_state,
-                    key_str.encode("utf-8"),
-                    module_hash_str.encode("utf-8"),
-                    ctypes.cast(hooks.forward, ctypes.c_void_p) if hooks.forward else None,
-                    ctypes.cast(hooks.backward, ctypes.c_void_p) if hooks.backward else None,
-                )
+                _apic_register_cpu_kernel(apic_capture, kernel, module_exec, hooks)
                 runtime.core.wp_cpu_launch_kernel(
                     ctypes.cast(func, ctypes.c_void_p),
                     ctypes.byref(bounds),
@@ -10728,7 +11480,12 @@ def launch(
                     ctypes.byref(apic_info),
                 )
             else:
+                start_ns = time.perf_counter_ns() if stats_start_ns or _cpu_timing_state is not None else 0
                 invoke(kernel, hooks, params, adjoint)
+                if start_ns:
+                    kernel_ns = time.perf_counter_ns() - start_ns
+                    if _cpu_timing_state is not None:
+                        _record_cpu_launch(kernel, bounds, adjoint, device, start_ns)
 
         else:
             kernel_args = [ctypes.c_void_p(ctypes.addressof(x)) for x in params]
@@ -10861,6 +11618,9 @@ def launch(
                 log_error(f"Error launching kernel: {kernel.key} on device {device}: {e}")
                 raise
 
+        if stats_start_ns:
+            _record_launch_stats(kernel, device, total_dim_size, pack_ns, kernel_ns)
+
     # record on tape if one is active
     if runtime.tape and record_tape:
         # record file, lineno, func as metadata
@@ -10935,6 +11695,95 @@ def launch_tiled(*args, **kwargs):
     return launch(*args, **kwargs)
 
 
+def launch_batch(launches: Sequence[Launch], stream: Stream | None = None) -> None:
+    """Replay a sequence of recorded launches with a single call into the native runtime.
+
+    The launches are executed in order, with the same result as calling
+    :meth:`Launch.launch` on each of them, but the per-launch argument packing is
+    cached on the :class:`Launch` objects and the whole sequence is submitted to
+    the device at once. This reduces the Python overhead of programs that issue
+    many small launches every step.
+
+    .. code-block:: python
+
+        cmds = [
+            wp.launch(integrate, dim=n, inputs=[x, v, dt], record_cmd=True),
+            wp.launch(collide, dim=n, inputs=[x, v], record_cmd=True),
+        ]
+
+        for _ in range(steps):
+            wp.launch_batch(cmds)
+
+    Parameters updated with :meth:`Launch.set_param_at_index` and similar methods
+    or :meth:`Launch.set_dim` between calls are picked up by the next batch.
+
+    While CPU activities are timed with :func:`warp.timing_begin` or launch statistics are collected,
+    CPU batches are executed one launch at a time so that each kernel is timed separately.
+
+    Args:
+        launches: The launch objects, recorded with ``wp.launch(..., record_cmd=True)``.
+            All launches must target the same device.
+        stream: The CUDA stream to launch on. Defaults to the current stream of the device.
+            Ignored for CPU launches.
+
+    Raises:
+        ValueError: If the launches target different devices.
+        RuntimeError: If a CUDA kernel launch fails.
+    """
+    count = len(launches)
+    if count == 0:
+        return
+
+    device = launches[0].device
+    for cmd in launches:
+        if cmd.device != device:
+            raise ValueError(f"All launches in a batch must target the same device, got '{device}' and '{cmd.device}'")
+
+    stats_start_ns = time.perf_counter_ns() if warp.config.collect_launch_stats else 0
+
+    # launches recorded into an APIC capture need their per-launch metadata,
+    # and timed CPU kernels each need their own record
+    if _get_apic_capture_for_device(device) is not None or (
+        device.is_cpu and (stats_start_ns or _cpu_timing_state is not None)
+    ):
+        for cmd in launches:
+            cmd.launch(stream)
+        return
+
+    commands = (launch_command_t * count)()
+    for i, cmd in enumerate(launches):
+        commands[i] = cmd._get_batch_command()
+
+    if device.is_cpu:
+        runtime.core.wp_cpu_launch_kernel_batch(
+            commands, count, warp.config.cpu_num_threads, warp.config.cpu_chunk_size
+        )
+        return
+
+    if stream is None:
+        stream = device.stream
+
+    # retain the CUDA modules so that they don't get unloaded before a captured graph is released
+    if len(runtime.captures) > 0 and runtime.core.wp_cuda_stream_is_capturing(stream.cuda_stream):
+        capture_id = runtime.core.wp_cuda_stream_get_capture_id(stream.cuda_stream)
+        graph = runtime.captures.get(capture_id)
+        if graph is not None:
+            for cmd in launches:
+                graph._retain_module_exec(cmd.module_exec)
+
+    pack_ns = time.perf_counter_ns() - stats_start_ns if stats_start_ns else 0
+
+    failed = runtime.core.wp_cuda_launch_kernel_batch(device.context, commands, count, stream.cuda_stream)
+    if failed >= 0:
+        _raise_cuda_launch_error(launches[failed].kernel, device)
+
+    if stats_start_ns:
+        # the time spent preparing the batch is shared evenly between its launches
+        for i, cmd in enumerate(launches):
+            launch_pack_ns = pack_ns * (i + 1) // count - pack_ns * i // count
+            _record_launch_stats(cmd.kernel, device, cmd.bounds.size, launch_pack_ns, None)
+
+
 def get_suggested_block_size(kernel, device: DeviceLike = None) -> tuple[int, int]:
     """Suggest a CUDA block size that maximizes occupancy for a kernel.
 
@@ -12590,6 +13439,13 @@ def capture_while(condition: warp.array[int], while_body: Callable | Graph, stre
         )
 
 
+def _cpu_graph_replay_threads() -> int:
+    # concurrent replay follows the CPU launch configuration unless it is disabled for debugging
+    if warp.config.cpu_graph_serial_replay:
+        return 1
+    return warp.config.cpu_num_threads
+
+
 def capture_launch(graph: Graph, stream: Stream | None = None):
     """Launch a previously captured graph.
 
@@ -12605,7 +13461,9 @@ def capture_launch(graph: Graph, stream: Stream | None = None):
     if graph._native_graph is not None:
         # CPU loaded graph: replay directly from byte stream
         if graph.device.is_cpu:
-            if not runtime.core.wp_apic_cpu_replay_graph(graph._native_graph):
+            if not runtime.core.wp_apic_cpu_replay_graph_concurrent(
+                graph._native_graph, _cpu_graph_replay_threads(), warp.config.cpu_chunk_size
+            ):
                 raise RuntimeError(f"CPU graph replay failed: {runtime.get_error_string()}")
             return
 
@@ -12628,7 +13486,9 @@ def capture_launch(graph: Graph, stream: Stream | None = None):
 
     # ---- CPU graph path (live capture) ----
     if graph.device.is_cpu and graph.apic_state is not None:
-        if not runtime.core.wp_apic_cpu_replay_state(graph.apic_state):
+        if not runtime.core.wp_apic_cpu_replay_state_concurrent(
+            graph.apic_state, _cpu_graph_replay_threads(), warp.config.cpu_chunk_size
+        ):
             raise RuntimeError(f"CPU graph replay failed: {runtime.get_error_string() or 'no operations recorded'}")
         return
 
@@ -12789,11 +13649,23 @@ def capture_save(graph: Graph, path: str, inputs: dict | None = None, outputs: d
             # to resolve kernel shared-memory metadata. For CPU (APIC) modules,
             # _apic_load_cpu_modules resolves kernel names directly from the
             # C++ graph via wp_apic_get_kernel_forward_name / _backward_name,
-            # so copying .meta for CPU is harmless but unnecessary.
+            # and uses .meta only to decide which kernels may run multithreaded.
             meta_filename = os.path.splitext(binary_filename)[0] + ".meta"
-            meta_path = os.path.join(os.path.dirname(binary_path), meta_filename)
+            meta_path = os.path.join(os.path.dirname(binary_path), info["meta_filename"])
             if os.path.exists(meta_path):
                 shutil.copy2(meta_path, os.path.join(modules_dir, meta_filename))
+
+                if graph.device.is_cpu:
+                    # Record whether each kernel was loaded with range entry points, so that replay
+                    # threads the same kernels (e.g. deterministic scatter launches stay serial)
+                    with open(meta_path) as meta_file:
+                        meta = json.load(meta_file)
+                    for kernel_info in apic_capture.collected_kernels.values():
+                        if kernel_info["module_hash"] == info["module_hash"]:
+                            name = kernel_info["forward_name"].removesuffix("_cpu_forward")
+                            meta[name + "_cpu_kernel_threaded"] = kernel_info["cpu_threaded"]
+                    with open(os.path.join(modules_dir, meta_filename), "w") as meta_file:
+                        json.dump(meta, meta_file)
         else:
             raise RuntimeError(
                 f"APIC: Could not find compiled binary for module {info['module_name']} "
@@ -12866,6 +13738,7 @@ def _apic_load_cpu_modules(native_graph, wrp_path: str) -> list[str]:
 
     # Load all .o modules from the modules directory
     loaded_handles = {}  # binary filename -> handle string
+    loaded_metas = {}  # handle string -> module metadata
     if os.path.isdir(modules_dir):
         for filename in os.listdir(modules_dir):
             if filename.endswith(".o"):
@@ -12883,6 +13756,12 @@ def _apic_load_cpu_modules(native_graph, wrp_path: str) -> list[str]:
                 # The module hash is embedded in the filename (e.g. wp_name_hash.o)
                 loaded_handles[filename] = handle
 
+                # graphs saved without metadata replay every kernel serially
+                meta_path = os.path.join(modules_dir, os.path.splitext(filename)[0] + ".meta")
+                if os.path.exists(meta_path):
+                    with open(meta_path) as meta_file:
+                        loaded_metas[handle] = json.load(meta_file)
+
     # Query kernel metadata from the loaded C++ graph and resolve function pointers
     num_kernels = runtime.core.wp_apic_get_num_kernels(native_graph)
 
@@ -12932,6 +13811,25 @@ def _apic_load_cpu_modules(native_graph, wrp_path: str) -> list[str]:
                 ctypes.c_void_p(backward_fn) if backward_fn else None,
             )
 
+            # modules built for multithreaded launches export range entry points for the
+            # kernels that may run concurrently with other launches, same check as Module.load()
+            name = forward_name.decode("utf-8").removesuffix("_cpu_forward")
+            if not loaded_metas.get(handle, {}).get(name + "_cpu_kernel_threaded", False):
+                continue
+
+            forward_range_fn = runtime.llvm.wp_lookup(handle.encode("utf-8"), forward_name + b"_range")
+            backward_range_fn = (
+                runtime.llvm.wp_lookup(handle.encode("utf-8"), backward_name + b"_range") if backward_fn else 0
+            )
+            if forward_range_fn:
+                runtime.core.wp_apic_register_loaded_cpu_kernel_range(
+                    native_graph,
+                    kernel_key,
+                    module_hash,
+                    ctypes.c_void_p(forward_range_fn),
+                    ctypes.c_void_p(backward_range_fn) if backward_range_fn else None,
+                )
+
     return list(loaded_handles.values())
 
 
@@ -13134,7 +14032,10 @@ def copy(
                     src.device.context, dst_ptr, src_ptr, bytes_to_copy, stream.cuda_stream
                 )
             else:
+                start_ns = time.perf_counter_ns() if _cpu_timing_state is not None else 0
                 result = runtime.core.wp_memcpy_h2h(dst_ptr, src_ptr, bytes_to_copy)
+                if start_ns:
+                    _record_cpu_activity(warp._src.utils.TIMING_MEMCPY, dest.device, "memcpy HtoH", start_ns)
 
         if not result:
             raise RuntimeError(f"Warp copy error: {runtime.get_error_string()}")
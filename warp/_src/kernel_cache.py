@@ -0,0 +1,623 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Bookkeeping for the on-disk kernel cache.
+
+Every module variant compiled by :meth:`warp.Module.load` is stored in a ``wp_*``
+directory of :attr:`warp.config.kernel_cache_dir`. This module keeps an index of those
+directories with their size and last access time, so that the cache can be kept under
+:attr:`warp.config.kernel_cache_max_bytes` by evicting the least recently used module
+directories. The index is shared between processes and only modified while holding an
+exclusive lock on a file next to it.
+
+A :class:`KernelCacheBackend` set as :attr:`warp.config.kernel_cache_backend` acts as a
+second cache level behind the local directory: modules missing locally are fetched from
+it before compiling, and newly compiled modules are stored into it.
+
+The ``references`` directory of the cache keeps, for each function and kernel source, the
+reference nodes of its syntax tree that module hashing needs to resolve. A warm process start
+resolves those nodes only, instead of scanning every node of every adjoint, see
+:meth:`warp._src.codegen.Adjoint.get_references_from_recipe`.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+import threading
+import time
+from typing import Any
+
+import warp.config
+
+# index and lock file names, stored at the root of the versioned cache directory
+_INDEX_NAME = "cache_index.json"
+_LOCK_NAME = "cache_index.lock"
+
+# module directories used within this window are never evicted, so another process
+# that just found a module in the cache can finish loading it
+EVICTION_GRACE_PERIOD = 30.0
+
+# per-process build directories, see Module._compile()
+_BUILD_DIR_PATTERN = re.compile(r"_p\d+_t\d+$")
+
+# directory of the reference recipes, and version of their format
+_REFERENCES_DIR = "references"
+_REFERENCES_FORMAT = 1
+
+# recipes kept in each shard file, the least recently added ones are dropped first
+_REFERENCES_MAX_ENTRIES = 4096
+
+_stats_lock = threading.Lock()
+_stats = {
+    "hits": 0,
+    "misses": 0,
+    "backend_hits": 0,
+    "evictions": 0,
+    "evicted_bytes": 0,
+    "reference_hits": 0,
+    "reference_misses": 0,
+}
+
+# reference recipe shards read by this process, and recipes not written to disk yet, keyed by shard path
+_references_lock = threading.Lock()
+_reference_shards: dict[str, dict[str, Any]] = {}
+_pending_references: dict[str, dict[str, Any]] = {}
+
+# cumulative time in seconds spent in each phase of Module.load()
+_timings = {"hash": 0.0, "codegen": 0.0, "compile": 0.0, "load": 0.0}
+
+
+class KernelCacheBackend:
+    """Interface for a shared store of compiled modules, see :attr:`warp.config.kernel_cache_backend`.
+
+    Entries are content-addressed: keys have the form ``"<version>/<module_hash>/<file_name>"``,
+    where ``version`` is :attr:`warp.config.version`, ``module_hash`` is the full hexadecimal
+    hash of the module source and compile options, and ``file_name`` identifies the target
+    (e.g. ``"wp_my_module_1a2b3c4.sm86.cubin"`` or ``"wp_my_module_1a2b3c4.meta"``). A key is
+    therefore always associated with the same content, and implementations never need to
+    handle updates or invalidation. Different Warp versions never share entries, since their
+    binaries are not guaranteed to be compatible.
+
+    Implementations must be safe to use from several threads and processes at once.
+    Exceptions raised by the backend are reported as warnings and treated as cache misses.
+    """
+
+    def get(self, key: str) -> bytes | None:
+        """Return the content stored under ``key``, or ``None`` if there is none."""
+        raise NotImplementedError
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store ``data`` under ``key``."""
+        raise NotImplementedError
+
+
+class LocalDirectoryCacheBackend(KernelCacheBackend):
+    """Kernel cache backend storing entries as files of a directory.
+
+    The directory can be a shared or network mount used by several machines. Entries are
+    written to a temporary file and renamed into place, so readers never observe partially
+    written entries.
+
+    Args:
+        path: Root directory of the store, created on first write if needed.
+        read_only: If ``True``, :meth:`put` does nothing, e.g. for a prepopulated read-only mount.
+    """
+
+    def __init__(self, path: str | os.PathLike, read_only: bool = False):
+        self.path = os.fspath(path)
+        self.read_only = read_only
+
+    def _entry_path(self, key: str) -> str:
+        parts = key.split("/")
+        if len(parts) < 2 or any(part in ("", ".", "..") or "\\" in part for part in parts):
+            raise ValueError(f"Invalid kernel cache key '{key}'")
+        return os.path.join(self.path, *parts)
+
+    def get(self, key: str) -> bytes | None:
+        try:
+            with open(self._entry_path(key), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, data: bytes) -> None:
+        if self.read_only:
+            return
+
+        entry_path = self._entry_path(key)
+        if os.path.exists(entry_path):
+            # content-addressed, an existing entry is identical
+            return
+
+        os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+        tmp_path = f"{entry_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, entry_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def __repr__(self):
+        return f"LocalDirectoryCacheBackend({self.path!r}, read_only={self.read_only})"
+
+
+@contextlib.contextmanager
+def _index_lock(cache_dir: str):
+    """Hold an exclusive inter-process lock on the cache index of ``cache_dir``."""
+    with open(os.path.join(cache_dir, _LOCK_NAME), "a+b") as lock_file:
+        if os.name == "nt":
+            import msvcrt  # noqa: PLC0415
+
+            lock_file.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # LK_LOCK gives up after ~10 seconds, keep waiting
+                    continue
+            try:
+                yield
+            finally:
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            import fcntl  # noqa: PLC0415
+
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def _read_index(cache_dir: str) -> dict[str, dict[str, Any]]:
+    try:
+        with open(os.path.join(cache_dir, _INDEX_NAME)) as f:
+            index = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError, UnicodeDecodeError, OSError):
+        return {}
+
+    if not isinstance(index, dict):
+        return {}
+
+    return {
+        name: entry
+        for name, entry in index.items()
+        if isinstance(entry, dict)
+        and isinstance(entry.get("size"), int)
+        and isinstance(entry.get("last_access"), (int, float))
+    }
+
+
+def _write_index(cache_dir: str, index: dict[str, dict[str, Any]]) -> None:
+    index_path = os.path.join(cache_dir, _INDEX_NAME)
+    tmp_path = f"{index_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(index, f)
+    os.replace(tmp_path, index_path)
+
+
+def _directory_size(path: str) -> int:
+    size = 0
+    for root, _dirs, files in os.walk(path):
+        for name in files:
+            try:
+                size += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                # file removed concurrently
+                pass
+    return size
+
+
+def _is_module_dir(cache_dir: str, name: str) -> bool:
+    return (
+        name.startswith("wp_") and not _BUILD_DIR_PATTERN.search(name) and os.path.isdir(os.path.join(cache_dir, name))
+    )
+
+
+def _reconcile_index(cache_dir: str, index: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    """Synchronize ``index`` with the module directories present on disk.
+
+    Drops entries whose directory was removed, adds directories that are not indexed yet
+    (e.g. created by an older Warp release), and refreshes access times from the
+    directory modification times, which cache hits update without taking the lock.
+    """
+    try:
+        names = os.listdir(cache_dir)
+    except OSError:
+        return {}
+
+    reconciled = {}
+    for name in names:
+        if not _is_module_dir(cache_dir, name):
+            continue
+
+        path = os.path.join(cache_dir, name)
+        try:
+            mtime = os.stat(path).st_mtime
+        except OSError:
+            continue
+
+        entry = index.get(name)
+        if entry is None:
+            entry = {"size": _directory_size(path), "last_access": float(mtime)}
+        else:
+            entry = {"size": entry["size"], "last_access": max(entry["last_access"], float(mtime))}
+
+        reconciled[name] = entry
+
+    return reconciled
+
+
+def _remove_module_dir(cache_dir: str, name: str) -> bool:
+    path = os.path.join(cache_dir, name)
+    # rename first so that other processes never observe a partially deleted module
+    trash_path = f"{path}_evicted_p{os.getpid()}_t{threading.get_ident()}"
+    try:
+        os.rename(path, trash_path)
+    except OSError:
+        return False
+    shutil.rmtree(trash_path, ignore_errors=True)
+    return True
+
+
+def _evict(
+    cache_dir: str,
+    index: dict[str, dict[str, Any]],
+    max_bytes: int,
+    protected: set[str],
+    grace_period: float,
+) -> None:
+    total = sum(entry["size"] for entry in index.values())
+    if total <= max_bytes:
+        return
+
+    now = time.time()
+    for name, entry in sorted(index.items(), key=lambda item: item[1]["last_access"]):
+        if total <= max_bytes:
+            break
+        if name in protected or now - entry["last_access"] < grace_period:
+            continue
+
+        if _remove_module_dir(cache_dir, name):
+            total -= entry["size"]
+            del index[name]
+
+            with _stats_lock:
+                _stats["evictions"] += 1
+                _stats["evicted_bytes"] += entry["size"]
+
+
+def record_load_timings(timings: dict[str, float]) -> None:
+    """Accumulate the phase timings in seconds of a module load."""
+    with _stats_lock:
+        for phase, seconds in timings.items():
+            _timings[phase] += seconds
+
+
+def record_hit(module_dir: str) -> None:
+    """Record that a module was found in the cache."""
+    with _stats_lock:
+        _stats["hits"] += 1
+
+    # bump the directory modification time instead of rewriting the shared index on every
+    # hit, the index picks it up the next time it is reconciled
+    try:
+        os.utime(module_dir)
+    except OSError:
+        pass
+
+
+def _update_index(module_dir: str) -> None:
+    """Record the current size of ``module_dir`` in the index, then enforce the size limit."""
+    cache_dir = os.path.dirname(os.path.normpath(module_dir))
+    name = os.path.basename(os.path.normpath(module_dir))
+
+    try:
+        with _index_lock(cache_dir):
+            index = _read_index(cache_dir)
+            index[name] = {"size": _directory_size(module_dir), "last_access": time.time()}
+
+            max_bytes = warp.config.kernel_cache_max_bytes
+            if max_bytes is not None:
+                index = _reconcile_index(cache_dir, index)
+                _evict(cache_dir, index, max_bytes, protected={name}, grace_period=EVICTION_GRACE_PERIOD)
+
+            _write_index(cache_dir, index)
+    except OSError as e:
+        from warp._src.logger import log_warning  # noqa: PLC0415
+
+        log_warning(f"Could not update the kernel cache index in '{cache_dir}': {e}", once=True)
+
+
+def _backend_key(module_hash: bytes, file_name: str) -> str:
+    return f"{warp.config.version}/{module_hash.hex()}/{file_name}"
+
+
+def record_store(module_dir: str, file_names: list[str], module_hash: bytes | None = None) -> None:
+    """Record that a module variant was compiled into ``module_dir``.
+
+    The given files of the module directory are also uploaded to the configured
+    :attr:`warp.config.kernel_cache_backend`, if any, under keys derived from ``module_hash``.
+    """
+    with _stats_lock:
+        _stats["misses"] += 1
+
+    backend = warp.config.kernel_cache_backend
+    if backend is not None and module_hash is not None:
+        for file_name in file_names:
+            key = _backend_key(module_hash, file_name)
+            try:
+                with open(os.path.join(module_dir, file_name), "rb") as f:
+                    data = f.read()
+                backend.put(key, data)
+            except Exception as e:
+                from warp._src.logger import log_warning  # noqa: PLC0415
+
+                log_warning(f"Could not store '{key}' in kernel cache backend {backend!r}: {e}")
+
+    _update_index(module_dir)
+
+
+def fetch_from_backend(module_dir: str, file_names: list[str], module_hash: bytes) -> bool:
+    """Try to populate ``module_dir`` with the given files from :attr:`warp.config.kernel_cache_backend`.
+
+    The files are looked up under keys derived from ``module_hash``.
+
+    Returns:
+        ``True`` if every file is present in ``module_dir`` afterwards.
+    """
+    backend = warp.config.kernel_cache_backend
+    if backend is None:
+        return False
+
+    # fetch everything before writing anything, so a partial entry never lands in the cache
+    contents = {}
+    for file_name in file_names:
+        if os.path.exists(os.path.join(module_dir, file_name)):
+            continue
+
+        key = _backend_key(module_hash, file_name)
+        try:
+            data = backend.get(key)
+        except Exception as e:
+            from warp._src.logger import log_warning  # noqa: PLC0415
+
+            log_warning(f"Could not fetch '{key}' from kernel cache backend {backend!r}: {e}")
+            return False
+
+        if data is None:
+            return False
+
+        contents[file_name] = data
+
+    os.makedirs(module_dir, exist_ok=True)
+    for file_name, data in contents.items():
+        file_path = os.path.join(module_dir, file_name)
+        tmp_path = f"{file_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, file_path)
+
+    with _stats_lock:
+        _stats["backend_hits"] += 1
+
+    _update_index(module_dir)
+
+    return True
+
+
+def trim_kernel_cache(max_bytes: int | None = None, grace_period: float = EVICTION_GRACE_PERIOD) -> None:
+    """Evict least recently used module directories until the kernel cache fits in ``max_bytes``.
+
+    Compiling a module only enforces :attr:`warp.config.kernel_cache_max_bytes` after adding
+    it to the cache. This function enforces a budget on demand, e.g. at application startup
+    or from a maintenance job running on a shared cache directory.
+
+    Args:
+        max_bytes: Size budget in bytes. Defaults to :attr:`warp.config.kernel_cache_max_bytes`;
+            nothing is evicted if both are ``None``.
+        grace_period: Module directories used within this many seconds are kept, so that
+            other processes can finish loading the modules they just found in the cache.
+    """
+    warp._src.context.init()
+
+    if max_bytes is None:
+        max_bytes = warp.config.kernel_cache_max_bytes
+
+    cache_dir = warp.config.kernel_cache_dir
+    with _index_lock(cache_dir):
+        index = _reconcile_index(cache_dir, _read_index(cache_dir))
+        if max_bytes is not None:
+            _evict(cache_dir, index, max_bytes, protected=set(), grace_period=grace_period)
+        _write_index(cache_dir, index)
+
+
+def reference_recipe_key(source: str) -> str:
+    """Return the key of the reference recipe of a function or kernel source.
+
+    Recipes index the reference nodes of the syntax tree parsed from ``source``, so the key
+    covers the Python version along with the Warp version and the recipe format.
+    """
+    ch = hashlib.sha256()
+    ch.update(f"{_REFERENCES_FORMAT}:{warp.config.version}:{sys.version_info[0]}.{sys.version_info[1]}:".encode())
+    ch.update(source.encode())
+    return ch.hexdigest()
+
+
+def _reference_shard_path(filename: str) -> str | None:
+    if not warp.config.cache_kernels or warp.config.kernel_cache_dir is None:
+        return None
+
+    # recipes are sharded by source file, so a process only reads the recipes of the files it uses
+    name = hashlib.sha256(filename.encode()).hexdigest()[:16]
+    return os.path.join(warp.config.kernel_cache_dir, _REFERENCES_DIR, f"{name}.json")
+
+
+def _is_valid_reference_recipe(entry: Any) -> bool:
+    return (
+        isinstance(entry, dict)
+        and isinstance(entry.get("kernel_dim"), int)
+        and isinstance(entry.get("nodes"), list)
+        and all(
+            isinstance(node, list) and len(node) == 2 and isinstance(node[0], int) and isinstance(node[1], bool)
+            for node in entry["nodes"]
+        )
+    )
+
+
+def _read_reference_shard(shard_path: str) -> dict[str, Any]:
+    try:
+        with open(shard_path) as f:
+            shard = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError, UnicodeDecodeError, OSError):
+        return {}
+
+    if not isinstance(shard, dict):
+        return {}
+
+    return {key: entry for key, entry in shard.items() if _is_valid_reference_recipe(entry)}
+
+
+def get_reference_recipe(filename: str, key: str) -> dict[str, Any] | None:
+    """Return the reference recipe stored under ``key`` for a source of ``filename``.
+
+    Returns:
+        A dictionary with the ``"nodes"`` recorded by :meth:`warp._src.codegen.Adjoint.get_references`
+        and the ``"kernel_dim"`` of the source, or ``None`` if the cache has no valid recipe.
+    """
+    shard_path = _reference_shard_path(filename)
+    if shard_path is None:
+        return None
+
+    with _references_lock:
+        shard = _reference_shards.get(shard_path)
+        if shard is None:
+            shard = _reference_shards[shard_path] = _read_reference_shard(shard_path)
+        entry = shard.get(key)
+
+    with _stats_lock:
+        _stats["reference_hits" if entry is not None else "reference_misses"] += 1
+
+    return entry
+
+
+def put_reference_recipe(filename: str, key: str, nodes: list, kernel_dim: int) -> None:
+    """Add a reference recipe, written to disk by the next :func:`flush_reference_recipes`."""
+    shard_path = _reference_shard_path(filename)
+    if shard_path is None:
+        return
+
+    entry = {"nodes": nodes, "kernel_dim": kernel_dim}
+    with _references_lock:
+        _reference_shards.setdefault(shard_path, {})[key] = entry
+        _pending_references.setdefault(shard_path, {})[key] = entry
+
+
+def flush_reference_recipes() -> None:
+    """Merge the reference recipes added by this process into their shard files."""
+    with _references_lock:
+        if not _pending_references:
+            return
+        pending = dict(_pending_references)
+        _pending_references.clear()
+
+    for shard_path, entries in pending.items():
+        try:
+            os.makedirs(os.path.dirname(shard_path), exist_ok=True)
+
+            # recipes are pure functions of their key, so merging without a lock at worst
+            # loses the recipes written concurrently by another process
+            shard = _read_reference_shard(shard_path)
+            for key in entries:
+                shard.pop(key, None)
+            shard.update(entries)
+            if len(shard) > _REFERENCES_MAX_ENTRIES:
+                shard = dict(list(shard.items())[-_REFERENCES_MAX_ENTRIES:])
+
+            tmp_path = f"{shard_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(shard, f, separators=(",", ":"))
+            os.replace(tmp_path, shard_path)
+        except OSError as e:
+            from warp._src.logger import log_warning  # noqa: PLC0415
+
+            log_warning(f"Could not write the kernel cache reference recipes to '{shard_path}': {e}", once=True)
+
+
+def reset_references(cache_dir: str) -> None:
+    """Remove the reference recipes of ``cache_dir``, used when the whole cache is cleared."""
+    shutil.rmtree(os.path.join(cache_dir, _REFERENCES_DIR), ignore_errors=True)
+
+    with _references_lock:
+        _reference_shards.clear()
+        _pending_references.clear()
+
+
+def reset_index(cache_dir: str) -> None:
+    """Remove the cache index of ``cache_dir``, used when the whole cache is cleared."""
+    with _index_lock(cache_dir):
+        try:
+            os.remove(os.path.join(cache_dir, _INDEX_NAME))
+        except FileNotFoundError:
+            pass
+
+
+def kernel_cache_stats() -> dict[str, int | float | None]:
+    """Return usage statistics of the kernel cache.
+
+    The hit and miss counts cover module variants loaded by the current process: a hit is
+    a module found in :attr:`warp.config.kernel_cache_dir`, a backend hit is a module
+    fetched from :attr:`warp.config.kernel_cache_backend`, and a miss is a module that had
+    to be compiled. The entry and byte counts describe the cache directory on disk, which
+    may be shared with other processes.
+
+    The time counters break down the cumulative time the current process spent loading
+    modules, e.g. to compare the cost of hashing modules at startup with the cost of
+    loading their cached binaries. Hashing is faster for function and kernel sources that
+    were already hashed by a previous process, which are counted as reference hits.
+
+    Returns:
+        A dictionary with the following keys:
+
+        - ``"hits"``: Number of module loads served from the cache.
+        - ``"backend_hits"``: Number of module loads served from the kernel cache backend.
+        - ``"misses"``: Number of module loads that required compilation.
+        - ``"evictions"``: Number of module directories evicted by this process.
+        - ``"evicted_bytes"``: Number of bytes evicted by this process.
+        - ``"reference_hits"``: Number of function and kernel sources hashed with the references
+          recorded by a previous process, without scanning their whole syntax tree.
+        - ``"reference_misses"``: Number of function and kernel sources whose references were scanned
+          and recorded for later processes.
+        - ``"entries"``: Number of module directories currently in the cache.
+        - ``"bytes"``: Total size in bytes of the module directories in the cache.
+        - ``"max_bytes"``: The current :attr:`warp.config.kernel_cache_max_bytes` budget.
+        - ``"hash_time"``: Seconds spent computing module hashes.
+        - ``"codegen_time"``: Seconds spent generating source code for compiled modules.
+        - ``"compile_time"``: Seconds spent looking up the cache and compiling modules, excluding codegen.
+        - ``"load_time"``: Seconds spent loading module binaries into the runtime.
+    """
+    warp._src.context.init()
+
+    cache_dir = warp.config.kernel_cache_dir
+    with _index_lock(cache_dir):
+        index = _reconcile_index(cache_dir, _read_index(cache_dir))
+        _write_index(cache_dir, index)
+
+    with _stats_lock:
+        stats = dict(_stats)
+        stats.update({f"{phase}_time": seconds for phase, seconds in _timings.items()})
+
+    stats["entries"] = len(index)
+    stats["bytes"] = sum(entry["size"] for entry in index.values())
+    stats["max_bytes"] = warp.config.kernel_cache_max_bytes
+    return stats
@@ -0,0 +1,277 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Batched ray and closest-point queries of :class:`warp.Mesh` objects.
+
+The queries are traversed in Morton order of their origins, and of their directions for rays, so that the
+queries processed by neighboring threads visit the same BVH nodes and triangles. The results are written back
+in the order of the input queries, one array per field.
+"""
+
+from __future__ import annotations
+
+import warp as wp
+
+# No need to auto-generate adjoint code for the queries
+wp.set_module_options({"enable_backward": False})
+
+# the sort that reorders the queries only pays off for large batches
+_REORDER_MIN_QUERY_COUNT = 4096
+
+# number of queries reduced by each thread of the bounds kernel
+_BOUNDS_BLOCK_SIZE = 256
+
+_SIGN_METHODS = {None: 0, "parity": 1, "normal": 2, "winding_number": 3}
+
+
+@wp.func
+def _morton_spread(x: int):
+    """Insert two zero bits between each of the 10 bits of ``x``, the result fits in 30 bits."""
+    x = (x * 0x00010001) & 0x030000FF
+    x = (x * 0x00000101) & 0x0300F00F
+    x = (x * 0x00000011) & 0x030C30C3
+    x = (x * 0x00000005) & 0x09249249
+    return x
+
+
+@wp.func
+def _morton_code(p: wp.vec3, lower: wp.vec3, upper: wp.vec3, bits: int):
+    """Morton code of ``p`` in the box ``[lower, upper]``, with ``bits`` bits per axis."""
+    scale = float((1 << bits) - 1)
+    extent = wp.max(upper - lower, wp.vec3(1.0e-12))
+    q = wp.cw_div(p - lower, extent)
+    x = int(wp.clamp(q[0], 0.0, 1.0) * scale)
+    y = int(wp.clamp(q[1], 0.0, 1.0) * scale)
+    z = int(wp.clamp(q[2], 0.0, 1.0) * scale)
+    return (_morton_spread(x) << 2) | (_morton_spread(y) << 1) | _morton_spread(z)
+
+
+@wp.kernel
+def _bounds_kernel(
+    points: wp.array(dtype=wp.vec3),
+    block_size: int,
+    lower: wp.array(dtype=wp.vec3),
+    upper: wp.array(dtype=wp.vec3),
+):
+    block = wp.tid()
+    begin = block * block_size
+    end = wp.min(begin + block_size, points.shape[0])
+
+    block_lower = points[begin]
+    block_upper = block_lower
+    for i in range(begin + 1, end):
+        block_lower = wp.min(block_lower, points[i])
+        block_upper = wp.max(block_upper, points[i])
+
+    wp.atomic_min(lower, 0, block_lower)
+    wp.atomic_max(upper, 0, block_upper)
+
+
+@wp.kernel
+def _point_keys_kernel(
+    points: wp.array(dtype=wp.vec3),
+    lower: wp.array(dtype=wp.vec3),
+    upper: wp.array(dtype=wp.vec3),
+    keys: wp.array(dtype=int),
+    order: wp.array(dtype=int),
+):
+    i = wp.tid()
+    keys[i] = _morton_code(points[i], lower[0], upper[0], 10)
+    order[i] = i
+
+
+@wp.kernel
+def _ray_keys_kernel(
+    origins: wp.array(dtype=wp.vec3),
+    directions: wp.array(dtype=wp.vec3),
+    lower: wp.array(dtype=wp.vec3),
+    upper: wp.array(dtype=wp.vec3),
+    keys: wp.array(dtype=int),
+    order: wp.array(dtype=int),
+):
+    i = wp.tid()
+
+    # rays are grouped by origin first, then by direction
+    origin_code = _morton_code(origins[i], lower[0], upper[0], 5)
+    direction_code = _morton_code(wp.normalize(directions[i]), wp.vec3(-1.0), wp.vec3(1.0), 5)
+    keys[i] = (origin_code << 15) | direction_code
+    order[i] = i
+
+
+@wp.kernel
+def _query_rays_kernel(
+    mesh: wp.uint64,
+    origins: wp.array(dtype=wp.vec3),
+    directions: wp.array(dtype=wp.vec3),
+    max_t: float,
+    order: wp.array(dtype=int),
+    hit: wp.array(dtype=wp.bool),
+    t: wp.array(dtype=float),
+    face: wp.array(dtype=int),
+    u: wp.array(dtype=float),
+    v: wp.array(dtype=float),
+    normal: wp.array(dtype=wp.vec3),
+):
+    i = wp.tid()
+    if order:
+        i = order[i]
+
+    query = wp.mesh_query_ray(mesh, origins[i], directions[i], max_t)
+
+    hit[i] = query.result
+    if query.result:
+        t[i] = query.t
+        face[i] = query.face
+        u[i] = query.u
+        v[i] = query.v
+        normal[i] = query.normal
+    else:
+        t[i] = 0.0
+        face[i] = -1
+        u[i] = 0.0
+        v[i] = 0.0
+        normal[i] = wp.vec3(0.0)
+
+
+@wp.kernel
+def _query_points_kernel(
+    mesh: wp.uint64,
+    points: wp.array(dtype=wp.vec3),
+    max_dist: float,
+    sign_method: int,
+    order: wp.array(dtype=int),
+    hit: wp.array(dtype=wp.bool),
+    face: wp.array(dtype=int),
+    u: wp.array(dtype=float),
+    v: wp.array(dtype=float),
+    closest: wp.array(dtype=wp.vec3),
+    distance: wp.array(dtype=float),
+    sign: wp.array(dtype=float),
+):
+    i = wp.tid()
+    if order:
+        i = order[i]
+
+    p = points[i]
+    inside = float(0.0)
+    face_index = int(0)
+    bary_u = float(0.0)
+    bary_v = float(0.0)
+
+    result = bool(False)
+    if sign_method == 0:
+        result = wp.mesh_query_point_no_sign(mesh, p, max_dist, face_index, bary_u, bary_v)
+    elif sign_method == 1:
+        result = wp.mesh_query_point_sign_parity(mesh, p, max_dist, inside, face_index, bary_u, bary_v)
+    elif sign_method == 2:
+        result = wp.mesh_query_point_sign_normal(mesh, p, max_dist, inside, face_index, bary_u, bary_v)
+    else:
+        result = wp.mesh_query_point_sign_winding_number(mesh, p, max_dist, inside, face_index, bary_u, bary_v)
+
+    hit[i] = result
+    if result:
+        q = wp.mesh_eval_position(mesh, face_index, bary_u, bary_v)
+        face[i] = face_index
+        u[i] = bary_u
+        v[i] = bary_v
+        closest[i] = q
+        distance[i] = wp.length(p - q)
+    else:
+        face[i] = -1
+        u[i] = 0.0
+        v[i] = 0.0
+        closest[i] = wp.vec3(0.0)
+        distance[i] = 0.0
+
+    if sign:
+        sign[i] = wp.where(inside < 0.0, -1.0, 1.0)
+
+
+def _check_query_array(mesh: wp.Mesh, queries: wp.array, name: str, count: int | None = None):
+    if not isinstance(queries, wp.array) or queries.dtype != wp.vec3 or queries.ndim != 1:
+        raise TypeError(f"Mesh query {name} should be a 1D array of type wp.vec3")
+    if queries.device != mesh.device:
+        raise RuntimeError(f"Mesh query {name} must live on the same device as the mesh")
+    if count is not None and queries.shape[0] != count:
+        raise RuntimeError(f"Mesh query {name} must have the same length as the ray origins")
+
+
+def _query_order(keys_kernel, inputs: list[wp.array], reorder: bool) -> wp.array | None:
+    """Indices of the queries sorted by their Morton code, or ``None`` to traverse them in input order."""
+    count = inputs[0].shape[0]
+    if not reorder or count < _REORDER_MIN_QUERY_COUNT:
+        return None
+
+    device = inputs[0].device
+    lower = wp.full(1, wp.vec3(wp.inf), dtype=wp.vec3, device=device)
+    upper = wp.full(1, wp.vec3(-wp.inf), dtype=wp.vec3, device=device)
+    wp.launch(
+        _bounds_kernel,
+        dim=(count + _BOUNDS_BLOCK_SIZE - 1) // _BOUNDS_BLOCK_SIZE,
+        inputs=[inputs[0], _BOUNDS_BLOCK_SIZE, lower, upper],
+        device=device,
+    )
+
+    # the radix sort uses the second half of the arrays as temporary storage
+    keys = wp.empty(2 * count, dtype=int, device=device)
+    order = wp.empty(2 * count, dtype=int, device=device)
+    wp.launch(keys_kernel, dim=count, inputs=[*inputs, lower, upper, keys, order], device=device)
+    wp.utils.radix_sort_pairs(keys, order, count, end_bit=30)
+
+    return order[:count]
+
+
+def mesh_query_rays(mesh: wp.Mesh, origins: wp.array, directions: wp.array, max_t: float, reorder: bool):
+    _check_query_array(mesh, origins, "origins")
+    _check_query_array(mesh, directions, "directions", origins.shape[0])
+
+    count = origins.shape[0]
+    device = mesh.device
+    hits = wp.Mesh.RayHits(
+        hit=wp.empty(count, dtype=wp.bool, device=device),
+        t=wp.empty(count, dtype=float, device=device),
+        face=wp.empty(count, dtype=int, device=device),
+        u=wp.empty(count, dtype=float, device=device),
+        v=wp.empty(count, dtype=float, device=device),
+        normal=wp.empty(count, dtype=wp.vec3, device=device),
+    )
+
+    order = _query_order(_ray_keys_kernel, [origins, directions], reorder)
+    wp.launch(
+        _query_rays_kernel,
+        dim=count,
+        inputs=[mesh.id, origins, directions, max_t, order],
+        outputs=list(hits),
+        device=device,
+    )
+    return hits
+
+
+def mesh_query_points(mesh: wp.Mesh, points: wp.array, max_dist: float, sign_method: str | None, reorder: bool):
+    _check_query_array(mesh, points, "points")
+    if sign_method not in _SIGN_METHODS:
+        raise ValueError(
+            f"Unsupported mesh query sign method '{sign_method}', expected one of {', '.join(map(repr, _SIGN_METHODS))}"
+        )
+
+    count = points.shape[0]
+    device = mesh.device
+    hits = wp.Mesh.PointHits(
+        hit=wp.empty(count, dtype=wp.bool, device=device),
+        face=wp.empty(count, dtype=int, device=device),
+        u=wp.empty(count, dtype=float, device=device),
+        v=wp.empty(count, dtype=float, device=device),
+        point=wp.empty(count, dtype=wp.vec3, device=device),
+        distance=wp.empty(count, dtype=float, device=device),
+        sign=None if sign_method is None else wp.empty(count, dtype=float, device=device),
+    )
+
+    order = _query_order(_point_keys_kernel, [points], reorder)
+    wp.launch(
+        _query_points_kernel,
+        dim=count,
+        inputs=[mesh.id, points, max_dist, _SIGN_METHODS[sign_method], order],
+        outputs=list(hits),
+        device=device,
+    )
+    return hits
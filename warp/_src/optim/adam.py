@@ -1,7 +1,10 @@
 # SPDX-FileCopyrightText: Copyright (c) 2022 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import functools
+
 import warp as wp
+from warp._src.optim.multi_tensor import _find_tensor, _grad_clip_scale, _MultiTensorState
 
 
 @wp.kernel
@@ -66,6 +69,42 @@ def adam_step_kernel_half(
     params[i] = params[i] - wp.float16(lr * mhat / (wp.sqrt(vhat) + eps))
 
 
+@functools.cache
+def _create_adam_multi_tensor_kernel(scalar_type):
+    @wp.kernel(enable_backward=False, module="unique")
+    def adam_multi_tensor_step_kernel(
+        param_ptrs: wp.array[wp.uint64],
+        grad_ptrs: wp.array[wp.uint64],
+        offsets: wp.array[int],
+        m: wp.array[float],
+        v: wp.array[float],
+        lr: float,
+        beta1: float,
+        beta2: float,
+        eps: float,
+        step: wp.array[int],
+        grad_sq_norm: wp.array[float],
+        max_grad_norm: float,
+    ):
+        i = wp.tid()
+        tensor = _find_tensor(i, offsets)
+        tensor_begin = offsets[tensor]
+        tensor_size = offsets[tensor + 1] - tensor_begin
+        params = wp.array(ptr=param_ptrs[tensor], shape=(tensor_size,), dtype=scalar_type)
+        grads = wp.array(ptr=grad_ptrs[tensor], shape=(tensor_size,), dtype=scalar_type)
+
+        j = i - tensor_begin
+        g = float(grads[j]) * _grad_clip_scale(grad_sq_norm, max_grad_norm)
+        t = float(step[0])
+        m[i] = beta1 * m[i] + (1.0 - beta1) * g
+        v[i] = beta2 * v[i] + (1.0 - beta2) * g * g
+        mhat = m[i] / (1.0 - wp.pow(beta1, (t + 1.0)))
+        vhat = v[i] / (1.0 - wp.pow(beta2, (t + 1.0)))
+        params[j] = scalar_type(float(params[j]) - lr * mhat / (wp.sqrt(vhat) + eps))
+
+    return adam_multi_tensor_step_kernel
+
+
 class Adam:
     """Adaptive Moment Estimation (Adam) optimizer.
 
@@ -81,21 +120,40 @@ class Adam:
     The interface is similar to `PyTorch's torch.optim.Adam
     <https://pytorch.org/docs/stable/generated/torch.optim.Adam.html>`_.
 
+    With ``multi_tensor=True``, the moments of all parameters are packed into
+    contiguous fp32 buffers (:attr:`m` and :attr:`v` hold per-parameter views of
+    them) and :meth:`step` updates every parameter of a given scalar type in a
+    single launch, reaching the parameter and gradient arrays through a
+    device-side table of pointers. The step count is then kept on the device in
+    :attr:`step_count`, so :meth:`step` can be captured in a graph and replayed.
+
     Args:
         params: List of :class:`warp.array` objects to optimize. Can be ``None``
             and set later via :meth:`set_params`. Supported dtypes are
             :class:`warp.float16`, :class:`warp.float32`, and :class:`warp.vec3`.
+            With ``multi_tensor=True``, any contiguous array of
+            :class:`warp.float16`, :class:`warp.bfloat16`, or :class:`warp.float32`
+            scalars, vectors, or matrices is supported.
         lr: Learning rate (step size).
         betas: Coefficients for computing running averages of gradient and its
             square. Tuple of two floats ``(beta1, beta2)`` where ``beta1`` is the
             exponential decay rate for the first moment and ``beta2`` is the decay
             rate for the second moment.
         eps: Small constant added to denominator for numerical stability.
+        multi_tensor: Whether to update all parameters with fused launches.
+        max_grad_norm: If set, scale the gradients so that their global L2 norm
+            over all parameters does not exceed this value. Requires
+            ``multi_tensor=True``. The attribute is read at every :meth:`step`.
     """
 
-    def __init__(self, params=None, lr=0.001, betas=(0.9, 0.999), eps=1e-08):
+    def __init__(self, params=None, lr=0.001, betas=(0.9, 0.999), eps=1e-08, multi_tensor=False, max_grad_norm=None):
+        if max_grad_norm is not None and not multi_tensor:
+            raise ValueError("max_grad_norm requires multi_tensor=True")
+        self.multi_tensor = multi_tensor
+        self.max_grad_norm = max_grad_norm
         self.m = []  # first moment
         self.v = []  # second moment
+        self._multi_tensor_state = None
         self.set_params(params)
         self.lr = lr
         self.beta1 = betas[0]
@@ -110,6 +168,9 @@ class Adam:
             params: List of :class:`warp.array` objects to optimize, or ``None``.
         """
         self.params = params
+        if self.multi_tensor:
+            self._set_multi_tensor_params(params)
+            return
         if params is not None and isinstance(params, list) and len(params) > 0:
             if len(self.m) != len(params):
                 self.m = [None] * len(params)  # reset first moment
@@ -138,8 +199,46 @@ class Adam:
                 elif self.v[i].device != param.device:
                     self.v[i] = self.v[i].to(param.device)
 
+    def _set_multi_tensor_params(self, params):
+        if params is None or len(params) == 0:
+            self._multi_tensor_state = None
+            self.m = []
+            self.v = []
+            return
+
+        # keep the state while the parameter arrays are unchanged, and carry the moments
+        # over to new arrays with matching shapes (e.g. parameters moved to another device)
+        previous = self._multi_tensor_state
+        if previous is not None and previous.key == _MultiTensorState.params_key(params):
+            return
+        state = _MultiTensorState(params, 2)
+        if (
+            previous is not None
+            and len(self.m) == len(params)
+            and all(
+                old.shape == new.shape and old.dtype == new.dtype
+                for old, new in zip(self.m, state.views[0], strict=True)
+            )
+        ):
+            for old_moments, new_moments in zip((self.m, self.v), state.views, strict=True):
+                for old, new in zip(old_moments, new_moments, strict=True):
+                    wp.copy(new, old)
+            wp.copy(state.step, previous.step)
+
+        self._multi_tensor_state = state
+        self.m, self.v = state.views
+
+    @property
+    def step_count(self):
+        """Device array holding the number of steps taken in multi-tensor mode, or ``None``."""
+        return self._multi_tensor_state.step if self._multi_tensor_state is not None else None
+
     def reset_internal_state(self):
         """Reset moment buffers and timestep to zero."""
+        if self._multi_tensor_state is not None:
+            self._multi_tensor_state.reset()
+            self.t = 0
+            return
         for m_i in self.m:
             m_i.zero_()
         for v_i in self.v:
@@ -153,12 +252,45 @@ class Adam:
             grad: List of gradient arrays matching ``params``.
         """
         assert self.params is not None
+        if self._multi_tensor_state is not None:
+            self._step_multi_tensor(grad)
+            self.t = self.t + 1
+            return
+        if self.max_grad_norm is not None and not self.multi_tensor:
+            raise ValueError("max_grad_norm requires multi_tensor=True")
         for i in range(len(self.params)):
             Adam.step_detail(
                 grad[i], self.m[i], self.v[i], self.lr, self.beta1, self.beta2, self.t, self.eps, self.params[i]
             )
         self.t = self.t + 1
 
+    def _step_multi_tensor(self, grad):
+        state = self._multi_tensor_state
+        state.check_grads(self.params, grad)
+        max_grad_norm = state.begin_step(grad, self.max_grad_norm)
+        for group in state.groups:
+            m, v = group.buffers
+            wp.launch(
+                _create_adam_multi_tensor_kernel(group.scalar_type),
+                dim=group.size,
+                inputs=[
+                    group.param_ptrs,
+                    group.grad_ptrs(grad),
+                    group.offsets,
+                    m,
+                    v,
+                    self.lr,
+                    self.beta1,
+                    self.beta2,
+                    self.eps,
+                    state.step,
+                    state.grad_sq_norm,
+                    max_grad_norm,
+                ],
+                device=state.device,
+            )
+        state.end_step()
+
     @staticmethod
     def step_detail(g, m, v, lr, beta1, beta2, t, eps, params):
         """Apply an Adam update to a single parameter array.
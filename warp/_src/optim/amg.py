@@ -0,0 +1,477 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Smoothed aggregation algebraic multigrid for :class:`warp.sparse.BsrMatrix` operators.
+
+The hierarchy is built from the strength-of-connection graph of each level. Nodes are grouped into
+aggregates on the host, and the resulting tentative prolongator is smoothed with one damped Jacobi step.
+Coarse operators are then formed on the device with Galerkin products. Once built, the
+hierarchy can be refreshed from new matrix values with the same sparsity pattern, reusing the
+aggregates and the plans of every intermediate sparse product.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+import warp as wp
+import warp.sparse as sparse
+from warp._src.optim.linear import (
+    LinearOperator,
+    _as_scalar_array,
+    _axpby_kernel,
+    _ChebyshevPreconditioner,
+    _check_square_bsr_matrix,
+    _host_bsr_entries,
+    _JacobiSpectrum,
+    aslinearoperator,
+)
+from warp._src.sparse import _bsr_row_end, _vec_array_view
+from warp._src.types import type_is_matrix
+
+# No need to auto-generate adjoint code for the multigrid cycle
+wp.set_module_options({"enable_backward": False})
+
+# Damping of the Jacobi smoother and prolongator smoothing, relative to the inverse spectral bound of D^-1 A
+_JACOBI_DAMPING = 4.0 / 3.0
+
+
+class _AMGLevel:
+    """Operators and work buffers of a single level of the hierarchy."""
+
+    def __init__(self, A: sparse.BsrMatrix):
+        self.A = A
+        self.scalar_count = A.nrow * A.block_shape[0]
+        self.spectrum = _JacobiSpectrum(A)
+        self.smoother = None
+
+        # right-hand side, solution and residual of the level's correction equation
+        self.b = wp.empty(shape=self.scalar_count, dtype=A.scalar_type, device=A.device)
+        self.x = wp.empty_like(self.b)
+        self.r = wp.empty_like(self.b)
+
+        # tentative prolongator to the next coarser level, and plans of the products built from it
+        self.T = None
+        self.AT_plan = None
+        self.P_plan = None
+        self.R_plan = None
+        self.AP_plan = None
+        self.RAP_plan = None
+
+    @property
+    def P(self) -> sparse.BsrMatrix:
+        return self.P_plan.result
+
+    @property
+    def R(self) -> sparse.BsrMatrix:
+        return self.R_plan.result
+
+
+class AMG(LinearOperator):
+    """Smoothed aggregation algebraic multigrid preconditioner for a :class:`warp.sparse.BsrMatrix`.
+
+    Applying the operator performs one multigrid V-cycle starting from a zero initial guess, so an
+    ``AMG`` instance can be passed as the ``M`` preconditioner of the iterative solvers, typically
+    :func:`warp.optim.linear.cg` for symmetric positive definite matrices.
+
+    The hierarchy assumes the componentwise constant vectors span the near-nullspace of ``A``, as
+    for scalar or vector diffusion problems. Aggregates are formed on the host CPU, and the coarsest
+    level is solved with a dense pseudo-inverse. Applying the operator only performs kernel
+    launches, so it can be captured in CUDA graphs along with the iterative solvers.
+
+    Args:
+        A: Square matrix with square blocks.
+        smoother: Either ``"jacobi"`` for damped Jacobi relaxation or ``"chebyshev"`` for a Chebyshev
+            polynomial of the Jacobi-scaled level matrix.
+        smoother_steps: Number of Jacobi sweeps, or degree of the Chebyshev polynomial, applied
+            before and after each coarse-grid correction.
+        strength_threshold: Threshold :math:`\\theta` of the strength-of-connection graph. Blocks ``(i, j)``
+            are strong connections if :math:`\\|A_{ij}\\| \\geq \\theta \\sqrt{\\|A_{ii}\\| \\|A_{jj}\\|}`.
+        max_levels: Maximum number of levels in the hierarchy, including the finest one.
+        coarse_size: Stop coarsening once a level has at most this many rows of blocks.
+    """
+
+    def __init__(
+        self,
+        A: sparse.BsrMatrix,
+        smoother: str = "jacobi",
+        smoother_steps: int = 2,
+        strength_threshold: float = 0.0,
+        max_levels: int = 10,
+        coarse_size: int = 64,
+    ):
+        _check_square_bsr_matrix(A, "amg")
+        if smoother not in ("jacobi", "chebyshev"):
+            raise ValueError(f"Unsupported AMG smoother '{smoother}'")
+        if smoother_steps < 1:
+            raise ValueError(f"The number of AMG smoother steps must be at least 1, got {smoother_steps}")
+        if max_levels < 1:
+            raise ValueError(f"The AMG hierarchy must have at least one level, got {max_levels}")
+
+        super().__init__(A.shape, A.dtype, A.device, matvec=self._matvec)
+
+        self.smoother = smoother
+        self.smoother_steps = smoother_steps
+
+        self._levels = [_AMGLevel(A)]
+        while len(self._levels) < max_levels and A.nrow > coarse_size:
+            level = self._levels[-1]
+            T = _tentative_prolongator(A, _standard_aggregation(*_strength_graph(A, strength_threshold)))
+            if T is None or T.ncol == A.nrow:
+                break
+
+            level.T = T
+            A = self._build_coarse_operator(level, reuse_plans=False)
+            self._levels.append(_AMGLevel(A))
+
+        self._coarse_inverse = None
+        self._coarse_solver = None
+        self._setup_smoothers()
+        self._factorize_coarse_level()
+
+    @property
+    def num_levels(self) -> int:
+        """Number of levels in the hierarchy, including the finest one."""
+        return len(self._levels)
+
+    @property
+    def level_shapes(self) -> list[tuple[int, int]]:
+        """Shape of the matrix of each level, from finest to coarsest."""
+        return [level.A.shape for level in self._levels]
+
+    def update(self, A: sparse.BsrMatrix | None = None):
+        """Refresh the hierarchy after the values of the fine matrix have changed.
+
+        The aggregates and the sparsity patterns of all transfer and coarse operators are kept,
+        so only the numerical values are recomputed.
+
+        Args:
+            A: Matrix with the same sparsity pattern as the one the hierarchy was built from.
+                If ``None``, the values of the original matrix are re-read.
+        """
+
+        if A is not None:
+            fine = self._levels[0]
+            if A.shape != fine.A.shape or A.block_shape != fine.A.block_shape or A.scalar_type != fine.A.scalar_type:
+                raise ValueError("The updated AMG matrix must have the same shape and block type as the original one")
+            fine.A = A
+            fine.spectrum.A = A
+
+        for level in self._levels:
+            level.spectrum.update()
+            if level.T is not None:
+                self._build_coarse_operator(level, reuse_plans=True)
+
+        self._setup_smoothers()
+        self._factorize_coarse_level()
+
+    def _build_coarse_operator(self, level: _AMGLevel, reuse_plans: bool) -> sparse.BsrMatrix:
+        """Smooth the tentative prolongator of ``level`` and form the Galerkin coarse operator ``R A P``.
+
+        The sparse products are planned when the hierarchy is built, then only their values are recomputed.
+        """
+
+        A = level.A
+
+        # AT := D^-1 A T, scaled by the prolongator smoothing weight
+        if reuse_plans:
+            AT = level.AT_plan.execute(x=A)
+        else:
+            level.AT_plan = sparse.bsr_mm_plan(A, level.T)
+            AT = level.AT_plan.result
+        wp.launch(
+            _scale_prolongator_rows_kernel,
+            dim=(A.nrow, A.block_shape[0]),
+            device=A.device,
+            inputs=[
+                AT.offsets,
+                AT.row_counts,
+                level.spectrum.inv_diag,
+                level.spectrum.lambda_max,
+                A.scalar_type(_JACOBI_DAMPING),
+                AT.scalar_values,
+            ],
+        )
+
+        # P := T - omega D^-1 A T, and R := P^T
+        if not reuse_plans:
+            level.P_plan = sparse.bsr_axpy_plan(AT, level.T)
+        level.P_plan.execute(alpha=-1.0, beta=1.0)
+        if reuse_plans:
+            level.R_plan.execute()
+        else:
+            level.R_plan = sparse.bsr_transpose_plan(level.P)
+
+        # Galerkin product R A P
+        if reuse_plans:
+            level.AP_plan.execute(x=A)
+            return level.RAP_plan.execute()
+
+        level.AP_plan = sparse.bsr_mm_plan(A, level.P)
+        level.RAP_plan = sparse.bsr_mm_plan(level.R, level.AP_plan.result)
+        return level.RAP_plan.result
+
+    def _setup_smoothers(self):
+        if self.smoother != "chebyshev":
+            return
+
+        for level in self._levels[:-1]:
+            if level.smoother is None or level.smoother.A is not level.A:
+                level.smoother = _ChebyshevPreconditioner(level.A, self.smoother_steps, spectrum=level.spectrum)
+            else:
+                level.smoother.update_coefficients()
+
+    def _factorize_coarse_level(self):
+        coarse = self._levels[-1]
+        inverse = np.linalg.pinv(_host_bsr_dense(coarse.A))
+
+        if self._coarse_inverse is None:
+            self._coarse_inverse = wp.array(inverse, dtype=coarse.A.scalar_type, device=coarse.A.device)
+            self._coarse_solver = aslinearoperator(self._coarse_inverse)
+        else:
+            wp.copy(
+                dest=self._coarse_inverse, src=wp.array(inverse, dtype=coarse.A.scalar_type, device=coarse.A.device)
+            )
+
+    def _smooth(self, level: _AMGLevel, b: wp.array, x: wp.array, zero_guess: bool):
+        """Relax ``A x = b`` on ``level``, overwriting ``x`` if ``zero_guess`` is ``True``."""
+
+        A = level.A
+        if self.smoother == "chebyshev":
+            if zero_guess:
+                level.smoother.matvec(b, x, x, 1.0, 0.0)
+            else:
+                self._residual(level, b, x)
+                level.smoother.matvec(level.r, x, x, 1.0, 1.0)
+            return
+
+        for step in range(self.smoother_steps):
+            first = zero_guess and step == 0
+            if not first:
+                self._residual(level, b, x)
+            wp.launch(
+                _jacobi_smoothing_kernel,
+                dim=level.scalar_count,
+                device=A.device,
+                inputs=[
+                    level.spectrum.inv_diag,
+                    level.spectrum.lambda_max,
+                    A.scalar_type(_JACOBI_DAMPING),
+                    b if first else level.r,
+                    x,
+                    0 if first else 1,
+                ],
+            )
+
+    def _residual(self, level: _AMGLevel, b: wp.array, x: wp.array):
+        wp.copy(dest=level.r, src=b)
+        sparse.bsr_mv(level.A, x, level.r, alpha=-1.0, beta=1.0)
+
+    def _cycle(self, k: int, b: wp.array, x: wp.array):
+        if k == len(self._levels) - 1:
+            self._coarse_solver.matvec(b, x, x, 1.0, 0.0)
+            return
+
+        level = self._levels[k]
+        coarse = self._levels[k + 1]
+
+        self._smooth(level, b, x, zero_guess=True)
+
+        self._residual(level, b, x)
+        sparse.bsr_mv(level.R, level.r, coarse.b, alpha=1.0, beta=0.0)
+        self._cycle(k + 1, coarse.b, coarse.x)
+        sparse.bsr_mv(level.P, coarse.x, x, alpha=1.0, beta=1.0)
+
+        self._smooth(level, b, x, zero_guess=False)
+
+    def _matvec(self, x, y, z, alpha, beta):
+        fine = self._levels[0]
+        scalar_type = fine.A.scalar_type
+        count = fine.scalar_count
+
+        self._cycle(0, _as_scalar_array(_vec_array_view(x, scalar_type, count)), fine.x)
+        wp.launch(
+            _axpby_kernel,
+            dim=count,
+            device=fine.A.device,
+            inputs=[
+                fine.x,
+                _as_scalar_array(_vec_array_view(y, scalar_type, count)),
+                _as_scalar_array(_vec_array_view(z, scalar_type, count)),
+                scalar_type(alpha),
+                scalar_type(beta),
+            ],
+        )
+
+
+def _host_bsr_blocks(A: sparse.BsrMatrix):
+    """Host copies of the rows, columns and values of the active blocks of ``A``."""
+    entries, entry_rows, entry_cols, _, _ = _host_bsr_entries(A)
+    values = A.scalar_values.numpy()[entries]
+    return entry_rows, entry_cols, values
+
+
+def _host_bsr_dense(A: sparse.BsrMatrix) -> np.ndarray:
+    rows, cols, values = _host_bsr_blocks(A)
+    block_rows, block_cols = A.block_shape
+    dense = np.zeros((A.nrow, block_rows, A.ncol, block_cols), dtype=values.dtype)
+    np.add.at(dense, (rows, slice(None), cols), values)
+    return dense.reshape(A.shape)
+
+
+def _strength_graph(A: sparse.BsrMatrix, threshold: float):
+    """Symmetric strength-of-connection graph of ``A`` in CSR format, excluding the diagonal."""
+    nrow = A.nrow
+    rows, cols, values = _host_bsr_blocks(A)
+    norms = np.linalg.norm(values.reshape(values.shape[0], -1).astype(np.float64), axis=1)
+
+    diag_norms = np.zeros(nrow)
+    is_diag = rows == cols
+    np.add.at(diag_norms, rows[is_diag], norms[is_diag])
+
+    strong = ~is_diag & (norms > 0.0) & (norms >= threshold * np.sqrt(diag_norms[rows] * diag_norms[cols]))
+    pairs = np.unique(
+        np.concatenate(
+            (rows[strong].astype(np.int64) * nrow + cols[strong], cols[strong].astype(np.int64) * nrow + rows[strong])
+        )
+    )
+    pair_rows = pairs // nrow
+    offsets = np.concatenate(([0], np.cumsum(np.bincount(pair_rows, minlength=nrow))))
+    return offsets.astype(np.int32), (pairs % nrow).astype(np.int32)
+
+
+def _standard_aggregation(offsets: np.ndarray, columns: np.ndarray):
+    """Greedy aggregation of the strength graph; nodes without strong connections are left unaggregated (-1)."""
+    device = wp.get_device("cpu")
+    aggregates = wp.empty(shape=offsets.shape[0] - 1, dtype=int, device=device)
+    aggregate_count = wp.zeros(shape=1, dtype=int, device=device)
+    wp.launch(
+        _standard_aggregation_kernel,
+        dim=1,
+        device=device,
+        inputs=[
+            wp.array(offsets, dtype=int, device=device),
+            wp.array(columns, dtype=int, device=device),
+            aggregates,
+            aggregate_count,
+        ],
+    )
+    return aggregates.numpy(), int(aggregate_count.numpy()[0])
+
+
+def _tentative_prolongator(A: sparse.BsrMatrix, aggregation) -> sparse.BsrMatrix | None:
+    """Piecewise constant prolongator from ``aggregation``, with orthonormal columns."""
+    aggregates, aggregate_count = aggregation
+    if aggregate_count == 0:
+        return None
+
+    rows = np.flatnonzero(aggregates >= 0).astype(np.int32)
+    cols = aggregates[rows]
+    scale = 1.0 / np.sqrt(np.bincount(cols, minlength=aggregate_count)[cols])
+
+    if type_is_matrix(A.dtype):
+        values = scale[:, None, None] * np.eye(A.block_shape[0])[None, :, :]
+    else:
+        values = scale
+
+    device = A.device
+    return sparse.bsr_from_triplets(
+        A.nrow,
+        aggregate_count,
+        wp.array(rows, dtype=int, device=device),
+        wp.array(cols, dtype=int, device=device),
+        wp.array(values, dtype=A.scalar_type, device=device),
+    )
+
+
+@wp.kernel
+def _standard_aggregation_kernel(
+    offsets: wp.array(dtype=int),
+    columns: wp.array(dtype=int),
+    aggregates: wp.array(dtype=int),
+    aggregate_count: wp.array(dtype=int),
+):
+    # Serial, must be launched with dim=1
+    node_count = aggregates.shape[0]
+    for i in range(node_count):
+        aggregates[i] = -1
+
+    count = int(0)
+
+    # Pass 1: nodes whose whole neighborhood is free seed new aggregates
+    for i in range(node_count):
+        begin = offsets[i]
+        end = offsets[i + 1]
+        if begin < end and aggregates[i] < 0:
+            free = int(1)
+            for e in range(begin, end):
+                if aggregates[columns[e]] >= 0:
+                    free = 0
+            if free == 1:
+                aggregates[i] = count
+                for e in range(begin, end):
+                    aggregates[columns[e]] = count
+                count += 1
+
+    # Pass 2: remaining nodes join a neighboring aggregate from pass 1, marked as -2 - aggregate meanwhile
+    for i in range(node_count):
+        if aggregates[i] == -1:
+            for e in range(offsets[i], offsets[i + 1]):
+                neighbor_aggregate = aggregates[columns[e]]
+                if neighbor_aggregate >= 0 and aggregates[i] == -1:
+                    aggregates[i] = -2 - neighbor_aggregate
+    for i in range(node_count):
+        if aggregates[i] < -1:
+            aggregates[i] = -2 - aggregates[i]
+
+    # Pass 3: nodes still free form aggregates with their free neighbors
+    for i in range(node_count):
+        begin = offsets[i]
+        end = offsets[i + 1]
+        if begin < end and aggregates[i] == -1:
+            aggregates[i] = count
+            for e in range(begin, end):
+                if aggregates[columns[e]] == -1:
+                    aggregates[columns[e]] = count
+            count += 1
+
+    aggregate_count[0] = count
+
+
+@wp.kernel(module="unique")
+def _scale_prolongator_rows_kernel(
+    offsets: wp.array(dtype=int),
+    row_counts: wp.array(dtype=int),
+    inv_diag: wp.array(dtype=Any),
+    lambda_max: wp.array(dtype=Any),
+    damping: Any,
+    values: wp.array3d(dtype=Any),
+):
+    row, sub_row = wp.tid()
+    zero = type(damping)(0.0)
+    omega = wp.where(lambda_max[0] > zero, damping / lambda_max[0], zero)
+    scale = omega * inv_diag[row * values.shape[1] + sub_row]
+    for block in range(offsets[row], _bsr_row_end(offsets, row_counts, row)):
+        for col in range(values.shape[2]):
+            values[block, sub_row, col] = scale * values[block, sub_row, col]
+
+
+@wp.kernel(module="unique")
+def _jacobi_smoothing_kernel(
+    inv_diag: wp.array(dtype=Any),
+    lambda_max: wp.array(dtype=Any),
+    damping: Any,
+    r: wp.array(dtype=Any),
+    x: wp.array(dtype=Any),
+    accumulate: int,
+):
+    i = wp.tid()
+    zero = type(damping)(0.0)
+    omega = wp.where(lambda_max[0] > zero, damping / lambda_max[0], zero)
+    dx = omega * inv_diag[i] * r[i]
+    if accumulate:
+        x[i] += dx
+    else:
+        x[i] = dx
@@ -0,0 +1,317 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Direct sparse :math:`LDL^T` factorization of symmetric :class:`warp.sparse.BsrMatrix` operators.
+
+The symbolic analysis runs on the host: the rows of blocks are reordered to reduce fill-in, then the
+elimination tree of the permuted matrix yields the exact sparsity pattern of the factor. The
+numerical factorization is an up-looking block :math:`LDL^T` on that pattern, scheduled by levels of
+the elimination tree so that the rows of a level are factorized concurrently. Only the numerical
+phase is repeated when the values of the matrix change.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+import warp as wp
+import warp.sparse as sparse
+from warp._src.optim.linear import (
+    LinearOperator,
+    _as_scalar_array,
+    _axpby_kernel,
+    _block_vector_type,
+    _check_square_bsr_matrix,
+    _host_bsr_entries,
+    _TriangularPreconditioner,
+)
+from warp._src.sparse import _vec_array_view
+
+# No need to auto-generate adjoint code for the factorization and solves
+wp.set_module_options({"enable_backward": False})
+
+
+class SparseCholesky(LinearOperator):
+    """Direct sparse :math:`LDL^T` factorization of a symmetric :class:`warp.sparse.BsrMatrix`.
+
+    Applying the operator solves :math:`A z = x` exactly, up to round-off errors, so a ``SparseCholesky``
+    instance can be used as a standalone direct solver through :meth:`solve`, or passed as the ``M``
+    preconditioner of the iterative solvers, for instance to factorize a nearby matrix only once.
+
+    The fill-reducing ordering, the elimination tree and the sparsity pattern of the factor are computed on
+    the host CPU when the operator is constructed, and are reused by :meth:`update` when only the values
+    of ``A`` change. Each block of the factor is one dense block of ``A``, and the rows of blocks at
+    the same depth of the elimination tree are factorized and solved in parallel, one launch per level.
+    On the CPU, these launches use several threads when :attr:`warp.config.cpu_num_threads` is not ``1``.
+
+    Diagonal blocks are inverted without pivoting, so ``A`` should be symmetric positive definite, or at least
+    have non-singular leading principal blocks in the chosen ordering. The symmetry of ``A`` is not checked;
+    only one of the two transposed blocks at coordinates ``(i, j)`` and ``(j, i)`` is read.
+    Applying the operator only performs kernel launches, so it can be captured in CUDA graphs.
+
+    Args:
+        A: Square matrix with square blocks and stored diagonal blocks.
+        ordering: Fill-reducing ordering of the rows of blocks, either ``"nested_dissection"`` or ``"rcm"``
+            (see :func:`warp.sparse.bsr_reordering`), or ``None`` to keep the original ordering.
+    """
+
+    def __init__(self, A: sparse.BsrMatrix, ordering: str | None = "nested_dissection"):
+        _check_square_bsr_matrix(A, "cholesky")
+        if ordering not in ("nested_dissection", "rcm", None):
+            raise ValueError(f"Unsupported Cholesky ordering '{ordering}'")
+
+        super().__init__(A.shape, A.dtype, A.device, matvec=self._matvec)
+
+        self.A = A
+        self.ordering = ordering
+
+        nrow = A.nrow
+        if ordering is None:
+            self._permutation = None
+            self._inverse_permutation = None
+            inverse_permutation = np.arange(nrow, dtype=np.int32)
+        else:
+            self._permutation, self._inverse_permutation = sparse.bsr_reordering(A, ordering)
+            inverse_permutation = self._inverse_permutation.numpy()
+
+        # lower triangle of the permuted matrix P A P^T, by rows
+        entries, entry_rows, entry_cols, _, _ = _host_bsr_entries(A)
+        rows = inverse_permutation[entry_rows]
+        cols = inverse_permutation[entry_cols]
+        is_lower = rows >= cols
+        entries, rows, cols = entries[is_lower], rows[is_lower], cols[is_lower]
+        if np.any(np.bincount(rows[rows == cols], minlength=nrow) != 1):
+            raise ValueError("The 'cholesky' preconditioner requires all diagonal blocks of the matrix to be stored")
+
+        factor_rows, factor_cols = _symbolic_factorization(nrow, rows, cols)
+
+        # the factor is stored as a lower triangular matrix with sorted columns in each row
+        self._factor = sparse.bsr_zeros(nrow, nrow, block_type=A.values.dtype, device=A.device)
+        sparse.bsr_set_from_triplets(
+            self._factor,
+            wp.array(factor_rows, dtype=int, device=A.device),
+            wp.array(factor_cols, dtype=int, device=A.device),
+            prune_numerical_zeros=False,
+        )
+
+        # storage index of each block of A in the factor
+        factor_entries, factor_entry_rows, factor_entry_cols, _, _ = _host_bsr_entries(self._factor)
+        factor_keys = factor_entry_rows.astype(np.int64) * nrow + factor_entry_cols
+        dst_entries = factor_entries[np.searchsorted(factor_keys, rows.astype(np.int64) * nrow + cols)]
+        self._src_entries = wp.array(entries, dtype=int, device=A.device)
+        self._dst_entries = wp.array(dst_entries, dtype=int, device=A.device)
+
+        self._scatter_values()
+        self._solver = _TriangularPreconditioner(self._factor, symmetric=True)
+
+        vec_type = _block_vector_type(A)
+        self._rhs = wp.empty(nrow, dtype=vec_type, device=A.device)
+        self._solution = wp.empty(nrow, dtype=vec_type, device=A.device)
+        self._result = wp.empty(nrow, dtype=vec_type, device=A.device)
+
+    @property
+    def factor_nnz(self) -> int:
+        """Number of blocks of the lower triangular factor, including its diagonal."""
+        return self._factor.nnz
+
+    @property
+    def level_count(self) -> int:
+        """Number of sequential launches of the numerical factorization."""
+        return len(self._solver.lower_levels) - 1
+
+    def update(self, A: sparse.BsrMatrix | None = None):
+        """Recompute the numerical factorization after the values of the matrix have changed.
+
+        The ordering and the sparsity pattern of the factor are kept.
+
+        Args:
+            A: Matrix with the same sparsity pattern and block storage as the one the factorization was built from.
+                If ``None``, the values of the original matrix are re-read.
+        """
+
+        if A is not None:
+            if A.shape != self.A.shape or A.block_shape != self.A.block_shape or A.scalar_type != self.A.scalar_type:
+                raise ValueError(
+                    "The updated Cholesky matrix must have the same shape and block type as the original one"
+                )
+            self.A = A
+
+        self._scatter_values()
+        self._solver.factorize()
+
+    def solve(self, b: wp.array, x: wp.array | None = None) -> wp.array:
+        """Solve :math:`A x = b` and return ``x``.
+
+        Args:
+            b: Right-hand side.
+            x: Array receiving the solution, allocated with the shape of ``b`` if ``None``. May alias ``b``.
+        """
+
+        if x is None:
+            x = wp.empty_like(b)
+        self._matvec(b, x, x, 1.0, 0.0)
+        return x
+
+    def _scatter_values(self):
+        factor = self._factor
+        factor.values.zero_()
+        wp.launch(
+            _scatter_blocks_kernel,
+            dim=self._src_entries.shape[0],
+            device=self.device,
+            inputs=[self._src_entries, self._dst_entries, self.A.values, factor.values],
+        )
+
+    def _matvec(self, x, y, z, alpha, beta):
+        vec_type = self._rhs.dtype
+        count = self.shape[0]
+        x = _vec_array_view(x, vec_type, count)
+        z = _vec_array_view(z, vec_type, count)
+
+        # solve the permuted system P A P^T (P z) = P x
+        if self._permutation is None:
+            wp.copy(dest=self._rhs, src=x)
+        else:
+            sparse.bsr_permute_vector(x, self._permutation, dest=self._rhs)
+        self._solver.matvec(self._rhs, self._rhs, self._solution, 1.0, 0.0)
+
+        direct = alpha == 1.0 and beta == 0.0
+        result = z if direct else self._result
+        if self._permutation is None:
+            wp.copy(dest=result, src=self._solution)
+        else:
+            sparse.bsr_permute_vector(self._solution, self._inverse_permutation, dest=result)
+
+        if not direct:
+            scalar_type = self.A.scalar_type
+            wp.launch(
+                _axpby_kernel,
+                dim=count,
+                device=self.device,
+                inputs=[
+                    _as_scalar_array(result),
+                    _as_scalar_array(_vec_array_view(y, vec_type, count)),
+                    _as_scalar_array(z),
+                    scalar_type(alpha),
+                    scalar_type(beta),
+                ],
+            )
+
+
+def _symbolic_factorization(nrow: int, rows: np.ndarray, cols: np.ndarray):
+    """Rows and columns of the blocks of the lower triangular factor of a matrix with the given lower triangle.
+
+    The pattern of each row of the factor is the union of the paths of the elimination tree
+    leading from the columns of the corresponding row of the matrix to the diagonal.
+    """
+
+    host = wp.get_device("cpu")
+
+    is_strict = cols < rows
+    order = np.lexsort((cols[is_strict], rows[is_strict]))
+    lower_columns = wp.array(cols[is_strict][order], dtype=int, device=host)
+    lower_offsets = wp.array(
+        np.concatenate(([0], np.cumsum(np.bincount(rows[is_strict], minlength=nrow)))), dtype=int, device=host
+    )
+
+    parent = wp.empty(nrow, dtype=int, device=host)
+    wp.launch(
+        _elimination_tree_kernel,
+        dim=1,
+        device=host,
+        inputs=[lower_offsets, lower_columns, wp.empty(nrow, dtype=int, device=host), parent],
+    )
+
+    # count the blocks of each row of the factor, then list their columns
+    factor_counts = wp.empty(nrow, dtype=int, device=host)
+    factor_offsets = wp.zeros(nrow + 1, dtype=int, device=host)
+    factor_columns = wp.empty(0, dtype=int, device=host)
+    for write in (0, 1):
+        wp.launch(
+            _factor_row_pattern_kernel,
+            dim=1,
+            device=host,
+            inputs=[
+                lower_offsets,
+                lower_columns,
+                parent,
+                write,
+                wp.full(nrow, -1, dtype=int, device=host),
+                factor_offsets,
+                factor_counts,
+                factor_columns,
+            ],
+        )
+        if not write:
+            counts = factor_counts.numpy()
+            factor_offsets = wp.array(np.concatenate(([0], np.cumsum(counts))), dtype=int, device=host)
+            factor_columns = wp.empty(int(counts.sum()), dtype=int, device=host)
+
+    diagonal = np.arange(nrow, dtype=np.int32)
+    factor_rows = np.concatenate((np.repeat(diagonal, counts), diagonal))
+    factor_cols = np.concatenate((factor_columns.numpy(), diagonal))
+    return factor_rows, factor_cols
+
+
+@wp.kernel
+def _elimination_tree_kernel(
+    lower_offsets: wp.array(dtype=int),
+    lower_columns: wp.array(dtype=int),
+    ancestors: wp.array(dtype=int),
+    parent: wp.array(dtype=int),
+):
+    """Elimination tree of a symmetric matrix given the strict lower triangle, using path compression."""
+
+    row_count = parent.shape[0]
+    for row in range(row_count):
+        parent[row] = -1
+        ancestors[row] = -1
+        for block in range(lower_offsets[row], lower_offsets[row + 1]):
+            node = lower_columns[block]
+            while node != -1 and node < row:
+                next_node = ancestors[node]
+                ancestors[node] = row
+                if next_node == -1:
+                    parent[node] = row
+                node = next_node
+
+
+@wp.kernel
+def _factor_row_pattern_kernel(
+    lower_offsets: wp.array(dtype=int),
+    lower_columns: wp.array(dtype=int),
+    parent: wp.array(dtype=int),
+    write: int,
+    marker: wp.array(dtype=int),
+    factor_offsets: wp.array(dtype=int),
+    factor_counts: wp.array(dtype=int),
+    factor_columns: wp.array(dtype=int),
+):
+    """Strict lower pattern of each row of the factor, obtained by climbing the elimination tree."""
+
+    row_count = parent.shape[0]
+    for row in range(row_count):
+        marker[row] = row
+        count = int(0)
+        for block in range(lower_offsets[row], lower_offsets[row + 1]):
+            node = lower_columns[block]
+            while marker[node] != row:
+                marker[node] = row
+                if write != 0:
+                    factor_columns[factor_offsets[row] + count] = node
+                count += 1
+                node = parent[node]
+        factor_counts[row] = count
+
+
+@wp.kernel
+def _scatter_blocks_kernel(
+    src_entries: wp.array(dtype=int),
+    dst_entries: wp.array(dtype=int),
+    src_values: wp.array(dtype=Any),
+    dst_values: wp.array(dtype=Any),
+):
+    i = wp.tid()
+    dst_values[dst_entries[i]] = src_values[src_entries[i]]
@@ -4,12 +4,18 @@
 import functools
 import math
 from collections.abc import Callable
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
 
 import warp as wp
 import warp.sparse as sparse
+from warp._src.sparse import _bsr_row_end, _vec_array_view
 from warp._src.types import type_is_matrix, type_is_vector, type_length, type_scalar_type
 
+if TYPE_CHECKING:
+    from warp._src.optim.refinement import MixedPrecisionRefinement
+
 __all__ = [
     "CG",
     "CR",
@@ -120,6 +126,7 @@ def aslinearoperator(A: _Matrix, batch_offsets: wp.array | None = None) -> Linea
     ``A`` must be of one of the following types:
 
         - :class:`warp.sparse.BsrMatrix`
+        - :class:`warp.sparse.BsrSellLayout`; products use its sliced storage when beneficial
         - two-dimensional ``warp.array``; then ``A`` is assumed to be a dense matrix
         - one-dimensional ``warp.array``; then ``A`` is assumed to be a diagonal matrix
         - :class:`warp.optim.linear.LinearOperator`; no casting necessary, ``batch_offsets`` is ignored
@@ -176,11 +183,14 @@ def aslinearoperator(A: _Matrix, batch_offsets: wp.array | None = None) -> Linea
             return LinearOperator(A.shape, A.dtype, A.device, matvec=diag_mv, batch_offsets=batch_offsets)
     if isinstance(A, sparse.BsrMatrix):
         return LinearOperator(A.shape, A.dtype, A.device, matvec=bsr_mv, batch_offsets=batch_offsets)
+    if isinstance(A, sparse.BsrSellLayout):
+        M = A.matrix
+        return LinearOperator(M.shape, M.dtype, M.device, matvec=bsr_mv, batch_offsets=batch_offsets)
 
     raise ValueError(f"Unable to create LinearOperator from {A}")
 
 
-def preconditioner(A: _Matrix, ptype: str = "diag") -> LinearOperator:
+def preconditioner(A: _Matrix, ptype: str = "diag", degree: int = 3) -> LinearOperator:
     """Construct and return a preconditioner for an input matrix.
 
     Args:
@@ -189,32 +199,69 @@ def preconditioner(A: _Matrix, ptype: str = "diag") -> LinearOperator:
 
          - ``"diag"``: Diagonal (a.k.a. Jacobi) preconditioner
          - ``"diag_abs"``: Similar to Jacobi, but using the absolute value of diagonal coefficients
+         - ``"block_diag"``: Block-Jacobi preconditioner, inverting the diagonal blocks of a :class:`warp.sparse.BsrMatrix`
+         - ``"ilu0"``: Incomplete LU factorization with zero fill-in of a :class:`warp.sparse.BsrMatrix`
+         - ``"ic0"``: Incomplete Cholesky (:math:`LDL^T`) factorization with zero fill-in of a symmetric
+           :class:`warp.sparse.BsrMatrix`, reading only its lower triangle
+         - ``"chebyshev"``: Chebyshev polynomial of the Jacobi-scaled :class:`warp.sparse.BsrMatrix`
+         - ``"amg"``: Smoothed aggregation algebraic multigrid V-cycle of a :class:`warp.sparse.BsrMatrix`,
+           see :class:`AMG` for finer control
+         - ``"cholesky"``: Exact sparse :math:`LDL^T` factorization of a symmetric :class:`warp.sparse.BsrMatrix`
+           with a nested dissection ordering, see :class:`SparseCholesky` for finer control
          - ``"id"``: Identity (null) preconditioner
+
+        degree: Polynomial degree of the ``"chebyshev"`` preconditioner, i.e. one more than the number of
+            matrix-vector products per application
+
+    The ``"ilu0"`` and ``"ic0"`` factorizations require the diagonal blocks of ``A`` to be stored, and are applied
+    with triangular solves that process independent rows in parallel, one launch per level of the dependency
+    graph. Diagonal blocks are inverted without pivoting. The ``"chebyshev"`` preconditioner bounds the spectrum
+    of the Jacobi-scaled matrix with Gershgorin discs and is suited to symmetric positive definite matrices.
+
+    All preconditioners only perform kernel launches when applied, so they can be captured in CUDA graphs
+    along with the iterative solvers. Building the ``"chebyshev"`` preconditioner is capturable as well,
+    while the ``"ilu0"``, ``"ic0"`` and ``"cholesky"`` preconditioners analyze the sparsity pattern of ``A`` on the host.
     """
 
     if ptype == "id":
         return None
     if ptype in ("diag", "diag_abs"):
         return _make_jacobi_preconditioner(A, use_abs=ptype == "diag_abs")
+    if ptype == "block_diag":
+        return _make_block_jacobi_preconditioner(A)
+    if ptype in ("ilu0", "ic0"):
+        return _TriangularPreconditioner(A, symmetric=ptype == "ic0").as_linear_operator()
+    if ptype == "chebyshev":
+        return _ChebyshevPreconditioner(A, degree).as_linear_operator()
+    if ptype == "amg":
+        from warp._src.optim.amg import AMG  # noqa: PLC0415
+
+        return AMG(A)
+    if ptype == "cholesky":
+        from warp._src.optim.cholesky import SparseCholesky  # noqa: PLC0415
+
+        return SparseCholesky(A)
 
     raise ValueError(f"Unsupported preconditioner type '{ptype}'")
 
 
-def _make_jacobi_preconditioner(A: _Matrix, use_abs: bool) -> LinearOperator:
+def _extract_inverse_diagonal(A: _Matrix, use_abs: bool, out: wp.array | None = None) -> wp.array:
     use_abs_int = 1 if use_abs else 0
     if isinstance(A, sparse.BsrMatrix):
         A_diag = sparse.bsr_get_diag(A)
         if type_is_matrix(A.dtype):
-            inv_diag = wp.empty(
-                shape=A.nrow, dtype=wp.types.vector(length=A.block_shape[0], dtype=A.scalar_type), device=A.device
-            )
+            inv_diag = out
+            if inv_diag is None:
+                inv_diag = wp.empty(
+                    shape=A.nrow, dtype=wp.types.vector(length=A.block_shape[0], dtype=A.scalar_type), device=A.device
+                )
             kernel = _extract_inverse_diagonal_blocked
         else:
-            inv_diag = wp.empty(shape=A.shape[0], dtype=A.scalar_type, device=A.device)
+            inv_diag = wp.empty(shape=A.shape[0], dtype=A.scalar_type, device=A.device) if out is None else out
             kernel = _extract_inverse_diagonal_scalar
         wp.launch(kernel, dim=inv_diag.shape, device=inv_diag.device, inputs=[A_diag, inv_diag, use_abs_int])
     elif isinstance(A, wp.array) and A.ndim == 2:
-        inv_diag = wp.empty(shape=A.shape[0], dtype=A.dtype, device=A.device)
+        inv_diag = wp.empty(shape=A.shape[0], dtype=A.dtype, device=A.device) if out is None else out
         wp.launch(
             _extract_inverse_diagonal_dense,
             dim=inv_diag.shape,
@@ -224,7 +271,376 @@ def _make_jacobi_preconditioner(A: _Matrix, use_abs: bool) -> LinearOperator:
     else:
         raise ValueError("Unsupported source matrix type for building diagonal preconditioner")
 
-    return aslinearoperator(inv_diag)
+    return inv_diag
+
+
+def _make_jacobi_preconditioner(A: _Matrix, use_abs: bool) -> LinearOperator:
+    return aslinearoperator(_extract_inverse_diagonal(A, use_abs))
+
+
+def _check_square_bsr_matrix(A: _Matrix, ptype: str):
+    if not isinstance(A, sparse.BsrMatrix):
+        raise ValueError(f"Unsupported source matrix type for building '{ptype}' preconditioner, expected a BsrMatrix")
+    if A.nrow != A.ncol or A.block_shape[0] != A.block_shape[1]:
+        raise ValueError(f"The '{ptype}' preconditioner requires a square matrix with square blocks")
+
+
+def _block_vector_type(A: sparse.BsrMatrix):
+    """Data type of the vector entries multiplied by the blocks of ``A``."""
+    if type_is_matrix(A.dtype):
+        return wp.types.vector(length=A.block_shape[0], dtype=A.scalar_type)
+    return A.scalar_type
+
+
+def _make_block_jacobi_preconditioner(A: _Matrix) -> LinearOperator:
+    if isinstance(A, sparse.BsrMatrix) and not type_is_matrix(A.dtype):
+        return _make_jacobi_preconditioner(A, use_abs=False)
+
+    _check_square_bsr_matrix(A, "block_diag")
+
+    inv_diag = sparse.bsr_get_diag(A)
+    wp.launch(
+        _create_block_inverse_kernel(A.dtype), dim=inv_diag.shape, device=inv_diag.device, inputs=[inv_diag, inv_diag]
+    )
+
+    vec_type = _block_vector_type(A)
+    scalar_count = A.nrow * A.block_shape[0]
+
+    def block_diag_mv(x, y, z, alpha, beta):
+        alpha = A.scalar_type(alpha)
+        beta = A.scalar_type(beta)
+        wp.launch(
+            _diag_mv_kernel,
+            dim=inv_diag.shape,
+            device=inv_diag.device,
+            inputs=[
+                inv_diag,
+                _vec_array_view(x, vec_type, scalar_count),
+                _vec_array_view(y, vec_type, scalar_count),
+                _vec_array_view(z, vec_type, scalar_count),
+                alpha,
+                beta,
+            ],
+        )
+
+    return LinearOperator(A.shape, A.dtype, A.device, matvec=block_diag_mv)
+
+
+def _host_bsr_entries(A: sparse.BsrMatrix):
+    """Host copies of the active blocks of ``A``, in row order.
+
+    Returns the storage index, row and column of each active block, followed by the start and end
+    storage indices of each row.
+    """
+    nrow = A.nrow
+    offsets = A.offsets.numpy()[: nrow + 1]
+    row_start = offsets[:-1]
+    row_end = row_start + A.row_counts.numpy()[:nrow] if A.row_counts is not None else offsets[1:]
+
+    row_block_counts = row_end - row_start
+    entry_rows = np.repeat(np.arange(nrow, dtype=np.int32), row_block_counts)
+    first_row_entry = np.concatenate(([0], np.cumsum(row_block_counts)[:-1])).astype(np.int64)
+    entries = (row_start[entry_rows] + np.arange(entry_rows.shape[0]) - first_row_entry[entry_rows]).astype(np.int32)
+    entry_cols = A.columns.numpy()[entries]
+
+    return entries, entry_rows, entry_cols, row_start, row_end
+
+
+def _host_level_sets(row_offsets: np.ndarray, row_columns: np.ndarray, reverse: bool):
+    """Group the rows of a triangular dependency graph into levels of independent rows.
+
+    Row ``i`` depends on the rows ``row_columns[row_offsets[i]:row_offsets[i+1]]``, which must all be smaller
+    than ``i`` (or larger if ``reverse`` is ``True``). Returns the rows sorted by level and the offsets of each
+    level in that array.
+    """
+    row_count = row_offsets.shape[0] - 1
+    levels = wp.empty(row_count, dtype=int, device="cpu")
+    wp.launch(
+        _triangular_levels_kernel,
+        dim=1,
+        device="cpu",
+        inputs=[
+            wp.array(row_offsets, dtype=int, device="cpu"),
+            wp.array(row_columns, dtype=int, device="cpu"),
+            int(reverse),
+            levels,
+        ],
+    )
+    levels = levels.numpy()
+
+    level_rows = np.argsort(levels, kind="stable").astype(np.int32)
+    level_offsets = np.concatenate(([0], np.cumsum(np.bincount(levels)))) if row_count else np.zeros(1, dtype=int)
+    return level_rows, [int(offset) for offset in level_offsets]
+
+
+class _TriangularPreconditioner:
+    """Incomplete ILU(0) or IC(0) factorization of a :class:`warp.sparse.BsrMatrix`.
+
+    The factors share the sparsity pattern of ``A``. Both the numerical factorization and the
+    triangular solves are level-scheduled: rows of a level only depend on rows of previous levels
+    and are processed by a single launch.
+
+    Args:
+        A: Square matrix with square blocks and stored diagonal blocks.
+        symmetric: If ``True``, compute the :math:`LDL^T` factorization of the lower triangle of ``A``,
+            otherwise the :math:`LU` factorization of ``A``.
+    """
+
+    def __init__(self, A: sparse.BsrMatrix, symmetric: bool):
+        ptype = "ic0" if symmetric else "ilu0"
+        _check_square_bsr_matrix(A, ptype)
+
+        self.A = A
+        self.symmetric = symmetric
+        self.device = A.device
+        self.vec_type = _block_vector_type(A)
+        self.scalar_count = A.nrow * A.block_shape[0]
+
+        nrow = A.nrow
+        entries, entry_rows, entry_cols, row_start, row_end = _host_bsr_entries(A)
+
+        same_row = entry_rows[1:] == entry_rows[:-1]
+        if np.any(entry_cols[1:][same_row] <= entry_cols[:-1][same_row]):
+            raise ValueError(f"The '{ptype}' preconditioner requires sorted column indices within each row")
+
+        is_diag = entry_cols == entry_rows
+        if np.any(np.bincount(entry_rows[is_diag], minlength=nrow) != 1):
+            raise ValueError(f"The '{ptype}' preconditioner requires all diagonal blocks of the matrix to be stored")
+
+        is_lower = entry_cols < entry_rows
+        lower_offsets = np.concatenate(([0], np.cumsum(np.bincount(entry_rows[is_lower], minlength=nrow))))
+        lower_rows, self.lower_levels = _host_level_sets(lower_offsets, entry_cols[is_lower], reverse=False)
+
+        if symmetric:
+            # rows of L^T are the columns of the strict lower triangle of A
+            order = np.lexsort((entry_rows[is_lower], entry_cols[is_lower]))
+            upper_entries = entries[is_lower][order]
+            upper_columns = entry_rows[is_lower][order]
+            upper_counts = np.bincount(entry_cols[is_lower], minlength=nrow)
+        else:
+            is_upper = entry_cols > entry_rows
+            upper_entries = entries[is_upper]
+            upper_columns = entry_cols[is_upper]
+            upper_counts = np.bincount(entry_rows[is_upper], minlength=nrow)
+        upper_offsets = np.concatenate(([0], np.cumsum(upper_counts)))
+        upper_rows, self.upper_levels = _host_level_sets(upper_offsets, upper_columns, reverse=True)
+
+        device = self.device
+        self.row_start = wp.array(row_start, dtype=int, device=device)
+        self.diag_index = wp.array(entries[is_diag], dtype=int, device=device)
+        self.row_end = wp.array(row_end, dtype=int, device=device)
+        self.columns = wp.clone(A.columns)
+        self.lower_rows = wp.array(lower_rows, dtype=int, device=device)
+        self.upper_rows = wp.array(upper_rows, dtype=int, device=device)
+        self.upper_offsets = wp.array(upper_offsets, dtype=int, device=device)
+        self.upper_columns = wp.array(upper_columns, dtype=int, device=device)
+        self.upper_entries = wp.array(upper_entries, dtype=int, device=device)
+
+        self.values = wp.empty_like(A.values)
+        self.inv_diag = wp.empty(shape=nrow, dtype=A.dtype, device=device)
+        self.work = wp.empty(shape=nrow, dtype=self.vec_type, device=device)
+        self.result = wp.empty(shape=nrow, dtype=self.vec_type, device=device)
+
+        self.factorize()
+
+    def factorize(self):
+        """Compute the incomplete factors from the current values of ``A``."""
+        wp.copy(dest=self.values, src=self.A.values)
+
+        kernel = _create_incomplete_factorization_kernel(self.A.dtype, self.symmetric)
+        for level in range(len(self.lower_levels) - 1):
+            begin, end = self.lower_levels[level], self.lower_levels[level + 1]
+            wp.launch(
+                kernel,
+                dim=end - begin,
+                device=self.device,
+                inputs=[
+                    self.lower_rows,
+                    begin,
+                    self.row_start,
+                    self.diag_index,
+                    self.row_end,
+                    self.columns,
+                    self.values,
+                    self.inv_diag,
+                ],
+            )
+
+    def matvec(self, x, y, z, alpha, beta):
+        x = _vec_array_view(x, self.vec_type, self.scalar_count)
+        z = _vec_array_view(z, self.vec_type, self.scalar_count)
+
+        # x is fully consumed by the forward solve, so the backward solve may write to an aliased z
+        direct = alpha == 1.0 and beta == 0.0
+        result = z if direct else self.result
+
+        for level in range(len(self.lower_levels) - 1):
+            begin, end = self.lower_levels[level], self.lower_levels[level + 1]
+            wp.launch(
+                _lower_solve_level_kernel,
+                dim=end - begin,
+                device=self.device,
+                inputs=[self.lower_rows, begin, self.row_start, self.diag_index, self.columns, self.values, x],
+                outputs=[self.work],
+            )
+
+        backward_kernel = _create_upper_solve_kernel(self.A.dtype, self.symmetric)
+        for level in range(len(self.upper_levels) - 1):
+            begin, end = self.upper_levels[level], self.upper_levels[level + 1]
+            wp.launch(
+                backward_kernel,
+                dim=end - begin,
+                device=self.device,
+                inputs=[
+                    self.upper_rows,
+                    begin,
+                    self.upper_offsets,
+                    self.upper_columns,
+                    self.upper_entries,
+                    self.values,
+                    self.inv_diag,
+                    self.work,
+                ],
+                outputs=[result],
+            )
+
+        if not direct:
+            scalar_type = self.A.scalar_type
+            wp.launch(
+                _axpby_kernel,
+                dim=self.scalar_count,
+                device=self.device,
+                inputs=[
+                    _as_scalar_array(result),
+                    _as_scalar_array(_vec_array_view(y, self.vec_type, self.scalar_count)),
+                    _as_scalar_array(z),
+                    scalar_type(alpha),
+                    scalar_type(beta),
+                ],
+            )
+
+    def as_linear_operator(self) -> LinearOperator:
+        return LinearOperator(self.A.shape, self.A.dtype, self.device, matvec=self.matvec)
+
+
+# Ratio between the largest and smallest eigenvalues targeted by the Chebyshev preconditioner
+_CHEBYSHEV_EIGENVALUE_RATIO = 30.0
+
+
+class _JacobiSpectrum:
+    """Inverse diagonal of a :class:`warp.sparse.BsrMatrix` and an upper bound of the eigenvalues of :math:`D^{-1}A`.
+
+    The bound is the largest Gershgorin disc of :math:`D^{-1}A`. Both are computed on the device,
+    so that no host synchronization is needed.
+    """
+
+    def __init__(self, A: sparse.BsrMatrix):
+        self.A = A
+        self._inv_diag = None
+        self.lambda_max = wp.empty(shape=1, dtype=A.scalar_type, device=A.device)
+        self.update()
+
+    def update(self):
+        """Recompute the inverse diagonal and the eigenvalue bound from the current values of ``A``."""
+        A = self.A
+        self._inv_diag = _extract_inverse_diagonal(A, use_abs=False, out=self._inv_diag)
+        self.inv_diag = _as_scalar_array(self._inv_diag)
+
+        self.lambda_max.zero_()
+        wp.launch(
+            _jacobi_gershgorin_bound_kernel,
+            dim=(A.nrow, A.block_shape[0]),
+            device=A.device,
+            inputs=[A.offsets, A.row_counts, A.scalar_values, self.inv_diag, self.lambda_max],
+        )
+
+
+class _ChebyshevPreconditioner:
+    """Chebyshev polynomial approximating the inverse of a :class:`warp.sparse.BsrMatrix`.
+
+    The polynomial is that of ``degree`` steps of the Jacobi-preconditioned Chebyshev iteration
+    started from zero, for eigenvalues of :math:`D^{-1}A` within
+    ``[lambda_max / _CHEBYSHEV_EIGENVALUE_RATIO, lambda_max]``. The upper bound ``lambda_max`` and
+    the recurrence coefficients are computed on the device, so that no host synchronization is needed.
+    """
+
+    def __init__(self, A: sparse.BsrMatrix, degree: int, spectrum: _JacobiSpectrum | None = None):
+        _check_square_bsr_matrix(A, "chebyshev")
+        if degree < 1:
+            raise ValueError(f"The Chebyshev preconditioner degree must be at least 1, got {degree}")
+
+        self.A = A
+        self.degree = degree
+        self.device = A.device
+        self.scalar_count = A.nrow * A.block_shape[0]
+        self.spectrum = _JacobiSpectrum(A) if spectrum is None else spectrum
+
+        scalar_type = A.scalar_type
+        device = self.device
+
+        # inverse of the spectrum center followed by the (d, r) coefficients of each step
+        self.coefficients = wp.empty(shape=(degree, 2), dtype=scalar_type, device=device)
+        self.update_coefficients()
+
+        self.residual = wp.empty(shape=self.scalar_count, dtype=scalar_type, device=device)
+        self.direction = wp.empty_like(self.residual)
+        self.product = wp.empty_like(self.residual)
+        self.result = wp.empty_like(self.residual)
+
+    def update_coefficients(self):
+        """Recompute the polynomial coefficients after the spectrum bound has been updated."""
+        wp.launch(
+            _chebyshev_coefficients_kernel,
+            dim=1,
+            device=self.device,
+            inputs=[
+                self.spectrum.lambda_max,
+                self.A.scalar_type(_CHEBYSHEV_EIGENVALUE_RATIO),
+                self.coefficients,
+            ],
+        )
+
+    def matvec(self, x, y, z, alpha, beta):
+        scalar_type = self.A.scalar_type
+        x = _as_scalar_array(_vec_array_view(x, scalar_type, self.scalar_count))
+        z = _as_scalar_array(_vec_array_view(z, scalar_type, self.scalar_count))
+
+        direct = alpha == 1.0 and beta == 0.0
+        result = z if direct else self.result
+
+        wp.launch(
+            _chebyshev_init_kernel,
+            dim=self.scalar_count,
+            device=self.device,
+            inputs=[self.spectrum.inv_diag, self.coefficients, x],
+            outputs=[self.residual, self.direction, result],
+        )
+        for step in range(1, self.degree):
+            sparse.bsr_mv(self.A, self.direction, self.product, alpha=1.0, beta=0.0)
+            wp.launch(
+                _chebyshev_step_kernel,
+                dim=self.scalar_count,
+                device=self.device,
+                inputs=[self.spectrum.inv_diag, self.coefficients, step, self.product],
+                outputs=[self.residual, self.direction, result],
+            )
+
+        if not direct:
+            wp.launch(
+                _axpby_kernel,
+                dim=self.scalar_count,
+                device=self.device,
+                inputs=[
+                    result,
+                    _as_scalar_array(_vec_array_view(y, scalar_type, self.scalar_count)),
+                    z,
+                    scalar_type(alpha),
+                    scalar_type(beta),
+                ],
+            )
+
+    def as_linear_operator(self) -> LinearOperator:
+        return LinearOperator(self.A.shape, self.A.dtype, self.device, matvec=self.matvec)
 
 
 def _as_scalar_array(x: wp.array):
@@ -366,12 +782,24 @@ class TiledDot:
             self.batch_dot_launch: wp.Launch = wp.launch(
                 batch_dot_kernel,
                 dim=(max_column_count, self.batch_count, self.tile_size),
-                inputs=[self.partial_sums_a, self.partial_sums_b, self.partial_sums_a, batch_offsets],
+                inputs=[self.partial_sums_a, self.partial_sums_b, self.partial_sums_a, batch_offsets, None, None],
                 block_dim=self.tile_size,
                 device=self.device,
                 record_cmd=True,
             )
 
+    def set_active_batches(self, active_batches: wp.array, active_count: wp.array):
+        """Restrict batched dot products to a subset of the subproblems.
+
+        Only the first ``active_count[0]`` subproblems listed in ``active_batches`` are reduced;
+        the results of other subproblems keep their previous values. Both arrays are read on the device
+        at each :meth:`compute`, so the subset may change between captured launches. Has no effect
+        when the dot products are not batched.
+        """
+        if self.batch_dot_launch is not None:
+            self.batch_dot_launch.set_param_at_index(4, active_batches)
+            self.batch_dot_launch.set_param_at_index(5, active_count)
+
     def compute(self, a: wp.array, b: wp.array, col_offset: int = 0):
         """Compute dot products, updating results accessible via :meth:`col` and :meth:`cols`.
 
@@ -492,9 +920,17 @@ def batch_dot_kernel(
     b: wp.array2d(dtype=Any),
     result: wp.array2d(dtype=Any),
     batch_offsets: wp.array1d(dtype=int),
+    active_batches: wp.array1d(dtype=int),
+    active_count: wp.array1d(dtype=int),
 ):
     col, batch_id, lane = wp.tid()
 
+    # When a list of active subproblems is provided, blocks past its end have nothing to do
+    if active_batches:
+        if batch_id >= active_count[0]:
+            return
+        batch_id = active_batches[batch_id]
+
     batch_start = batch_offsets[batch_id] + lane
     batch_end = batch_offsets[batch_id + 1]
 
@@ -508,6 +944,103 @@ def batch_dot_kernel(
     wp.tile_store(result[col], total, offset=batch_id)
 
 
+@wp.kernel
+def _batch_status_reset_kernel(
+    active: wp.array(dtype=int),
+    iterations: wp.array(dtype=int),
+    active_batches: wp.array(dtype=int),
+    active_count: wp.array(dtype=int),
+):
+    batch_id = wp.tid()
+    active[batch_id] = 1
+    iterations[batch_id] = 0
+    active_batches[batch_id] = batch_id
+    if batch_id == 0:
+        active_count[0] = active.shape[0]
+
+
+@wp.kernel
+def _batch_status_update_kernel(
+    cycle_size: int,
+    r_norm_sq: wp.array(dtype=Any),
+    atol_sq: wp.array(dtype=Any),
+    active: wp.array(dtype=int),
+    iterations: wp.array(dtype=int),
+    active_batches: wp.array(dtype=int),
+    active_count: wp.array(dtype=int),
+):
+    batch_id = wp.tid()
+
+    # Converged subproblems stay inactive until the next solve
+    if active[batch_id] == 0 or r_norm_sq[batch_id] <= atol_sq[batch_id]:
+        active[batch_id] = 0
+        return
+
+    iterations[batch_id] += cycle_size
+    active_batches[wp.atomic_add(active_count, 0, 1)] = batch_id
+
+
+@wp.kernel
+def _batch_status_residual_kernel(r_norm_sq: wp.array(dtype=Any), residual_norms: wp.array(dtype=Any)):
+    batch_id = wp.tid()
+    residual_norms[batch_id] = wp.sqrt(r_norm_sq[batch_id])
+
+
+class _BatchStatus:
+    """Per-subproblem convergence state of a batched iterative solve.
+
+    Before each iteration cycle, subproblems whose residual satisfies their tolerance are marked
+    inactive and removed from the compacted list of active subproblems, which batched dot products
+    and update kernels use to skip them. Also records the number of iterations performed by each
+    subproblem and its final residual norm.
+    """
+
+    def __init__(self, batch_count: int, scalar_type: type, device):
+        self.batch_count = batch_count
+        self.device = device
+        self.active = wp.empty(batch_count, dtype=int, device=device)
+        self.iterations = wp.zeros(batch_count, dtype=int, device=device)
+        self.residual_norms = wp.zeros(batch_count, dtype=scalar_type, device=device)
+        self.active_batches = wp.empty(batch_count, dtype=int, device=device)
+        self.active_count = wp.empty(1, dtype=int, device=device)
+
+    def reset(self):
+        """Mark all subproblems as active."""
+        wp.launch(
+            _batch_status_reset_kernel,
+            dim=self.batch_count,
+            device=self.device,
+            inputs=[self.active, self.iterations, self.active_batches, self.active_count],
+        )
+
+    def update(self, r_norm_sq: wp.array, atol_sq: wp.array, cycle_size: int):
+        """Deactivate converged subproblems and rebuild the list of active ones."""
+        self.active_count.zero_()
+        wp.launch(
+            _batch_status_update_kernel,
+            dim=self.batch_count,
+            device=self.device,
+            inputs=[
+                cycle_size,
+                r_norm_sq,
+                atol_sq,
+                self.active,
+                self.iterations,
+                self.active_batches,
+                self.active_count,
+            ],
+        )
+
+    def finalize(self, r_norm_sq: wp.array):
+        """Record the residual norm of each subproblem at the end of the solve."""
+        wp.launch(
+            _batch_status_residual_kernel,
+            dim=self.batch_count,
+            device=self.device,
+            inputs=[r_norm_sq, self.residual_norms],
+        )
+
+
 class LinearSolverState:
     """Pre-allocated state for a linear iterative solver.
 
@@ -519,6 +1052,12 @@ class LinearSolverState:
     ``batch_offsets`` array is part of that layout. This avoids repeated buffer
     allocation when the same solver is applied many times.
 
+    For batched systems, each subproblem stops iterating as soon as its own residual satisfies its
+    tolerance: converged subproblems are masked out of the update kernels and compacted away from the
+    dot products of the :class:`~warp.optim.linear.CG`, :class:`~warp.optim.linear.CR`, and
+    :class:`~warp.optim.linear.BiCGSTAB` solvers, while the others keep iterating. The per-subproblem
+    outcome of the last solve is reported by :attr:`batch_iterations` and :attr:`batch_residual_norms`.
+
     Args:
         A: the linear system's left-hand-side
         b: the linear system's right-hand-side
@@ -569,8 +1108,34 @@ class LinearSolverState:
             maxiter = _scalar_dof_count(b) // self._batch_count
         self._maxiter = int(maxiter)
 
+        if self._A.batch_offsets is not None:
+            self._batch_status = _BatchStatus(self._batch_count, self._scalar_type, self._device)
+        else:
+            self._batch_status = None
+
         self._allocate()
 
+    @property
+    def batch_iterations(self) -> wp.array | None:
+        """Device array of shape ``(batch_count,)`` holding the number of iterations performed by each
+        subproblem during the last solve, or ``None`` if the system is not batched."""
+        return None if self._batch_status is None else self._batch_status.iterations
+
+    @property
+    def batch_residual_norms(self) -> wp.array | None:
+        """Device array of shape ``(batch_count,)`` holding the residual norm of each subproblem at the end
+        of the last solve, or ``None`` if the system is not batched."""
+        return None if self._batch_status is None else self._batch_status.residual_norms
+
+    def _batch_active(self) -> wp.array | None:
+        """Active mask read by the update kernels, or ``None`` if the system is not batched."""
+        return None if self._batch_status is None else self._batch_status.active
+
+    def _use_batch_compaction(self):
+        """Restrict the batched dot products to the active subproblems."""
+        if self._batch_status is not None:
+            self._tiled_dot.set_active_batches(self._batch_status.active_batches, self._batch_status.active_count)
+
     def _allocate(self):
         """Allocate solver-specific temporary buffers. Implemented by subclasses."""
         raise NotImplementedError
@@ -655,6 +1220,7 @@ class CG(LinearSolverState):
             max_column_count=2,
             batch_offsets=A.batch_offsets,
         )
+        self._use_batch_compaction()
 
         # (r, r) view — so we can compute r.z and r.r at once
         self._r_repeated = _repeat_first(self._r_and_z_buf)
@@ -662,6 +1228,7 @@ class CG(LinearSolverState):
     def _run(self, A, b, x, M):
         device = self._device
         batch_offsets = A.batch_offsets
+        batch_active = self._batch_active()
         dofs_per_entry = self._dofs_per_entry
         tiled_dot = self._tiled_dot
         p_and_Ap = self._p_and_Ap
@@ -686,6 +1253,9 @@ class CG(LinearSolverState):
         Ap.zero_()
         z.zero_()
 
+        if self._batch_status is not None:
+            self._batch_status.reset()
+
         # Initialize tolerance from right-hand-side norm
         _initialize_absolute_tolerance(b, self._tol, self._atol, tiled_dot, atol_sq)
         # Initialize residual
@@ -714,7 +1284,7 @@ class CG(LinearSolverState):
                 kernel=_cg_kernel_1,
                 dim=x.shape[0],
                 device=device,
-                inputs=[atol_sq, r_norm_sq, rz_old, p_Ap, x, r, p, Ap, batch_offsets, dofs_per_entry],
+                inputs=[atol_sq, r_norm_sq, rz_old, p_Ap, x, r, p, Ap, batch_offsets, batch_active, dofs_per_entry],
             )
 
             update_rr_rz()
@@ -723,7 +1293,7 @@ class CG(LinearSolverState):
                 kernel=_cg_kernel_2,
                 dim=z.shape[0],
                 device=device,
-                inputs=[atol_sq, r_norm_sq, rz_old, rz_new, z, p, batch_offsets, dofs_per_entry],
+                inputs=[atol_sq, r_norm_sq, rz_old, rz_new, z, p, batch_offsets, batch_active, dofs_per_entry],
             )
 
         return _run_capturable_loop(
@@ -734,6 +1304,7 @@ class CG(LinearSolverState):
             self._callback,
             self._check_every,
             self._use_cuda_graph,
+            batch_status=self._batch_status,
         )
 
 
@@ -749,12 +1320,15 @@ def cg(
     check_every=10,
     use_cuda_graph=True,
     run: bool = True,
-) -> tuple[int, float, float] | tuple[wp.array, wp.array, wp.array] | CG:
+    inner_dtype: type | None = None,
+    max_refinements: int = 10,
+) -> "tuple[int, float, float] | tuple[wp.array, wp.array, wp.array] | CG | MixedPrecisionRefinement":
     """Compute an approximate solution to a symmetric, positive-definite linear system
     using the Conjugate Gradient algorithm.
 
     Supports batched systems when ``A`` is a :class:`LinearOperator` with ``batch_offsets`` set;
-    all subproblems iterate together and convergence uses the worst-case residual.
+    each subproblem stops iterating once its residual satisfies its tolerance, and the solve terminates
+    when all of them have converged. Use ``run=False`` to access per-subproblem iteration counts and residuals.
 
     Args:
         A: the linear system's left-hand-side
@@ -777,6 +1351,12 @@ def cg(
             The functor can be called repeatedly without reallocating temporary buffers when replacement operands match the
             construction-time shape, dtype, device, and batch layout. For batched :class:`LinearOperator` inputs, replacement
             operators must use the same ``batch_offsets`` array.
+        inner_dtype: If set to ``wp.float32`` or ``wp.float16``, solve a ``float64`` system by mixed-precision
+            iterative refinement: residuals and corrections are computed in double precision, while each correction
+            is obtained by an inner CG solve on a copy of ``A`` with ``inner_dtype`` values and single-precision
+            vectors. ``maxiter`` then applies to each inner solve, and ``check_every`` must be positive.
+            See :class:`~warp.optim.linear.MixedPrecisionRefinement`.
+        max_refinements: Maximum number of refinement steps when ``inner_dtype`` is set.
 
     Returns:
         If ``run`` is ``True`` and ``check_every`` > 0: Tuple (final_iteration, residual_norm, absolute_tolerance)
@@ -791,8 +1371,31 @@ def cg(
 
         If ``run`` is ``False``: a :class:`~warp.optim.linear.CG` functor with all temporary buffers pre-allocated.
 
+        If ``inner_dtype`` is set, ``final_iteration`` is the total number of inner iterations, and
+        ``run=False`` returns a :class:`~warp.optim.linear.MixedPrecisionRefinement` functor.
+
     If both `tol` and `atol` are provided, the absolute tolerance used as the termination criterion for the residual norm is ``max(atol, tol * norm(b))``.
     """
+    if inner_dtype is not None:
+        from warp._src.optim.refinement import MixedPrecisionRefinement  # noqa: PLC0415
+
+        state = MixedPrecisionRefinement(
+            A,
+            b,
+            x,
+            solver="cg",
+            inner_dtype=inner_dtype,
+            tol=tol,
+            atol=atol,
+            maxiter=maxiter,
+            max_refinements=max_refinements,
+            M=M,
+            callback=callback,
+            check_every=check_every,
+            use_cuda_graph=use_cuda_graph,
+        )
+        return state() if run else state
+
     state = CG(
         A,
         b,
@@ -841,6 +1444,7 @@ class CR(LinearSolverState):
             max_column_count=2,
             batch_offsets=A.batch_offsets,
         )
+        self._use_batch_compaction()
 
         self._r_and_z_repeated = _repeat_first(self._r_and_z_buf)
         self._y_and_Ap_repeated = _repeat_first(self._y_and_Ap_buf)
@@ -848,6 +1452,7 @@ class CR(LinearSolverState):
     def _run(self, A, b, x, M):
         device = self._device
         batch_offsets = A.batch_offsets
+        batch_active = self._batch_active()
         dofs_per_entry = self._dofs_per_entry
         tiled_dot = self._tiled_dot
         r_and_z_buf = self._r_and_z_buf
@@ -870,6 +1475,9 @@ class CR(LinearSolverState):
         zAz_new = tiled_dot.col(1)
         zAz_old, atol_sq = self._residuals[0], self._residuals[1]
 
+        if self._batch_status is not None:
+            self._batch_status.reset()
+
         # Initialize tolerance from right-hand-side norm
         _initialize_absolute_tolerance(b, self._tol, self._atol, tiled_dot, atol_sq)
         # Initialize residual
@@ -907,7 +1515,19 @@ class CR(LinearSolverState):
                     kernel=_cg_kernel_1,
                     dim=x.shape[0],
                     device=device,
-                    inputs=[atol_sq, r_norm_sq, zAz_old, y_Ap, x, r, p, Ap, batch_offsets, dofs_per_entry],
+                    inputs=[
+                        atol_sq,
+                        r_norm_sq,
+                        zAz_old,
+                        y_Ap,
+                        x,
+                        r,
+                        p,
+                        Ap,
+                        batch_offsets,
+                        batch_active,
+                        dofs_per_entry,
+                    ],
                 )
             else:
                 # In preconditioned case, we have one more vector to update
@@ -915,7 +1535,21 @@ class CR(LinearSolverState):
                     kernel=_cr_kernel_1,
                     dim=x.shape[0],
                     device=device,
-                    inputs=[atol_sq, r_norm_sq, zAz_old, y_Ap, x, r, z, p, Ap, y, batch_offsets, dofs_per_entry],
+                    inputs=[
+                        atol_sq,
+                        r_norm_sq,
+                        zAz_old,
+                        y_Ap,
+                        x,
+                        r,
+                        z,
+                        p,
+                        Ap,
+                        y,
+                        batch_offsets,
+                        batch_active,
+                        dofs_per_entry,
+                    ],
                 )
 
             update_rr_zAz()
@@ -923,7 +1557,19 @@ class CR(LinearSolverState):
                 kernel=_cr_kernel_2,
                 dim=z.shape[0],
                 device=device,
-                inputs=[atol_sq, r_norm_sq, zAz_old, zAz_new, z, p, Az, Ap, batch_offsets, dofs_per_entry],
+                inputs=[
+                    atol_sq,
+                    r_norm_sq,
+                    zAz_old,
+                    zAz_new,
+                    z,
+                    p,
+                    Az,
+                    Ap,
+                    batch_offsets,
+                    batch_active,
+                    dofs_per_entry,
+                ],
             )
 
         return _run_capturable_loop(
@@ -935,6 +1581,7 @@ class CR(LinearSolverState):
             callback=self._callback,
             check_every=self._check_every,
             use_cuda_graph=self._use_cuda_graph,
+            batch_status=self._batch_status,
         )
 
 
@@ -955,7 +1602,8 @@ def cr(
     using the Conjugate Residual algorithm.
 
     Supports batched systems when ``A`` is a :class:`LinearOperator` with ``batch_offsets`` set;
-    all subproblems iterate together and convergence uses the worst-case residual.
+    each subproblem stops iterating once its residual satisfies its tolerance, and the solve terminates
+    when all of them have converged. Use ``run=False`` to access per-subproblem iteration counts and residuals.
 
     Args:
         A: the linear system's left-hand-side
@@ -1088,6 +1736,7 @@ class BiCGSTAB(LinearSolverState):
             max_column_count=5,
             batch_offsets=A.batch_offsets,
         )
+        self._use_batch_compaction()
 
         self._atol_sq = wp.empty(batch_count, dtype=scalar_type, device=device)
 
@@ -1103,6 +1752,7 @@ class BiCGSTAB(LinearSolverState):
     def _run(self, A, b, x, M):
         device = self._device
         batch_offsets = A.batch_offsets
+        batch_active = self._batch_active()
         dofs_per_entry = self._dofs_per_entry
         tiled_dot = self._tiled_dot
         is_left_preconditioner = self._is_left_preconditioner
@@ -1122,6 +1772,9 @@ class BiCGSTAB(LinearSolverState):
         rho = tiled_dot.col(1)
         atol_sq = self._atol_sq
 
+        if self._batch_status is not None:
+            self._batch_status.reset()
+
         # Initialize tolerance from right-hand-side norm
         _initialize_absolute_tolerance(b, self._tol, self._atol, tiled_dot, atol_sq)
         # Initialize residual
@@ -1154,7 +1807,7 @@ class BiCGSTAB(LinearSolverState):
                 kernel=_bicgstab_kernel_1,
                 dim=x.shape[0],
                 device=device,
-                inputs=[atol_sq, r_norm_sq, rho, r0v, x, r, y, v, batch_offsets, dofs_per_entry],
+                inputs=[atol_sq, r_norm_sq, rho, r0v, x, r, y, v, batch_offsets, batch_active, dofs_per_entry],
             )
             tiled_dot.compute(r, r, col_offset=0)
 
@@ -1184,7 +1837,7 @@ class BiCGSTAB(LinearSolverState):
                 kernel=_bicgstab_kernel_2,
                 dim=z.shape[0],
                 device=device,
-                inputs=[atol_sq, r_norm_sq, st, tt, z, t, x, r, batch_offsets, dofs_per_entry],
+                inputs=[atol_sq, r_norm_sq, st, tt, z, t, x, r, batch_offsets, batch_active, dofs_per_entry],
             )
 
             # r = <r,r>, rho = <r0, r>
@@ -1196,7 +1849,7 @@ class BiCGSTAB(LinearSolverState):
                 kernel=_bicgstab_kernel_3,
                 dim=z.shape[0],
                 device=device,
-                inputs=[atol_sq, r_norm_sq, rho, r0v, st, tt, p, r, v, batch_offsets, dofs_per_entry],
+                inputs=[atol_sq, r_norm_sq, rho, r0v, st, tt, p, r, v, batch_offsets, batch_active, dofs_per_entry],
             )
 
         return _run_capturable_loop(
@@ -1207,6 +1860,7 @@ class BiCGSTAB(LinearSolverState):
             callback=self._callback,
             check_every=self._check_every,
             use_cuda_graph=self._use_cuda_graph,
+            batch_status=self._batch_status,
         )
 
 
@@ -1227,7 +1881,8 @@ def bicgstab(
     """Compute an approximate solution to a linear system using the Biconjugate Gradient Stabilized method (BiCGSTAB).
 
     Supports batched systems when ``A`` is a :class:`LinearOperator` with ``batch_offsets`` set;
-    all subproblems iterate together and convergence uses the worst-case residual.
+    each subproblem stops iterating once its residual satisfies its tolerance, and the solve terminates
+    when all of them have converged. Use ``run=False`` to access per-subproblem iteration counts and residuals.
 
     Args:
         A: the linear system's left-hand-side
@@ -1446,6 +2101,9 @@ class GMRES(LinearSolverState):
         arnoldi_axpy = self._arnoldi_axpy
         copy_hessenberg_col = self._copy_hessenberg_col
 
+        if self._batch_status is not None:
+            self._batch_status.reset()
+
         # Initialize tolerance from right-hand-side norm
         _initialize_absolute_tolerance(b, self._tol, self._atol, tiled_dot, atol_sq)
         # Initialize residual
@@ -1545,6 +2203,7 @@ class GMRES(LinearSolverState):
             callback=self._callback,
             check_every=self._check_every,
             use_cuda_graph=self._use_cuda_graph,
+            batch_status=self._batch_status,
         )
 
 
@@ -1562,11 +2221,14 @@ def gmres(
     use_cuda_graph=True,
     is_left_preconditioner=False,
     run: bool = True,
-):
+    inner_dtype: type | None = None,
+    max_refinements: int = 10,
+) -> "tuple[int, float, float] | tuple[wp.array, wp.array, wp.array] | GMRES | MixedPrecisionRefinement":
     """Compute an approximate solution to a linear system using the restarted Generalized Minimum Residual method (GMRES[k]).
 
     Supports batched systems when ``A`` is a :class:`LinearOperator` with ``batch_offsets`` set;
     all subproblems iterate together and convergence uses the worst-case residual.
+    Use ``run=False`` to access per-subproblem iteration counts and residuals.
 
     Args:
         A: the linear system's left-hand-side
@@ -1592,6 +2254,12 @@ def gmres(
             reallocating temporary buffers when replacement operands match the construction-time shape, dtype, device,
             and batch layout. For batched :class:`LinearOperator` inputs, replacement operators must use the same
             ``batch_offsets`` array.
+        inner_dtype: If set to ``wp.float32`` or ``wp.float16``, solve a ``float64`` system by mixed-precision
+            iterative refinement: residuals and corrections are computed in double precision, while each correction
+            is obtained by an inner GMRES solve on a copy of ``A`` with ``inner_dtype`` values and single-precision
+            vectors. ``maxiter`` then applies to each inner solve, and ``check_every`` must be positive.
+            See :class:`~warp.optim.linear.MixedPrecisionRefinement`.
+        max_refinements: Maximum number of refinement steps when ``inner_dtype`` is set.
 
     Returns:
         If ``run`` is ``True`` and ``check_every`` > 0: Tuple (final_iteration, residual_norm, absolute_tolerance)
@@ -1606,8 +2274,33 @@ def gmres(
 
         If ``run`` is ``False``: a :class:`~warp.optim.linear.GMRES` functor with all temporary buffers pre-allocated.
 
+        If ``inner_dtype`` is set, ``final_iteration`` is the total number of inner iterations, and
+        ``run=False`` returns a :class:`~warp.optim.linear.MixedPrecisionRefinement` functor.
+
     If both `tol` and `atol` are provided, the absolute tolerance used as the termination criterion for the residual norm is ``max(atol, tol * norm(b))``.
     """
+    if inner_dtype is not None:
+        from warp._src.optim.refinement import MixedPrecisionRefinement  # noqa: PLC0415
+
+        state = MixedPrecisionRefinement(
+            A,
+            b,
+            x,
+            solver="gmres",
+            inner_dtype=inner_dtype,
+            tol=tol,
+            atol=atol,
+            maxiter=maxiter,
+            max_refinements=max_refinements,
+            M=M,
+            callback=callback,
+            check_every=check_every,
+            use_cuda_graph=use_cuda_graph,
+            restart=restart,
+            is_left_preconditioner=is_left_preconditioner,
+        )
+        return state() if run else state
+
     state = GMRES(
         A,
         b,
@@ -1681,6 +2374,18 @@ def _find_entry_batch(entry: int, batch_offsets: wp.array(dtype=int), dofs_per_e
     return _find_batch(entry * dofs_per_entry, batch_offsets)
 
 
+@wp.func
+def _find_active_entry_batch(
+    entry: int, batch_offsets: wp.array(dtype=int), batch_active: wp.array(dtype=int), dofs_per_entry: int
+) -> int:
+    """Like :func:`_find_entry_batch`, but returns ``-1`` for subproblems masked out by ``batch_active``."""
+    bid = _find_entry_batch(entry, batch_offsets, dofs_per_entry)
+    if bid >= 0 and batch_active:
+        if batch_active[bid] == 0:
+            return -1
+    return bid
+
+
 @wp.kernel
 def _initialize_tolerance(
     rtol: Any,
@@ -1757,14 +2462,25 @@ def _run_capturable_loop(
     check_every: int,
     use_cuda_graph: bool,
     cycle_size: int = 1,
+    batch_status: _BatchStatus | None = None,
 ):
     device = atol_sq.device
     batch_count = atol_sq.shape[0]
 
+    if batch_status is not None:
+        do_solver_cycle = do_cycle
+
+        def do_cycle():
+            batch_status.update(r_norm_sq, atol_sq, cycle_size)
+            do_solver_cycle()
+
     if check_every > 0:
-        return _run_solver_loop(
+        result = _run_solver_loop(
             do_cycle, cycle_size, r_norm_sq, maxiter, atol_sq, callback, check_every, use_cuda_graph, device
         )
+        if batch_status is not None:
+            batch_status.finalize(r_norm_sq)
+        return result
 
     cur_iter_and_condition = wp.full((2,), value=-1, dtype=int, device=device)
     cur_iter = cur_iter_and_condition[0:1]
@@ -1808,6 +2524,9 @@ def _run_capturable_loop(
         for _ in range(0, maxiter, cycle_size):
             do_cycle_with_condition()
 
+    if batch_status is not None:
+        batch_status.finalize(r_norm_sq)
+
     return cur_iter, r_norm_sq, atol_sq
 
 
@@ -1961,6 +2680,293 @@ def _extract_inverse_diagonal_dense(
     inv_diag[i] = _inverse_diag_coefficient(dense_matrix[i, i], use_abs != 0)
 
 
+@functools.cache
+def _create_block_funcs(block_type):
+    """Inverse and transpose of ``block_type`` values, which may be scalars or square matrices."""
+    if not type_is_matrix(block_type):
+
+        @wp.func
+        def block_inverse(m: block_type):
+            return wp.where(m == block_type(0.0), block_type(1.0), block_type(1.0) / m)
+
+        @wp.func
+        def block_transpose(m: block_type):
+            return m
+
+        return block_inverse, block_transpose
+
+    size = block_type._shape_[0]
+    scalar_type = block_type._wp_scalar_type_
+
+    @wp.func
+    def block_inverse(m: block_type):
+        # in-place Gauss-Jordan elimination without pivoting, zero pivots are replaced with one
+        a = m
+        for k in range(size):
+            pivot = a[k, k]
+            if pivot == scalar_type(0.0):
+                pivot = scalar_type(1.0)
+            a[k, k] = scalar_type(1.0)
+            for j in range(size):
+                a[k, j] = a[k, j] / pivot
+            for i in range(size):
+                if i != k:
+                    f = a[i, k]
+                    a[i, k] = scalar_type(0.0)
+                    for j in range(size):
+                        a[i, j] = a[i, j] - f * a[k, j]
+        return a
+
+    @wp.func
+    def block_transpose(m: block_type):
+        return wp.transpose(m)
+
+    return block_inverse, block_transpose
+
+
+@functools.cache
+def _create_block_inverse_kernel(block_type):
+    block_inverse, _ = _create_block_funcs(block_type)
+
+    @wp.kernel(module="unique")
+    def block_inverse_kernel(blocks: wp.array(dtype=block_type), inv_blocks: wp.array(dtype=block_type)):
+        i = wp.tid()
+        inv_blocks[i] = block_inverse(blocks[i])
+
+    return block_inverse_kernel
+
+
+@wp.kernel(enable_backward=False)
+def _triangular_levels_kernel(
+    row_offsets: wp.array(dtype=int),
+    row_columns: wp.array(dtype=int),
+    reverse: int,
+    levels: wp.array(dtype=int),
+):
+    """Level of each row in a triangular dependency graph.
+
+    Note:
+        Rows are processed sequentially; this kernel must be launched with ``dim=1``.
+    """
+    row_count = levels.shape[0]
+    for k in range(row_count):
+        row = wp.where(reverse != 0, row_count - 1 - k, k)
+        level = int(0)
+        for e in range(row_offsets[row], row_offsets[row + 1]):
+            level = wp.max(level, levels[row_columns[e]] + 1)
+        levels[row] = level
+
+
+@functools.cache
+def _create_incomplete_factorization_kernel(block_type, symmetric: bool):
+    block_inverse, block_transpose = _create_block_funcs(block_type)
+
+    @wp.kernel(module="unique")
+    def incomplete_factorization_kernel(
+        level_rows: wp.array(dtype=int),
+        level_begin: int,
+        row_start: wp.array(dtype=int),
+        diag_index: wp.array(dtype=int),
+        row_end: wp.array(dtype=int),
+        columns: wp.array(dtype=int),
+        values: wp.array(dtype=block_type),
+        inv_diag: wp.array(dtype=block_type),
+    ):
+        row = level_rows[level_begin + wp.tid()]
+        begin = row_start[row]
+        diag = diag_index[row]
+
+        if wp.static(symmetric):
+            # LDL^T: L_ik = (A_ik - sum_{j<k} L_ij D_j L_kj^T) D_k^-1
+            for e in range(begin, diag):
+                k = columns[e]
+                s = values[e]
+                p = begin
+                q = row_start[k]
+                k_diag = diag_index[k]
+                while p < e and q < k_diag:
+                    if columns[p] == columns[q]:
+                        s -= values[p] * values[diag_index[columns[p]]] * block_transpose(values[q])
+                        p += 1
+                        q += 1
+                    elif columns[p] < columns[q]:
+                        p += 1
+                    else:
+                        q += 1
+                values[e] = s * inv_diag[k]
+
+            # D_i = A_ii - sum_{k<i} L_ik D_k L_ik^T
+            d = values[diag]
+            for e in range(begin, diag):
+                d -= values[e] * values[diag_index[columns[e]]] * block_transpose(values[e])
+            values[diag] = d
+        else:
+            # LU: L_ik = A_ik U_kk^-1, then A_ij -= L_ik U_kj for j > k
+            end = row_end[row]
+            for e in range(begin, diag):
+                k = columns[e]
+                l_ik = values[e] * inv_diag[k]
+                values[e] = l_ik
+
+                p = diag_index[k] + 1
+                q = e + 1
+                k_end = row_end[k]
+                while p < k_end and q < end:
+                    if columns[p] == columns[q]:
+                        values[q] = values[q] - l_ik * values[p]
+                        p += 1
+                        q += 1
+                    elif columns[p] < columns[q]:
+                        p += 1
+                    else:
+                        q += 1
+
+        inv_diag[row] = block_inverse(values[diag])
+
+    return incomplete_factorization_kernel
+
+
+@wp.kernel(module="unique")
+def _lower_solve_level_kernel(
+    level_rows: wp.array(dtype=int),
+    level_begin: int,
+    row_start: wp.array(dtype=int),
+    diag_index: wp.array(dtype=int),
+    columns: wp.array(dtype=int),
+    values: wp.array(dtype=Any),
+    x: wp.array(dtype=Any),
+    y: wp.array(dtype=Any),
+):
+    # forward substitution with the unit lower triangular factor
+    row = level_rows[level_begin + wp.tid()]
+    s = x[row]
+    for e in range(row_start[row], diag_index[row]):
+        s -= values[e] * y[columns[e]]
+    y[row] = s
+
+
+@functools.cache
+def _create_upper_solve_kernel(block_type, symmetric: bool):
+    _, block_transpose = _create_block_funcs(block_type)
+
+    @wp.kernel(module="unique")
+    def upper_solve_level_kernel(
+        level_rows: wp.array(dtype=int),
+        level_begin: int,
+        upper_offsets: wp.array(dtype=int),
+        upper_columns: wp.array(dtype=int),
+        upper_entries: wp.array(dtype=int),
+        values: wp.array(dtype=block_type),
+        inv_diag: wp.array(dtype=block_type),
+        x: wp.array(dtype=Any),
+        y: wp.array(dtype=Any),
+    ):
+        # backward substitution with U, or with D L^T for the symmetric factorization
+        row = level_rows[level_begin + wp.tid()]
+        s = x[row]
+        if wp.static(symmetric):
+            s = inv_diag[row] * s
+            for u in range(upper_offsets[row], upper_offsets[row + 1]):
+                s -= block_transpose(values[upper_entries[u]]) * y[upper_columns[u]]
+            y[row] = s
+        else:
+            for u in range(upper_offsets[row], upper_offsets[row + 1]):
+                s -= values[upper_entries[u]] * y[upper_columns[u]]
+            y[row] = inv_diag[row] * s
+
+    return upper_solve_level_kernel
+
+
+@wp.kernel(module="unique")
+def _axpby_kernel(x: wp.array(dtype=Any), y: wp.array(dtype=Any), z: wp.array(dtype=Any), alpha: Any, beta: Any):
+    i = wp.tid()
+    zero = type(alpha)(0)
+    s = zero
+    if alpha != zero:
+        s += alpha * x[i]
+    if beta != zero:
+        s += beta * y[i]
+    z[i] = s
+
+
+@wp.kernel(module="unique")
+def _jacobi_gershgorin_bound_kernel(
+    offsets: wp.array(dtype=int),
+    row_counts: wp.array(dtype=int),
+    values: wp.array3d(dtype=Any),
+    inv_diag: wp.array(dtype=Any),
+    lambda_max: wp.array(dtype=Any),
+):
+    # the largest Gershgorin disc of D^-1 A bounds its eigenvalues
+    row, sub_row = wp.tid()
+    s = type(inv_diag[0])(0.0)
+    for block in range(offsets[row], _bsr_row_end(offsets, row_counts, row)):
+        for col in range(values.shape[2]):
+            s += wp.abs(values[block, sub_row, col])
+    wp.atomic_max(lambda_max, 0, s * wp.abs(inv_diag[row * values.shape[1] + sub_row]))
+
+
+@wp.kernel(module="unique")
+def _chebyshev_coefficients_kernel(
+    lambda_max: wp.array(dtype=Any),
+    eigenvalue_ratio: Any,
+    coefficients: wp.array2d(dtype=Any),
+):
+    one = type(eigenvalue_ratio)(1.0)
+    two = type(eigenvalue_ratio)(2.0)
+
+    upper = wp.where(lambda_max[0] > type(eigenvalue_ratio)(0.0), lambda_max[0], one)
+    lower = upper / eigenvalue_ratio
+    theta = (upper + lower) / two
+    delta = (upper - lower) / two
+    sigma = theta / delta
+
+    coefficients[0, 0] = one / theta
+    coefficients[0, 1] = type(eigenvalue_ratio)(0.0)
+
+    rho = one / sigma
+    for step in range(1, coefficients.shape[0]):
+        rho_new = one / (two * sigma - rho)
+        coefficients[step, 0] = rho_new * rho
+        coefficients[step, 1] = two * rho_new / delta
+        rho = rho_new
+
+
+@wp.kernel(module="unique")
+def _chebyshev_init_kernel(
+    inv_diag: wp.array(dtype=Any),
+    coefficients: wp.array2d(dtype=Any),
+    x: wp.array(dtype=Any),
+    r: wp.array(dtype=Any),
+    d: wp.array(dtype=Any),
+    z: wp.array(dtype=Any),
+):
+    i = wp.tid()
+    r_i = inv_diag[i] * x[i]
+    d_i = coefficients[0, 0] * r_i
+    r[i] = r_i
+    d[i] = d_i
+    z[i] = d_i
+
+
+@wp.kernel(module="unique")
+def _chebyshev_step_kernel(
+    inv_diag: wp.array(dtype=Any),
+    coefficients: wp.array2d(dtype=Any),
+    step: int,
+    Ad: wp.array(dtype=Any),
+    r: wp.array(dtype=Any),
+    d: wp.array(dtype=Any),
+    z: wp.array(dtype=Any),
+):
+    i = wp.tid()
+    r_i = r[i] - inv_diag[i] * Ad[i]
+    d_i = coefficients[step, 0] * d[i] + coefficients[step, 1] * r_i
+    r[i] = r_i
+    d[i] = d_i
+    z[i] += d_i
+
+
 @wp.kernel
 def _cg_kernel_1(
     tol: wp.array(dtype=Any),
@@ -1972,10 +2978,11 @@ def _cg_kernel_1(
     p: wp.array(dtype=Any),
     Ap: wp.array(dtype=Any),
     batch_offsets: wp.array(dtype=int),
+    batch_active: wp.array(dtype=int),
     dofs_per_entry: int,
 ):
     i = wp.tid()
-    bid = _find_entry_batch(i, batch_offsets, dofs_per_entry)
+    bid = _find_active_entry_batch(i, batch_offsets, batch_active, dofs_per_entry)
 
     if bid >= 0:
         alpha = wp.where(resid[bid] > tol[bid], rz_old[bid] / p_Ap[bid], rz_old.dtype(0.0))
@@ -1993,11 +3000,12 @@ def _cg_kernel_2(
     z: wp.array(dtype=Any),
     p: wp.array(dtype=Any),
     batch_offsets: wp.array(dtype=int),
+    batch_active: wp.array(dtype=int),
     dofs_per_entry: int,
 ):
     #    p = r + (rz_new / rz_old) * p;
     i = wp.tid()
-    bid = _find_entry_batch(i, batch_offsets, dofs_per_entry)
+    bid = _find_active_entry_batch(i, batch_offsets, batch_active, dofs_per_entry)
 
     if bid >= 0:
         beta = wp.where(resid_new[bid] > tol[bid], rz_new[bid] / rz_old[bid], rz_old.dtype(0.0))
@@ -2018,10 +3026,11 @@ def _cr_kernel_1(
     Ap: wp.array(dtype=Any),
     y: wp.array(dtype=Any),
     batch_offsets: wp.array(dtype=int),
+    batch_active: wp.array(dtype=int),
     dofs_per_entry: int,
 ):
     i = wp.tid()
-    bid = _find_entry_batch(i, batch_offsets, dofs_per_entry)
+    bid = _find_active_entry_batch(i, batch_offsets, batch_active, dofs_per_entry)
 
     if bid >= 0:
         alpha = wp.where(resid[bid] > tol[bid] and y_Ap[bid] > 0.0, zAz_old[bid] / y_Ap[bid], zAz_old.dtype(0.0))
@@ -2042,11 +3051,12 @@ def _cr_kernel_2(
     Az: wp.array(dtype=Any),
     Ap: wp.array(dtype=Any),
     batch_offsets: wp.array(dtype=int),
+    batch_active: wp.array(dtype=int),
     dofs_per_entry: int,
 ):
     #    p = r + (rz_new / rz_old) * p;
     i = wp.tid()
-    bid = _find_entry_batch(i, batch_offsets, dofs_per_entry)
+    bid = _find_active_entry_batch(i, batch_offsets, batch_active, dofs_per_entry)
 
     if bid >= 0:
         beta = wp.where(resid[bid] > tol[bid] and zAz_old[bid] > 0.0, zAz_new[bid] / zAz_old[bid], zAz_old.dtype(0.0))
@@ -2066,10 +3076,11 @@ def _bicgstab_kernel_1(
     y: wp.array(dtype=Any),
     v: wp.array(dtype=Any),
     batch_offsets: wp.array(dtype=int),
+    batch_active: wp.array(dtype=int),
     dofs_per_entry: int,
 ):
     i = wp.tid()
-    bid = _find_entry_batch(i, batch_offsets, dofs_per_entry)
+    bid = _find_active_entry_batch(i, batch_offsets, batch_active, dofs_per_entry)
 
     if bid >= 0:
         alpha = wp.where(resid[bid] > tol[bid], rho_old[bid] / r0v[bid], rho_old.dtype(0.0))
@@ -2089,10 +3100,11 @@ def _bicgstab_kernel_2(
     x: wp.array(dtype=Any),
     r: wp.array(dtype=Any),
     batch_offsets: wp.array(dtype=int),
+    batch_active: wp.array(dtype=int),
     dofs_per_entry: int,
 ):
     i = wp.tid()
-    bid = _find_entry_batch(i, batch_offsets, dofs_per_entry)
+    bid = _find_active_entry_batch(i, batch_offsets, batch_active, dofs_per_entry)
 
     if bid >= 0:
         omega = wp.where(resid[bid] > tol[bid], st[bid] / tt[bid], st.dtype(0.0))
@@ -2113,10 +3125,11 @@ def _bicgstab_kernel_3(
     r: wp.array(dtype=Any),
     v: wp.array(dtype=Any),
     batch_offsets: wp.array(dtype=int),
+    batch_active: wp.array(dtype=int),
     dofs_per_entry: int,
 ):
     i = wp.tid()
-    bid = _find_entry_batch(i, batch_offsets, dofs_per_entry)
+    bid = _find_active_entry_batch(i, batch_offsets, batch_active, dofs_per_entry)
 
     if bid >= 0:
         beta = wp.where(resid[bid] > tol[bid], rho_new[bid] * tt[bid] / (r0v[bid] * st[bid]), st.dtype(0.0))
@@ -2393,6 +3406,8 @@ def _register_overloads():
         wp.overload(_gmres_copy_hessenberg_column, {"src": a2, "H": a3})
         wp.overload(_gmres_update_x_kernel, {"scale": dtype, "y": a2, "V": a2, "x": a})
         wp.overload(_gmres_add_active_entries_kernel, {"update": a, "x": a})
+        wp.overload(_batch_status_update_kernel, {"r_norm_sq": a, "atol_sq": a})
+        wp.overload(_batch_status_residual_kernel, {"r_norm_sq": a, "residual_norms": a})
 
 
 _register_overloads()
@@ -0,0 +1,220 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Shared state for the multi-tensor (fused) optimizer steps.
+
+Parameters and gradients stay in the arrays owned by the caller and are reached through
+device-side tables of pointers and element offsets, while the optimizer state (moments,
+momentum buffers) is packed into contiguous fp32 storage. One launch then updates every
+parameter of a given scalar type.
+"""
+
+from __future__ import annotations
+
+import functools
+
+import numpy as np
+
+import warp as wp
+from warp._src.types import matrix, type_is_matrix, type_is_vector, type_length, type_scalar_type, type_size, vector
+
+# Scalar types of the parameters supported by the multi-tensor steps
+_SUPPORTED_SCALAR_TYPES = (wp.float16, wp.bfloat16, wp.float32)
+
+# Number of gradient entries reduced by each thread of the global norm kernel
+_GRAD_NORM_ENTRIES_PER_THREAD = 64
+
+# Largest number of scalars of a given type that the fused launches can update
+_MAX_GROUP_SIZE = 2**31 - 1
+
+
+@wp.func
+def _find_tensor(entry: int, offsets: wp.array[int]) -> int:
+    """Binary search for the tensor containing the flat scalar ``entry`` in ``offsets``."""
+    tensor_count = offsets.shape[0] - 1
+    return wp.lower_bound(offsets, 0, tensor_count + 1, entry + 1) - 1
+
+
+@wp.func
+def _grad_clip_scale(grad_sq_norm: wp.array[float], max_grad_norm: float) -> float:
+    """Factor scaling the gradients so that their global norm does not exceed ``max_grad_norm``."""
+    if max_grad_norm <= 0.0:
+        return 1.0
+    return wp.min(1.0, max_grad_norm / (wp.sqrt(grad_sq_norm[0]) + 1.0e-6))
+
+
+@wp.kernel(enable_backward=False)
+def _multi_tensor_step_end_kernel(step: wp.array[int], grad_sq_norm: wp.array[float]):
+    step[0] = step[0] + 1
+    grad_sq_norm[0] = 0.0
+
+
+@functools.cache
+def _create_grad_sq_norm_kernel(scalar_type):
+    @wp.kernel(enable_backward=False, module="unique")
+    def grad_sq_norm_kernel(
+        grad_ptrs: wp.array[wp.uint64],
+        offsets: wp.array[int],
+        grad_sq_norm: wp.array[float],
+    ):
+        chunk = wp.tid()
+
+        size = offsets[offsets.shape[0] - 1]
+        begin = chunk * _GRAD_NORM_ENTRIES_PER_THREAD
+        end = wp.min(begin + _GRAD_NORM_ENTRIES_PER_THREAD, size)
+
+        # constructing a scalar_type value makes the closure type part of the module hash
+        sq_sum = float(scalar_type(0.0))
+        entry = begin
+        while entry < end:
+            # chunks may straddle several tensors
+            tensor = _find_tensor(entry, offsets)
+            tensor_begin = offsets[tensor]
+            tensor_end = wp.min(offsets[tensor + 1], end)
+            grads = wp.array(ptr=grad_ptrs[tensor], shape=(tensor_end - tensor_begin,), dtype=scalar_type)
+            for j in range(entry - tensor_begin, tensor_end - tensor_begin):
+                g = float(grads[j])
+                sq_sum += g * g
+            entry = tensor_end
+
+        wp.atomic_add(grad_sq_norm, 0, sq_sum)
+
+    return grad_sq_norm_kernel
+
+
+def _state_dtype(dtype):
+    """Data type of the fp32 optimizer state of a parameter with data type ``dtype``."""
+    if type_scalar_type(dtype) == wp.float32:
+        return dtype
+    if type_is_vector(dtype):
+        return vector(length=type_length(dtype), dtype=wp.float32)
+    if type_is_matrix(dtype):
+        return matrix(shape=dtype._shape_, dtype=wp.float32)
+    return wp.float32
+
+
+class _MultiTensorGroup:
+    """Parameters sharing a scalar type, updated by a single launch."""
+
+    def __init__(self, scalar_type, indices, params, num_buffers, device):
+        self.scalar_type = scalar_type
+        self.indices = indices
+
+        sizes = [params[i].size * type_size(params[i].dtype) for i in indices]
+        offsets = np.concatenate(([0], np.cumsum(sizes, dtype=np.int64)))
+        if offsets[-1] > _MAX_GROUP_SIZE:
+            # the fused launches index the scalars of a group with 32-bit thread ids
+            raise RuntimeError(
+                f"Multi-tensor optimizer parameters of type {scalar_type.__name__} hold {offsets[-1]} scalars, "
+                f"at most {_MAX_GROUP_SIZE} are supported"
+            )
+        offsets = offsets.astype(np.int32)
+        self.size = int(offsets[-1])
+        self.offsets = wp.array(offsets, dtype=int, device=device)
+        self.param_ptrs = wp.array([params[i].ptr or 0 for i in indices], dtype=wp.uint64, device=device)
+
+        # packed fp32 optimizer state, plus per-parameter views with the parameter's shape
+        self.buffers = [wp.zeros(self.size, dtype=wp.float32, device=device) for _ in range(num_buffers)]
+        self.views = []
+        for buffer in self.buffers:
+            views = []
+            for k, i in enumerate(indices):
+                dtype = params[i].dtype
+                flat = buffer[int(offsets[k]) : int(offsets[k + 1])]
+                views.append(flat.reshape((*params[i].shape, *getattr(dtype, "_shape_", ()))).view(_state_dtype(dtype)))
+            self.views.append(views)
+
+        self._grad_ptr_values = None
+        self._grad_ptrs = None
+
+    def grad_ptrs(self, grads):
+        """Device table of the gradient pointers, uploaded again only when the gradient arrays change."""
+        values = tuple(grads[i].ptr or 0 for i in self.indices)
+        if values != self._grad_ptr_values:
+            self._grad_ptrs = wp.array(values, dtype=wp.uint64, device=self.offsets.device)
+            self._grad_ptr_values = values
+        return self._grad_ptrs
+
+
+class _MultiTensorState:
+    """Device-side bookkeeping shared by the multi-tensor optimizer steps.
+
+    Args:
+        params: Parameter arrays, all contiguous and on the same device.
+        num_buffers: Number of fp32 state buffers per parameter (e.g. 2 for the Adam moments).
+    """
+
+    def __init__(self, params, num_buffers: int):
+        self.device = params[0].device
+        self.key = _MultiTensorState.params_key(params)
+
+        group_indices = {}
+        for i, param in enumerate(params):
+            if param.device != self.device:
+                raise RuntimeError(
+                    f"Multi-tensor optimizer parameters must be on the same device, got {param.device} and {self.device}"
+                )
+            if not param.is_contiguous:
+                raise RuntimeError("Multi-tensor optimizer parameters must be contiguous arrays")
+            scalar_type = type_scalar_type(param.dtype)
+            if scalar_type not in _SUPPORTED_SCALAR_TYPES:
+                raise RuntimeError(f"Unsupported dtype for a multi-tensor Warp optimizer: {param.dtype}")
+            group_indices.setdefault(scalar_type, []).append(i)
+
+        self.groups = [
+            _MultiTensorGroup(scalar_type, indices, params, num_buffers, self.device)
+            for scalar_type, indices in group_indices.items()
+        ]
+
+        # per-parameter views of each state buffer, in parameter order
+        self.views = [[None] * len(params) for _ in range(num_buffers)]
+        for group in self.groups:
+            for b in range(num_buffers):
+                for k, i in enumerate(group.indices):
+                    self.views[b][i] = group.views[b][k]
+
+        self.step = wp.zeros(1, dtype=int, device=self.device)
+        self.grad_sq_norm = wp.zeros(1, dtype=float, device=self.device)
+
+    @staticmethod
+    def params_key(params):
+        """Key identifying the memory of ``params``; the pointer tables stay valid while it is unchanged."""
+        return tuple((p.ptr, p.shape, p.dtype, p.device) for p in params)
+
+    def check_grads(self, params, grads):
+        if len(grads) != len(params):
+            raise RuntimeError(f"Expected {len(params)} gradient arrays, got {len(grads)}")
+        for param, grad in zip(params, grads, strict=True):
+            if grad.dtype != param.dtype or grad.shape != param.shape:
+                raise RuntimeError("Gradient arrays must match the dtype and shape of their parameters")
+            if not grad.is_contiguous:
+                raise RuntimeError("Multi-tensor optimizer gradients must be contiguous arrays")
+
+    def begin_step(self, grads, max_grad_norm: float | None) -> float:
+        """Accumulate the squared global gradient norm when clipping is enabled.
+
+        Returns:
+            The norm to clip the gradients to in the step kernels, ``0.0`` when clipping is disabled.
+        """
+        max_grad_norm = 0.0 if max_grad_norm is None else float(max_grad_norm)
+        if max_grad_norm <= 0.0:
+            return 0.0
+        for group in self.groups:
+            wp.launch(
+                _create_grad_sq_norm_kernel(group.scalar_type),
+                dim=(group.size + _GRAD_NORM_ENTRIES_PER_THREAD - 1) // _GRAD_NORM_ENTRIES_PER_THREAD,
+                inputs=[group.grad_ptrs(grads), group.offsets, self.grad_sq_norm],
+                device=self.device,
+            )
+        return max_grad_norm
+
+    def end_step(self):
+        """Advance the device step counter and clear the gradient norm for the next step."""
+        wp.launch(_multi_tensor_step_end_kernel, dim=1, inputs=[self.step, self.grad_sq_norm], device=self.device)
+
+    def reset(self):
+        for group in self.groups:
+            for buffer in group.buffers:
+                buffer.zero_()
+        self.step.zero_()
+        self.grad_sq_norm.zero_()
@@ -0,0 +1,378 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+"""Mixed-precision iterative refinement around the Krylov solvers of :mod:`warp.optim.linear`.
+
+The outer loop computes residuals and accumulates corrections in the double-precision of the
+original system, while each correction is obtained by an inner Krylov solve on a single-precision
+copy of the operator. Matrix values may also be stored in half precision, in which case products
+still accumulate in single precision.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Callable
+from typing import Any
+
+import warp as wp
+import warp.sparse as sparse
+from warp._src.optim.linear import (
+    CG,
+    CR,
+    GMRES,
+    BiCGSTAB,
+    LinearOperator,
+    TiledDot,
+    _as_scalar_array,
+    _get_tolerances,
+    _Matrix,
+    _scalar_dof_count,
+    aslinearoperator,
+)
+from warp._src.sparse import _bsr_row_end
+from warp._src.types import type_is_matrix, type_is_vector, type_length, type_scalar_type
+
+# No need to auto-generate adjoint code for the refinement loop
+wp.set_module_options({"enable_backward": False})
+
+_INNER_SOLVERS = {"cg": CG, "cr": CR, "bicgstab": BiCGSTAB, "gmres": GMRES}
+
+# Default tolerance of the inner solves, relative to the norm of the current residual
+_DEFAULT_INNER_TOL = 1.0e-4
+
+
+def _lower_precision_dtype(dtype: type, scalar_type: type) -> type:
+    """Data type with the same shape as ``dtype`` and scalar type ``scalar_type``."""
+    if type_is_vector(dtype):
+        return wp.types.vector(length=type_length(dtype), dtype=scalar_type)
+    if type_is_matrix(dtype):
+        return wp.types.matrix(shape=dtype._shape_, dtype=scalar_type)
+    return scalar_type
+
+
+class MixedPrecisionRefinement:
+    """Mixed-precision iterative refinement of a double-precision linear system.
+
+    Each refinement step computes the residual ``r = b - A x`` in double precision, solves
+    ``A d = r`` approximately with an inner Krylov solver running on a single-precision copy of ``A``,
+    and accumulates the correction ``x += d`` in double precision. The inner iterations move half as
+    much data per matrix-vector product as a double-precision solve, while the outer loop recovers
+    double-precision accuracy for reasonably conditioned systems.
+
+    The inner operator is a copy of ``A`` with lower-precision values when ``A`` is a
+    :class:`warp.sparse.BsrMatrix` or a dense or diagonal ``warp.array``. Other
+    :class:`LinearOperator` objects are applied in double precision by converting the inner vectors,
+    which keeps the solver interface but not the bandwidth savings.
+    Likewise, preconditioners should preferably be built from :attr:`inner_matrix`.
+
+    Obtain instances by calling :func:`cg` or :func:`gmres` with ``inner_dtype`` and ``run=False``.
+    Calling the instance runs the refinement loop and returns a tuple ``(iterations, residual_norm, atol)``,
+    where ``iterations`` is the total number of inner iterations.
+
+    Args:
+        A: Left-hand side of the linear system, with ``float64`` scalars.
+        b: Right-hand side of the linear system, with ``float64`` scalars.
+        x: Initial guess and solution vector, with ``float64`` scalars.
+        solver: Inner Krylov solver, one of ``"cg"``, ``"cr"``, ``"bicgstab"``, or ``"gmres"``.
+        inner_dtype: Scalar type of the inner operator values, either ``wp.float32`` or ``wp.float16``.
+            Inner vectors always use ``wp.float32``; half-precision values are only supported for
+            :class:`warp.sparse.BsrMatrix` operators.
+        tol: Relative tolerance for the final residual, as a ratio of the right-hand-side norm.
+        atol: Absolute tolerance for the final residual.
+        inner_tol: Relative tolerance of each inner solve, as a ratio of the current residual norm.
+        maxiter: Maximum number of iterations of each inner solve. Defaults to the system size.
+        max_refinements: Maximum number of refinement steps.
+        M: Optional preconditioner of the inner solves. Double-precision operators are applied
+            by converting the inner vectors.
+        callback: Function called after each refinement step with the total number of inner iterations,
+            the residual norm, and the absolute tolerance.
+        check_every: Number of iterations every which the inner solver checks its residual. Must be positive.
+        use_cuda_graph: Whether the inner solver captures its iterations as a CUDA graph.
+        solver_options: Additional keyword arguments of the inner solver, such as ``restart`` for GMRES.
+    """
+
+    def __init__(
+        self,
+        A: _Matrix,
+        b: wp.array,
+        x: wp.array,
+        solver: str = "cg",
+        inner_dtype: type = wp.float32,
+        tol: float | None = None,
+        atol: float | None = None,
+        inner_tol: float = _DEFAULT_INNER_TOL,
+        maxiter: float | None = 0,
+        max_refinements: int = 10,
+        M: _Matrix | None = None,
+        callback: Callable | None = None,
+        check_every: int = 10,
+        use_cuda_graph: bool = True,
+        **solver_options,
+    ):
+        if solver not in _INNER_SOLVERS:
+            raise ValueError(f"Unsupported inner solver '{solver}'")
+        if inner_dtype not in (wp.float32, wp.float16):
+            raise ValueError(f"Inner dtype must be wp.float32 or wp.float16, got {inner_dtype}")
+        if type_scalar_type(b.dtype) != wp.float64 or type_scalar_type(x.dtype) != wp.float64:
+            raise ValueError("Mixed-precision refinement requires float64 right-hand side and solution vectors")
+        if check_every <= 0:
+            raise ValueError("Mixed-precision refinement requires host-side residual checks (check_every > 0)")
+
+        self._A = A
+        self._A_op = aslinearoperator(A)
+        if self._A_op.batch_offsets is not None:
+            raise ValueError("Mixed-precision refinement does not support batched systems")
+        if type_scalar_type(self._A_op.dtype) != wp.float64:
+            raise ValueError("Mixed-precision refinement requires a float64 operator")
+
+        self._b = b
+        self._x = x
+        self._tol = tol
+        self._atol = atol
+        self._max_refinements = int(max_refinements)
+        self._callback = callback
+        self.inner_dtype = inner_dtype
+        """Scalar type of the values of the inner operator"""
+
+        device = self._A_op.device
+        vector_dtype = _lower_precision_dtype(b.dtype, wp.float32)
+
+        # double-precision residual, and single-precision correction equation
+        self._r = wp.empty_like(b)
+        self._inner_b = wp.empty(b.shape, dtype=vector_dtype, device=device)
+        self._inner_x = wp.zeros_like(self._inner_b)
+        self._tiled_dot = TiledDot(max_length=_scalar_dof_count(b), scalar_type=wp.float64, device=device)
+
+        self._M = M
+        self._inner_matrix = None
+        self._inner_preconditioner_matrix = None
+        inner_A = self._make_inner_operator(A, inner_dtype)
+        inner_M = None if M is None else self._make_inner_operator(M, wp.float32, preconditioner=True)
+
+        self._inner_solver = _INNER_SOLVERS[solver](
+            inner_A,
+            self._inner_b,
+            self._inner_x,
+            tol=inner_tol,
+            atol=0.0,
+            maxiter=maxiter,
+            M=inner_M,
+            check_every=check_every,
+            use_cuda_graph=use_cuda_graph,
+            **solver_options,
+        )
+
+        self.refinement_count = 0
+        """Number of refinement steps performed by the last solve"""
+
+    @property
+    def inner_matrix(self) -> sparse.BsrMatrix | wp.array | None:
+        """Lower-precision copy of ``A`` used by the inner solves, or ``None`` if ``A`` is a generic operator."""
+        return self._inner_matrix
+
+    def update(self):
+        """Copy the current values of ``A`` to :attr:`inner_matrix`, and those of ``M`` to its single-precision copy.
+
+        Must be called after modifying the values of a sparse or dense ``A`` or ``M``. Their sparsity patterns
+        may change, in which case the lower-precision copies are rebuilt accordingly.
+        """
+        for src, dest in ((self._A, self._inner_matrix), (self._M, self._inner_preconditioner_matrix)):
+            if isinstance(dest, sparse.BsrMatrix):
+                sparse.bsr_assign(dest=dest, src=src)
+            elif dest is not None:
+                _cast(src, dest)
+
+    def __call__(self, b: wp.array | None = None, x: wp.array | None = None):
+        """Run the refinement loop, optionally substituting a new right-hand side or solution vector
+        with the same shape and data type as the ones passed at construction."""
+        b = self._b if b is None else b
+        x = self._x if x is None else x
+        if b.shape != self._b.shape or b.dtype != self._b.dtype:
+            raise ValueError("Incompatible right-hand side for mixed-precision refinement")
+        if x.shape != self._x.shape or x.dtype != self._x.dtype:
+            raise ValueError("Incompatible solution vector for mixed-precision refinement")
+
+        A = self._A_op
+        r = self._r
+        tiled_dot = self._tiled_dot
+        r_norm_sq = tiled_dot.col(0)
+
+        tiled_dot.compute(b, b)
+        rtol, atol = _get_tolerances(wp.float64, self._tol, self._atol)
+        atol = max(rtol * math.sqrt(float(r_norm_sq.numpy()[0])), atol)
+
+        iterations = 0
+        self.refinement_count = 0
+        while True:
+            # double-precision residual
+            A.matvec(x, b, r, alpha=-1.0, beta=1.0)
+            tiled_dot.compute(r, r)
+            err = math.sqrt(float(r_norm_sq.numpy()[0]))
+
+            if self._callback is not None:
+                self._callback(iterations, err, atol)
+            if err <= atol or self.refinement_count >= self._max_refinements:
+                break
+
+            # solve for the correction in single precision, with a unit-norm right-hand side
+            wp.launch(
+                _refinement_scale_residual_kernel,
+                dim=_scalar_dof_count(r),
+                device=r.device,
+                inputs=[_as_scalar_array(r), r_norm_sq, _as_scalar_array(self._inner_b)],
+            )
+            self._inner_x.zero_()
+            inner_iterations, _, _ = self._inner_solver()
+            iterations += inner_iterations
+
+            wp.launch(
+                _refinement_correction_kernel,
+                dim=_scalar_dof_count(x),
+                device=x.device,
+                inputs=[_as_scalar_array(self._inner_x), r_norm_sq, _as_scalar_array(x)],
+            )
+            self.refinement_count += 1
+
+        return iterations, err, atol
+
+    def _make_inner_operator(self, A: _Matrix, inner_dtype: type, preconditioner: bool = False) -> LinearOperator:
+        """Single-precision operator approximating ``A``."""
+
+        if isinstance(A, sparse.BsrMatrix) and type_scalar_type(A.dtype) == wp.float64:
+            inner_matrix = sparse.bsr_copy(A, scalar_type=inner_dtype)
+            if preconditioner:
+                self._inner_preconditioner_matrix = inner_matrix
+            else:
+                self._inner_matrix = inner_matrix
+            if inner_dtype == wp.float32:
+                return aslinearoperator(inner_matrix)
+            return _half_bsr_operator(inner_matrix)
+
+        if inner_dtype != wp.float32:
+            raise ValueError("Half-precision inner operators are only supported for sparse matrices")
+
+        if isinstance(A, wp.array) and type_scalar_type(A.dtype) == wp.float64 and A.ndim in (1, 2):
+            inner_matrix = wp.empty(A.shape, dtype=_lower_precision_dtype(A.dtype, wp.float32), device=A.device)
+            _cast(A, inner_matrix)
+            if preconditioner:
+                self._inner_preconditioner_matrix = inner_matrix
+            else:
+                self._inner_matrix = inner_matrix
+            return aslinearoperator(inner_matrix)
+
+        A = aslinearoperator(A)
+        if type_scalar_type(A.dtype) == wp.float32:
+            return A
+        return _converting_operator(A, self._b)
+
+
+def _cast(src: wp.array, dest: wp.array):
+    """Copy the values of ``src`` to ``dest``, which has the same shape and a different scalar type."""
+    src = _as_scalar_array(src.flatten())
+    wp.launch(
+        _refinement_cast_kernel,
+        dim=src.shape[0],
+        device=src.device,
+        inputs=[src, _as_scalar_array(dest.flatten())],
+    )
+
+
+def _half_bsr_operator(A: sparse.BsrMatrix) -> LinearOperator:
+    """Operator applying a half-precision sparse matrix to single-precision vectors."""
+
+    dtype = _lower_precision_dtype(A.dtype, wp.float32)
+
+    def matvec(x, y, z, alpha, beta):
+        wp.launch(
+            _half_bsr_mv_kernel,
+            dim=(A.nrow, A.block_shape[0]),
+            device=A.device,
+            inputs=[
+                A.offsets,
+                A.row_counts,
+                A.columns,
+                A.scalar_values,
+                _as_scalar_array(x),
+                _as_scalar_array(y),
+                _as_scalar_array(z),
+                wp.float32(alpha),
+                wp.float32(beta),
+            ],
+        )
+
+    return LinearOperator(A.shape, dtype, A.device, matvec=matvec)
+
+
+def _converting_operator(A: LinearOperator, b: wp.array) -> LinearOperator:
+    """Operator applying the square double-precision operator ``A`` to single-precision vectors shaped like ``b``."""
+
+    x64 = wp.empty_like(b)
+    z64 = wp.empty_like(b)
+
+    def matvec(x, y, z, alpha, beta):
+        _cast(x, x64)
+        # y may hold garbage when beta is zero, and A is not guaranteed to skip it
+        if beta != 0.0:
+            _cast(y, z64)
+        else:
+            z64.zero_()
+        A.matvec(x64, z64, z64, alpha, beta)
+        _cast(z64, z)
+
+    return LinearOperator(A.shape, _lower_precision_dtype(A.dtype, wp.float32), A.device, matvec=matvec)
+
+
+@wp.kernel(module="unique")
+def _refinement_cast_kernel(src: wp.array(dtype=Any), dest: wp.array(dtype=Any)):
+    i = wp.tid()
+    dest[i] = dest.dtype(src[i])
+
+
+@wp.kernel
+def _refinement_scale_residual_kernel(
+    r: wp.array(dtype=wp.float64),
+    r_norm_sq: wp.array(dtype=wp.float64),
+    inner_b: wp.array(dtype=wp.float32),
+):
+    i = wp.tid()
+    inner_b[i] = wp.float32(r[i] / wp.sqrt(r_norm_sq[0]))
+
+
+@wp.kernel
+def _refinement_correction_kernel(
+    inner_x: wp.array(dtype=wp.float32),
+    r_norm_sq: wp.array(dtype=wp.float64),
+    x: wp.array(dtype=wp.float64),
+):
+    i = wp.tid()
+    x[i] += wp.float64(inner_x[i]) * wp.sqrt(r_norm_sq[0])
+
+
+@wp.kernel
+def _half_bsr_mv_kernel(
+    offsets: wp.array(dtype=int),
+    row_counts: wp.array(dtype=int),
+    columns: wp.array(dtype=int),
+    values: wp.array3d(dtype=wp.float16),
+    x: wp.array(dtype=wp.float32),
+    y: wp.array(dtype=wp.float32),
+    z: wp.array(dtype=wp.float32),
+    alpha: wp.float32,
+    beta: wp.float32,
+):
+    row, sub_row = wp.tid()
+    block_cols = values.shape[2]
+
+    # half-precision values, single-precision accumulation
+    s = wp.float32(0.0)
+    for block in range(offsets[row], _bsr_row_end(offsets, row_counts, row)):
+        x_offset = columns[block] * block_cols
+        for col in range(block_cols):
+            s += wp.float32(values[block, sub_row, col]) * x[x_offset + col]
+
+    i = row * values.shape[1] + sub_row
+    s *= alpha
+    if beta != 0.0:
+        s += beta * y[i]
+    z[i] = s
@@ -1,9 +1,11 @@
 # SPDX-FileCopyrightText: Copyright (c) 2022 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import functools
 from typing import Any
 
 import warp as wp
+from warp._src.optim.multi_tensor import _find_tensor, _grad_clip_scale, _MultiTensorState
 
 
 @wp.kernel
@@ -36,6 +38,51 @@ def sgd_step_kernel(
     params[i] = params[i] - lr * gt
 
 
+@functools.cache
+def _create_sgd_multi_tensor_kernel(scalar_type):
+    @wp.kernel(enable_backward=False, module="unique")
+    def sgd_multi_tensor_step_kernel(
+        param_ptrs: wp.array[wp.uint64],
+        grad_ptrs: wp.array[wp.uint64],
+        offsets: wp.array[int],
+        b: wp.array[float],
+        lr: float,
+        momentum: float,
+        damping: float,
+        weight_decay: float,
+        nesterov: int,
+        step: wp.array[int],
+        grad_sq_norm: wp.array[float],
+        max_grad_norm: float,
+    ):
+        i = wp.tid()
+        tensor = _find_tensor(i, offsets)
+        tensor_begin = offsets[tensor]
+        tensor_size = offsets[tensor + 1] - tensor_begin
+        params = wp.array(ptr=param_ptrs[tensor], shape=(tensor_size,), dtype=scalar_type)
+        grads = wp.array(ptr=grad_ptrs[tensor], shape=(tensor_size,), dtype=scalar_type)
+
+        j = i - tensor_begin
+        p = float(params[j])
+        gt = float(grads[j]) * _grad_clip_scale(grad_sq_norm, max_grad_norm)
+        if weight_decay != 0.0:
+            gt += weight_decay * p
+        if momentum != 0.0:
+            bt = b[i]
+            if step[0] > 0:
+                bt = momentum * bt + (1.0 - damping) * gt
+            else:
+                bt = gt
+            if nesterov == 1:
+                gt += momentum * bt
+            else:
+                gt = bt
+            b[i] = bt
+        params[j] = scalar_type(p - lr * gt)
+
+    return sgd_multi_tensor_step_kernel
+
+
 class SGD:
     """Stochastic Gradient Descent (SGD) optimizer with optional momentum.
 
@@ -45,19 +92,47 @@ class SGD:
     The interface is similar to `PyTorch's torch.optim.SGD
     <https://pytorch.org/docs/stable/generated/torch.optim.SGD.html>`_.
 
+    With ``multi_tensor=True``, the momentum buffers of all parameters are packed
+    into a contiguous fp32 buffer (:attr:`b` holds per-parameter views of it) and
+    :meth:`step` updates every parameter of a given scalar type in a single
+    launch. The step count is then kept on the device in :attr:`step_count`, so
+    :meth:`step` can be captured in a graph and replayed.
+
     Args:
         params: List of :class:`warp.array` objects to optimize. Can be ``None``
-            and set later via :meth:`set_params`.
+            and set later via :meth:`set_params`. With ``multi_tensor=True``,
+            parameters must be contiguous arrays of :class:`warp.float16`,
+            :class:`warp.bfloat16`, or :class:`warp.float32` scalars, vectors, or
+            matrices.
         lr: Learning rate (step size).
         momentum: Momentum factor for accelerating SGD in relevant directions.
         dampening: Dampening factor applied to the momentum.
         weight_decay: Weight decay coefficient (L2 regularization).
         nesterov: Whether to use Nesterov momentum. Requires ``momentum > 0``
             and ``dampening = 0``.
+        multi_tensor: Whether to update all parameters with fused launches.
+        max_grad_norm: If set, scale the gradients so that their global L2 norm
+            over all parameters does not exceed this value. Requires
+            ``multi_tensor=True``. The attribute is read at every :meth:`step`.
     """
 
-    def __init__(self, params=None, lr=0.001, momentum=0.0, dampening=0.0, weight_decay=0.0, nesterov=False):
+    def __init__(
+        self,
+        params=None,
+        lr=0.001,
+        momentum=0.0,
+        dampening=0.0,
+        weight_decay=0.0,
+        nesterov=False,
+        multi_tensor=False,
+        max_grad_norm=None,
+    ):
+        if max_grad_norm is not None and not multi_tensor:
+            raise ValueError("max_grad_norm requires multi_tensor=True")
+        self.multi_tensor = multi_tensor
+        self.max_grad_norm = max_grad_norm
         self.b = []  # momentum buffer
+        self._multi_tensor_state = None
         self.set_params(params)
         self.lr = lr
         self.momentum = momentum
@@ -73,6 +148,9 @@ class SGD:
             params: List of :class:`warp.array` objects to optimize, or ``None``.
         """
         self.params = params
+        if self.multi_tensor:
+            self._set_multi_tensor_params(params)
+            return
         if params is not None and isinstance(params, list) and len(params) > 0:
             if len(self.b) != len(params):
                 self.b = [None] * len(params)
@@ -86,8 +164,44 @@ class SGD:
                 if param is not None:
                     wp.overload(sgd_step_kernel, {"g": param, "b": param, "params": param})
 
+    def _set_multi_tensor_params(self, params):
+        if params is None or len(params) == 0:
+            self._multi_tensor_state = None
+            self.b = []
+            return
+
+        # keep the state while the parameter arrays are unchanged, and carry the momentum
+        # over to new arrays with matching shapes (e.g. parameters moved to another device)
+        previous = self._multi_tensor_state
+        if previous is not None and previous.key == _MultiTensorState.params_key(params):
+            return
+        state = _MultiTensorState(params, 1)
+        if (
+            previous is not None
+            and len(self.b) == len(params)
+            and all(
+                old.shape == new.shape and old.dtype == new.dtype
+                for old, new in zip(self.b, state.views[0], strict=True)
+            )
+        ):
+            for old, new in zip(self.b, state.views[0], strict=True):
+                wp.copy(new, old)
+            wp.copy(state.step, previous.step)
+
+        self._multi_tensor_state = state
+        self.b = state.views[0]
+
+    @property
+    def step_count(self):
+        """Device array holding the number of steps taken in multi-tensor mode, or ``None``."""
+        return self._multi_tensor_state.step if self._multi_tensor_state is not None else None
+
     def reset_internal_state(self):
         """Reset momentum buffers and timestep to zero."""
+        if self._multi_tensor_state is not None:
+            self._multi_tensor_state.reset()
+            self.t = 0
+            return
         for b_i in self.b:
             b_i.zero_()
         self.t = 0
@@ -99,6 +213,12 @@ class SGD:
             grad: List of gradient arrays matching ``params``.
         """
         assert self.params is not None
+        if self._multi_tensor_state is not None:
+            self._step_multi_tensor(grad)
+            self.t = self.t + 1
+            return
+        if self.max_grad_norm is not None and not self.multi_tensor:
+            raise ValueError("max_grad_norm requires multi_tensor=True")
         for i in range(len(self.params)):
             SGD.step_detail(
                 grad[i],
@@ -113,6 +233,32 @@ class SGD:
             )
         self.t = self.t + 1
 
+    def _step_multi_tensor(self, grad):
+        state = self._multi_tensor_state
+        state.check_grads(self.params, grad)
+        max_grad_norm = state.begin_step(grad, self.max_grad_norm)
+        for group in state.groups:
+            wp.launch(
+                _create_sgd_multi_tensor_kernel(group.scalar_type),
+                dim=group.size,
+                inputs=[
+                    group.param_ptrs,
+                    group.grad_ptrs(grad),
+                    group.offsets,
+                    group.buffers[0],
+                    self.lr,
+                    self.momentum,
+                    self.dampening,
+                    self.weight_decay,
+                    int(self.nesterov),
+                    state.step,
+                    state.grad_sq_norm,
+                    max_grad_norm,
+                ],
+                device=state.device,
+            )
+        state.end_step()
+
     @staticmethod
     def step_detail(g, b, lr, momentum, dampening, weight_decay, nesterov, t, params):
         """Apply an SGD update to a single parameter array.
@@ -34,8 +34,10 @@ __all__ = [
     "BSR_STATUS_ROW_CAPACITY_EXCEEDED",
     "BSR_STATUS_SUCCESS",
     "BsrMatrix",
+    "BsrSellLayout",
     "bsr_assign",
     "bsr_axpy",
+    "bsr_axpy_plan",
     "bsr_axpy_work_arrays",
     "bsr_block_index",
     "bsr_compress",
@@ -46,8 +48,12 @@ __all__ = [
     "bsr_identity",
     "bsr_matrix_t",
     "bsr_mm",
+    "bsr_mm_plan",
     "bsr_mm_work_arrays",
     "bsr_mv",
+    "bsr_permute",
+    "bsr_permute_vector",
+    "bsr_reordering",
     "bsr_row_index",
     "bsr_scale",
     "bsr_set_diag",
@@ -55,6 +61,7 @@ __all__ = [
     "bsr_set_identity",
     "bsr_set_transpose",
     "bsr_set_zero",
+    "bsr_transpose_plan",
     "bsr_transposed",
     "bsr_zeros",
 ]
@@ -2826,6 +2833,119 @@ def bsr_transposed(A: BsrMatrixOrExpression) -> BsrMatrix:
     return transposed
 
 
+@wp.kernel(enable_backward=False)
+def _bsr_transpose_plan_map_blocks(
+    src_offsets: wp.array(dtype=int),
+    src_row_counts: wp.array(dtype=int),
+    src_columns: wp.array(dtype=int),
+    dest_nrow: int,
+    dest_offsets: wp.array(dtype=int),
+    dest_row_counts: wp.array(dtype=int),
+    dest_columns: wp.array(dtype=int),
+    src_blocks: wp.array(dtype=int),
+):
+    dest_block = wp.tid()
+
+    row = bsr_row_index(dest_offsets, dest_nrow, dest_block, dest_row_counts)
+    if row == -1:
+        src_blocks[dest_block] = -1
+    else:
+        src_blocks[dest_block] = bsr_block_index(
+            dest_columns[dest_block], row, src_offsets, src_columns, src_row_counts
+        )
+
+
+@wp.kernel(enable_backward=False, module="unique")
+def _bsr_transpose_plan_compute_values(
+    alpha: Any,
+    src_blocks: wp.array(dtype=int),
+    src_values: wp.array3d(dtype=Any),
+    dest_values: wp.array3d(dtype=Any),
+):
+    dest_block, i, j = wp.tid()
+
+    val = type(alpha)(0.0)
+    src_block = src_blocks[dest_block]
+    if src_block != -1:
+        val = alpha * src_values[src_block, j, i]
+    dest_values[dest_block, i, j] = val
+
+
+class bsr_transpose_plan:
+    """Precomputed topology of the transpose of a sparse matrix.
+
+    Constructing the plan allocates the :attr:`result` matrix with the transposed topology of ``src``,
+    and locates for each of its blocks the corresponding block of ``src``. :meth:`execute` then only
+    gathers and transposes block values with a single kernel launch, so it can be graph-captured.
+
+    The plan remains valid as long as the sparsity pattern of ``src`` does not change.
+    Building the plan requires host synchronization.
+
+    Args:
+        src: Sparse matrix to transpose.
+    """
+
+    def __init__(self, src: BsrMatrix[BlockType[Rows, Cols, Scalar]]):
+        self.src = src
+
+        self.result = bsr_transposed(src)
+        """Transposed matrix, with the planned topology"""
+
+        dest = self.result
+        device = dest.device
+        self._nnz = dest.nnz
+        self._src_info = _bsr_plan_operand_info(src)
+        self._result_info = _bsr_plan_operand_info(dest)
+
+        self._src_blocks = wp.empty(shape=(self._nnz,), dtype=int, device=device)
+        wp.launch(
+            _bsr_transpose_plan_map_blocks,
+            dim=self._nnz,
+            device=device,
+            inputs=[
+                src.offsets,
+                src.row_counts,
+                src.columns,
+                dest.nrow,
+                dest.offsets,
+                dest.row_counts,
+                dest.columns,
+                self._src_blocks,
+            ],
+        )
+
+    def execute(
+        self,
+        src: BsrMatrixOrExpression[BlockType[Rows, Cols, Scalar]] | None = None,
+        dest: BsrMatrix[BlockType[Cols, Rows, Scalar]] | None = None,
+    ) -> BsrMatrix[BlockType[Cols, Rows, Scalar]]:
+        """Assign the transpose of ``src`` to ``dest`` with the planned topology and return ``dest``.
+
+        Args:
+            src: Sparse matrix to transpose, with the same sparsity pattern as the one the plan was built for.
+              Defaults to the matrix passed at construction.
+            dest: Sparse matrix to populate, which must have the topology of :attr:`result` (for instance,
+              a copy of it) and must not alias ``src``. Defaults to :attr:`result`.
+        """
+
+        src, src_scale = _extract_matrix_and_scale(self.src if src is None else src)
+        if dest is None:
+            dest = self.result
+
+        if dest == src:
+            raise ValueError("The result of a `bsr_transpose_plan` must not alias its operand")
+        _bsr_plan_check_operand(src, self._src_info)
+        _bsr_plan_check_operand(dest, self._result_info)
+
+        wp.launch(
+            _bsr_transpose_plan_compute_values,
+            dim=(self._nnz, *dest.block_shape),
+            device=dest.device,
+            inputs=[dest.scalar_type(src_scale), self._src_blocks, src.scalar_values, dest.scalar_values],
+        )
+        return dest
+
+
 @wp.kernel(module="unique")
 def _bsr_get_diag_kernel(
     scale: Any,
@@ -3574,6 +3694,157 @@ def bsr_axpy(
     return y
 
 
+@wp.kernel(enable_backward=False)
+def _bsr_axpy_plan_map_blocks(
+    x_offsets: wp.array(dtype=int),
+    x_row_counts: wp.array(dtype=int),
+    x_columns: wp.array(dtype=int),
+    y_offsets: wp.array(dtype=int),
+    y_row_counts: wp.array(dtype=int),
+    y_columns: wp.array(dtype=int),
+    z_nrow: int,
+    z_offsets: wp.array(dtype=int),
+    z_row_counts: wp.array(dtype=int),
+    z_columns: wp.array(dtype=int),
+    x_blocks: wp.array(dtype=int),
+    y_blocks: wp.array(dtype=int),
+):
+    z_block = wp.tid()
+
+    row = bsr_row_index(z_offsets, z_nrow, z_block, z_row_counts)
+    col = z_columns[z_block]
+    x_blocks[z_block] = bsr_block_index(row, col, x_offsets, x_columns, x_row_counts)
+    y_blocks[z_block] = bsr_block_index(row, col, y_offsets, y_columns, y_row_counts)
+
+
+@wp.kernel(enable_backward=False, module="unique")
+def _bsr_axpy_plan_compute_values(
+    alpha: Any,
+    beta: Any,
+    x_blocks: wp.array(dtype=int),
+    y_blocks: wp.array(dtype=int),
+    x_values: wp.array3d(dtype=Any),
+    y_values: wp.array3d(dtype=Any),
+    z_values: wp.array3d(dtype=Any),
+):
+    z_block, i, j = wp.tid()
+
+    val = type(alpha)(0.0)
+    x_block = x_blocks[z_block]
+    if x_block != -1:
+        val += alpha * x_values[x_block, i, j]
+    y_block = y_blocks[z_block]
+    if y_block != -1:
+        val += beta * y_values[y_block, i, j]
+    z_values[z_block, i, j] = val
+
+
+class bsr_axpy_plan:
+    """Precomputed topology of the sparse matrix addition ``alpha * x + beta * y``.
+
+    Constructing the plan allocates the :attr:`result` matrix with the union of the topologies of ``x`` and ``y``,
+    and locates for each of its blocks the corresponding blocks of ``x`` and ``y``. :meth:`execute` then
+    only gathers and combines block values with a single kernel launch, so it can be graph-captured.
+
+    The plan remains valid as long as the sparsity patterns of the operands do not change.
+    Building the plan requires host synchronization.
+
+    Args:
+        x: First operand of the addition.
+        y: Second operand of the addition.
+    """
+
+    def __init__(
+        self,
+        x: BsrMatrix[BlockType[Rows, Cols, Scalar]],
+        y: BsrMatrix[BlockType[Rows, Cols, Scalar]],
+    ):
+        self.x = x
+        self.y = y
+
+        self.result = bsr_axpy(x, bsr_copy(y))
+        """Sum matrix, with the planned topology"""
+
+        z = self.result
+        device = z.device
+        self._nnz = z.nnz
+        self._x_info = _bsr_plan_operand_info(x)
+        self._y_info = _bsr_plan_operand_info(y)
+        self._result_info = _bsr_plan_operand_info(z)
+
+        self._x_blocks = wp.empty(shape=(self._nnz,), dtype=int, device=device)
+        self._y_blocks = wp.empty(shape=(self._nnz,), dtype=int, device=device)
+        wp.launch(
+            _bsr_axpy_plan_map_blocks,
+            dim=self._nnz,
+            device=device,
+            inputs=[
+                x.offsets,
+                x.row_counts,
+                x.columns,
+                y.offsets,
+                y.row_counts,
+                y.columns,
+                z.nrow,
+                z.offsets,
+                z.row_counts,
+                z.columns,
+                self._x_blocks,
+                self._y_blocks,
+            ],
+        )
+
+    def execute(
+        self,
+        x: BsrMatrixOrExpression[BlockType[Rows, Cols, Scalar]] | None = None,
+        y: BsrMatrixOrExpression[BlockType[Rows, Cols, Scalar]] | None = None,
+        z: BsrMatrix[BlockType[Rows, Cols, Scalar]] | None = None,
+        alpha: Scalar = 1.0,
+        beta: Scalar = 1.0,
+    ) -> BsrMatrix[BlockType[Rows, Cols, Scalar]]:
+        """Perform ``z := alpha * x + beta * y`` with the planned topology and return ``z``.
+
+        Args:
+            x: First operand, with the same sparsity pattern as the one the plan was built for.
+              Defaults to the matrix passed at construction.
+            y: Second operand, with the same sparsity pattern as the one the plan was built for.
+              Defaults to the matrix passed at construction.
+            z: Result matrix, which must have the topology of :attr:`result` (for instance, a copy of it)
+              and must not alias ``x`` or ``y``. Defaults to :attr:`result`.
+            alpha: Uniform scaling factor for ``x``.
+            beta: Uniform scaling factor for ``y``.
+        """
+
+        x, x_scale = _extract_matrix_and_scale(self.x if x is None else x)
+        alpha *= x_scale
+        y, y_scale = _extract_matrix_and_scale(self.y if y is None else y)
+        beta *= y_scale
+        if z is None:
+            z = self.result
+
+        if z == x or z == y:
+            raise ValueError("The result of a `bsr_axpy_plan` must not alias its operands")
+        _bsr_plan_check_operand(x, self._x_info)
+        _bsr_plan_check_operand(y, self._y_info)
+        _bsr_plan_check_operand(z, self._result_info)
+
+        wp.launch(
+            _bsr_axpy_plan_compute_values,
+            dim=(self._nnz, *z.block_shape),
+            device=z.device,
+            inputs=[
+                z.scalar_type(alpha),
+                z.scalar_type(beta),
+                self._x_blocks,
+                self._y_blocks,
+                x.scalar_values,
+                y.scalar_values,
+                z.scalar_values,
+            ],
+        )
+        return z
+
+
 @cache
 def make_bsr_mm_count_coeffs(tile_size):
 
@@ -4581,6 +4852,243 @@ def bsr_mm(
     return z
 
 
+@wp.kernel(enable_backward=False)
+def _bsr_mm_plan_count_pairs(
+    x_offsets: wp.array(dtype=int),
+    x_row_counts: wp.array(dtype=int),
+    x_columns: wp.array(dtype=int),
+    y_offsets: wp.array(dtype=int),
+    y_row_counts: wp.array(dtype=int),
+    y_columns: wp.array(dtype=int),
+    z_nrow: int,
+    z_offsets: wp.array(dtype=int),
+    z_row_counts: wp.array(dtype=int),
+    z_columns: wp.array(dtype=int),
+    pair_offsets: wp.array(dtype=int),
+):
+    z_block = wp.tid()
+
+    count = int(0)
+    row = bsr_row_index(z_offsets, z_nrow, z_block, z_row_counts)
+    if row != -1:
+        col = z_columns[z_block]
+        for x_block in range(x_offsets[row], _bsr_row_end(x_offsets, x_row_counts, row)):
+            if bsr_block_index(x_columns[x_block], col, y_offsets, y_columns, y_row_counts) != -1:
+                count += 1
+
+    pair_offsets[z_block + 1] = count
+
+
+@wp.kernel(enable_backward=False)
+def _bsr_mm_plan_list_pairs(
+    x_offsets: wp.array(dtype=int),
+    x_row_counts: wp.array(dtype=int),
+    x_columns: wp.array(dtype=int),
+    y_offsets: wp.array(dtype=int),
+    y_row_counts: wp.array(dtype=int),
+    y_columns: wp.array(dtype=int),
+    z_nrow: int,
+    z_offsets: wp.array(dtype=int),
+    z_row_counts: wp.array(dtype=int),
+    z_columns: wp.array(dtype=int),
+    pair_offsets: wp.array(dtype=int),
+    pair_x_blocks: wp.array(dtype=int),
+    pair_y_blocks: wp.array(dtype=int),
+):
+    z_block = wp.tid()
+
+    row = bsr_row_index(z_offsets, z_nrow, z_block, z_row_counts)
+    if row == -1:
+        return
+
+    col = z_columns[z_block]
+    pair = pair_offsets[z_block]
+    for x_block in range(x_offsets[row], _bsr_row_end(x_offsets, x_row_counts, row)):
+        y_block = bsr_block_index(x_columns[x_block], col, y_offsets, y_columns, y_row_counts)
+        if y_block != -1:
+            pair_x_blocks[pair] = x_block
+            pair_y_blocks[pair] = y_block
+            pair += 1
+
+
+@wp.kernel(enable_backward=False, module="unique")
+def _bsr_mm_plan_compute_values(
+    alpha: Any,
+    beta: Any,
+    pair_offsets: wp.array(dtype=int),
+    pair_x_blocks: wp.array(dtype=int),
+    pair_y_blocks: wp.array(dtype=int),
+    x_values: wp.array3d(dtype=Any),
+    y_values: wp.array3d(dtype=Any),
+    z_values: wp.array3d(dtype=Any),
+):
+    z_block, i, j = wp.tid()
+
+    zero = type(alpha)(0.0)
+    val = zero
+    for pair in range(pair_offsets[z_block], pair_offsets[z_block + 1]):
+        x_block = pair_x_blocks[pair]
+        y_block = pair_y_blocks[pair]
+        for k in range(x_values.shape[2]):
+            val += x_values[x_block, i, k] * y_values[y_block, k, j]
+
+    val *= alpha
+    if beta != zero:
+        val += beta * z_values[z_block, i, j]
+    z_values[z_block, i, j] = val
+
+
+class bsr_mm_plan:
+    """Precomputed topology of the sparse matrix-matrix product ``x @ y``.
+
+    Constructing the plan performs the symbolic phase of the product once: it allocates the :attr:`result`
+    matrix with the topology of ``x @ y``, and lists for each of its blocks the pairs of ``x`` and ``y`` blocks
+    contributing to it. :meth:`execute` then only gathers and multiplies block values with a single kernel
+    launch, so it can be graph-captured.
+
+    The plan remains valid as long as the sparsity patterns of the operands do not change,
+    which is typically the case for Newton iterations or multigrid setups with changing values.
+    Building the plan requires host synchronization.
+
+    Args:
+        x: Left operand of the matrix-matrix product.
+        y: Right operand of the matrix-matrix product.
+    """
+
+    def __init__(
+        self,
+        x: BsrMatrix[BlockType[Rows, Any, Scalar]],
+        y: BsrMatrix[BlockType[Any, Cols, Scalar]],
+    ):
+        self.x = x
+        self.y = y
+
+        self.result = bsr_mm(x, y)
+        """Product matrix, with the planned topology"""
+
+        z = self.result
+        device = z.device
+        self._nnz = z.nnz
+        self._x_info = _bsr_plan_operand_info(x)
+        self._y_info = _bsr_plan_operand_info(y)
+        self._result_info = _bsr_plan_operand_info(z)
+
+        self._pair_offsets = wp.zeros(shape=(self._nnz + 1,), dtype=int, device=device)
+        topology_args = [
+            x.offsets,
+            x.row_counts,
+            x.columns,
+            y.offsets,
+            y.row_counts,
+            y.columns,
+            z.nrow,
+            z.offsets,
+            z.row_counts,
+            z.columns,
+            self._pair_offsets,
+        ]
+        wp.launch(_bsr_mm_plan_count_pairs, dim=self._nnz, device=device, inputs=topology_args)
+        warp._src.utils.array_scan(self._pair_offsets, self._pair_offsets, inclusive=True)
+
+        pair_count = int(self._pair_offsets.numpy()[self._nnz])
+        self._pair_x_blocks = wp.empty(shape=(pair_count,), dtype=int, device=device)
+        self._pair_y_blocks = wp.empty(shape=(pair_count,), dtype=int, device=device)
+        wp.launch(
+            _bsr_mm_plan_list_pairs,
+            dim=self._nnz,
+            device=device,
+            inputs=[*topology_args, self._pair_x_blocks, self._pair_y_blocks],
+        )
+
+    @property
+    def pair_count(self) -> int:
+        """Number of block products ``x[i, k] @ y[k, j]`` evaluated by each execution."""
+        return self._pair_x_blocks.shape[0]
+
+    def execute(
+        self,
+        x: BsrMatrixOrExpression[BlockType[Rows, Any, Scalar]] | None = None,
+        y: BsrMatrixOrExpression[BlockType[Any, Cols, Scalar]] | None = None,
+        z: BsrMatrix[BlockType[Rows, Cols, Scalar]] | None = None,
+        alpha: Scalar = 1.0,
+        beta: Scalar = 0.0,
+    ) -> BsrMatrix[BlockType[Rows, Cols, Scalar]]:
+        """Perform ``z := alpha * x @ y + beta * z`` with the planned topology and return ``z``.
+
+        Args:
+            x: Left operand, with the same sparsity pattern as the one the plan was built for.
+              Defaults to the matrix passed at construction.
+            y: Right operand, with the same sparsity pattern as the one the plan was built for.
+              Defaults to the matrix passed at construction.
+            z: Result matrix, which must have the topology of :attr:`result` (for instance, a copy of it)
+              and must not alias ``x`` or ``y``. Defaults to :attr:`result`.
+            alpha: Uniform scaling factor for the ``x @ y`` product.
+            beta: Uniform scaling factor for ``z``.
+        """
+
+        x, x_scale = _extract_matrix_and_scale(self.x if x is None else x)
+        alpha *= x_scale
+        y, y_scale = _extract_matrix_and_scale(self.y if y is None else y)
+        alpha *= y_scale
+        if z is None:
+            z = self.result
+
+        if z == x or z == y:
+            raise ValueError("The result of a `bsr_mm_plan` must not alias its operands")
+        _bsr_plan_check_operand(x, self._x_info)
+        _bsr_plan_check_operand(y, self._y_info)
+        _bsr_plan_check_operand(z, self._result_info)
+
+        wp.launch(
+            _bsr_mm_plan_compute_values,
+            dim=(self._nnz, *z.block_shape),
+            device=z.device,
+            inputs=[
+                z.scalar_type(alpha),
+                z.scalar_type(beta),
+                self._pair_offsets,
+                self._pair_x_blocks,
+                self._pair_y_blocks,
+                x.scalar_values,
+                y.scalar_values,
+                z.scalar_values,
+            ],
+        )
+        return z
+
+
+def _bsr_plan_operand_info(matrix: BsrMatrix) -> tuple:
+    """Host-side description of the storage of a plan operand, compared with the operands of each execution."""
+    return (
+        matrix.values.device,
+        matrix.scalar_type,
+        matrix.block_shape,
+        matrix.nrow,
+        matrix.ncol,
+        matrix.nnz,
+        matrix.row_counts is not None,
+    )
+
+
+def _bsr_plan_check_operand(matrix: BsrMatrix, planned: tuple):
+    device, scalar_type, block_shape, nrow, ncol, nnz, padded = planned
+    if matrix.values.device != device:
+        raise ValueError(f"All arguments must reside on the same device, got {matrix.values.device} and {device}")
+    if matrix.scalar_type != scalar_type or matrix.block_shape != block_shape:
+        raise ValueError(
+            f"Matrices must have the planned block type, got ({matrix.block_shape}, {matrix.scalar_type}) and ({block_shape}, {scalar_type})"
+        )
+    if matrix.nrow != nrow or matrix.ncol != ncol:
+        raise ValueError(
+            f"Matrices must have the planned number of rows and columns, got ({matrix.nrow}, {matrix.ncol}) and ({nrow}, {ncol})"
+        )
+    # the block indices of the plan address the storage of the planned topology
+    if matrix.nnz != nnz or (matrix.row_counts is not None) != padded:
+        raise ValueError(
+            f"Matrices must have the planned sparsity pattern, got {matrix.nnz} {'padded' if matrix.row_counts is not None else 'compact'} blocks and {nnz} {'padded' if padded else 'compact'}"
+        )
+
+
 @cache
 def make_bsr_mv_kernel(block_cols: int):
 
@@ -4747,8 +5255,276 @@ def _vec_array_view(array: wp.array, dtype: type, expected_scalar_count: int) ->
     return view
 
 
+# Coefficient of variation of the row lengths above which `bsr_mv` uses the sliced ELLPACK storage
+_BSR_SELL_ROW_LENGTH_VARIATION = 0.5
+# Maximum ratio of stored to non-zero blocks for `bsr_mv` to use the sliced ELLPACK storage
+_BSR_SELL_MAX_PADDING_RATIO = 2.0
+
+
+@cache
+def make_bsr_sell_mv_kernel(block_cols: int):
+
+    @wp.kernel(enable_backward=False, module="unique")
+    def bsr_sell_mv_kernel(
+        alpha: Any,
+        chunk_size: int,
+        row_permutation: wp.array(dtype=int),
+        row_lengths: wp.array(dtype=int),
+        slice_offsets: wp.array(dtype=int),
+        sell_columns: wp.array(dtype=int),
+        sell_values: wp.array3d(dtype=Any),
+        x: wp.array(dtype=Any),
+        beta: Any,
+        y: wp.array(dtype=Any),
+    ):
+        slot, subrow = wp.tid()
+
+        # consecutive slots of a slice read consecutive entries of each column of the slice
+        slice_index = slot // chunk_size
+        entry = slice_offsets[slice_index] + slot - slice_index * chunk_size
+
+        scalar_zero = type(alpha)(0)
+        v = scalar_zero
+
+        if alpha != scalar_zero:
+            for _j in range(row_lengths[slot]):
+                xs = sell_columns[entry] * block_cols
+                for col in range(wp.static(block_cols)):
+                    v += sell_values[entry, subrow, col] * x[xs + col]
+                entry += chunk_size
+            v *= alpha
+
+        yi = row_permutation[slot] * sell_values.shape[1] + subrow
+        if beta != scalar_zero:
+            v += beta * y[yi]
+
+        y[yi] = v
+
+    return bsr_sell_mv_kernel
+
+
+@wp.kernel(enable_backward=False)
+def _bsr_sell_row_lengths(
+    offsets: wp.array(dtype=int),
+    row_counts: wp.array(dtype=int),
+    negated_lengths: wp.array(dtype=int),
+    rows: wp.array(dtype=int),
+):
+    row = wp.tid()
+    negated_lengths[row] = offsets[row] - _bsr_row_end(offsets, row_counts, row)
+    rows[row] = row
+
+
+@wp.kernel(enable_backward=False)
+def _bsr_sell_slice_sizes(
+    chunk_size: int,
+    row_count: int,
+    negated_lengths: wp.array(dtype=int),
+    slice_offsets: wp.array(dtype=int),
+):
+    slice_index = wp.tid()
+
+    width = int(0)
+    for slot in range(slice_index * chunk_size, wp.min(row_count, (slice_index + 1) * chunk_size)):
+        width = wp.max(width, -negated_lengths[slot])
+
+    slice_offsets[slice_index + 1] = width * chunk_size
+    if slice_index == 0:
+        slice_offsets[0] = 0
+
+
+@wp.kernel(enable_backward=False)
+def _bsr_sell_fill_topology(
+    chunk_size: int,
+    offsets: wp.array(dtype=int),
+    columns: wp.array(dtype=int),
+    row_permutation: wp.array(dtype=int),
+    negated_lengths: wp.array(dtype=int),
+    row_lengths: wp.array(dtype=int),
+    slice_offsets: wp.array(dtype=int),
+    sell_columns: wp.array(dtype=int),
+    sell_blocks: wp.array(dtype=int),
+):
+    slot = wp.tid()
+
+    slice_index = slot // chunk_size
+    entry = slice_offsets[slice_index] + slot - slice_index * chunk_size
+
+    length = -negated_lengths[slot]
+    row_lengths[slot] = length
+
+    block = offsets[row_permutation[slot]]
+    for _j in range(length):
+        sell_columns[entry] = columns[block]
+        sell_blocks[entry] = block
+        block += 1
+        entry += chunk_size
+
+
+@wp.kernel(enable_backward=False, module="unique")
+def _bsr_sell_gather_values(
+    sell_blocks: wp.array(dtype=int),
+    values: wp.array3d(dtype=Any),
+    sell_values: wp.array3d(dtype=Any),
+):
+    entry, i, j = wp.tid()
+    block = sell_blocks[entry]
+    if block == -1:
+        sell_values[entry, i, j] = sell_values.dtype(0.0)
+    else:
+        sell_values[entry, i, j] = values[block, i, j]
+
+
+class BsrSellLayout:
+    """Sliced ELLPACK (SELL-C-sigma) copy of a :class:`BsrMatrix`, for faster matrix-vector products.
+
+    Rows of blocks are sorted by decreasing length within windows of ``sigma`` rows, then grouped into slices of
+    ``chunk_size`` consecutive sorted rows. The blocks of each slice are stored column-major and padded to the
+    length of its longest row, so that rows processed together have similar lengths and read contiguous memory.
+
+    Passing the layout instead of its :attr:`matrix` to :func:`bsr_mv` performs the product using the
+    sliced storage when the lengths of the rows of the matrix vary enough for it to be beneficial,
+    and falls back to the compressed-row kernels otherwise.
+
+    The layout copies the values of the matrix: :meth:`sync_values` must be called after they are modified.
+    If the topology of the matrix changes, :meth:`update` rebuilds the layout.
+
+    Args:
+        A: Source sparse matrix.
+        chunk_size: Number of rows per slice.
+        sigma: Size of the windows of rows sorted by length, as a multiple of ``chunk_size``.
+          If ``None``, defaults to 32 chunks.
+        use_sell: Whether :func:`bsr_mv` should use the sliced storage. If ``None``, it is used when the
+          coefficient of variation of the row lengths exceeds a fixed threshold and the padding of the slices
+          remains moderate.
+    """
+
+    def __init__(
+        self,
+        A: BsrMatrix[BlockType[Rows, Cols, Scalar]],
+        chunk_size: int = 32,
+        sigma: int | None = None,
+        use_sell: bool | None = None,
+    ):
+        if chunk_size < 1:
+            raise ValueError(f"Chunk size must be positive, got {chunk_size}")
+        if sigma is None:
+            sigma = 32 * chunk_size
+        if sigma < chunk_size or sigma % chunk_size != 0:
+            raise ValueError(f"Sorting window ({sigma}) must be a positive multiple of the chunk size ({chunk_size})")
+
+        self.matrix = A
+        """Source sparse matrix"""
+        self.chunk_size = chunk_size
+        self.sigma = sigma
+
+        self._use_sell = use_sell
+        self.update()
+
+    @property
+    def use_sell(self) -> bool:
+        """Whether :func:`bsr_mv` uses the sliced storage rather than the compressed rows of :attr:`matrix`."""
+        return self._use_sell_storage
+
+    @property
+    def padding_ratio(self) -> float:
+        """Ratio between the number of stored blocks, including padding, and the number of non-zero blocks."""
+        return self.entry_count / max(self.matrix.nnz, 1)
+
+    def update(self):
+        """Rebuild the layout from the current topology and values of :attr:`matrix`.
+
+        This requires synchronizing the host with the device.
+        """
+
+        A = self.matrix
+        device = A.device
+        nrow = A.nrow
+        C = self.chunk_size
+
+        # sort rows by decreasing length within each window
+        negated_lengths = wp.empty(2 * nrow, dtype=int, device=device)
+        self.row_permutation = wp.empty(2 * nrow, dtype=int, device=device)
+        wp.launch(
+            _bsr_sell_row_lengths,
+            dim=nrow,
+            device=device,
+            inputs=[A.offsets, A.row_counts, negated_lengths, self.row_permutation],
+        )
+
+        window_starts = wp.array([*range(0, nrow, self.sigma), nrow], dtype=wp.int32, device=device)
+        warp._src.utils.segmented_sort_pairs(negated_lengths, self.row_permutation, nrow, window_starts)
+        self.row_permutation = self.row_permutation[:nrow]
+
+        # slice sizes, padded to their longest row
+        slice_count = (nrow + C - 1) // C
+        self.slice_offsets = wp.empty(slice_count + 1, dtype=int, device=device)
+        wp.launch(
+            _bsr_sell_slice_sizes,
+            dim=slice_count,
+            device=device,
+            inputs=[C, nrow, negated_lengths, self.slice_offsets],
+        )
+        warp._src.utils.array_scan(self.slice_offsets, self.slice_offsets, inclusive=True)
+
+        host_negated_lengths = negated_lengths[:nrow].numpy()
+        self.entry_count = int(self.slice_offsets[slice_count:].numpy()[0]) if slice_count > 0 else 0
+
+        if self._use_sell is None:
+            lengths = -host_negated_lengths
+            mean_length = lengths.mean() if nrow > 0 else 0.0
+            self._use_sell_storage = (
+                mean_length > 0.0
+                and lengths.std() > _BSR_SELL_ROW_LENGTH_VARIATION * mean_length
+                and self.padding_ratio <= _BSR_SELL_MAX_PADDING_RATIO
+            )
+        else:
+            self._use_sell_storage = self._use_sell
+
+        self.row_lengths = wp.empty(nrow, dtype=int, device=device)
+        self.columns = wp.zeros(self.entry_count, dtype=int, device=device)
+        self.blocks = wp.full(self.entry_count, value=-1, dtype=int, device=device)
+        wp.launch(
+            _bsr_sell_fill_topology,
+            dim=nrow,
+            device=device,
+            inputs=[
+                C,
+                A.offsets,
+                A.columns,
+                self.row_permutation,
+                negated_lengths,
+                self.row_lengths,
+                self.slice_offsets,
+                self.columns,
+                self.blocks,
+            ],
+        )
+
+        # values are only copied when the sliced storage is used
+        value_count = self.entry_count if self._use_sell_storage else 0
+        self.values = wp.empty((value_count, *A.block_shape), dtype=A.scalar_type, device=device)
+        self.sync_values()
+
+    def sync_values(self):
+        """Copy the current values of :attr:`matrix` to the sliced storage.
+
+        The topology of the matrix must not have changed since the layout was built.
+        This only performs a kernel launch, so it can be graph-captured.
+        """
+        if not self._use_sell_storage:
+            return
+
+        wp.launch(
+            _bsr_sell_gather_values,
+            dim=self.values.shape,
+            device=self.values.device,
+            inputs=[self.blocks, self.matrix.scalar_values, self.values],
+        )
+
+
 def bsr_mv(
-    A: BsrMatrixOrExpression[BlockType[Rows, Cols, Scalar]],
+    A: BsrMatrixOrExpression[BlockType[Rows, Cols, Scalar]] | BsrSellLayout,
     x: Array[Vector[Scalar, Cols] | Scalar],
     y: Array[Vector[Scalar, Rows] | Scalar] | None = None,
     alpha: Scalar = 1.0,
@@ -4762,7 +5538,8 @@ def bsr_mv(
     The ``x`` and ``y`` vectors are allowed to alias.
 
     Args:
-        A: Read-only, left matrix operand of the matrix-vector product.
+        A: Read-only, left matrix operand of the matrix-vector product. If a :class:`BsrSellLayout` is passed,
+          its sliced storage is used for non-transposed products when beneficial.
         x: Read-only, right vector operand of the matrix-vector product.
         y: Mutable affine operand and result vector. If ``y`` is not provided, it will be allocated and treated as zero.
         alpha: Uniform scaling factor for ``x``. If zero, ``x`` will not be read and may be left uninitialized.
@@ -4776,6 +5553,11 @@ def bsr_mv(
           use tiles using using an heuristic based on the matrix shape and number of non-zeros..
     """
 
+    sell = None
+    if isinstance(A, BsrSellLayout):
+        sell = A if A.use_sell and not transpose else None
+        A = A.matrix
+
     A, A_scale = _extract_matrix_and_scale(A)
     alpha *= A_scale
 
@@ -4852,6 +5634,24 @@ def bsr_mv(
                 dim=(A.nnz, block_shape[0]),
                 inputs=[alpha, A.nrow, A.offsets, A.row_counts, A.columns, A.scalar_values, x_view, y_view],
             )
+    elif sell is not None:
+        wp.launch(
+            kernel=make_bsr_sell_mv_kernel(block_cols=block_shape[1]),
+            device=A.values.device,
+            dim=(nrow, block_shape[0]),
+            inputs=[
+                alpha,
+                sell.chunk_size,
+                sell.row_permutation,
+                sell.row_lengths,
+                sell.slice_offsets,
+                sell.columns,
+                sell.values,
+                x_view,
+                beta,
+                y_view,
+            ],
+        )
     elif use_tiles:
         wp.launch(
             kernel=make_bsr_mv_tiled_kernel(tile_size),
@@ -4869,3 +5669,446 @@ def bsr_mv(
         )
 
     return y
+
+
+# Maximum number of breadth-first searches used to look for a pseudo-peripheral node
+_BSR_REORDER_PERIPHERAL_SEARCHES = 8
+
+# Subgraphs with at most this number of nodes are not bisected further by nested dissection
+_BSR_NESTED_DISSECTION_LEAF_SIZE = 64
+
+
+@wp.func
+def _bsr_reorder_bfs(
+    start: int,
+    offsets: wp.array(dtype=int),
+    columns: wp.array(dtype=int),
+    degrees: wp.array(dtype=int),
+    parts: wp.array(dtype=int),
+    part: int,
+    marks: wp.array(dtype=int),
+    stamp: int,
+    levels: wp.array(dtype=int),
+    queue: wp.array(dtype=int),
+    begin: int,
+    sort_by_degree: bool,
+):
+    """Breadth-first search of the nodes of ``part``, storing the visit order in ``queue`` from ``begin``.
+
+    Returns the end of the visited range in ``queue``, the start of the last level, and the number of levels minus one.
+    """
+    queue[begin] = start
+    marks[start] = stamp
+    levels[start] = 0
+
+    head = begin
+    end = begin + 1
+    level_end = begin + 1
+    last_level_begin = begin
+    depth = int(0)
+
+    while head < end:
+        if head == level_end:
+            depth += 1
+            last_level_begin = head
+            level_end = end
+
+        node = queue[head]
+        head += 1
+
+        first_new = end
+        for block in range(offsets[node], offsets[node + 1]):
+            neighbor = columns[block]
+            if parts[neighbor] == part and marks[neighbor] != stamp:
+                marks[neighbor] = stamp
+                levels[neighbor] = levels[node] + 1
+                queue[end] = neighbor
+                end += 1
+
+        if sort_by_degree:
+            # insertion sort of the newly discovered nodes by increasing degree
+            for i in range(first_new + 1, end):
+                node_i = queue[i]
+                j = i
+                while j > first_new and degrees[queue[j - 1]] > degrees[node_i]:
+                    queue[j] = queue[j - 1]
+                    j -= 1
+                queue[j] = node_i
+
+    return end, last_level_begin, depth
+
+
+@wp.func
+def _bsr_reorder_peripheral_node(
+    seed: int,
+    offsets: wp.array(dtype=int),
+    columns: wp.array(dtype=int),
+    degrees: wp.array(dtype=int),
+    parts: wp.array(dtype=int),
+    part: int,
+    marks: wp.array(dtype=int),
+    stamp: int,
+    levels: wp.array(dtype=int),
+    queue: wp.array(dtype=int),
+    begin: int,
+):
+    """Pseudo-peripheral node of the component of ``seed`` (George-Liu), and the last used search stamp."""
+    end, last_level_begin, depth = _bsr_reorder_bfs(
+        seed, offsets, columns, degrees, parts, part, marks, stamp, levels, queue, begin, False
+    )
+
+    root = seed
+    for _search in range(_BSR_REORDER_PERIPHERAL_SEARCHES):
+        candidate = queue[last_level_begin]
+        for i in range(last_level_begin + 1, end):
+            if degrees[queue[i]] < degrees[candidate]:
+                candidate = queue[i]
+
+        stamp += 1
+        candidate_end, candidate_last_level_begin, candidate_depth = _bsr_reorder_bfs(
+            candidate, offsets, columns, degrees, parts, part, marks, stamp, levels, queue, begin, False
+        )
+        if candidate_depth <= depth:
+            break
+
+        root = candidate
+        end = candidate_end
+        last_level_begin = candidate_last_level_begin
+        depth = candidate_depth
+
+    return root, stamp
+
+
+@wp.kernel(enable_backward=False)
+def _bsr_reorder_degrees(offsets: wp.array(dtype=int), degrees: wp.array(dtype=int)):
+    node = wp.tid()
+    degrees[node] = offsets[node + 1] - offsets[node]
+
+
+@wp.kernel(enable_backward=False)
+def _bsr_rcm_ordering(
+    offsets: wp.array(dtype=int),
+    columns: wp.array(dtype=int),
+    degrees: wp.array(dtype=int),
+    parts: wp.array(dtype=int),
+    marks: wp.array(dtype=int),
+    levels: wp.array(dtype=int),
+    queue: wp.array(dtype=int),
+    permutation: wp.array(dtype=int),
+):
+    # Serial, must be launched with dim=1
+    node_count = permutation.shape[0]
+
+    count = int(0)
+    stamp = int(0)
+    for seed in range(node_count):
+        if parts[seed] == 0:
+            root, stamp = _bsr_reorder_peripheral_node(
+                seed, offsets, columns, degrees, parts, 0, marks, stamp + 1, levels, queue, count
+            )
+
+            stamp += 1
+            end, _last_level_begin, _depth = _bsr_reorder_bfs(
+                root, offsets, columns, degrees, parts, 0, marks, stamp, levels, queue, count, True
+            )
+            for i in range(count, end):
+                parts[queue[i]] = 1
+            count = end
+
+    # Reverse Cuthill-McKee
+    for i in range(node_count):
+        permutation[i] = queue[node_count - 1 - i]
+
+
+@wp.kernel(enable_backward=False)
+def _bsr_nested_dissection_ordering(
+    offsets: wp.array(dtype=int),
+    columns: wp.array(dtype=int),
+    degrees: wp.array(dtype=int),
+    leaf_size: int,
+    parts: wp.array(dtype=int),
+    marks: wp.array(dtype=int),
+    levels: wp.array(dtype=int),
+    queue: wp.array(dtype=int),
+    nodes: wp.array(dtype=int),
+    sorted_nodes: wp.array(dtype=int),
+    stack: wp.array2d(dtype=int),
+    permutation: wp.array(dtype=int),
+):
+    # Serial, must be launched with dim=1
+    node_count = permutation.shape[0]
+    for i in range(node_count):
+        nodes[i] = i
+
+    # Subgraphs to dissect are contiguous ranges of `nodes` sharing the same part index.
+    # Positions are assigned from the end, separators first, so each subgraph is ordered before its separator.
+    stack[0, 0] = 0
+    stack[0, 1] = node_count
+    stack[0, 2] = 0
+    stack_size = int(1)
+    part_count = int(1)
+    position = node_count
+    stamp = int(0)
+
+    while stack_size > 0:
+        stack_size -= 1
+        begin = stack[stack_size, 0]
+        end = stack[stack_size, 1]
+        part = stack[stack_size, 2]
+
+        separated = bool(False)
+        if end - begin > leaf_size:
+            root, stamp = _bsr_reorder_peripheral_node(
+                nodes[begin], offsets, columns, degrees, parts, part, marks, stamp + 1, levels, queue, 0
+            )
+            stamp += 1
+            _visited_end, _last_level_begin, depth = _bsr_reorder_bfs(
+                root, offsets, columns, degrees, parts, part, marks, stamp, levels, queue, 0, False
+            )
+
+            if depth >= 2:
+                # The middle level structure separates the nodes before it from those after it
+                # and from the other connected components of the subgraph
+                separator_level = depth // 2
+                first_count = int(0)
+                separator_count = int(0)
+                for i in range(begin, end):
+                    node = nodes[i]
+                    if marks[node] == stamp and levels[node] <= separator_level:
+                        if levels[node] < separator_level:
+                            first_count += 1
+                        else:
+                            separator_count += 1
+
+                first = begin
+                second = begin + first_count
+                separator = end - separator_count
+                for i in range(begin, end):
+                    node = nodes[i]
+                    if marks[node] == stamp and levels[node] < separator_level:
+                        sorted_nodes[first] = node
+                        parts[node] = part_count
+                        first += 1
+                    elif marks[node] == stamp and levels[node] == separator_level:
+                        sorted_nodes[separator] = node
+                        separator += 1
+                    else:
+                        sorted_nodes[second] = node
+                        parts[node] = part_count + 1
+                        second += 1
+
+                for i in range(end - 1, begin - 1, -1):
+                    nodes[i] = sorted_nodes[i]
+                    if i >= end - separator_count:
+                        position -= 1
+                        permutation[position] = nodes[i]
+
+                stack[stack_size, 0] = begin
+                stack[stack_size, 1] = begin + first_count
+                stack[stack_size, 2] = part_count
+                stack[stack_size + 1, 0] = begin + first_count
+                stack[stack_size + 1, 1] = end - separator_count
+                stack[stack_size + 1, 2] = part_count + 1
+                stack_size += 2
+                part_count += 2
+                separated = True
+
+        if not separated:
+            for i in range(end - 1, begin - 1, -1):
+                position -= 1
+                permutation[position] = nodes[i]
+
+
+@wp.kernel(enable_backward=False)
+def _bsr_inverse_permutation(permutation: wp.array(dtype=int), inverse_permutation: wp.array(dtype=int)):
+    i = wp.tid()
+    inverse_permutation[permutation[i]] = i
+
+
+@wp.kernel(enable_backward=False)
+def _bsr_permute_triplets(
+    nrow: int,
+    offsets: wp.array(dtype=int),
+    row_counts: wp.array(dtype=int),
+    columns: wp.array(dtype=int),
+    inverse_permutation: wp.array(dtype=int),
+    permuted_rows: wp.array(dtype=int),
+    permuted_columns: wp.array(dtype=int),
+):
+    block = wp.tid()
+    row = bsr_row_index(offsets, nrow, block, row_counts)
+    if row == -1:
+        permuted_rows[block] = -1
+        permuted_columns[block] = -1
+    else:
+        permuted_rows[block] = inverse_permutation[row]
+        permuted_columns[block] = inverse_permutation[columns[block]]
+
+
+@wp.kernel(enable_backward=False, module="unique")
+def _bsr_permute_vector_kernel(permutation: wp.array(dtype=int), x: wp.array(dtype=Any), y: wp.array(dtype=Any)):
+    i = wp.tid()
+    y[i] = x[permutation[i]]
+
+
+def bsr_reordering(A: BsrMatrix, method: Literal["rcm", "nested_dissection"] = "rcm") -> tuple[wp.array, wp.array]:
+    """Compute a symmetric reordering of the rows and columns of blocks of a square BSR matrix.
+
+    The ordering is computed from the symmetrized sparsity pattern of ``A``, on the host CPU.
+
+    Args:
+        A: Square sparse matrix, whose numerical values are ignored.
+        method: Ordering method. ``"rcm"`` (Reverse Cuthill-McKee) reduces the matrix bandwidth, which improves
+          the memory locality of :func:`bsr_mv` and :func:`bsr_mm`. ``"nested_dissection"`` recursively bisects
+          the graph of ``A`` with level-structure separators, ordering each separator after the two subgraphs
+          it separates.
+
+    Returns:
+        A tuple ``(permutation, inverse_permutation)`` of integer arrays on the device of ``A``, where
+        ``permutation[i]`` is the original index of the row of blocks that is moved to row ``i``, and
+        ``inverse_permutation`` is the converse mapping.
+    """
+
+    if A.nrow != A.ncol:
+        raise ValueError(f"Reordering requires a square matrix, got {A.nrow} rows and {A.ncol} columns of blocks")
+    if method not in ("rcm", "nested_dissection"):
+        raise ValueError(f"Unsupported reordering method: {method}")
+
+    # symmetrized topology, on the host
+    graph = bsr_axpy(bsr_transposed(A), bsr_copy(A))
+    host = wp.get_device("cpu")
+    n = graph.nrow
+    offsets = wp.clone(graph.offsets[: n + 1], device=host)
+    columns = wp.clone(graph.columns[: graph.nnz], device=host)
+
+    degrees = wp.empty(n, dtype=int, device=host)
+    wp.launch(_bsr_reorder_degrees, dim=n, device=host, inputs=[offsets, degrees])
+
+    parts = wp.zeros(n, dtype=int, device=host)
+    marks = wp.zeros(n, dtype=int, device=host)
+    levels = wp.empty(n, dtype=int, device=host)
+    queue = wp.empty(n, dtype=int, device=host)
+    permutation = wp.empty(n, dtype=int, device=host)
+
+    if method == "rcm":
+        wp.launch(
+            _bsr_rcm_ordering,
+            dim=1,
+            device=host,
+            inputs=[offsets, columns, degrees, parts, marks, levels, queue, permutation],
+        )
+    else:
+        wp.launch(
+            _bsr_nested_dissection_ordering,
+            dim=1,
+            device=host,
+            inputs=[
+                offsets,
+                columns,
+                degrees,
+                _BSR_NESTED_DISSECTION_LEAF_SIZE,
+                parts,
+                marks,
+                levels,
+                queue,
+                wp.empty(n, dtype=int, device=host),
+                wp.empty(n, dtype=int, device=host),
+                wp.empty((n + 1, 3), dtype=int, device=host),
+                permutation,
+            ],
+        )
+
+    permutation = permutation.to(A.device)
+    inverse_permutation = wp.empty_like(permutation)
+    wp.launch(_bsr_inverse_permutation, dim=n, device=A.device, inputs=[permutation, inverse_permutation])
+    return permutation, inverse_permutation
+
+
+def bsr_permute(
+    A: BsrMatrixOrExpression[BlockType[Rows, Cols, Scalar]],
+    permutation: wp.array(dtype=int),
+    dest: BsrMatrix[BlockType[Rows, Cols, Scalar]] | None = None,
+) -> BsrMatrix[BlockType[Rows, Cols, Scalar]]:
+    """Symmetrically permute the rows and columns of blocks of a square BSR matrix and return the result.
+
+    Row and column ``i`` of the result are row and column ``permutation[i]`` of ``A``.
+
+    Args:
+        A: Square sparse matrix to permute.
+        permutation: Permutation of the rows of blocks, for instance as returned by :func:`bsr_reordering`.
+        dest: Sparse matrix to populate. May be ``A`` itself for an in-place permutation.
+          If ``None``, a new matrix is allocated.
+    """
+
+    A, A_scale = _extract_matrix_and_scale(A)
+
+    if A.nrow != A.ncol:
+        raise ValueError(f"Permutation requires a square matrix, got {A.nrow} rows and {A.ncol} columns of blocks")
+    if permutation.shape != (A.nrow,):
+        raise ValueError(f"Permutation must have shape ({A.nrow},), got {permutation.shape}")
+
+    device = A.device
+    if dest is None:
+        dest = bsr_zeros(A.nrow, A.ncol, block_type=A.values.dtype, device=device)
+
+    inverse_permutation = wp.empty_like(permutation)
+    wp.launch(_bsr_inverse_permutation, dim=A.nrow, device=device, inputs=[permutation, inverse_permutation])
+
+    nnz = A.nnz
+    rows = wp.empty(nnz, dtype=int, device=device)
+    columns = wp.empty(nnz, dtype=int, device=device)
+    wp.launch(
+        _bsr_permute_triplets,
+        dim=nnz,
+        device=device,
+        inputs=[A.nrow, A.offsets, A.row_counts, A.columns, inverse_permutation, rows, columns],
+    )
+
+    # values are copied, as ``dest`` may alias ``A``
+    values = wp.clone(A.values[:nnz])
+    bsr_set_from_triplets(dest, rows, columns, values, prune_numerical_zeros=False)
+    if A_scale != 1.0:
+        bsr_scale(dest, A_scale)
+
+    return dest
+
+
+def bsr_permute_vector(x: wp.array, permutation: wp.array(dtype=int), dest: wp.array | None = None) -> wp.array:
+    """Permute the entries of a vector and return the result, ``dest[i] = x[permutation[i]]``.
+
+    Use the ``permutation`` returned by :func:`bsr_reordering` to reorder a right-hand side consistently with
+    :func:`bsr_permute`, and the ``inverse_permutation`` to scatter a solution back to the original order.
+    Vectors may store either one entry per row of blocks, or one scalar per row of the matrix.
+
+    Args:
+        x: Vector to permute.
+        permutation: Permutation of the rows of blocks.
+        dest: Permuted vector. May be ``x`` itself for an in-place permutation. If ``None``, a new array is allocated.
+    """
+
+    row_count = permutation.shape[0]
+    scalar_type = type_scalar_type(x.dtype)
+    scalar_count = x.size * type_size(x.dtype)
+    block_size = scalar_count // max(row_count, 1)
+    if block_size * row_count != scalar_count:
+        raise ValueError(f"Vector of {scalar_count} scalars cannot be split into {row_count} rows of blocks")
+
+    if dest is None:
+        dest = wp.empty_like(x)
+    elif dest.shape != x.shape or not types_equal(dest.dtype, x.dtype):
+        raise ValueError("Permuted vector must have the same shape and data type as the source vector")
+
+    src = wp.clone(x) if dest.ptr == x.ptr else x
+
+    block_type = scalar_type if block_size == 1 else wp.types.vector(length=block_size, dtype=scalar_type)
+    wp.launch(
+        _bsr_permute_vector_kernel,
+        dim=row_count,
+        device=x.device,
+        inputs=[
+            permutation,
+            _vec_array_view(src, block_type, scalar_count),
+            _vec_array_view(dest, block_type, scalar_count),
+        ],
+    )
+    return dest
@@ -5742,6 +5742,7 @@ class Bvh:
                 constructor,
                 get_data(groups),
                 leaf_size,
+                warp.config.cpu_num_threads,
             )
         else:
             self.id = self.runtime.core.wp_bvh_create_device(
@@ -5841,7 +5842,7 @@ class Bvh:
                 raise ValueError("Cannot rebuild a non-cuBQL BVH with constructor='cubql'; create a new BVH instead")
 
             if self.device.is_cpu:
-                self.runtime.core.wp_bvh_rebuild_host(self.id, constructor)
+                self.runtime.core.wp_bvh_rebuild_host(self.id, constructor, warp.config.cpu_num_threads)
             else:
                 self.runtime.core.wp_bvh_rebuild_device(self.id)
                 self.runtime.verify_cuda_device(self.device)
@@ -5856,7 +5857,7 @@ class Bvh:
                     "LBVH constructor is not available for a CPU tree. Falling back to SAH constructor.", stacklevel=2
                 )
                 constructor = BvhConstructor.SAH
-            self.runtime.core.wp_bvh_rebuild_host(self.id, constructor)
+            self.runtime.core.wp_bvh_rebuild_host(self.id, constructor, warp.config.cpu_num_threads)
             self._constructor = constructor
         else:
             if constructor != BvhConstructor.LBVH:
@@ -5880,6 +5881,46 @@ class Mesh:
         "indices": _Var("indices", array(dtype=int32)),
     }
 
+    class RayHits(NamedTuple):
+        """Results of :meth:`Mesh.query_rays`, one array per field indexed like the input rays.
+
+        For rays that miss the mesh, ``face`` is ``-1`` and the other fields are zero.
+        """
+
+        hit: array
+        """Whether the ray hits the mesh before ``max_t``, of type :class:`warp.bool`."""
+        t: array
+        """Distance to the closest hit along the ray, in multiples of the length of the ray direction."""
+        face: array
+        """Index of the hit triangle."""
+        u: array
+        """Barycentric u coordinate of the hit point."""
+        v: array
+        """Barycentric v coordinate of the hit point."""
+        normal: array
+        """Geometric normal of the hit triangle, of type :class:`warp.vec3`."""
+
+    class PointHits(NamedTuple):
+        """Results of :meth:`Mesh.query_points`, one array per field indexed like the input points.
+
+        For points farther than ``max_dist`` from the mesh, ``face`` is ``-1`` and the other fields are zero.
+        """
+
+        hit: array
+        """Whether a triangle is closer than ``max_dist`` to the point, of type :class:`warp.bool`."""
+        face: array
+        """Index of the closest triangle."""
+        u: array
+        """Barycentric u coordinate of the closest point."""
+        v: array
+        """Barycentric v coordinate of the closest point."""
+        point: array
+        """Closest point on the mesh, of type :class:`warp.vec3`."""
+        distance: array
+        """Distance from the query point to the closest point."""
+        sign: array | None
+        """``-1.0`` for points inside the mesh and ``1.0`` otherwise, or ``None`` if no sign method was requested."""
+
     def __new__(cls, *args, **kwargs):
         instance = super().__new__(cls)
         instance.id = None
@@ -5991,6 +6032,7 @@ class Mesh:
                 bvh_constructor,
                 ctypes.c_void_p(groups.ptr) if groups else ctypes.c_void_p(0),
                 bvh_leaf_size,
+                warp.config.cpu_num_threads,
             )
         else:
             self.id = self.runtime.core.wp_mesh_create_device(
@@ -6100,6 +6142,61 @@ class Mesh:
             self.runtime.core.wp_mesh_set_velocities_device(self.id, velocities_new.__ctype__())
             self.runtime.verify_cuda_device(self.device)
 
+    def query_rays(
+        self, origins: array, directions: array, max_t: float = 1.0e6, reorder: builtins.bool = True
+    ) -> Mesh.RayHits:
+        """Find the closest hit of a batch of rays with the mesh.
+
+        This is the batched equivalent of launching a kernel that calls :func:`warp.mesh_query_ray` for each ray,
+        for instance to render depth sensors. Large batches are first sorted by the Morton code of the ray origins
+        and directions, so that the rays traversed by neighboring threads visit the same BVH nodes, which improves
+        memory coherence for the incoherent rays of typical sensor setups. On the CPU, the rays are traversed
+        by :attr:`warp.config.cpu_num_threads` threads.
+
+        Args:
+            origins: Ray origins in the mesh's local space, a 1D array of type :class:`warp.vec3`.
+            directions: Ray directions in the mesh's local space, with the same shape as ``origins``.
+                They need not be normalized, see :func:`warp.mesh_query_ray`.
+            max_t: Maximum distance along the rays to check for intersections, in multiples of the direction lengths.
+            reorder: Whether to traverse large batches in Morton order. The results do not depend on the order.
+
+        Returns:
+            The hits of the rays, as arrays in the order of the input rays.
+        """
+        from warp._src.mesh_query import mesh_query_rays  # noqa: PLC0415
+
+        return mesh_query_rays(self, origins, directions, max_t, reorder)
+
+    def query_points(
+        self,
+        points: array,
+        max_dist: float = 1.0e6,
+        sign_method: str | None = None,
+        reorder: builtins.bool = True,
+    ) -> Mesh.PointHits:
+        """Find the closest point of the mesh to each point of a batch.
+
+        This is the batched equivalent of launching a kernel that calls :func:`warp.mesh_query_point_no_sign`,
+        or one of the signed variants, for each point. Large batches are first sorted by the Morton code of the
+        points so that neighboring threads visit the same BVH nodes. On the CPU, the points are processed by
+        :attr:`warp.config.cpu_num_threads` threads.
+
+        Args:
+            points: Query points in the mesh's local space, a 1D array of type :class:`warp.vec3`.
+            max_dist: Maximum distance to the returned closest points.
+            sign_method: How to classify the points as inside or outside the mesh: ``"parity"``
+                (see :func:`warp.mesh_query_point_sign_parity`), ``"normal"``
+                (see :func:`warp.mesh_query_point_sign_normal`), ``"winding_number"``
+                (see :func:`warp.mesh_query_point_sign_winding_number`), or ``None`` to skip the classification.
+            reorder: Whether to traverse large batches in Morton order. The results do not depend on the order.
+
+        Returns:
+            The closest points, as arrays in the order of the input points.
+        """
+        from warp._src.mesh_query import mesh_query_points  # noqa: PLC0415
+
+        return mesh_query_points(self, points, max_dist, sign_method, reorder)
+
 
 class Volume:
     """Sparse volumetric data structure based on NanoVDB for efficient 3D sampling."""
@@ -7639,6 +7736,18 @@ class MeshQueryRay:
     }
 
 
+class hash_grid_build_stats_t(ctypes.Structure):
+    """Statistics of a host hash grid build, mirrors ``hash_grid_build_stats_t`` in ``hashgrid.cpp``."""
+
+    _fields_ = (
+        ("num_points", ctypes.c_int),
+        ("occupied_cells", ctypes.c_int),
+        ("max_cell_points", ctypes.c_int),
+        ("moved_points", ctypes.c_int),
+        ("incremental", ctypes.c_int),
+    )
+
+
 class HashGrid:
     """Hash-based spatial grid for accelerated neighbor queries on point data.
 
@@ -7666,6 +7775,25 @@ class HashGrid:
     _TYPE_FLOAT64 = 2
     _MAX_CELL_COUNT = (1 << 31) - 1
 
+    class BuildStats(NamedTuple):
+        """Statistics of the most recent :meth:`HashGrid.build` of a CPU hash grid.
+
+        The ratio of :attr:`num_points` to :attr:`occupied_cells` is the average number of points per occupied cell,
+        which, together with :attr:`max_cell_points`, helps choosing the ``radius`` of the grid.
+        """
+
+        num_points: int
+        """Number of points in the grid."""
+        occupied_cells: int
+        """Number of cells containing at least one point."""
+        max_cell_points: int
+        """Number of points in the most occupied cell."""
+        moved_points: int
+        """Number of points that were bucketed by the build: the points that changed cells for an incremental build,
+        all the points otherwise."""
+        incremental: builtins.bool
+        """Whether the build only re-bucketed the points that changed cells."""
+
     _dtype_map: ClassVar = {
         float16: (vec3h, _TYPE_FLOAT16),
         float32: (vec3f, _TYPE_FLOAT32),
@@ -7750,12 +7878,17 @@ class HashGrid:
         self.reserved = False
         self.groups = None
 
-    def build(self, points, radius, groups=None):
+        self._build_stats = hash_grid_build_stats_t() if self.device.is_cpu else None
+        self._build_stats_valid = False
+
+    def build(self, points, radius, groups=None, incremental=False):
         """Update the hash grid data structure.
 
         This method rebuilds the underlying datastructure and should be called any time the set
         of points changes.
 
+        On the CPU, the build runs on :attr:`warp.config.cpu_num_threads` threads.
+
         Args:
             points (:class:`warp.array`): Array of points matching the grid's dtype
                 (vec3h for float16, vec3/vec3f for float32, vec3d for float64)
@@ -7769,6 +7902,12 @@ class HashGrid:
                 :func:`warp.hash_grid_query` preserves the all-points traversal behavior.
                 Group ids may be arbitrary ``int32`` values and are consumed on-device, so group assignments may
                 change between rebuilds, including during CPU and CUDA graph replay.
+            incremental (bool): On the CPU, update the previous build by only re-bucketing the points whose cell
+                (or group) changed, which is faster when most points stay in the same cell between builds.
+                The result is identical to a full build. The grid keeps the cell of each point between incremental
+                builds; a full build is performed instead if the previous build was not incremental, if the number
+                of points, the radius or the use of groups changed, or if too many points changed cells.
+                Ignored on CUDA devices.
         """
         if not types_equal(points.dtype, self._vec_type):
             raise TypeError(f"Hash grid points should have type {self._vec_type.__name__}, got {points.dtype}")
@@ -7808,9 +7947,41 @@ class HashGrid:
             apic_capture.track_array(groups)
 
         self.groups = groups
-        self._native_func("update")(self.id, self._type_id, radius, ctypes.byref(points.__ctype__()), groups_arg)
+        if self.device.is_cpu:
+            self._native_func("update")(
+                self.id,
+                self._type_id,
+                radius,
+                ctypes.byref(points.__ctype__()),
+                groups_arg,
+                warp.config.cpu_num_threads,
+                incremental,
+                ctypes.byref(self._build_stats),
+            )
+            # builds recorded by a CPU graph capture only run on replay
+            self._build_stats_valid = apic_capture is None
+        else:
+            self._native_func("update")(self.id, self._type_id, radius, ctypes.byref(points.__ctype__()), groups_arg)
         self.reserved = True
 
+    @property
+    def build_stats(self) -> HashGrid.BuildStats | None:
+        """Statistics of the most recent :meth:`build`.
+
+        ``None`` for CUDA hash grids, before the first build, and after a build recorded by a CPU graph capture.
+        """
+        if not self._build_stats_valid:
+            return None
+
+        stats = self._build_stats
+        return HashGrid.BuildStats(
+            stats.num_points,
+            stats.occupied_cells,
+            stats.max_cell_points,
+            stats.moved_points,
+            builtins.bool(stats.incremental),
+        )
+
     def reserve(self, num_points, with_groups=False):
         """Reserve enough memory to build the grid for the given number of points.
 
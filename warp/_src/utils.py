@@ -5,6 +5,8 @@ from __future__ import annotations
 
 import cProfile
 import gc
+import io
+import json
 import os
 import sys
 import threading
@@ -1537,8 +1539,11 @@ TIMING_MEMSET = 8
 TIMING_GRAPH = 16
 """Timing flag for CUDA graph launches."""
 
+TIMING_MODULE_LOAD = 32
+"""Timing flag for module loads, including code generation and compilation, measured on the host."""
+
 TIMING_ALL = 0xFFFFFFFF
-"""Timing flag to capture all CUDA activities."""
+"""Timing flag to capture all activities."""
 
 
 # timer utils
@@ -1766,7 +1771,7 @@ class ScopedAllocator:
     On context exit, the previous allocator setting is restored.
 
     Args:
-        device: The CUDA device on which to set the allocator.
+        device: The device on which to set the allocator.
         allocator: The allocator to use, or ``None`` to restore the built-in allocator.
 
     Example:
@@ -1781,8 +1786,6 @@ class ScopedAllocator:
 
     def __init__(self, device: DeviceLike, allocator: Allocator | None):
         self.device = wp.get_device(device)
-        if not self.device.is_cuda:
-            raise RuntimeError("Custom allocators are only supported on CUDA devices")
         _validate_allocator(allocator)
         self.allocator = allocator
 
@@ -2045,7 +2048,7 @@ def check_p2p():
 class TimingResult:
     """Timing result for a single activity."""
 
-    def __init__(self, device, name, filter, elapsed):
+    def __init__(self, device, name, filter, elapsed, start=None, dim=None, module=None):
         self.device: warp._src.context.Device = device
         """The device where the activity was recorded."""
 
@@ -2058,13 +2061,27 @@ class TimingResult:
         self.elapsed: float = elapsed
         """The elapsed time in milliseconds."""
 
+        self.start: float | None = start
+        """The start time in milliseconds since :func:`timing_begin`, or ``None`` for CUDA activities."""
+
+        self.dim: tuple[int, ...] | None = dim
+        """The launch dimensions of CPU kernel activities, otherwise ``None``."""
+
+        self.module: str | None = module
+        """The name of the module of CPU kernel and module load activities, otherwise ``None``."""
+
 
-def timing_begin(cuda_filter: int = TIMING_ALL, synchronize: bool = True) -> None:
+def timing_begin(cuda_filter: int = TIMING_ALL, synchronize: bool = True, cpu_filter: int | None = None) -> None:
     """Begin detailed activity timing.
 
+    Besides CUDA activities, host activities are timed as well: kernel launches and memory copies
+    on the CPU device, and module loads on any device.
+
     Parameters:
         cuda_filter: Filter flags for CUDA activity timing, e.g. ``warp.TIMING_KERNEL`` or ``warp.TIMING_ALL``
         synchronize: Whether to synchronize all CUDA devices before timing starts
+        cpu_filter: Filter flags for host activity timing, among ``warp.TIMING_KERNEL``, ``warp.TIMING_MEMCPY``
+          and ``warp.TIMING_MODULE_LOAD``. If ``None``, ``cuda_filter`` is used.
     """
 
     if synchronize:
@@ -2072,6 +2089,10 @@ def timing_begin(cuda_filter: int = TIMING_ALL, synchronize: bool = True) -> Non
 
     warp._src.context.runtime.core.wp_cuda_timing_begin(cuda_filter)
 
+    context._cpu_timing_state = context._CpuTimingState(
+        cuda_filter if cpu_filter is None else cpu_filter, context._cpu_timing_state
+    )
+
 
 def timing_end(synchronize: bool = True) -> list[TimingResult]:
     """End detailed activity timing.
@@ -2086,6 +2107,10 @@ def timing_end(synchronize: bool = True) -> list[TimingResult]:
     if synchronize:
         warp.synchronize()
 
+    cpu_state = context._cpu_timing_state
+    if cpu_state is not None:
+        context._cpu_timing_state = cpu_state.parent
+
     # get result count
     count = warp._src.context.runtime.core.wp_cuda_timing_get_result_count()
 
@@ -2116,6 +2141,20 @@ def timing_end(synchronize: bool = True) -> list[TimingResult]:
 
         results.append(TimingResult(device, name, filter, elapsed))
 
+    if cpu_state is not None:
+        for device, name, filter, start_ns, end_ns, dim, module in cpu_state.records:
+            results.append(
+                TimingResult(
+                    device,
+                    name,
+                    filter,
+                    (end_ns - start_ns) * 1.0e-6,
+                    start=(start_ns - cpu_state.origin_ns) * 1.0e-6,
+                    dim=dim,
+                    module=module,
+                )
+            )
+
     return results
 
 
@@ -2147,7 +2186,13 @@ def timing_print(results: list[TimingResult], indent: str = "") -> None:
     activity_width = max_name_len + 1
     activity_dashes = "-" * activity_width
 
-    print(f"{indent}CUDA timeline:")
+    # CUDA-only results keep the CUDA headings
+    if all(r.device.is_cuda for r in results):
+        headings = ("CUDA timeline", "CUDA activity summary", "CUDA device summary")
+    else:
+        headings = ("Activity timeline", "Activity summary", "Device summary")
+
+    print(f"{indent}{headings[0]}:")
     print(f"{indent}----------------+---------+{activity_dashes}")
     print(f"{indent}Time            | Device  | Activity")
     print(f"{indent}----------------+---------+{activity_dashes}")
@@ -2169,7 +2214,7 @@ def timing_print(results: list[TimingResult], indent: str = "") -> None:
         print(f"{indent}{r.elapsed:12.6f} ms | {r.device.alias:7s} | {r.name}")
 
     print()
-    print(f"{indent}CUDA activity summary:")
+    print(f"{indent}{headings[1]}:")
     print(f"{indent}----------------+---------+{activity_dashes}")
     print(f"{indent}Total time      | Count   | Activity")
     print(f"{indent}----------------+---------+{activity_dashes}")
@@ -2177,7 +2222,7 @@ def timing_print(results: list[TimingResult], indent: str = "") -> None:
         print(f"{indent}{agg.elapsed:12.6f} ms | {agg.count:7d} | {name}")
 
     print()
-    print(f"{indent}CUDA device summary:")
+    print(f"{indent}{headings[2]}:")
     print(f"{indent}----------------+---------+{activity_dashes}")
     print(f"{indent}Total time      | Count   | Device")
     print(f"{indent}----------------+---------+{activity_dashes}")
@@ -2185,6 +2230,176 @@ def timing_print(results: list[TimingResult], indent: str = "") -> None:
         print(f"{indent}{agg.elapsed:12.6f} ms | {agg.count:7d} | {device}")
 
 
+def timing_export_chrome_trace(results: list[TimingResult], file: str | os.PathLike | io.TextIOBase) -> None:
+    """Save timing results as a Chrome trace, which can be opened in Perfetto or ``chrome://tracing``.
+
+    Each device is shown as a separate track. CUDA activities do not carry start times, so they are
+    laid out end to end on their device track, in the order they were recorded.
+
+    Parameters:
+        results: List of :class:`TimingResult` objects, as returned by :func:`timing_end`.
+        file: Path of the JSON file to write, or a text stream.
+    """
+
+    events = []
+    tracks = {}
+    cuda_cursors = {}
+    for r in results:
+        alias = r.device.alias if r.device is not None else "unknown"
+        tid = tracks.get(alias)
+        if tid is None:
+            tid = len(tracks)
+            tracks[alias] = tid
+            events.append({"name": "thread_name", "ph": "M", "pid": 0, "tid": tid, "args": {"name": alias}})
+
+        if r.start is None:
+            start = cuda_cursors.get(alias, 0.0)
+            cuda_cursors[alias] = start + r.elapsed
+        else:
+            start = r.start
+
+        args = {"filter": r.filter}
+        if r.dim is not None:
+            args["dim"] = list(r.dim)
+        if r.module is not None:
+            args["module"] = r.module
+
+        events.append(
+            {
+                "name": r.name,
+                "cat": "cuda" if r.start is None else "host",
+                "ph": "X",
+                "pid": 0,
+                "tid": tid,
+                # microseconds
+                "ts": start * 1000.0,
+                "dur": r.elapsed * 1000.0,
+                "args": args,
+            }
+        )
+
+    trace = {"traceEvents": events, "displayTimeUnit": "ms"}
+    if isinstance(file, io.TextIOBase):
+        json.dump(trace, file)
+    else:
+        with open(file, "w") as f:
+            json.dump(trace, f)
+
+
+class LaunchStats:
+    """Launch statistics of a kernel on a device, accumulated while :attr:`warp.config.collect_launch_stats` is enabled.
+
+    Launches of all the overloads of a generic kernel are accumulated together. Launches replayed from a captured
+    CUDA graph are not counted, only the launch performed during the capture.
+    """
+
+    def __init__(self, kernel, module, device, launches, threads, pack_time, kernel_time=None, timed_launches=0):
+        self.kernel: str = kernel
+        """The kernel key."""
+
+        self.module: str = module
+        """The name of the module of the kernel."""
+
+        self.device: str = device
+        """The alias of the device the kernel was launched on."""
+
+        self.launches: int = launches
+        """The number of launches."""
+
+        self.threads: int = threads
+        """The total number of threads over all launches, i.e. the sum of the sizes of the launch dimensions."""
+
+        self.pack_time: float = pack_time
+        """The total host time in milliseconds spent preparing the launches, including argument packing."""
+
+        self.kernel_time: float | None = kernel_time
+        """The total execution time in milliseconds of CPU kernels, or ``None`` if no launch was timed.
+
+        CUDA kernels run asynchronously, so their execution time is not collected;
+        use :func:`timing_begin` and :func:`timing_end` instead.
+        """
+
+        self.timed_launches: int = timed_launches
+        """The number of launches included in :attr:`kernel_time`."""
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the statistics as a dictionary of plain values, e.g. for JSON serialization."""
+        return {
+            "kernel": self.kernel,
+            "module": self.module,
+            "device": self.device,
+            "launches": self.launches,
+            "threads": self.threads,
+            "pack_time": self.pack_time,
+            "kernel_time": self.kernel_time,
+            "timed_launches": self.timed_launches,
+        }
+
+
+def get_launch_stats() -> list[LaunchStats]:
+    """Get the kernel launch statistics accumulated since the last call to :func:`reset_launch_stats`.
+
+    Statistics are only collected while :attr:`warp.config.collect_launch_stats` is enabled.
+
+    Returns:
+        A list of :class:`LaunchStats` objects, one for each kernel and device, sorted by decreasing number of launches.
+    """
+
+    with context._launch_stats_lock:
+        entries = [(key, tuple(entry)) for key, entry in context._launch_stats.items()]
+
+    stats = []
+    for (module, kernel, device), (launches, threads, pack_ns, kernel_ns, timed_launches) in entries:
+        stats.append(
+            LaunchStats(
+                kernel,
+                module,
+                device,
+                launches,
+                threads,
+                pack_ns * 1.0e-6,
+                kernel_time=kernel_ns * 1.0e-6 if timed_launches else None,
+                timed_launches=timed_launches,
+            )
+        )
+
+    stats.sort(key=lambda s: s.launches, reverse=True)
+    return stats
+
+
+def reset_launch_stats() -> None:
+    """Clear the accumulated kernel launch statistics."""
+    with context._launch_stats_lock:
+        context._launch_stats.clear()
+
+
+def print_launch_stats(stats: list[LaunchStats] | None = None, indent: str = "") -> None:
+    """Print kernel launch statistics as a table.
+
+    Parameters:
+        stats: List of :class:`LaunchStats` objects to print. If ``None``, the result of :func:`get_launch_stats` is used.
+        indent: Optional indentation to prepend to all output lines.
+    """
+
+    if stats is None:
+        stats = get_launch_stats()
+
+    if not stats:
+        print(f"{indent}No launches")
+        return
+
+    max_name_len = max(len("Kernel"), *(len(s.kernel) for s in stats))
+    kernel_dashes = "-" * (max_name_len + 1)
+
+    print(f"{indent}Launches  | Threads        | Pack time       | Kernel time     | Device  | Kernel")
+    print(f"{indent}----------+----------------+-----------------+-----------------+---------+{kernel_dashes}")
+    for s in stats:
+        kernel_time = f"{s.kernel_time:12.6f} ms" if s.kernel_time is not None else f"{'-':>15s}"
+        print(
+            f"{indent}{s.launches:9d} | {s.threads:14d} | {s.pack_time:12.6f} ms | {kernel_time} | {s.device:7s} | {s.kernel}"
+        )
+
+
 class ScopedMemoryTracker:
     """Context manager that tracks memory allocations across all devices.
 
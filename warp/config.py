@@ -14,13 +14,18 @@ setting documentation for details.
 For information on module-level and kernel-level settings, see :doc:`/user_guide/configuration`.
 """
 
+import os as _os
 import sys as _sys
 import types as _types
 from enum import IntEnum as _IntEnum
+from typing import TYPE_CHECKING as _TYPE_CHECKING
 
 from warp._src.logger import LOG_INFO as _LOG_INFO
 from warp._src.logger import log_warning as _log_warning
 
+if _TYPE_CHECKING:
+    from warp._src.kernel_cache import KernelCacheBackend as _KernelCacheBackend
+
 _deprecated_verbose_warning_seen = False
 _deprecated_quiet_warning_seen = False
 _suppress_verbose_log_level_mapping = False
@@ -163,6 +168,16 @@ Prints information about each kernel launch including:
 Note: Enabling this flag impacts performance.
 """
 
+collect_launch_stats: bool = False
+"""Enable the accumulation of kernel launch statistics.
+
+Counts the launches of each kernel on each device, their total number of threads, the host time spent
+packing their arguments, and the execution time of CPU kernels.
+The statistics are retrieved with :func:`warp.get_launch_stats` and cleared with :func:`warp.reset_launch_stats`.
+
+The overhead is a few timer reads and dictionary updates per launch.
+"""
+
 mode: str = "release"
 """Compilation mode for Warp kernels.
 
@@ -253,6 +268,28 @@ base path to prevent cache collisions between different Warp versions.
 Note: Subdirectories prefixed with ``wp_`` will be created in this location.
 """
 
+kernel_cache_max_bytes: int | None = None
+"""Size budget in bytes for the module directories of the kernel cache.
+
+When set, compiling a module that grows the cache beyond this budget evicts the least
+recently used module directories from :attr:`kernel_cache_dir`, including those written
+by other processes sharing the same directory. Modules used in the last 30 seconds are
+never evicted, so the budget can be exceeded temporarily. ``None`` (default) lets the
+cache grow without bound. See :func:`warp.kernel_cache_stats` for current usage and
+:func:`warp.trim_kernel_cache` to enforce the budget without compiling a module.
+"""
+
+kernel_cache_backend: "_KernelCacheBackend | None" = None
+"""Shared store of compiled modules used as a second level behind :attr:`kernel_cache_dir`.
+
+Modules that are not found in the local kernel cache are fetched from this backend before
+falling back to compilation, and newly compiled modules are stored into it. Entries are
+keyed by Warp version and module hash, so a backend can be shared by all processes and
+machines running the same code, e.g. a :class:`warp.LocalDirectoryCacheBackend` on a shared
+mount that warms the caches of a fleet of workers. Different Warp versions can share a
+backend without exchanging binaries. Not used when :attr:`cache_kernels` is ``False``.
+"""
+
 cuda_output: str | None = None
 """Preferred CUDA output format for kernel compilation.
 
@@ -449,6 +486,64 @@ loaded CPU modules remain valid.
    future release.
 """
 
+cpu_num_threads: int = 1
+"""Number of threads used to execute kernel launches on the CPU.
+
+``1`` (default) runs every launch serially on the calling thread. ``0`` uses all
+hardware threads, and values greater than ``1`` use that many threads from a
+persistent worker pool.
+
+Running kernels with more than one thread requires CPU atomics to be compiled as real
+atomic instructions, so whether this setting is ``1`` is part of the kernel cache key
+and only affects modules that are loaded after it is changed. Kernels that use tiles
+always run serially, as do kernels that record deterministic-mode scatter operations.
+
+The same number of threads builds and rebuilds :class:`warp.Bvh` and :class:`warp.Mesh`
+trees on the CPU with the ``"sah"`` and ``"median"`` constructors. The resulting trees
+are identical for any thread count.
+
+:func:`warp.utils.graph_coloring_repair` and the
+:attr:`~warp.utils.GraphColoringAlgorithm.PARALLEL` graph coloring algorithm also use this
+number of threads.
+"""
+
+cpu_chunk_size: int = 0
+"""Number of consecutive threads of a CPU launch processed as one unit of work.
+
+Only used when :attr:`cpu_num_threads` is not ``1``. ``0`` (default) picks a chunk size
+based on the launch size and the number of threads. This setting can be changed at runtime.
+"""
+
+cpu_graph_serial_replay: bool = False
+"""Replay captured CPU graphs strictly in the order their operations were recorded.
+
+When :attr:`cpu_num_threads` is not ``1``, :func:`wp.capture_launch() <warp.capture_launch>`
+replays a CPU graph concurrently: consecutive kernel launches that reference no common
+array run at the same time on the worker pool, while launches that reference a common
+array keep their recorded order. Every array a launch receives is treated as written to,
+and launches of kernels that cannot run on several threads, launches that take a mesh,
+BVH, or other handle, and all operations other than kernel launches run on their own.
+
+Set this to ``True`` to replay one operation at a time, for example to rule out missing
+dependencies while debugging. This setting can be changed at runtime.
+"""
+
+lazy_builtins: bool = _os.environ.get("WARP_LAZY_BUILTINS", "0") not in ("", "0")
+"""Defer the registration of built-in functions until they are first used.
+
+Registering the built-in functions, including the concrete overloads that make
+generic built-ins callable from Python, accounts for a large part of the time
+spent in ``import warp``. When enabled, each built-in is registered the first
+time it is looked up, either by code generation or as an attribute of the
+``warp`` module, which shortens the startup of short-lived processes that only
+use a few kernels.
+
+Built-in functions are registered while ``warp`` is imported, so this setting is
+read from the ``WARP_LAZY_BUILTINS`` environment variable (``1`` to enable) and
+changing it afterwards has no effect. Built-ins that have not been used yet are
+not listed by ``dir(warp)`` or imported by ``from warp import *``.
+"""
+
 load_module_max_workers: int | None = 0
 """Default number of worker threads for compiling and loading modules in parallel.
 
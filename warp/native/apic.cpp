@@ -21,6 +21,7 @@
 #include "error.h"
 #include "hashgrid.h"
 #include "mesh.h"
+#include "thread_pool.h"
 
 #include <algorithm>
 #include <cassert>
@@ -32,6 +33,8 @@
 #include <cstdlib>
 #include <cstring>
 #include <string>
+#include <unordered_map>
+#include <vector>
 
 // Convert a strided view into its lowest touched byte and full backing span,
 // including negative strides whose logical first element is not the base.
@@ -331,10 +334,20 @@ void wp_apic_register_cpu_kernel(
 {
     if (!state || !kernel_key)
         return;
-    APICCPUKernel entry;
+    APICCPUKernel& entry = state->cpu_kernels[apic_kernel_map_key(module_hash ? module_hash : "", kernel_key)];
     entry.forward_fn = forward_fn;
     entry.backward_fn = backward_fn;
-    state->cpu_kernels[apic_kernel_map_key(module_hash ? module_hash : "", kernel_key)] = entry;
+}
+
+void wp_apic_register_cpu_kernel_range(
+    APICState* state, const char* kernel_key, const char* module_hash, void* forward_range_fn, void* backward_range_fn
+)
+{
+    if (!state || !kernel_key)
+        return;
+    APICCPUKernel& entry = state->cpu_kernels[apic_kernel_map_key(module_hash ? module_hash : "", kernel_key)];
+    entry.forward_range_fn = forward_range_fn;
+    entry.backward_range_fn = backward_range_fn;
 }
 
 // ============================================================================
@@ -1308,7 +1321,7 @@ bool apic_create_meshes(APICGraph* graph)
         if (graph->device_type == APIC_DEVICE_CPU) {
             new_mesh_id = wp_mesh_create_host(
                 points, velocities, indices, rec.num_points, rec.num_tris, rec.support_winding_number,
-                rec.bvh_constructor, nullptr, rec.bvh_leaf_size
+                rec.bvh_constructor, nullptr, rec.bvh_leaf_size, 1
             );
         } else {
             new_mesh_id = wp_mesh_create_device(
@@ -2041,7 +2054,9 @@ static size_t apic_args_buf_size(const APICLaunchParamRecord* bindings, uint16_t
 }
 
 template <typename VecType>
-static void apic_execute_hash_grid_update(const APICHashGridUpdateRecord* rec, void* points_data, void* groups_data)
+static void apic_execute_hash_grid_update(
+    const APICHashGridUpdateRecord* rec, void* points_data, void* groups_data, int num_threads
+)
 {
     // Recreate transient descriptors around replay-resolved data because the
     // captured array descriptors contain process-local pointers.
@@ -2058,17 +2073,184 @@ static void apic_execute_hash_grid_update(const APICHashGridUpdateRecord* rec, v
     groups.strides[0] = rec->groups_stride;
 
     wp_hash_grid_update_host(
-        rec->grid_id, rec->grid_type, rec->cell_width, &points, rec->has_groups ? &groups : nullptr
+        rec->grid_id, rec->grid_type, rec->cell_width, &points, rec->has_groups ? &groups : nullptr, num_threads, false,
+        nullptr
     );
 }
 
+// Kernel launches collected by a concurrent CPU replay (see
+// wp_apic_cpu_replay_state_concurrent). Consecutive launches are queued with
+// their resolved bounds and argument buffers, then scheduled by flush() when
+// the replay reaches any other operation or the end of the stream.
+//
+// Each launch is assigned a level one past the last level that touched any
+// of its memory regions. Launches on the same level share no region and run
+// concurrently, one launch per pool thread; levels run in order. Without
+// per-argument access modes every region reference counts as a write, so
+// two launches that only read the same array are still ordered. Launches
+// that are not safe to overlap get a level of their own after everything
+// queued before them.
+class APICCPULaunchQueue {
+public:
+    APICCPULaunchQueue(int num_threads, size_t chunk_size)
+        : m_num_threads(num_threads)
+        , m_chunk_size(chunk_size)
+    {
+    }
+
+    int num_threads() const { return m_num_threads; }
+
+    // Copy a launch into the queue. range_func is the kernel's range entry
+    // point, or nullptr if the launch must not overlap with other launches.
+    void push(
+        void* func,
+        void* range_func,
+        size_t size,
+        const void* bounds,
+        size_t bounds_size,
+        const void* args,
+        size_t args_size,
+        const void* adj_args,
+        size_t adj_args_size,
+        const APICLaunchPtrLocation* relocs,
+        uint32_t num_relocs
+    )
+    {
+        Launch launch;
+        launch.func = func;
+        launch.range_func = range_func;
+        launch.size = size;
+        launch.bounds = store(bounds, bounds_size);
+        launch.args = store(args, args_size);
+        launch.adj_args = adj_args ? store(adj_args, adj_args_size) : SIZE_MAX;
+        launch.first_region = m_regions.size();
+        for (uint32_t r = 0; r < num_relocs; r++) {
+            if (relocs[r].kind == APIC_RELOC_DATA_PTR)
+                m_regions.push_back(relocs[r].region_id);
+            else if (relocs[r].kind == APIC_RELOC_HANDLE)
+                // handles reach memory that is not described by the relocations
+                launch.range_func = nullptr;
+        }
+        launch.num_regions = m_regions.size() - launch.first_region;
+        m_launches.push_back(launch);
+    }
+
+    // Execute all queued launches and empty the queue.
+    void flush()
+    {
+        const size_t count = m_launches.size();
+        if (count == 0)
+            return;
+
+        // assign levels in recorded order
+        std::vector<uint32_t> levels(count);
+        std::unordered_map<int32_t, uint32_t> region_levels;
+        uint32_t max_level = 0;
+        uint32_t min_level = 0;
+        for (size_t i = 0; i < count; i++) {
+            const Launch& launch = m_launches[i];
+            uint32_t level;
+            if (launch.range_func) {
+                level = min_level + 1;
+                for (size_t r = 0; r < launch.num_regions; r++) {
+                    auto it = region_levels.find(m_regions[launch.first_region + r]);
+                    if (it != region_levels.end())
+                        level = std::max(level, it->second + 1);
+                }
+            } else {
+                level = max_level + 1;
+                min_level = level;
+            }
+            for (size_t r = 0; r < launch.num_regions; r++)
+                region_levels[m_regions[launch.first_region + r]] = level;
+            levels[i] = level;
+            max_level = std::max(max_level, level);
+        }
+
+        // bucket the launches by level, keeping the recorded order within a level
+        std::vector<size_t> level_start(max_level + 2, 0);
+        for (size_t i = 0; i < count; i++)
+            level_start[levels[i] + 1]++;
+        for (size_t l = 1; l < level_start.size(); l++)
+            level_start[l] += level_start[l - 1];
+        std::vector<size_t> order(count);
+        std::vector<size_t> cursor(level_start.begin(), level_start.end() - 1);
+        for (size_t i = 0; i < count; i++)
+            order[cursor[levels[i]]++] = i;
+
+        for (uint32_t l = 1; l <= max_level; l++) {
+            const size_t begin = level_start[l];
+            const size_t end = level_start[l + 1];
+            if (end - begin == 1) {
+                run(m_launches[order[begin]], true);
+            } else {
+                wp::parallel_for(end - begin, 1, m_num_threads, [&](size_t first, size_t last) {
+                    for (size_t i = first; i < last; i++)
+                        run(m_launches[order[begin + i]], false);
+                });
+            }
+        }
+
+        m_launches.clear();
+        m_regions.clear();
+        m_storage.clear();
+    }
+
+private:
+    struct Launch {
+        void* func;
+        void* range_func;
+        size_t size;
+        size_t bounds;
+        size_t args;
+        size_t adj_args;
+        size_t first_region;
+        size_t num_regions;
+    };
+
+    // Append a blob to the storage and return its offset. Offsets stay valid
+    // while the storage grows; pointers are only formed in run().
+    size_t store(const void* data, size_t size)
+    {
+        constexpr size_t align = alignof(std::max_align_t);
+        size_t offset = (m_storage.size() + align - 1) & ~(align - 1);
+        m_storage.resize(offset + std::max(size, size_t(1)));
+        if (size > 0)
+            memcpy(m_storage.data() + offset, data, size);
+        return offset;
+    }
+
+    void run(const Launch& launch, bool split)
+    {
+        uint8_t* base = m_storage.data();
+        void* bounds = base + launch.bounds;
+        void* args = base + launch.args;
+        void* adj_args = launch.adj_args != SIZE_MAX ? base + launch.adj_args : nullptr;
+        if (split && launch.range_func && m_num_threads != 1)
+            wp_cpu_launch_kernel_range(
+                launch.range_func, bounds, args, adj_args, launch.size, m_num_threads, m_chunk_size
+            );
+        else
+            wp_cpu_launch_kernel(launch.func, bounds, args, adj_args, /*apic_info=*/nullptr);
+    }
+
+    int m_num_threads;
+    size_t m_chunk_size;
+    std::vector<Launch> m_launches;
+    std::vector<int32_t> m_regions;
+    std::vector<uint8_t> m_storage;
+};
+
 // Walk an APIC byte stream and execute CPU operations. Assumes the stream
 // has already passed apic_validate_operation_stream — no per-op bounds
 // checks are performed here.
 // resolve_ptr:   (int32_t region_id, uint64_t offset) -> void*
 // remap_handle:  (uint64_t old_id) -> uint64_t (identity for live recording,
 //                                                load-time remap for loaded graphs)
-// find_kernel:   (const std::string& key, uint8_t is_forward) -> void*
+// find_kernel:   (const std::string& key, const std::string& module_hash)
+//                -> const APICCPUKernel* (nullptr if not registered)
+// queue:         collects kernel launches for concurrent scheduling, or
+//                nullptr to execute every operation in recorded order
 template <typename ResolvePtrFn, typename RemapHandleFn, typename FindKernelFn>
 static bool apic_cpu_replay_stream(
     const uint8_t* stream_data,
@@ -2076,7 +2258,8 @@ static bool apic_cpu_replay_stream(
     uint32_t operation_count,
     ResolvePtrFn resolve_ptr,
     RemapHandleFn remap_handle,
-    FindKernelFn find_kernel
+    FindKernelFn find_kernel,
+    APICCPULaunchQueue* queue
 )
 {
     // Stream was validated at close time (wp_apic_end_recording or
@@ -2095,6 +2278,10 @@ static bool apic_cpu_replay_stream(
     for (uint32_t i = 0; i < operation_count; i++) {
         const APICOpHeader* header = reinterpret_cast<const APICOpHeader*>(ptr);
 
+        // queued launches complete before any other operation starts
+        if (queue && header->op_type != APIC_OP_KERNEL_LAUNCH)
+            queue->flush();
+
         switch (header->op_type) {
         case APIC_OP_KERNEL_LAUNCH: {
             const APICLaunchRecord* rec = reinterpret_cast<const APICLaunchRecord*>(ptr);
@@ -2125,7 +2312,8 @@ static bool apic_cpu_replay_stream(
             for (uint16_t j = 0; j < rec->num_params; j++)
                 fwd_reloc_count += fwd_bindings[j].num_relocs;
 
-            void* func = find_kernel(key_str, module_hash_str, rec->is_forward);
+            const APICCPUKernel* kernel = find_kernel(key_str, module_hash_str);
+            void* func = kernel ? (rec->is_forward ? kernel->forward_fn : kernel->backward_fn) : nullptr;
             if (!func) {
                 fprintf(stderr, "APIC: Error - CPU kernel not found: %s\n", key_str.c_str());
                 return false;
@@ -2196,6 +2384,14 @@ static bool apic_cpu_replay_stream(
                 }
             }
 
+            if (queue) {
+                queue->push(
+                    func, rec->is_forward ? kernel->forward_range_fn : kernel->backward_range_fn, rec->size, bounds_buf,
+                    bounds_size, fwd_buf, fwd_total, adj_buf, adj_total, relocs, rec->num_relocs
+                );
+                break;
+            }
+
             // Replay via the same wp_cpu_launch_kernel that captured this op.
             // apic_info=nullptr is safe: g_apic_state is null during replay, so
             // the recording branch in wp_cpu_launch_kernel is a no-op and the
@@ -2592,7 +2788,7 @@ static bool apic_cpu_replay_stream(
 
         case APIC_OP_BVH_REBUILD: {
             const APICBvhRecord* rec = reinterpret_cast<const APICBvhRecord*>(ptr);
-            wp_bvh_rebuild_host(remap_handle(rec->bvh_id), rec->constructor_type);
+            wp_bvh_rebuild_host(remap_handle(rec->bvh_id), rec->constructor_type, 1);
             break;
         }
 
@@ -2649,15 +2845,17 @@ static bool apic_cpu_replay_stream(
                 groups_data = static_cast<uint8_t*>(low_data) + (rec->groups_offset - low_offset);
             }
 
+            // queued launches were flushed before this operation, so the build can use all replay threads
+            const int replay_threads = queue ? queue->num_threads() : 1;
             switch (rec->grid_type) {
             case wp::HASH_GRID_TYPE_FLOAT16:
-                apic_execute_hash_grid_update<wp::vec3h>(rec, points_data, groups_data);
+                apic_execute_hash_grid_update<wp::vec3h>(rec, points_data, groups_data, replay_threads);
                 break;
             case wp::HASH_GRID_TYPE_FLOAT32:
-                apic_execute_hash_grid_update<wp::vec3f>(rec, points_data, groups_data);
+                apic_execute_hash_grid_update<wp::vec3f>(rec, points_data, groups_data, replay_threads);
                 break;
             case wp::HASH_GRID_TYPE_FLOAT64:
-                apic_execute_hash_grid_update<wp::vec3d>(rec, points_data, groups_data);
+                apic_execute_hash_grid_update<wp::vec3d>(rec, points_data, groups_data, replay_threads);
                 break;
             default:
                 fprintf(stderr, "APIC: Error - unsupported HashGrid type at operation %u\n", i);
@@ -2683,12 +2881,14 @@ static bool apic_cpu_replay_stream(
 
             if (cond_value && rec->branch_a_size > 0) {
                 if (!apic_cpu_replay_stream(
-                        branch_a, rec->branch_a_size, rec->branch_a_op_count, resolve_ptr, remap_handle, find_kernel
+                        branch_a, rec->branch_a_size, rec->branch_a_op_count, resolve_ptr, remap_handle, find_kernel,
+                        queue
                     ))
                     return false;
             } else if (!cond_value && rec->branch_b_size > 0) {
                 if (!apic_cpu_replay_stream(
-                        branch_b, rec->branch_b_size, rec->branch_b_op_count, resolve_ptr, remap_handle, find_kernel
+                        branch_b, rec->branch_b_size, rec->branch_b_op_count, resolve_ptr, remap_handle, find_kernel,
+                        queue
                     ))
                     return false;
             }
@@ -2712,7 +2912,7 @@ static bool apic_cpu_replay_stream(
                 if (rec->branch_a_size == 0)
                     break;
                 if (!apic_cpu_replay_stream(
-                        body, rec->branch_a_size, rec->branch_a_op_count, resolve_ptr, remap_handle, find_kernel
+                        body, rec->branch_a_size, rec->branch_a_op_count, resolve_ptr, remap_handle, find_kernel, queue
                     ))
                     return false;
                 if (++guard >= guard_limit) {
@@ -2731,18 +2931,23 @@ static bool apic_cpu_replay_stream(
         ptr += header->total_size;
     }
 
+    if (queue)
+        queue->flush();
+
     return true;
 }
 
-// Shared body for the two public CPU replay entry points. Container is either
+// Shared body for the public CPU replay entry points. Container is either
 // APICState or APICGraph; both expose operation_stream,
 // operation_count, and cpu_kernels (map<string, APICCPUKernel>). The only
 // per-container difference is how region_id is resolved to a host pointer,
-// which the caller supplies as `resolve`.
+// which the caller supplies as `resolve`. num_threads != 1 schedules
+// independent kernel launches concurrently (see APICCPULaunchQueue).
 template <typename Container, typename Resolver, typename HandleRemap>
-static bool apic_cpu_replay_container(Container* c, Resolver resolve, HandleRemap remap_handle)
+static bool
+apic_cpu_replay_container(Container* c, Resolver resolve, HandleRemap remap_handle, int num_threads, size_t chunk_size)
 {
-    auto find_kernel = [c](const std::string& key, const std::string& module_hash, uint8_t is_forward) -> void* {
+    auto find_kernel = [c](const std::string& key, const std::string& module_hash) -> const APICCPUKernel* {
         // Prefer the exact (module_hash, key) match so same-key kernels from
         // distinct modules are dispatched correctly. The plain-key fallback is
         // retained for older in-memory states/graphs registered before module
@@ -2752,14 +2957,23 @@ static bool apic_cpu_replay_container(Container* c, Resolver resolve, HandleRema
             it = c->cpu_kernels.find(key);
         if (it == c->cpu_kernels.end())
             return nullptr;
-        return is_forward ? it->second.forward_fn : it->second.backward_fn;
+        return &it->second;
     };
+
+    if (num_threads == 1)
+        return apic_cpu_replay_stream(
+            c->operation_stream.data(), c->operation_stream.size(), c->operation_count, resolve, remap_handle,
+            find_kernel, nullptr
+        );
+
+    APICCPULaunchQueue queue(num_threads, chunk_size);
     return apic_cpu_replay_stream(
-        c->operation_stream.data(), c->operation_stream.size(), c->operation_count, resolve, remap_handle, find_kernel
+        c->operation_stream.data(), c->operation_stream.size(), c->operation_count, resolve, remap_handle, find_kernel,
+        &queue
     );
 }
 
-bool wp_apic_cpu_replay_state(APICState* state)
+bool wp_apic_cpu_replay_state_concurrent(APICState* state, int num_threads, size_t chunk_size)
 {
     if (!state)
         return false;
@@ -2776,11 +2990,13 @@ bool wp_apic_cpu_replay_state(APICState* state)
         [state](int32_t region_id, uint64_t offset, size_t access_size) {
             return apic_resolve_state_region_ptr(state, region_id, offset, access_size);
         },
-        [](uint64_t handle) -> uint64_t { return handle; }
+        [](uint64_t handle) -> uint64_t { return handle; }, num_threads, chunk_size
     );
 }
 
-bool wp_apic_cpu_replay_graph(APICGraph* graph)
+bool wp_apic_cpu_replay_state(APICState* state) { return wp_apic_cpu_replay_state_concurrent(state, 1, 0); }
+
+bool wp_apic_cpu_replay_graph_concurrent(APICGraph* graph, int num_threads, size_t chunk_size)
 {
     if (!graph)
         return false;
@@ -2796,10 +3012,13 @@ bool wp_apic_cpu_replay_graph(APICGraph* graph)
         [graph](uint64_t handle) -> uint64_t {
             auto it = graph->handle_ptr_remap.find(handle);
             return (it != graph->handle_ptr_remap.end()) ? it->second : handle;
-        }
+        },
+        num_threads, chunk_size
     );
 }
 
+bool wp_apic_cpu_replay_graph(APICGraph* graph) { return wp_apic_cpu_replay_graph_concurrent(graph, 1, 0); }
+
 // ============================================================================
 // Serialization: wp_apic_state_save
 // ============================================================================
@@ -3098,10 +3317,20 @@ void wp_apic_register_loaded_cpu_kernel(
 {
     if (!graph || !kernel_key)
         return;
-    APICCPUKernel info;
+    APICCPUKernel& info = graph->cpu_kernels[apic_kernel_map_key(module_hash ? module_hash : "", kernel_key)];
     info.forward_fn = forward_fn;
     info.backward_fn = backward_fn;
-    graph->cpu_kernels[apic_kernel_map_key(module_hash ? module_hash : "", kernel_key)] = info;
+}
+
+void wp_apic_register_loaded_cpu_kernel_range(
+    APICGraph* graph, const char* kernel_key, const char* module_hash, void* forward_range_fn, void* backward_range_fn
+)
+{
+    if (!graph || !kernel_key)
+        return;
+    APICCPUKernel& info = graph->cpu_kernels[apic_kernel_map_key(module_hash ? module_hash : "", kernel_key)];
+    info.forward_range_fn = forward_range_fn;
+    info.backward_range_fn = backward_range_fn;
 }
 
 // ============================================================================
@@ -165,12 +165,31 @@ WP_API void wp_apic_register_cpu_kernel(
     APICState* state, const char* kernel_key, const char* module_hash, void* forward_fn, void* backward_fn
 );
 
+// Register the range entry points (``*_cpu_forward_range`` / ``*_cpu_backward_range``)
+// of a CPU kernel registered with wp_apic_register_cpu_kernel(). Kernels with range
+// entry points may run concurrently with other launches during a concurrent replay.
+WP_API void wp_apic_register_cpu_kernel_range(
+    APICState* state, const char* kernel_key, const char* module_hash, void* forward_range_fn, void* backward_range_fn
+);
+
 // Replay CPU operations from a live capture's byte stream
 WP_API bool wp_apic_cpu_replay_state(APICState* state);
 
 // Replay CPU operations from a loaded graph's byte stream
 WP_API bool wp_apic_cpu_replay_graph(APICGraph* graph);
 
+// Concurrent variants of the replay functions above. Consecutive kernel launches
+// are scheduled by the memory regions their arguments reference: launches that
+// share no region run at the same time on up to num_threads threads (<= 0 for all
+// hardware threads), while launches that share a region keep their recorded order.
+// Every region reference is treated as a write. Launches of kernels without range
+// entry points, launches that reference a handle (mesh, BVH, ...), and all other
+// operations run on their own, after everything recorded before them.
+// chunk_size is forwarded to wp_cpu_launch_kernel_range() for launches that run
+// on their own. num_threads == 1 replays serially, like the functions above.
+WP_API bool wp_apic_cpu_replay_state_concurrent(APICState* state, int num_threads, size_t chunk_size);
+WP_API bool wp_apic_cpu_replay_graph_concurrent(APICGraph* graph, int num_threads, size_t chunk_size);
+
 // =============================================================================
 // Serialization: Save to .wrp file
 // =============================================================================
@@ -209,6 +228,9 @@ WP_API bool wp_apic_launch(APICGraph* graph, void* stream);
 WP_API void wp_apic_register_loaded_cpu_kernel(
     APICGraph* graph, const char* kernel_key, const char* module_hash, void* forward_fn, void* backward_fn
 );
+WP_API void wp_apic_register_loaded_cpu_kernel_range(
+    APICGraph* graph, const char* kernel_key, const char* module_hash, void* forward_range_fn, void* backward_range_fn
+);
 
 // Query loaded graph kernel metadata (for CPU module loading)
 WP_API int wp_apic_get_num_kernels(APICGraph* graph);
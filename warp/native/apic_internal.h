@@ -202,9 +202,15 @@ struct APICMemoryPtrLocation {
 // CPU kernel function pointers, resolved during capture / load and consumed
 // by CPU replay. Stored both in APICState (for live capture) and
 // APICGraph (for loaded .wrp graphs), keyed by (module_hash, kernel_key).
+//
+// The optional range entry points (``*_cpu_forward_range``) are only emitted for
+// kernels that keep no state outside of their arguments, so a kernel that has
+// them may run alongside other launches during a concurrent replay.
 struct APICCPUKernel {
     void* forward_fn = nullptr;
     void* backward_fn = nullptr;
+    void* forward_range_fn = nullptr;
+    void* backward_range_fn = nullptr;
 };
 
 // ============================================================================
@@ -2056,12 +2056,58 @@ CUDA_CALLABLE inline int slice_get_length(const slice_t& slice)
     return 0;
 }
 
-template <typename T> inline CUDA_CALLABLE T atomic_add(T* buf, T value)
-{
 #if !defined(__CUDA_ARCH__)
+template <int Size> struct cpu_atomic_word;
+template <> struct cpu_atomic_word<1> {
+    typedef uint8 type;
+};
+template <> struct cpu_atomic_word<2> {
+    typedef uint16 type;
+};
+template <> struct cpu_atomic_word<4> {
+    typedef uint32 type;
+};
+template <> struct cpu_atomic_word<8> {
+    typedef uint64 type;
+};
+
+// Read-modify-write shared by the CPU atomics below: replaces *buf with op(*buf)
+// and returns the previous value. CPU kernels run on a single thread by default
+// and use a plain load and store. Modules compiled for multithreaded CPU launches
+// (warp.config.cpu_num_threads != 1) define WP_ENABLE_CPU_ATOMICS, which turns
+// this into a lock-free compare-and-swap loop on the value's bit pattern.
+template <typename T, typename Op> inline T cpu_atomic_rmw(T* buf, Op op)
+{
+#if defined(WP_ENABLE_CPU_ATOMICS)
+    typedef typename cpu_atomic_word<sizeof(T)>::type word_t;
+
+    word_t* addr = reinterpret_cast<word_t*>(buf);
+    word_t expected = __atomic_load_n(addr, __ATOMIC_RELAXED);
+
+    for (;;) {
+        T old;
+        memcpy(&old, &expected, sizeof(T));
+
+        T result = op(old);
+        word_t desired;
+        memcpy(&desired, &result, sizeof(T));
+
+        // on failure, expected is updated to the current value
+        if (__atomic_compare_exchange_n(addr, &expected, desired, true, __ATOMIC_ACQ_REL, __ATOMIC_RELAXED))
+            return old;
+    }
+#else
     T old = buf[0];
-    buf[0] += value;
+    buf[0] = op(old);
     return old;
+#endif
+}
+#endif  // !defined(__CUDA_ARCH__)
+
+template <typename T> inline CUDA_CALLABLE T atomic_add(T* buf, T value)
+{
+#if !defined(__CUDA_ARCH__)
+    return cpu_atomic_rmw(buf, [value](T x) { return T(x + value); });
 #else
     return atomicAdd(buf, value);
 #endif
@@ -2070,9 +2116,7 @@ template <typename T> inline CUDA_CALLABLE T atomic_add(T* buf, T value)
 template <> inline CUDA_CALLABLE int64 atomic_add(int64* buf, int64 value)
 {
 #if !defined(__CUDA_ARCH__)
-    int64 old = buf[0];
-    buf[0] += value;
-    return old;
+    return cpu_atomic_rmw(buf, [value](int64 x) { return int64(x + value); });
 #else  // CUDA compiled by NVRTC
     unsigned long long int* buf_as_ull = (unsigned long long int*)buf;
     unsigned long long int unsigned_value = static_cast<unsigned long long int>(value);
@@ -2084,9 +2128,7 @@ template <> inline CUDA_CALLABLE int64 atomic_add(int64* buf, int64 value)
 template <> inline CUDA_CALLABLE float16 atomic_add(float16* buf, float16 value)
 {
 #if !defined(__CUDA_ARCH__)
-    float16 old = buf[0];
-    buf[0] += value;
-    return old;
+    return cpu_atomic_rmw(buf, [value](float16 x) { return float16(x + value); });
 #else  // CUDA compiled by NVRTC
 #if __CUDA_ARCH__ >= 700
 #if defined(__clang__)  // CUDA compiled by Clang
@@ -2119,9 +2161,7 @@ template <> inline CUDA_CALLABLE float16 atomic_add(float16* buf, float16 value)
 template <> inline CUDA_CALLABLE bfloat16 atomic_add(bfloat16* buf, bfloat16 value)
 {
 #if !defined(__CUDA_ARCH__)
-    bfloat16 old = buf[0];
-    buf[0] += value;
-    return old;
+    return cpu_atomic_rmw(buf, [value](bfloat16 x) { return bfloat16(x + value); });
 #elif __CUDA_ARCH__ >= 900
     bfloat16 old;
     asm volatile("atom.add.noftz.bf16 %0, [%1], %2;" : "=h"(old.u) : "l"(buf), "h"(value.u) : "memory");
@@ -2151,9 +2191,7 @@ template <> inline CUDA_CALLABLE bfloat16 atomic_add(bfloat16* buf, bfloat16 val
 template <> inline CUDA_CALLABLE float64 atomic_add(float64* buf, float64 value)
 {
 #if !defined(__CUDA_ARCH__)
-    float64 old = buf[0];
-    buf[0] += value;
-    return old;
+    return cpu_atomic_rmw(buf, [value](float64 x) { return float64(x + value); });
 #elif defined(__clang__)  // CUDA compiled by Clang
     return atomicAdd(buf, value);
 #else  // CUDA compiled by NVRTC
@@ -2184,9 +2222,7 @@ template <typename T> inline CUDA_CALLABLE T atomic_min(T* address, T val)
 #if defined(__CUDA_ARCH__)
     return atomicMin(address, val);
 #else
-    T old = *address;
-    *address = min(old, val);
-    return old;
+    return cpu_atomic_rmw(address, [val](T x) { return min(x, val); });
 #endif
 }
 
@@ -2219,9 +2255,7 @@ template <> inline CUDA_CALLABLE float atomic_min(float* address, float val)
     return __int_as_float(old);
 
 #else
-    float old = *address;
-    *address = min(old, val);
-    return old;
+    return cpu_atomic_rmw(address, [val](float x) { return min(x, val); });
 #endif
 }
 
@@ -2245,9 +2279,7 @@ template <> inline CUDA_CALLABLE double atomic_min(double* address, double val)
     return __longlong_as_double(old);
 
 #else
-    double old = *address;
-    *address = min(old, val);
-    return old;
+    return cpu_atomic_rmw(address, [val](double x) { return min(x, val); });
 #endif
 }
 
@@ -2256,9 +2288,7 @@ template <> inline CUDA_CALLABLE double atomic_min(double* address, double val)
 template <> inline CUDA_CALLABLE bfloat16 atomic_min(bfloat16* buf, bfloat16 val)
 {
 #if !defined(__CUDA_ARCH__)
-    bfloat16 old = buf[0];
-    buf[0] = min(old, val);
-    return old;
+    return cpu_atomic_rmw(buf, [val](bfloat16 x) { return min(x, val); });
 #elif __CUDA_ARCH__ >= 700
     // 16-bit atomicCAS is available on compute capability >= 7.0
     unsigned short int* address_as_ushort = reinterpret_cast<unsigned short int*>(buf);
@@ -2293,9 +2323,7 @@ template <typename T> inline CUDA_CALLABLE T atomic_max(T* address, T val)
 #if defined(__CUDA_ARCH__)
     return atomicMax(address, val);
 #else
-    T old = *address;
-    *address = max(old, val);
-    return old;
+    return cpu_atomic_rmw(address, [val](T x) { return max(x, val); });
 #endif
 }
 
@@ -2319,9 +2347,7 @@ template <> inline CUDA_CALLABLE float atomic_max(float* address, float val)
     return __int_as_float(old);
 
 #else
-    float old = *address;
-    *address = max(old, val);
-    return old;
+    return cpu_atomic_rmw(address, [val](float x) { return max(x, val); });
 #endif
 }
 
@@ -2345,9 +2371,7 @@ template <> inline CUDA_CALLABLE double atomic_max(double* address, double val)
     return __longlong_as_double(old);
 
 #else
-    double old = *address;
-    *address = max(old, val);
-    return old;
+    return cpu_atomic_rmw(address, [val](double x) { return max(x, val); });
 #endif
 }
 
@@ -2356,9 +2380,7 @@ template <> inline CUDA_CALLABLE double atomic_max(double* address, double val)
 template <> inline CUDA_CALLABLE bfloat16 atomic_max(bfloat16* buf, bfloat16 val)
 {
 #if !defined(__CUDA_ARCH__)
-    bfloat16 old = buf[0];
-    buf[0] = max(old, val);
-    return old;
+    return cpu_atomic_rmw(buf, [val](bfloat16 x) { return max(x, val); });
 #elif __CUDA_ARCH__ >= 700
     // 16-bit atomicCAS is available on compute capability >= 7.0
     unsigned short int* address_as_ushort = reinterpret_cast<unsigned short int*>(buf);
@@ -2410,11 +2432,7 @@ template <typename T> inline CUDA_CALLABLE T atomic_cas(T* address, T compare, T
 #if defined(__CUDA_ARCH__)
     return atomicCAS(address, compare, val);
 #else
-    T old = *address;
-    if (old == compare) {
-        *address = val;
-    }
-    return old;
+    return cpu_atomic_rmw(address, [compare, val](T x) { return x == compare ? val : x; });
 #endif
 }
 
@@ -2426,11 +2444,7 @@ template <> inline CUDA_CALLABLE float atomic_cas(float* address, float compare,
     auto result = atomicCAS(reinterpret_cast<unsigned int*>(address), compare_bits, val_bits);
     return __uint_as_float(result);
 #else
-    float old = *address;
-    if (old == compare) {
-        *address = val;
-    }
-    return old;
+    return cpu_atomic_rmw(address, [compare, val](float x) { return x == compare ? val : x; });
 #endif
 }
 
@@ -2442,11 +2456,7 @@ template <> inline CUDA_CALLABLE double atomic_cas(double* address, double compa
     auto result = atomicCAS(reinterpret_cast<unsigned long long int*>(address), compare_bits, val_bits);
     return __longlong_as_double(static_cast<long long int>(result));
 #else
-    double old = *address;
-    if (old == compare) {
-        *address = val;
-    }
-    return old;
+    return cpu_atomic_rmw(address, [compare, val](double x) { return x == compare ? val : x; });
 #endif
 }
 
@@ -2459,11 +2469,7 @@ template <> inline CUDA_CALLABLE int64 atomic_cas(int64* address, int64 compare,
     );
     return static_cast<int64>(result);
 #else
-    int64 old = *address;
-    if (old == compare) {
-        *address = val;
-    }
-    return old;
+    return cpu_atomic_rmw(address, [compare, val](int64 x) { return x == compare ? val : x; });
 #endif
 }
 
@@ -2472,9 +2478,7 @@ template <typename T> inline CUDA_CALLABLE T atomic_exch(T* address, T val)
 #if defined(__CUDA_ARCH__)
     return atomicExch(address, val);
 #else
-    T old = *address;
-    *address = val;
-    return old;
+    return cpu_atomic_rmw(address, [val](T) { return val; });
 #endif
 }
 
@@ -2485,9 +2489,7 @@ template <> inline CUDA_CALLABLE double atomic_exch(double* address, double val)
     auto result = atomicExch(reinterpret_cast<unsigned long long int*>(address), val_bits);
     return __longlong_as_double(static_cast<long long int>(result));
 #else
-    double old = *address;
-    *address = val;
-    return old;
+    return cpu_atomic_rmw(address, [val](double) { return val; });
 #endif
 }
 
@@ -2498,9 +2500,7 @@ template <> inline CUDA_CALLABLE int64 atomic_exch(int64* address, int64 val)
         = atomicExch(reinterpret_cast<unsigned long long int*>(address), static_cast<unsigned long long int>(val));
     return static_cast<int64>(result);
 #else
-    int64 old = *address;
-    *address = val;
-    return old;
+    return cpu_atomic_rmw(address, [val](int64) { return val; });
 #endif
 }
 
@@ -2524,9 +2524,7 @@ template <typename T> inline CUDA_CALLABLE T atomic_and(T* buf, T value)
 #if defined(__CUDA_ARCH__)
     return atomicAnd(buf, value);
 #else
-    T old = buf[0];
-    buf[0] &= value;
-    return old;
+    return cpu_atomic_rmw(buf, [value](T x) { return T(x & value); });
 #endif
 }
 
@@ -2535,9 +2533,7 @@ template <typename T> inline CUDA_CALLABLE T atomic_or(T* buf, T value)
 #if defined(__CUDA_ARCH__)
     return atomicOr(buf, value);
 #else
-    T old = buf[0];
-    buf[0] |= value;
-    return old;
+    return cpu_atomic_rmw(buf, [value](T x) { return T(x | value); });
 #endif
 }
 
@@ -2546,9 +2542,7 @@ template <typename T> inline CUDA_CALLABLE T atomic_xor(T* buf, T value)
 #if defined(__CUDA_ARCH__)
     return atomicXor(buf, value);
 #else
-    T old = buf[0];
-    buf[0] ^= value;
-    return old;
+    return cpu_atomic_rmw(buf, [value](T x) { return T(x ^ value); });
 #endif
 }
 
@@ -8,6 +8,7 @@
 #include "bvh.h"
 #include "cuda_util.h"
 #include "error.h"
+#include "thread_pool.h"
 
 #include <algorithm>
 #include <cassert>
@@ -20,18 +21,65 @@ using namespace wp;
 
 namespace wp {
 
+// Ranges with at least this many primitives are built with build_parallel() when more than one thread is requested
+static constexpr int BVH_PARALLEL_BUILD_MIN_ITEMS = 8192;
+// Target number of independent subtrees per thread in build_parallel(), for load balancing
+static constexpr int BVH_PARALLEL_TASKS_PER_THREAD = 8;
+// Subtrees smaller than this are never split further into separate tasks
+static constexpr int BVH_PARALLEL_MIN_TASK_ITEMS = 1024;
+// Minimum number of primitives per chunk when reducing bounds or SAH buckets over a range in parallel
+static constexpr int BVH_PARALLEL_REDUCE_CHUNK_ITEMS = 4096;
+
 
 /////////////////////////////////////////////////////////////////////////////////////////////
 
 class TopDownBVHBuilder {
 public:
-    void build(BVH& bvh, const vec3* lowers, const vec3* uppers, int n, int in_constructor_type, int* groups);
-    void rebuild(BVH& bvh, int in_constructor_type);
+    void build(
+        BVH& bvh,
+        const vec3* lowers,
+        const vec3* uppers,
+        int n,
+        int in_constructor_type,
+        int* groups,
+        int num_threads = 1
+    );
+    void rebuild(BVH& bvh, int in_constructor_type, int num_threads = 1);
 
 private:
+    // Node of a subtree built by build_parallel() before it is assigned its final index in the BVH.
+    // Children are indices into the same node list, or ~task for the root of a subtree built by a task.
+    struct PendingNode {
+        bounds3 bounds;
+        int left = -1;
+        int right = -1;
+        int start = 0;
+        int end = 0;
+        bool leaf = false;
+    };
+
+    // Subtree over [start, end) built concurrently with the other tasks into its own node list
+    struct SubtreeTask {
+        int start;
+        int end;
+        int depth;
+        std::vector<PendingNode> nodes;
+    };
+
     void initialize_empty(BVH& bvh);
 
-    bounds3 calc_bounds(const vec3* lowers, const vec3* uppers, const int* indices, int start, int end);
+    bounds3
+    calc_bounds(const vec3* lowers, const vec3* uppers, const int* indices, int start, int end, int threads = 1);
+    int build_subtree(
+        BVH& bvh,
+        const vec3* lowers,
+        const vec3* uppers,
+        int start,
+        int end,
+        int depth,
+        int parent,
+        int assigned_node = -1
+    );
     int build_recursive(
         BVH& bvh,
         const vec3* lowers,
@@ -42,6 +90,45 @@ private:
         int parent,
         int assigned_node = -1
     );
+    int build_parallel(
+        BVH& bvh,
+        const vec3* lowers,
+        const vec3* uppers,
+        int start,
+        int end,
+        int depth,
+        int parent,
+        int assigned_node = -1
+    );
+    int build_pending(
+        const BVH& bvh,
+        const vec3* lowers,
+        const vec3* uppers,
+        int start,
+        int end,
+        int depth,
+        std::vector<PendingNode>& nodes,
+        std::vector<SubtreeTask>* tasks,
+        int task_cutoff
+    );
+    int emit_pending(
+        BVH& bvh,
+        const std::vector<PendingNode>& nodes,
+        int node,
+        const std::vector<SubtreeTask>& tasks,
+        int depth,
+        int parent,
+        int assigned_node
+    );
+    int partition_range(
+        const vec3* lowers,
+        const vec3* uppers,
+        int* indices,
+        int start,
+        int end,
+        const bounds3& range_bounds,
+        int threads
+    );
     int
     partition_median(const vec3* lowers, const vec3* uppers, int* indices, int start, int end, bounds3 range_bounds);
     int
@@ -53,10 +140,12 @@ private:
         int start,
         int end,
         bounds3 range_bounds,
-        int& split_axis
+        int& split_axis,
+        int threads = 1
     );
     void build_with_groups(BVH& bvh, const vec3* lowers, const vec3* uppers, const int* groups, int n);
     int constructor_type = -1;
+    int num_threads = 1;
 };
 
 //////////////////////////////////////////////////////////////////////
@@ -205,7 +294,7 @@ void TopDownBVHBuilder::build_with_groups(BVH& bvh, const vec3* lowers, const ve
         int prim_end = bvh.node_uppers[node].i;
         // Replace this packed leaf with a full subtree over [prim_start, prim_end)
         bvh.node_lowers[node].b = 0;
-        build_recursive(bvh, lowers, uppers, prim_start, prim_end, 0, bvh.node_parents[node], node);
+        build_subtree(bvh, lowers, uppers, prim_start, prim_end, 0, bvh.node_parents[node], node);
     }
 
     // 5. Reorder the tree so that all the leaf nodes are stored in the front
@@ -214,7 +303,7 @@ void TopDownBVHBuilder::build_with_groups(BVH& bvh, const vec3* lowers, const ve
 
 
 void TopDownBVHBuilder::build(
-    BVH& bvh, const vec3* lowers, const vec3* uppers, int n, int in_constructor_type, int* groups
+    BVH& bvh, const vec3* lowers, const vec3* uppers, int n, int in_constructor_type, int* groups, int in_num_threads
 )
 {
     assert(n >= 0);
@@ -223,6 +312,7 @@ void TopDownBVHBuilder::build(
     }
 
     constructor_type = in_constructor_type;
+    num_threads = resolve_num_threads(in_num_threads);
     if (constructor_type != BVH_CONSTRUCTOR_SAH && constructor_type != BVH_CONSTRUCTOR_MEDIAN) {
         fprintf(
             stderr,
@@ -266,11 +356,11 @@ void TopDownBVHBuilder::build(
     if (groups) {
         build_with_groups(bvh, lowers, uppers, groups, n);
     } else {
-        build_recursive(bvh, lowers, uppers, 0, n, 0, -1);
+        build_subtree(bvh, lowers, uppers, 0, n, 0, -1);
     }
 }
 
-void TopDownBVHBuilder::rebuild(BVH& bvh, int in_constructor_type)
+void TopDownBVHBuilder::rebuild(BVH& bvh, int in_constructor_type, int in_num_threads)
 {
     if (in_constructor_type != BVH_CONSTRUCTOR_SAH && in_constructor_type != BVH_CONSTRUCTOR_MEDIAN) {
         fprintf(
@@ -284,6 +374,7 @@ void TopDownBVHBuilder::rebuild(BVH& bvh, int in_constructor_type)
         return;
 
     constructor_type = in_constructor_type;
+    num_threads = resolve_num_threads(in_num_threads);
     for (int i = 0; i < bvh.num_items; ++i)
         bvh.primitive_indices[i] = i;
 
@@ -294,20 +385,56 @@ void TopDownBVHBuilder::rebuild(BVH& bvh, int in_constructor_type)
     if (bvh.item_groups) {
         build_with_groups(bvh, bvh.item_lowers, bvh.item_uppers, bvh.item_groups, bvh.num_items);
     } else {
-        build_recursive(bvh, bvh.item_lowers, bvh.item_uppers, 0, bvh.num_items, 0, -1);
+        build_subtree(bvh, bvh.item_lowers, bvh.item_uppers, 0, bvh.num_items, 0, -1);
     }
 }
 
+// Reduce over [start, end) in parallel: chunk_func(begin, end) computes the partial result of a chunk,
+// and merge(result, partial) folds the partial results in chunk order. The bounds unions and bucket
+// counts reduced by the builder are exact, so the result matches a single pass over the range.
+template <typename T, typename ChunkFunc, typename MergeFunc>
+static T parallel_reduce_range(int start, int end, int threads, ChunkFunc chunk_func, MergeFunc merge)
+{
+    const int64_t n = end - start;
+    const int64_t num_chunks
+        = std::max<int64_t>(1, std::min<int64_t>(int64_t(threads) * 4, n / BVH_PARALLEL_REDUCE_CHUNK_ITEMS));
+
+    std::vector<T> partials(num_chunks);
+    parallel_for(num_chunks, 1, threads, [&](size_t first, size_t last) {
+        for (size_t c = first; c < last; ++c) {
+            const int chunk_start = int(start + n * int64_t(c) / num_chunks);
+            const int chunk_end = int(start + n * int64_t(c + 1) / num_chunks);
+            partials[c] = chunk_func(chunk_start, chunk_end);
+        }
+    });
+
+    T result = partials[0];
+    for (int64_t c = 1; c < num_chunks; ++c)
+        merge(result, partials[c]);
+    return result;
+}
+
 
-bounds3 TopDownBVHBuilder::calc_bounds(const vec3* lowers, const vec3* uppers, const int* indices, int start, int end)
+bounds3 TopDownBVHBuilder::calc_bounds(
+    const vec3* lowers, const vec3* uppers, const int* indices, int start, int end, int threads
+)
 {
-    bounds3 u;
+    auto bounds_of = [&](int chunk_start, int chunk_end) {
+        bounds3 u;
 
-    for (int i = start; i < end; ++i) {
-        u.add_bounds(lowers[indices[i]], uppers[indices[i]]);
-    }
+        for (int i = chunk_start; i < chunk_end; ++i) {
+            u.add_bounds(lowers[indices[i]], uppers[indices[i]]);
+        }
+
+        return u;
+    };
 
-    return u;
+    if (threads == 1 || end - start < 2 * BVH_PARALLEL_REDUCE_CHUNK_ITEMS)
+        return bounds_of(start, end);
+
+    return parallel_reduce_range<bounds3>(start, end, threads, bounds_of, [](bounds3& u, const bounds3& partial) {
+        u.add_bounds(partial.lower, partial.upper);
+    });
 }
 
 struct PartitionPredicateMedian {
@@ -396,6 +523,33 @@ int TopDownBVHBuilder::partition_midpoint(
     return k;
 }
 
+// Per-bucket primitive counts and bounds of a binned SAH split
+struct SAHBuckets {
+    int counts[SAH_NUM_BUCKETS] = {};
+    bounds3 bounds[SAH_NUM_BUCKETS];
+
+    void add(int bucket_idx, const bounds3& item_bound)
+    {
+        if (counts[bucket_idx]) {
+            bounds[bucket_idx] = bounds_union(item_bound, bounds[bucket_idx]);
+        } else {
+            bounds[bucket_idx] = item_bound;
+        }
+
+        counts[bucket_idx]++;
+    }
+
+    void merge(const SAHBuckets& other)
+    {
+        for (int i = 0; i < SAH_NUM_BUCKETS; ++i) {
+            if (other.counts[i] == 0)
+                continue;
+            bounds[i] = counts[i] ? bounds_union(other.bounds[i], bounds[i]) : other.bounds[i];
+            counts[i] += other.counts[i];
+        }
+    }
+};
+
 float TopDownBVHBuilder::partition_sah_indices(
     const vec3* lowers,
     const vec3* uppers,
@@ -403,22 +557,35 @@ float TopDownBVHBuilder::partition_sah_indices(
     int start,
     int end,
     bounds3 range_bounds,
-    int& split_axis
+    int& split_axis,
+    int threads
 )
 {
-    int buckets_counts[SAH_NUM_BUCKETS];
-    bounds3 buckets[SAH_NUM_BUCKETS];
     float left_areas[SAH_NUM_BUCKETS - 1];
     float right_areas[SAH_NUM_BUCKETS - 1];
 
     assert(end - start >= 2);
 
-    int n = end - start;
+    // large ranges at the top of a parallel build are binned by several threads
+    const bool parallel = threads != 1 && end - start >= 2 * BVH_PARALLEL_REDUCE_CHUNK_ITEMS;
+
+    auto centroid_bounds_of = [&](int chunk_start, int chunk_end) {
+        bounds3 u;
+        for (int i = chunk_start; i < chunk_end; ++i) {
+            vec3 item_center = 0.5f * (lowers[indices[i]] + uppers[indices[i]]);
+            u.add_point(item_center);
+        }
+        return u;
+    };
 
     bounds3 centroid_bounds;
-    for (int i = start; i < end; ++i) {
-        vec3 item_center = 0.5f * (lowers[indices[i]] + uppers[indices[i]]);
-        centroid_bounds.add_point(item_center);
+    if (parallel) {
+        centroid_bounds = parallel_reduce_range<bounds3>(
+            start, end, threads, centroid_bounds_of,
+            [](bounds3& u, const bounds3& partial) { u.add_bounds(partial.lower, partial.upper); }
+        );
+    } else {
+        centroid_bounds = centroid_bounds_of(start, end);
     }
     vec3 edges = centroid_bounds.edges();
 
@@ -435,26 +602,32 @@ float TopDownBVHBuilder::partition_sah_indices(
         return range_start;
     }
 
-    std::fill(buckets_counts, buckets_counts + SAH_NUM_BUCKETS, 0);
-    for (int item_idx = start; item_idx < end; item_idx++) {
-        vec3 item_center = 0.5f * (lowers[indices[item_idx]] + uppers[indices[item_idx]]);
-        int bucket_idx = SAH_NUM_BUCKETS * (item_center[split_axis] - range_start) / (range_end - range_start);
-        // clamp into valid range [0, SAH_NUM_BUCKETS-1]
-        if (bucket_idx < 0)
-            bucket_idx = 0;
-        if (bucket_idx >= SAH_NUM_BUCKETS)
-            bucket_idx = SAH_NUM_BUCKETS - 1;
-
-        bounds3 item_bound(lowers[indices[item_idx]], uppers[indices[item_idx]]);
-
-        if (buckets_counts[bucket_idx]) {
-            buckets[bucket_idx] = bounds_union(item_bound, buckets[bucket_idx]);
-        } else {
-            buckets[bucket_idx] = item_bound;
+    auto buckets_of = [&](int chunk_start, int chunk_end) {
+        SAHBuckets b;
+        for (int item_idx = chunk_start; item_idx < chunk_end; item_idx++) {
+            vec3 item_center = 0.5f * (lowers[indices[item_idx]] + uppers[indices[item_idx]]);
+            int bucket_idx = SAH_NUM_BUCKETS * (item_center[split_axis] - range_start) / (range_end - range_start);
+            // clamp into valid range [0, SAH_NUM_BUCKETS-1]
+            if (bucket_idx < 0)
+                bucket_idx = 0;
+            if (bucket_idx >= SAH_NUM_BUCKETS)
+                bucket_idx = SAH_NUM_BUCKETS - 1;
+
+            b.add(bucket_idx, bounds3(lowers[indices[item_idx]], uppers[indices[item_idx]]));
         }
+        return b;
+    };
 
-        buckets_counts[bucket_idx]++;
+    SAHBuckets sah_buckets;
+    if (parallel) {
+        sah_buckets = parallel_reduce_range<SAHBuckets>(
+            start, end, threads, buckets_of, [](SAHBuckets& b, const SAHBuckets& partial) { b.merge(partial); }
+        );
+    } else {
+        sah_buckets = buckets_of(start, end);
     }
+    const int* buckets_counts = sah_buckets.counts;
+    const bounds3* buckets = sah_buckets.bounds;
 
     bounds3 left;
     bounds3 right;
@@ -537,21 +710,41 @@ int TopDownBVHBuilder::build_recursive(
         return node_index;
     }
 
+    int split = partition_range(lowers, uppers, bvh.primitive_indices, start, end, b, 1);
+    if (split < 0)
+        return -1;
+
+    int left_child = build_recursive(bvh, lowers, uppers, start, split, depth + 1, node_index);
+    int right_child = build_recursive(bvh, lowers, uppers, split, end, depth + 1, node_index);
+
+    bvh.node_lowers[node_index] = make_node(b.lower, left_child, false);
+    bvh.node_uppers[node_index] = make_node(b.upper, right_child, false);
+    bvh.node_parents[node_index] = parent;
+    return node_index;
+}
+
+
+int TopDownBVHBuilder::partition_range(
+    const vec3* lowers, const vec3* uppers, int* indices, int start, int end, const bounds3& range_bounds, int threads
+)
+{
+    // Partition [start,end) into two non-empty halves and return the split index, or -1 for an unknown constructor
     int split = -1;
     if (constructor_type == BVH_CONSTRUCTOR_SAH)
     // SAH constructor
     {
         int split_axis = -1;
-        float split_point = partition_sah_indices(lowers, uppers, bvh.primitive_indices, start, end, b, split_axis);
-        auto boundary = std::partition(bvh.primitive_indices + start, bvh.primitive_indices + end, [&](int i) {
+        float split_point
+            = partition_sah_indices(lowers, uppers, indices, start, end, range_bounds, split_axis, threads);
+        auto boundary = std::partition(indices + start, indices + end, [&](int i) {
             return 0.5f * (lowers[i] + uppers[i])[split_axis] < split_point;
         });
 
-        split = std::distance(bvh.primitive_indices + start, boundary) + start;
+        split = std::distance(indices + start, boundary) + start;
     } else if (constructor_type == BVH_CONSTRUCTOR_MEDIAN)
     // Median constructor
     {
-        split = partition_median(lowers, uppers, bvh.primitive_indices, start, end, b);
+        split = partition_median(lowers, uppers, indices, start, end, range_bounds);
     } else {
         printf("Unknown type of BVH constructor: %d!\n", constructor_type);
         return -1;
@@ -562,11 +755,133 @@ int TopDownBVHBuilder::build_recursive(
         split = (start + end) / 2;
     }
 
-    int left_child = build_recursive(bvh, lowers, uppers, start, split, depth + 1, node_index);
-    int right_child = build_recursive(bvh, lowers, uppers, split, end, depth + 1, node_index);
+    return split;
+}
 
-    bvh.node_lowers[node_index] = make_node(b.lower, left_child, false);
-    bvh.node_uppers[node_index] = make_node(b.upper, right_child, false);
+
+int TopDownBVHBuilder::build_subtree(
+    BVH& bvh, const vec3* lowers, const vec3* uppers, int start, int end, int depth, int parent, int assigned_node
+)
+{
+    if (num_threads > 1 && end - start >= BVH_PARALLEL_BUILD_MIN_ITEMS)
+        return build_parallel(bvh, lowers, uppers, start, end, depth, parent, assigned_node);
+
+    return build_recursive(bvh, lowers, uppers, start, end, depth, parent, assigned_node);
+}
+
+
+int TopDownBVHBuilder::build_parallel(
+    BVH& bvh, const vec3* lowers, const vec3* uppers, int start, int end, int depth, int parent, int assigned_node
+)
+{
+    // Multithreaded version of build_recursive() producing identical output:
+    // 1. Split the top of the tree on the calling thread, reducing bounds and SAH buckets of the large ranges in
+    //    parallel, until the remaining ranges give every thread several subtrees to build
+    // 2. Build those subtrees concurrently, each into its own node list. Their primitive ranges are disjoint, and each
+    //    range is partitioned exactly as build_recursive() would partition it
+    // 3. Emit all nodes into the BVH in the depth-first order of build_recursive(), assigning the final node indices
+    const int n = end - start;
+    const int task_cutoff = std::max(n / (num_threads * BVH_PARALLEL_TASKS_PER_THREAD), BVH_PARALLEL_MIN_TASK_ITEMS);
+
+    std::vector<PendingNode> top_nodes;
+    std::vector<SubtreeTask> tasks;
+    const int root = build_pending(bvh, lowers, uppers, start, end, depth, top_nodes, &tasks, task_cutoff);
+
+    parallel_for(tasks.size(), 1, num_threads, [&](size_t first, size_t last) {
+        for (size_t i = first; i < last; ++i) {
+            SubtreeTask& task = tasks[i];
+            build_pending(bvh, lowers, uppers, task.start, task.end, task.depth, task.nodes, nullptr, 0);
+        }
+    });
+
+    return emit_pending(bvh, top_nodes, root, tasks, depth, parent, assigned_node);
+}
+
+
+int TopDownBVHBuilder::build_pending(
+    const BVH& bvh,
+    const vec3* lowers,
+    const vec3* uppers,
+    int start,
+    int end,
+    int depth,
+    std::vector<PendingNode>& nodes,
+    std::vector<SubtreeTask>* tasks,
+    int task_cutoff
+)
+{
+    // Build the subtree over [start,end) into nodes in pre-order and return its root. When tasks is not null,
+    // ranges of at most task_cutoff primitives are deferred to a new task and referenced as ~task.
+    assert(start < end);
+
+    const int n = end - start;
+    if (tasks && n <= task_cutoff) {
+        tasks->push_back({ start, end, depth, {} });
+        return ~int(tasks->size() - 1);
+    }
+
+    const int threads = tasks ? num_threads : 1;
+    const int node_index = int(nodes.size());
+    nodes.emplace_back();
+    nodes[node_index].bounds = calc_bounds(lowers, uppers, bvh.primitive_indices, start, end, threads);
+
+    if (n <= bvh.leaf_size || depth >= BVH_QUERY_STACK_SIZE) {
+        nodes[node_index].leaf = true;
+        nodes[node_index].start = start;
+        nodes[node_index].end = end;
+        return node_index;
+    }
+
+    // build() and rebuild() have already validated the constructor type
+    const int split
+        = partition_range(lowers, uppers, bvh.primitive_indices, start, end, nodes[node_index].bounds, threads);
+    assert(split > start && split < end);
+
+    const int left_child = build_pending(bvh, lowers, uppers, start, split, depth + 1, nodes, tasks, task_cutoff);
+    const int right_child = build_pending(bvh, lowers, uppers, split, end, depth + 1, nodes, tasks, task_cutoff);
+
+    nodes[node_index].left = left_child;
+    nodes[node_index].right = right_child;
+    return node_index;
+}
+
+
+int TopDownBVHBuilder::emit_pending(
+    BVH& bvh,
+    const std::vector<PendingNode>& nodes,
+    int node,
+    const std::vector<SubtreeTask>& tasks,
+    int depth,
+    int parent,
+    int assigned_node
+)
+{
+    // the root of a task's subtree is the first node of its list
+    if (node < 0)
+        return emit_pending(bvh, tasks[~node].nodes, 0, tasks, depth, parent, assigned_node);
+
+    const PendingNode& pending = nodes[node];
+    const int node_index = (assigned_node >= 0) ? assigned_node : bvh.num_nodes++;
+
+    if (assigned_node < 0)
+        assert(node_index < bvh.max_nodes);
+
+    if (depth > bvh.max_depth)
+        bvh.max_depth = depth;
+
+    if (pending.leaf) {
+        bvh.node_lowers[node_index] = make_node(pending.bounds.lower, pending.start, true);
+        bvh.node_uppers[node_index] = make_node(pending.bounds.upper, pending.end, false);
+        bvh.node_parents[node_index] = parent;
+        bvh.num_leaf_nodes++;
+        return node_index;
+    }
+
+    int left_child = emit_pending(bvh, nodes, pending.left, tasks, depth + 1, node_index, -1);
+    int right_child = emit_pending(bvh, nodes, pending.right, tasks, depth + 1, node_index, -1);
+
+    bvh.node_lowers[node_index] = make_node(pending.bounds.lower, left_child, false);
+    bvh.node_uppers[node_index] = make_node(pending.bounds.upper, right_child, false);
     bvh.node_parents[node_index] = parent;
     return node_index;
 }
@@ -733,7 +1048,7 @@ void bvh_refit_recursive(BVH& bvh, int index)
 }
 
 void bvh_refit_host(BVH& bvh) { bvh_refit_recursive(bvh, *bvh.root); }
-void bvh_rebuild_host(BVH& bvh, int constructor_type)
+void bvh_rebuild_host(BVH& bvh, int constructor_type, int num_threads)
 {
     if (constructor_type == BVH_CONSTRUCTOR_CUBQL) {
         if (bvh.item_groups) {
@@ -755,7 +1070,7 @@ void bvh_rebuild_host(BVH& bvh, int constructor_type)
     }
 
     TopDownBVHBuilder builder;
-    builder.rebuild(bvh, constructor_type);
+    builder.rebuild(bvh, constructor_type, num_threads);
     bvh.constructor_type = constructor_type;
 }
 
@@ -790,7 +1105,14 @@ void bvh_rem_descriptor(uint64_t id) { g_bvh_descriptors.erase(id); }
 
 // create in-place given existing descriptor
 void bvh_create_host(
-    vec3* lowers, vec3* uppers, int num_items, int constructor_type, int* groups, int leaf_size, BVH& bvh
+    vec3* lowers,
+    vec3* uppers,
+    int num_items,
+    int constructor_type,
+    int* groups,
+    int leaf_size,
+    BVH& bvh,
+    int num_threads
 )
 {
     if (constructor_type == BVH_CONSTRUCTOR_CUBQL) {
@@ -814,7 +1136,7 @@ void bvh_create_host(
     bvh.constructor_type = constructor_type;
 
     TopDownBVHBuilder builder;
-    builder.build(bvh, lowers, uppers, num_items, constructor_type, groups);
+    builder.build(bvh, lowers, uppers, num_items, constructor_type, groups, num_threads);
 }
 
 
@@ -839,11 +1161,13 @@ void bvh_destroy_host(BVH& bvh)
 
 }  // namespace wp
 
-uint64_t wp_bvh_create_host(vec3* lowers, vec3* uppers, int num_items, int constructor_type, int* groups, int leaf_size)
+uint64_t wp_bvh_create_host(
+    vec3* lowers, vec3* uppers, int num_items, int constructor_type, int* groups, int leaf_size, int num_threads
+)
 {
     BVH* bvh = static_cast<BVH*>(wp_alloc_host(sizeof(BVH), "(native:bvh)"));
     memset(bvh, 0, sizeof(BVH));
-    wp::bvh_create_host(lowers, uppers, num_items, constructor_type, groups, leaf_size, *bvh);
+    wp::bvh_create_host(lowers, uppers, num_items, constructor_type, groups, leaf_size, *bvh, num_threads);
 
     if (!bvh->node_lowers && num_items > 0) {
         wp_free_host(bvh);
@@ -885,13 +1209,13 @@ void wp_bvh_refit_host(uint64_t id)
     wp::bvh_refit_host(*bvh);
 }
 
-void wp_bvh_rebuild_host(uint64_t id, int constructor_type)
+void wp_bvh_rebuild_host(uint64_t id, int constructor_type, int num_threads)
 {
     if (apic_capture_bvh_rebuild_host(id, constructor_type))
         return;
 
     BVH* bvh = (BVH*)(id);
-    wp::bvh_rebuild_host(*bvh, constructor_type);
+    wp::bvh_rebuild_host(*bvh, constructor_type, num_threads);
 }
 
 void wp_bvh_destroy_host(uint64_t id)
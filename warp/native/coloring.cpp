@@ -20,10 +20,14 @@
 
 #include "warp.h"
 
+#include "thread_pool.h"
+
 #include <algorithm>
 #include <array>
+#include <atomic>
 #include <climits>
 #include <iostream>
+#include <memory>
 #include <numeric>
 #include <queue>
 #include <random>
@@ -482,11 +486,182 @@ int graph_coloring_naive_greedy(Graph& graph)
     std::iota(std::begin(ordering), std::end(ordering), 0);
     return graph_coloring_ordered_greedy(ordering, graph);
 }
+
+// Nodes colored speculatively per chunk of parallel work
+#define SPECULATIVE_COLORING_CHUNK_SIZE (256)
+
+// Gebremedhin, A. H., & Manne, F. (2000). Scalable parallel graph coloring algorithms. Concurrency: Practice and
+// Experience, 12(12), 1121-1136.
+//
+// Colors the nodes of the worklist speculatively: every node in the worklist takes the smallest color not used by its
+// neighbors at the time it is visited, concurrently with the other nodes. Adjacent nodes colored at the same time may
+// pick the same color; of each such pair the node ranked later is put back into the worklist and colored again in the
+// next round. The node ranked first in the worklist always keeps its color, so every round makes progress. Nodes that
+// are not in the worklist must already have valid colors, which are left untouched.
+//
+// Run on a single thread, this is the sequential greedy coloring of the worklist in rank order.
+int graph_coloring_speculative(Graph& graph, std::vector<int> worklist, const std::vector<int>& rank, int num_threads)
+{
+    std::unique_ptr<std::atomic<int>[]> colors(new std::atomic<int>[graph.num_nodes]);
+    for (int node = 0; node < graph.num_nodes; node++) {
+        colors[node].store(graph.node_colors[node], std::memory_order_relaxed);
+    }
+    for (int node : worklist) {
+        colors[node].store(-1, std::memory_order_relaxed);
+    }
+
+    std::vector<std::vector<int>> chunk_conflicts;
+
+    while (!worklist.empty()) {
+        // tentative coloring
+        parallel_for(worklist.size(), SPECULATIVE_COLORING_CHUNK_SIZE, num_threads, [&](size_t first, size_t last) {
+            // colors used by the neighbors are marked with the index of the node being colored
+            std::vector<int> color_used_by;
+            for (size_t i = first; i < last; i++) {
+                int node = worklist[i];
+                int degree = graph.get_node_degree(node);
+                // a node never needs more than degree + 1 colors
+                color_used_by.resize(std::max(color_used_by.size(), size_t(degree + 1)), -1);
+
+                for (int nei_counter = 0; nei_counter < degree; nei_counter++) {
+                    int nei_color = colors[graph.get_node_neighbor(node, nei_counter)].load(std::memory_order_relaxed);
+                    if (nei_color >= 0 && nei_color <= degree) {
+                        color_used_by[nei_color] = node;
+                    }
+                }
+
+                int color = 0;
+                while (color_used_by[color] == node) {
+                    color++;
+                }
+                colors[node].store(color, std::memory_order_relaxed);
+            }
+        });
+
+        // conflict detection, conflicts of each chunk are gathered separately to keep the worklist ordered
+        size_t num_chunks = (worklist.size() + SPECULATIVE_COLORING_CHUNK_SIZE - 1) / SPECULATIVE_COLORING_CHUNK_SIZE;
+        chunk_conflicts.assign(num_chunks, std::vector<int>());
+        parallel_for(num_chunks, 1, num_threads, [&](size_t first, size_t last) {
+            for (size_t chunk = first; chunk < last; chunk++) {
+                size_t begin = chunk * SPECULATIVE_COLORING_CHUNK_SIZE;
+                size_t end = std::min(begin + SPECULATIVE_COLORING_CHUNK_SIZE, worklist.size());
+                for (size_t i = begin; i < end; i++) {
+                    int node = worklist[i];
+                    int color = colors[node].load(std::memory_order_relaxed);
+                    for (int nei_counter = 0; nei_counter < graph.get_node_degree(node); nei_counter++) {
+                        int nei_node_idx = graph.get_node_neighbor(node, nei_counter);
+                        if (colors[nei_node_idx].load(std::memory_order_relaxed) == color
+                            && rank[nei_node_idx] < rank[node]) {
+                            chunk_conflicts[chunk].push_back(node);
+                            break;
+                        }
+                    }
+                }
+            }
+        });
+
+        worklist.clear();
+        for (const std::vector<int>& conflicts : chunk_conflicts) {
+            worklist.insert(worklist.end(), conflicts.begin(), conflicts.end());
+        }
+    }
+
+    int max_color = -1;
+    for (int node = 0; node < graph.num_nodes; node++) {
+        graph.node_colors[node] = colors[node].load(std::memory_order_relaxed);
+        max_color = std::max(max_color, graph.node_colors[node]);
+    }
+
+    return max_color + 1;
+}
+
+// orders nodes by decreasing degree and returns the rank of each node in rank_out
+std::vector<int> degree_ordering(const Graph& graph, const std::vector<int>& nodes, std::vector<int>& rank_out)
+{
+    std::vector<int> ordering(nodes);
+    std::sort(std::begin(ordering), std::end(ordering), [&graph](const auto& lhs, const auto& rhs) {
+        return graph.get_node_degree(lhs) > graph.get_node_degree(rhs);
+    });
+
+    // nodes outside of the ordering keep their colors, they rank before every ordered node
+    rank_out.assign(graph.num_nodes, -1);
+    for (size_t i = 0; i < ordering.size(); i++) {
+        rank_out[ordering[i]] = int(i);
+    }
+
+    return ordering;
+}
+
+// Degree-ordered greedy coloring computed with speculative coloring on multiple threads
+int graph_coloring_parallel(Graph& graph, int num_threads)
+{
+    std::vector<int> nodes(graph.num_nodes);
+    std::iota(std::begin(nodes), std::end(nodes), 0);
+
+    std::vector<int> rank;
+    std::vector<int> ordering = degree_ordering(graph, nodes, rank);
+
+    return graph_coloring_speculative(graph, std::move(ordering), rank, num_threads);
+}
+
+// Recolors uncolored nodes and one endpoint of each conflicting edge, keeping the colors of all other nodes
+int graph_coloring_repair(Graph& graph, const wp::array_t<int>& changed_edges, int num_threads)
+{
+    std::vector<char> recolor(graph.num_nodes, 0);
+    for (int node = 0; node < graph.num_nodes; node++) {
+        if (graph.node_colors[node] < 0) {
+            recolor[node] = 1;
+        }
+    }
+
+    for (size_t edge_idx = 0; edge_idx < changed_edges.shape[0]; edge_idx++) {
+        int e0 = *address(changed_edges, edge_idx, 0);
+        int e1 = *address(changed_edges, edge_idx, 1);
+        if (e0 != e1 && graph.node_colors[e0] == graph.node_colors[e1] && !recolor[e0] && !recolor[e1]) {
+            recolor[std::max(e0, e1)] = 1;
+        }
+    }
+
+    std::vector<int> nodes;
+    for (int node = 0; node < graph.num_nodes; node++) {
+        if (recolor[node]) {
+            nodes.push_back(node);
+        }
+    }
+
+    std::vector<int> rank;
+    std::vector<int> ordering = degree_ordering(graph, nodes, rank);
+
+    return graph_coloring_speculative(graph, std::move(ordering), rank, num_threads);
+}
+
+// Checks that an edge array has shape (edge_count, 2) and only references nodes in [0, num_nodes)
+bool check_edges(const wp::array_t<int>& edges, int num_nodes, const char* name)
+{
+    if (edges.ndim != 2 || edges.shape[1] != 2) {
+        fprintf(stderr, "The %s array must have the shape (edge_count, 2)!\n", name);
+        return false;
+    }
+
+    for (size_t edge_idx = 0; edge_idx < edges.shape[0]; edge_idx++) {
+        for (int end = 0; end < 2; end++) {
+            int node = *address(edges, edge_idx, end);
+            if (node < 0 || node >= num_nodes) {
+                fprintf(stderr, "The %s array references node %d, out of the range [0, %d)!\n", name, node, num_nodes);
+                return false;
+            }
+        }
+    }
+
+    return true;
+}
 }
 using namespace wp;
 
 extern "C" {
-int wp_graph_coloring(int num_nodes, wp::array_t<int> edges, int algorithm, wp::array_t<int> node_colors)
+int wp_graph_coloring(
+    int num_nodes, wp::array_t<int> edges, int algorithm, wp::array_t<int> node_colors, int num_threads
+)
 {
     if (node_colors.ndim != 1 || node_colors.shape[0] != num_nodes) {
         fprintf(stderr, "The node_colors array must have the preallocated shape of (num_nodes,)!\n");
@@ -517,6 +692,10 @@ int wp_graph_coloring(int num_nodes, wp::array_t<int> edges, int algorithm, wp::
         // greedy
         num_colors = graph_coloring_degree_ordered_greedy(graph);
         break;
+    case 2:
+        // speculative parallel greedy
+        num_colors = graph_coloring_parallel(graph, num_threads);
+        break;
     // case 2:
     //     // mcs algorithm
     //     num_colors = graph_coloring_mcs_set(graph);
@@ -537,6 +716,34 @@ int wp_graph_coloring(int num_nodes, wp::array_t<int> edges, int algorithm, wp::
     return num_colors;
 }
 
+int wp_graph_coloring_repair(
+    int num_nodes, wp::array_t<int> edges, wp::array_t<int> changed_edges, wp::array_t<int> node_colors, int num_threads
+)
+{
+    if (node_colors.ndim != 1 || node_colors.shape[0] != num_nodes) {
+        fprintf(stderr, "The node_colors array must have the preallocated shape of (num_nodes,)!\n");
+        return -1;
+    }
+
+    if (num_nodes == 0) {
+        fprintf(stderr, "Empty graph!\n");
+        return -1;
+    }
+
+    if (!check_edges(edges, num_nodes, "edges") || !check_edges(changed_edges, num_nodes, "changed_edges")) {
+        return -1;
+    }
+
+    Graph graph(num_nodes, edges);
+    memcpy(graph.node_colors.data(), node_colors.data, num_nodes * sizeof(int));
+
+    int num_colors = graph_coloring_repair(graph, changed_edges, num_threads);
+
+    memcpy(node_colors.data, graph.node_colors.data(), num_nodes * sizeof(int));
+
+    return num_colors;
+}
+
 float wp_balance_coloring(
     int num_nodes, wp::array_t<int> edges, int num_colors, float target_max_min_ratio, wp::array_t<int> node_colors
 )
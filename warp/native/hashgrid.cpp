@@ -9,8 +9,13 @@
 #include "hashgrid.h"
 #include "sort.h"
 #include "string.h"
+#include "thread_pool.h"
 
+#include <algorithm>
 #include <cstddef>
+#include <mutex>
+#include <type_traits>
+#include <vector>
 
 using namespace wp;
 
@@ -152,14 +157,277 @@ template <typename Type> void hash_grid_reserve_host_impl(uint64_t id, int num_p
     grid->num_points = num_points;
 }
 
+// Statistics of a host build, mirrors hash_grid_build_stats_t in types.py
+struct hash_grid_build_stats_t {
+    int num_points;
+    int occupied_cells;
+    int max_cell_points;
+    int moved_points;  // points that changed cells, or all points for a full build
+    int incremental;  // whether the build only re-bucketed the moved points
+};
+
+namespace {
+
+// minimum number of points processed by each chunk of a multithreaded host build
+constexpr int HASH_GRID_PARALLEL_CHUNK_POINTS = 8192;
+
+// an incremental build falls back to a full build when more than 1/N of the points changed cells
+constexpr int HASH_GRID_INCREMENTAL_MAX_MOVED_FRACTION = 8;
+
+// Keys of the points at the previous host build of a grid, kept between builds to update it incrementally
+struct HashGridIncrementalState {
+    std::vector<int> point_cells;  // cell of each point, for grids without groups
+    std::vector<uint64_t> point_keys;  // (cell, group) key of each point, for grids with groups
+    std::vector<uint8_t> moved;  // flags of the points that changed keys, cleared after each update
+};
+
+// maps host hash grid address (id) to its incremental build state, only for grids built with incremental=true
+std::mutex g_hash_grid_incremental_mutex;
+std::map<uint64_t, HashGridIncrementalState> g_hash_grid_incremental_states;
+
+HashGridIncrementalState& hash_grid_get_incremental_state(uint64_t id)
+{
+    std::lock_guard<std::mutex> lock(g_hash_grid_incremental_mutex);
+    return g_hash_grid_incremental_states[id];
+}
+
+void hash_grid_release_incremental_state(uint64_t id)
+{
+    std::lock_guard<std::mutex> lock(g_hash_grid_incremental_mutex);
+    g_hash_grid_incremental_states.erase(id);
+}
+
+std::vector<int>& hash_grid_previous_keys(HashGridIncrementalState& state, const int*) { return state.point_cells; }
+
+std::vector<uint64_t>& hash_grid_previous_keys(HashGridIncrementalState& state, const uint64_t*)
+{
+    return state.point_keys;
+}
+
+int hash_grid_num_chunks(int num_points, int threads)
+{
+    return std::max(1, std::min(threads * 4, num_points / HASH_GRID_PARALLEL_CHUNK_POINTS));
+}
+
+// Run func(chunk, begin, end) over num_chunks contiguous ranges of [0, num_points)
+template <typename Func> void hash_grid_for_chunks(int num_points, int num_chunks, int threads, Func func)
+{
+    parallel_for(num_chunks, 1, threads, [&](size_t first, size_t last) {
+        for (size_t c = first; c < last; ++c) {
+            const int begin = int(int64_t(num_points) * int64_t(c) / num_chunks);
+            const int end = int(int64_t(num_points) * int64_t(c + 1) / num_chunks);
+            func(int(c), begin, end);
+        }
+    });
+}
+
+// number of low key bits spanned by the cell indices of the grid
+int hash_grid_cell_bits(int num_cells)
+{
+    int bits = 1;
+    while (bits < 31 && (1 << bits) < num_cells)
+        ++bits;
+    return bits;
+}
+
+int hash_grid_key_cell(int key) { return key; }
+
+int hash_grid_key_cell(uint64_t key) { return int(key >> 32); }
+
+template <typename KeyType> struct HashGridMovedPoint {
+    KeyType key;
+    int id;
+
+    bool operator<(const HashGridMovedPoint& other) const
+    {
+        return key < other.key || (key == other.key && id < other.id);
+    }
+};
+
+// Re-bucket the points whose key changed since the previous build.
+//
+// The previous build left keys[] sorted by (key, point id), and its per-point keys in previous_keys. The points
+// that kept their key are still in sorted order, so only the moved points are sorted, then both sequences are
+// merged. The result is identical to a full build. Returns false, leaving the grid and the previous keys
+// untouched, if too many points moved for the update to pay off.
+template <typename Type, typename KeyType, typename KeyFunc>
+bool hash_grid_update_incremental(
+    HashGrid_t<Type>& grid,
+    KeyType* keys,
+    std::vector<KeyType>& previous_keys,
+    std::vector<uint8_t>& moved_flags,
+    int num_points,
+    int threads,
+    KeyFunc key_func,
+    int& moved_count
+)
+{
+    const int num_chunks = hash_grid_num_chunks(num_points, threads);
+    const int max_moved = num_points / HASH_GRID_INCREMENTAL_MAX_MOVED_FRACTION;
+
+    // find the moved points of each chunk, in point order so the points are read sequentially
+    std::vector<std::vector<HashGridMovedPoint<KeyType>>> chunk_moved(num_chunks);
+    hash_grid_for_chunks(num_points, num_chunks, threads, [&](int c, int begin, int end) {
+        auto& moved = chunk_moved[c];
+        for (int i = begin; i < end; ++i) {
+            const KeyType key = key_func(i);
+            if (key != previous_keys[i]) {
+                moved.push_back({ key, i });
+                if (int(moved.size()) > max_moved)
+                    break;
+            }
+        }
+    });
+
+    std::vector<HashGridMovedPoint<KeyType>> moved;
+    for (const auto& m : chunk_moved)
+        moved.insert(moved.end(), m.begin(), m.end());
+
+    if (int(moved.size()) > max_moved)
+        return false;
+
+    moved_count = int(moved.size());
+    if (moved.empty())
+        return true;
+
+    std::sort(moved.begin(), moved.end());
+
+    if (int(moved_flags.size()) != num_points)
+        moved_flags.assign(num_points, 0);
+
+    // the cells left by the moved points may end up empty, the others are rewritten by the offsets pass
+    for (const auto& m : moved) {
+        const int old_cell = hash_grid_key_cell(previous_keys[m.id]);
+        grid.cell_starts[old_cell] = 0;
+        grid.cell_ends[old_cell] = 0;
+
+        previous_keys[m.id] = m.key;
+        moved_flags[m.id] = 1;
+    }
+
+    // Merge in parallel: chunk c of the previous order receives the kept points of its slots and the moved points
+    // whose new (key, id) falls between the previous (key, id) of its first slot and that of the next chunk.
+    std::vector<int> kept_before(num_chunks + 1, 0);
+    std::vector<int> moved_before(num_chunks + 1, int(moved.size()));
+    hash_grid_for_chunks(num_points, num_chunks, threads, [&](int c, int begin, int end) {
+        int kept = 0;
+        for (int s = begin; s < end; ++s)
+            kept += 1 - moved_flags[grid.point_ids[s]];
+        kept_before[c + 1] = kept;
+
+        if (c > 0) {
+            const HashGridMovedPoint<KeyType> first = { keys[begin], grid.point_ids[begin] };
+            moved_before[c] = int(std::lower_bound(moved.begin(), moved.end(), first) - moved.begin());
+        } else {
+            moved_before[c] = 0;
+        }
+    });
+    for (int c = 0; c < num_chunks; ++c)
+        kept_before[c + 1] += kept_before[c];
+
+    KeyType* out_keys = keys + num_points;
+    int* out_ids = grid.point_ids + num_points;
+
+    hash_grid_for_chunks(num_points, num_chunks, threads, [&](int c, int begin, int end) {
+        int out = kept_before[c] + moved_before[c];
+        int m = moved_before[c];
+        const int m_end = moved_before[c + 1];
+
+        for (int s = begin; s < end; ++s) {
+            const int id = grid.point_ids[s];
+            if (moved_flags[id])
+                continue;
+
+            const KeyType key = keys[s];
+            while (m < m_end && (moved[m].key < key || (moved[m].key == key && moved[m].id < id))) {
+                out_keys[out] = moved[m].key;
+                out_ids[out] = moved[m].id;
+                ++out;
+                ++m;
+            }
+
+            out_keys[out] = key;
+            out_ids[out] = id;
+            ++out;
+        }
+
+        for (; m < m_end; ++m, ++out) {
+            out_keys[out] = moved[m].key;
+            out_ids[out] = moved[m].id;
+        }
+    });
+
+    for (const auto& m : moved)
+        moved_flags[m.id] = 0;
+
+    memcpy(keys, out_keys, sizeof(KeyType) * num_points);
+    memcpy(grid.point_ids, out_ids, sizeof(int) * num_points);
+    return true;
+}
+
+// Sort the points of the grid by key, recording their keys for a later incremental build if previous_keys is set
+template <typename Type, typename KeyType, typename KeyFunc>
+void hash_grid_update_full(
+    HashGrid_t<Type>& grid,
+    KeyType* keys,
+    std::vector<KeyType>* previous_keys,
+    int num_points,
+    int num_cells,
+    int threads,
+    KeyFunc key_func
+)
+{
+    if (previous_keys)
+        previous_keys->resize(num_points);
+
+    hash_grid_for_chunks(num_points, hash_grid_num_chunks(num_points, threads), threads, [&](int, int begin, int end) {
+        for (int i = begin; i < end; ++i) {
+            keys[i] = key_func(i);
+            grid.point_ids[i] = i;
+            if (previous_keys)
+                (*previous_keys)[i] = keys[i];
+        }
+    });
+
+    // grouped keys hold the cell in their high 32 bits and the group in the low ones
+    const int key_bits = hash_grid_cell_bits(num_cells) + (sizeof(KeyType) == sizeof(uint64_t) ? 32 : 0);
+
+    // cell indices are non-negative, so they sort the same as unsigned keys
+    using RadixKeyType = typename std::conditional<sizeof(KeyType) == sizeof(uint64_t), uint64_t, uint32_t>::type;
+    radix_sort_pairs_host_parallel(
+        reinterpret_cast<RadixKeyType*>(keys), grid.point_ids, num_points, threads, 0, key_bits
+    );
+}
+
+}  // anonymous namespace
+
 template <typename Type>
 void hash_grid_update_host_impl(
-    uint64_t id, Type cell_width, const wp::array_t<vec_t<3, Type>>* points, const wp::array_t<int>* groups
+    uint64_t id,
+    Type cell_width,
+    const wp::array_t<vec_t<3, Type>>* points,
+    const wp::array_t<int>* groups,
+    int num_threads,
+    bool incremental,
+    hash_grid_build_stats_t* stats
 )
 {
     // array dtypes, shapes, and devices are validated by HashGrid.build() before reaching native code
     HashGrid_t<Type>* grid = (HashGrid_t<Type>*)(id);
     const int num_points = points->shape[0];
+    const int num_cells = hash_grid_num_cells(*grid);
+    const int threads = resolve_num_threads(num_threads);
+    const int num_chunks = hash_grid_num_chunks(num_points, threads);
+
+    HashGridIncrementalState* state = nullptr;
+    if (incremental)
+        state = &hash_grid_get_incremental_state(id);
+    else
+        hash_grid_release_incremental_state(id);
+
+    // an incremental build requires the previous build to have bucketed the same points with the same cells
+    const bool can_update = state && num_points > 0 && num_points == grid->num_points && cell_width == grid->cell_width
+        && grid->has_groups == (groups ? 1 : 0);
 
     hash_grid_reserve_host_impl<Type>(id, num_points, groups != nullptr);
 
@@ -167,50 +435,113 @@ void hash_grid_update_host_impl(
     grid->cell_width_inv = Type(1) / cell_width;
     grid->has_groups = groups ? 1 : 0;
 
+    int moved_count = num_points;
+    bool updated = false;
+
     if (groups) {
         // sort composite (cell, group) keys so each cell's points are contiguous per group
-        for (int i = 0; i < num_points; ++i) {
-            const int cell = hash_grid_index(*grid, wp::index(*points, i));
-            grid->point_keys[i] = hash_grid_point_key(cell, wp::index(*groups, i));
-            grid->point_ids[i] = i;
+        auto key_func = [&](int i) {
+            return hash_grid_point_key(hash_grid_index(*grid, wp::index(*points, i)), wp::index(*groups, i));
+        };
+
+        if (can_update && int(state->point_keys.size()) == num_points)
+            updated = hash_grid_update_incremental(
+                *grid, grid->point_keys, state->point_keys, state->moved, num_points, threads, key_func, moved_count
+            );
+
+        if (!updated) {
+            if (state)
+                state->point_cells.clear();
+            hash_grid_update_full(
+                *grid, grid->point_keys, state ? &state->point_keys : nullptr, num_points, num_cells, threads, key_func
+            );
         }
 
-        radix_sort_pairs_host(grid->point_keys, grid->point_ids, num_points);
-
-        for (int i = 0; i < num_points; ++i)
-            grid->point_cells[i] = (int)(grid->point_keys[i] >> 32);
+        if (moved_count > 0) {
+            hash_grid_for_chunks(num_points, num_chunks, threads, [&](int, int begin, int end) {
+                for (int i = begin; i < end; ++i)
+                    grid->point_cells[i] = (int)(grid->point_keys[i] >> 32);
+            });
+        }
     } else {
-        for (int i = 0; i < num_points; ++i) {
-            grid->point_cells[i] = hash_grid_index(*grid, wp::index(*points, i));
-            grid->point_ids[i] = i;
+        auto key_func = [&](int i) { return hash_grid_index(*grid, wp::index(*points, i)); };
+
+        if (can_update && int(state->point_cells.size()) == num_points)
+            updated = hash_grid_update_incremental(
+                *grid, grid->point_cells, state->point_cells, state->moved, num_points, threads, key_func, moved_count
+            );
+
+        if (!updated) {
+            if (state)
+                state->point_keys.clear();
+            hash_grid_update_full(
+                *grid, grid->point_cells, state ? &state->point_cells : nullptr, num_points, num_cells, threads,
+                key_func
+            );
         }
+    }
 
-        radix_sort_pairs_host(grid->point_cells, grid->point_ids, num_points);
+    if (!updated) {
+        memset(grid->cell_starts, 0, sizeof(int) * num_cells);
+        memset(grid->cell_ends, 0, sizeof(int) * num_cells);
     }
 
-    const int num_cells = hash_grid_num_cells(*grid);
-    memset(grid->cell_starts, 0, sizeof(int) * num_cells);
-    memset(grid->cell_ends, 0, sizeof(int) * num_cells);
-
-    // compute cell start / end
-    for (int i = 0; i < num_points; ++i) {
-        // scan the particle-cell array to find the start and end
-        const int c = grid->point_cells[i];
-
-        if (i == 0)
-            grid->cell_starts[c] = 0;
-        else {
-            const int p = grid->point_cells[i - 1];
-
-            if (c != p) {
-                grid->cell_starts[c] = i;
-                grid->cell_ends[p] = i;
+    // compute cell start / end, unless no point changed cells
+    const int* point_cells = grid->point_cells;
+    if (moved_count > 0) {
+        hash_grid_for_chunks(num_points, num_chunks, threads, [&](int, int begin, int end) {
+            for (int i = begin; i < end; ++i) {
+                // scan the particle-cell array to find the start and end
+                const int c = point_cells[i];
+
+                if (i == 0)
+                    grid->cell_starts[c] = 0;
+                else {
+                    const int p = point_cells[i - 1];
+
+                    if (c != p) {
+                        grid->cell_starts[c] = i;
+                        grid->cell_ends[p] = i;
+                    }
+                }
+
+                if (i == num_points - 1) {
+                    grid->cell_ends[c] = i + 1;
+                }
             }
-        }
+        });
+    }
 
-        if (i == num_points - 1) {
-            grid->cell_ends[c] = i + 1;
+    if (stats) {
+        // count the runs of equal cells; only the runs crossing chunk boundaries look up the cell ranges
+        std::vector<int> chunk_occupied(num_chunks, 0);
+        std::vector<int> chunk_max(num_chunks, 0);
+        hash_grid_for_chunks(num_points, num_chunks, threads, [&](int c, int begin, int end) {
+            int run_begin = begin;
+            for (int i = begin; i < end; ++i) {
+                const int cell = point_cells[i];
+                if (i == 0 || point_cells[i - 1] != cell)
+                    ++chunk_occupied[c];
+
+                if (i + 1 == end || point_cells[i + 1] != cell) {
+                    const int count = (run_begin == begin || i + 1 == end)
+                        ? grid->cell_ends[cell] - grid->cell_starts[cell]
+                        : i + 1 - run_begin;
+                    chunk_max[c] = std::max(chunk_max[c], count);
+                    run_begin = i + 1;
+                }
+            }
+        });
+
+        stats->num_points = num_points;
+        stats->occupied_cells = 0;
+        stats->max_cell_points = 0;
+        for (int c = 0; c < num_chunks; ++c) {
+            stats->occupied_cells += chunk_occupied[c];
+            stats->max_cell_points = std::max(stats->max_cell_points, chunk_max[c]);
         }
+        stats->moved_points = moved_count;
+        stats->incremental = updated ? 1 : 0;
     }
 }
 
@@ -403,6 +734,8 @@ uint64_t wp_hash_grid_create_host(int type, int dim_x, int dim_y, int dim_z)
 
 void wp_hash_grid_destroy_host(uint64_t id, int type)
 {
+    hash_grid_release_incremental_state(id);
+
     switch (type) {
     case HASH_GRID_TYPE_FLOAT16:
         hash_grid_destroy_host_impl<half>(id);
@@ -418,15 +751,28 @@ void wp_hash_grid_destroy_host(uint64_t id, int type)
     }
 }
 
-void wp_hash_grid_update_host(uint64_t id, int type, double cell_width, const void* points, const void* groups)
+void wp_hash_grid_update_host(
+    uint64_t id,
+    int type,
+    double cell_width,
+    const void* points,
+    const void* groups,
+    int num_threads,
+    bool incremental,
+    void* stats
+)
 {
+    auto* build_stats = static_cast<hash_grid_build_stats_t*>(stats);
+
     switch (type) {
     case HASH_GRID_TYPE_FLOAT16: {
         const auto* points_desc = static_cast<const wp::array_t<wp::vec3h>*>(points);
         const auto* groups_desc = static_cast<const wp::array_t<int>*>(groups);
         if (hash_grid_record_update_host(wp_apic_get_recording_state(), id, type, cell_width, points_desc, groups_desc))
             break;
-        hash_grid_update_host_impl<half>(id, half(cell_width), points_desc, groups_desc);
+        hash_grid_update_host_impl<half>(
+            id, half(cell_width), points_desc, groups_desc, num_threads, incremental, build_stats
+        );
         break;
     }
     case HASH_GRID_TYPE_FLOAT32: {
@@ -434,7 +780,9 @@ void wp_hash_grid_update_host(uint64_t id, int type, double cell_width, const vo
         const auto* groups_desc = static_cast<const wp::array_t<int>*>(groups);
         if (hash_grid_record_update_host(wp_apic_get_recording_state(), id, type, cell_width, points_desc, groups_desc))
             break;
-        hash_grid_update_host_impl<float>(id, float(cell_width), points_desc, groups_desc);
+        hash_grid_update_host_impl<float>(
+            id, float(cell_width), points_desc, groups_desc, num_threads, incremental, build_stats
+        );
         break;
     }
     case HASH_GRID_TYPE_FLOAT64: {
@@ -442,7 +790,9 @@ void wp_hash_grid_update_host(uint64_t id, int type, double cell_width, const vo
         const auto* groups_desc = static_cast<const wp::array_t<int>*>(groups);
         if (hash_grid_record_update_host(wp_apic_get_recording_state(), id, type, cell_width, points_desc, groups_desc))
             break;
-        hash_grid_update_host_impl<double>(id, cell_width, points_desc, groups_desc);
+        hash_grid_update_host_impl<double>(
+            id, cell_width, points_desc, groups_desc, num_threads, incremental, build_stats
+        );
         break;
     }
     default:
@@ -452,6 +802,9 @@ void wp_hash_grid_update_host(uint64_t id, int type, double cell_width, const vo
 
 void wp_hash_grid_reserve_host(uint64_t id, int type, int num_points, bool with_groups)
 {
+    // reallocated point buffers lose the sorted order an incremental build starts from
+    hash_grid_release_incremental_state(id);
+
     switch (type) {
     case HASH_GRID_TYPE_FLOAT16:
         hash_grid_reserve_host_impl<half>(id, num_points, with_groups);
@@ -124,7 +124,8 @@ uint64_t wp_mesh_create_host(
     int support_winding_number,
     int constructor_type,
     int* groups,
-    int bvh_leaf_size
+    int bvh_leaf_size,
+    int num_threads
 )
 {
     Mesh* m
@@ -169,7 +170,9 @@ uint64_t wp_mesh_create_host(
     }
 #endif
     {
-        wp::bvh_create_host(m->lowers, m->uppers, num_tris, constructor_type, groups, bvh_leaf_size, m->bvh);
+        wp::bvh_create_host(
+            m->lowers, m->uppers, num_tris, constructor_type, groups, bvh_leaf_size, m->bvh, num_threads
+        );
     }
 
     if (!m->bvh.node_lowers && num_tris > 0) {
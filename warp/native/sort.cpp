@@ -9,9 +9,12 @@
 #include "error.h"
 #include "sort.h"
 #include "string.h"
+#include "thread_pool.h"
 
+#include <algorithm>
 #include <cassert>
 #include <cstdint>
+#include <vector>
 
 template <int Size> struct SortPayload {
     uint8_t data[Size];
@@ -256,6 +259,115 @@ void radix_sort_pairs_host(uint64_t* keys, int* values, int n, int begin_bit, in
     radix_sort_pairs_host(keys, values, n, n, begin_bit, end_bit, sizeof(int));
 }
 
+// minimum number of keys sorted by each chunk of a multithreaded host sort
+static constexpr int RADIX_SORT_PARALLEL_CHUNK_KEYS = 16384;
+// digit width of the multithreaded host sort, small enough for the per-chunk histograms to stay in cache
+static constexpr int RADIX_SORT_PARALLEL_DIGIT_BITS = 11;
+
+// LSD radix sort over contiguous chunks of the input: each pass counts the digits of every chunk in parallel,
+// then each chunk scatters its keys to the offsets reserved for it. Chunks keep their relative order within
+// each digit, so the sort is stable and gives the same result as the serial sort.
+template <typename KeyType, typename RadixKeyType, typename KeyToRadix>
+static void radix_sort_pairs_host_parallel_impl(
+    KeyType* keys, int* values, int n, int num_threads, int begin_bit, int end_bit, KeyToRadix key_to_radix
+)
+{
+    constexpr int keyWidth = sizeof(RadixKeyType) * 8;
+    constexpr int numBuckets = 1 << RADIX_SORT_PARALLEL_DIGIT_BITS;
+
+    if (begin_bit < 0 || end_bit <= begin_bit || end_bit > keyWidth) {
+        return;
+    }
+
+    const int threads = wp::resolve_num_threads(num_threads);
+    const int num_chunks = std::min(threads * 2, n / RADIX_SORT_PARALLEL_CHUNK_KEYS);
+    if (threads == 1 || num_chunks <= 1) {
+        radix_sort_pairs_host<KeyType, int, RadixKeyType>(keys, values, n, n, begin_bit, end_bit, key_to_radix);
+        return;
+    }
+
+    std::vector<int> offsets(size_t(num_chunks) * numBuckets);
+
+    KeyType* readKeys = keys;
+    int* readValues = values;
+    KeyType* writeKeys = keys + n;
+    int* writeValues = values + n;
+
+    for (int shift = begin_bit; shift < end_bit; shift += RADIX_SORT_PARALLEL_DIGIT_BITS) {
+        const int passBits = std::min(end_bit - shift, RADIX_SORT_PARALLEL_DIGIT_BITS);
+        const RadixKeyType mask = (RadixKeyType(1) << passBits) - 1;
+
+        wp::parallel_for(num_chunks, 1, threads, [&](size_t first, size_t last) {
+            for (size_t c = first; c < last; ++c) {
+                int* counts = offsets.data() + c * numBuckets;
+                memset(counts, 0, sizeof(int) * numBuckets);
+
+                const int begin = int(int64_t(n) * c / num_chunks);
+                const int end = int(int64_t(n) * (c + 1) / num_chunks);
+                for (int i = begin; i < end; ++i)
+                    ++counts[(key_to_radix(readKeys[i]) >> shift) & mask];
+            }
+        });
+
+        // exclusive scan over (digit, chunk) pairs; a pass where all keys share the same digit is skipped
+        bool single_digit = false;
+        int off = 0;
+        for (int b = 0; b < numBuckets; ++b) {
+            const int digit_begin = off;
+            for (int c = 0; c < num_chunks; ++c) {
+                int& count = offsets[size_t(c) * numBuckets + b];
+                const int newoff = off + count;
+                count = off;
+                off = newoff;
+            }
+            if (off - digit_begin == n) {
+                single_digit = true;
+                break;
+            }
+        }
+        if (single_digit)
+            continue;
+
+        wp::parallel_for(num_chunks, 1, threads, [&](size_t first, size_t last) {
+            for (size_t c = first; c < last; ++c) {
+                int* chunk_offsets = offsets.data() + c * numBuckets;
+
+                const int begin = int(int64_t(n) * c / num_chunks);
+                const int end = int(int64_t(n) * (c + 1) / num_chunks);
+                for (int i = begin; i < end; ++i) {
+                    const KeyType k = readKeys[i];
+                    const int offset = chunk_offsets[(key_to_radix(k) >> shift) & mask]++;
+
+                    writeKeys[offset] = k;
+                    writeValues[offset] = readValues[i];
+                }
+            }
+        });
+
+        std::swap(readKeys, writeKeys);
+        std::swap(readValues, writeValues);
+    }
+
+    if (readKeys != keys) {
+        memcpy(keys, readKeys, sizeof(KeyType) * n);
+        memcpy(values, readValues, sizeof(int) * n);
+    }
+}
+
+void radix_sort_pairs_host_parallel(uint32_t* keys, int* values, int n, int num_threads, int begin_bit, int end_bit)
+{
+    radix_sort_pairs_host_parallel_impl<uint32_t, uint32_t>(
+        keys, values, n, num_threads, begin_bit, end_bit, [](uint32_t key) { return key; }
+    );
+}
+
+void radix_sort_pairs_host_parallel(uint64_t* keys, int* values, int n, int num_threads, int begin_bit, int end_bit)
+{
+    radix_sort_pairs_host_parallel_impl<uint64_t, uint64_t>(
+        keys, values, n, num_threads, begin_bit, end_bit, [](uint64_t key) { return key; }
+    );
+}
+
 // http://stereopsis.com/radix.html
 inline unsigned int radix_float_to_int(float f)
 {
@@ -21,6 +21,14 @@ void radix_sort_pairs_host(float* keys, int* values, int n, int begin_bit = 0, i
 void radix_sort_pairs_host(int64_t* keys, int* values, int n, int begin_bit = 0, int end_bit = 64);
 void radix_sort_pairs_host(uint64_t* keys, int* values, int n, int begin_bit = 0, int end_bit = 64);
 void radix_sort_pairs_host(double* keys, int* values, int n, int begin_bit = 0, int end_bit = 64);
+// Multithreaded host sorts, stable and equivalent to radix_sort_pairs_host(). Keys and values need room for 2*n
+// elements, like the serial sorts. num_threads <= 0 selects all hardware threads.
+void radix_sort_pairs_host_parallel(
+    uint32_t* keys, int* values, int n, int num_threads, int begin_bit = 0, int end_bit = 32
+);
+void radix_sort_pairs_host_parallel(
+    uint64_t* keys, int* values, int n, int num_threads, int begin_bit = 0, int end_bit = 64
+);
 void radix_sort_pairs_device(void* context, int* keys, int* values, int n, int begin_bit = 0, int end_bit = 32);
 void radix_sort_pairs_device(void* context, uint32_t* keys, int* values, int n, int begin_bit = 0, int end_bit = 32);
 void radix_sort_pairs_device(void* context, float* keys, int* values, int n, int begin_bit = 0, int end_bit = 32);
@@ -0,0 +1,161 @@
+// SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+// SPDX-License-Identifier: Apache-2.0
+
+#include "thread_pool.h"
+
+#include <stdint.h>
+
+#include <algorithm>
+#include <atomic>
+#include <condition_variable>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+namespace wp {
+
+namespace {
+
+// Smallest chunk picked automatically, so that launching a handful of work
+// items does not pay for waking up the pool.
+constexpr size_t kMinAutoChunkSize = 32;
+
+// Number of chunks per thread targeted by the automatic chunk size.
+constexpr size_t kAutoChunksPerThread = 8;
+
+// Set on pool workers and on a calling thread while it takes part in a
+// parallel_for(), so nested calls fall back to serial execution.
+thread_local bool t_in_parallel_region = false;
+
+class ThreadPool {
+public:
+    void run(size_t count, size_t chunk_size, int num_helpers, const std::function<void(size_t, size_t)>& func)
+    {
+        // the pool executes one job at a time
+        std::lock_guard<std::mutex> job_lock(m_job_mutex);
+
+        ensure_workers(num_helpers);
+
+        {
+            std::lock_guard<std::mutex> lock(m_mutex);
+            m_func = &func;
+            m_count = count;
+            m_chunk_size = chunk_size;
+            m_next.store(0, std::memory_order_relaxed);
+            m_num_helpers = num_helpers;
+            m_remaining = num_helpers;
+            ++m_generation;
+        }
+        m_wake.notify_all();
+
+        // the calling thread processes chunks alongside the workers
+        t_in_parallel_region = true;
+        process_chunks();
+        t_in_parallel_region = false;
+
+        std::unique_lock<std::mutex> lock(m_mutex);
+        m_done.wait(lock, [this] { return m_remaining == 0; });
+        m_func = nullptr;
+    }
+
+private:
+    void ensure_workers(int count)
+    {
+        while (int(m_workers.size()) < count) {
+            int index = int(m_workers.size());
+            m_workers.emplace_back([this, index] { worker_main(index); });
+            // workers live for the rest of the process, see get_pool()
+            m_workers.back().detach();
+        }
+    }
+
+    void process_chunks()
+    {
+        const std::function<void(size_t, size_t)>& func = *m_func;
+        for (;;) {
+            size_t begin = m_next.fetch_add(m_chunk_size, std::memory_order_relaxed);
+            if (begin >= m_count)
+                break;
+            func(begin, std::min(begin + m_chunk_size, m_count));
+        }
+    }
+
+    void worker_main(int index)
+    {
+        t_in_parallel_region = true;
+
+        uint64_t seen_generation = 0;
+        std::unique_lock<std::mutex> lock(m_mutex);
+        for (;;) {
+            // only the first m_num_helpers workers take part in a job
+            m_wake.wait(lock, [&] { return m_generation != seen_generation && index < m_num_helpers; });
+            seen_generation = m_generation;
+
+            lock.unlock();
+            process_chunks();
+            lock.lock();
+
+            if (--m_remaining == 0)
+                m_done.notify_one();
+        }
+    }
+
+    std::mutex m_job_mutex;
+
+    std::mutex m_mutex;
+    std::condition_variable m_wake;
+    std::condition_variable m_done;
+
+    std::vector<std::thread> m_workers;
+
+    const std::function<void(size_t, size_t)>* m_func = nullptr;
+    size_t m_count = 0;
+    size_t m_chunk_size = 1;
+    std::atomic<size_t> m_next { 0 };
+    int m_num_helpers = 0;
+    int m_remaining = 0;
+    uint64_t m_generation = 0;
+};
+
+ThreadPool& get_pool()
+{
+    // Intentionally leaked: joining worker threads from a static destructor
+    // can deadlock while the library is being unloaded.
+    static ThreadPool* pool = new ThreadPool();
+    return *pool;
+}
+
+}  // anonymous namespace
+
+int hardware_concurrency()
+{
+    unsigned int n = std::thread::hardware_concurrency();
+    return n > 0 ? int(n) : 1;
+}
+
+int resolve_num_threads(int num_threads) { return num_threads > 0 ? num_threads : hardware_concurrency(); }
+
+void parallel_for(size_t count, size_t chunk_size, int num_threads, const std::function<void(size_t, size_t)>& func)
+{
+    if (count == 0)
+        return;
+
+    num_threads = resolve_num_threads(num_threads);
+
+    if (chunk_size == 0) {
+        size_t target_chunks = size_t(num_threads) * kAutoChunksPerThread;
+        chunk_size = std::max((count + target_chunks - 1) / target_chunks, kMinAutoChunkSize);
+    }
+
+    size_t num_chunks = (count + chunk_size - 1) / chunk_size;
+
+    if (num_threads <= 1 || num_chunks <= 1 || t_in_parallel_region) {
+        func(0, count);
+        return;
+    }
+
+    int num_helpers = int(std::min(size_t(num_threads), num_chunks)) - 1;
+    get_pool().run(count, chunk_size, num_helpers, func);
+}
+
+}  // namespace wp
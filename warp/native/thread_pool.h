@@ -0,0 +1,30 @@
+// SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+// SPDX-License-Identifier: Apache-2.0
+
+#pragma once
+
+#include <stddef.h>
+
+#include <functional>
+
+namespace wp {
+
+// Number of hardware threads available to the process (at least 1).
+int hardware_concurrency();
+
+// Resolve a requested thread count: values <= 0 select hardware_concurrency().
+int resolve_num_threads(int num_threads);
+
+// Run func(begin, end) over the index range [0, count) split into chunks of
+// chunk_size consecutive indices. Chunks are distributed dynamically over the
+// calling thread plus up to num_threads - 1 workers of a persistent pool, and
+// the call returns once every chunk has completed.
+//
+// A chunk_size of 0 selects a chunk size that gives each thread several
+// chunks for load balancing while keeping tiny ranges on the calling thread.
+// Nested calls (from inside func) and ranges that fit in a single chunk run
+// serially on the calling thread. Concurrent calls from different threads
+// are serialized.
+void parallel_for(size_t count, size_t chunk_size, int num_threads, const std::function<void(size_t, size_t)>& func);
+
+}  // namespace wp
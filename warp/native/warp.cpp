@@ -17,6 +17,7 @@
 #include "error.h"
 #include "exports.h"
 #include "scan.h"
+#include "thread_pool.h"
 #include "version.h"
 
 #include <stdlib.h>
@@ -285,6 +286,46 @@ void wp_cpu_launch_kernel(void* func, void* bounds, void* args, void* adj_args,
     }
 }
 
+// Multithreaded CPU kernel launch. func is a kernel's *_cpu_forward_range or
+// *_cpu_backward_range entry point (selected by adj_args != nullptr), which
+// executes the work items [begin, end) of the launch. The launch range is split
+// into chunks that run concurrently on the calling thread and the worker pool.
+void wp_cpu_launch_kernel_range(
+    void* func, void* bounds, void* args, void* adj_args, size_t size, int num_threads, size_t chunk_size
+)
+{
+    typedef void (*kernel_range_fn_forward)(void*, void*, size_t, size_t);
+    typedef void (*kernel_range_fn_backward)(void*, void*, void*, size_t, size_t);
+
+    if (!func)
+        return;
+
+    if (adj_args) {
+        wp::parallel_for(size, chunk_size, num_threads, [=](size_t begin, size_t end) {
+            ((kernel_range_fn_backward)func)(bounds, args, adj_args, begin, end);
+        });
+    } else {
+        wp::parallel_for(size, chunk_size, num_threads, [=](size_t begin, size_t end) {
+            ((kernel_range_fn_forward)func)(bounds, args, begin, end);
+        });
+    }
+}
+
+int wp_cpu_get_hardware_concurrency() { return wp::hardware_concurrency(); }
+
+void wp_cpu_launch_kernel_batch(const launch_command_t* commands, int count, int num_threads, size_t chunk_size)
+{
+    for (int i = 0; i < count; ++i) {
+        const launch_command_t& cmd = commands[i];
+        if (num_threads != 1 && cmd.kernel_range)
+            wp_cpu_launch_kernel_range(
+                cmd.kernel_range, cmd.bounds, cmd.args, cmd.adj_args, cmd.dim, num_threads, chunk_size
+            );
+        else
+            wp_cpu_launch_kernel(cmd.kernel, cmd.bounds, cmd.args, cmd.adj_args, nullptr);
+    }
+}
+
 bool wp_memcpy_h2h(void* dest, void* src, size_t n)
 {
     // During capture, record only — don't execute (matches CUDA graph semantics)
@@ -1257,6 +1298,11 @@ WP_API size_t wp_cuda_launch_kernel(
     return 0;
 }
 
+WP_API int wp_cuda_launch_kernel_batch(void* context, const launch_command_t* commands, int count, void* stream)
+{
+    return -1;
+}
+
 WP_API bool wp_cuda_get_suggested_block_size(
     void* context, void* kernel, int shared_memory_bytes, int* block_size_out, int* min_grid_size_out
 )
@@ -5663,6 +5663,23 @@ size_t wp_cuda_launch_kernel(
     return res;
 }
 
+int wp_cuda_launch_kernel_batch(void* context, const launch_command_t* commands, int count, void* stream)
+{
+    ContextGuard guard(context);
+
+    for (int i = 0; i < count; ++i) {
+        const launch_command_t& cmd = commands[i];
+        size_t res = wp_cuda_launch_kernel(
+            context, cmd.kernel, cmd.dim, cmd.max_blocks, cmd.block_dim, cmd.grid_stride, cmd.cluster_dim,
+            cmd.shared_memory_bytes, static_cast<void**>(cmd.args), stream, nullptr
+        );
+        if (res != CUDA_SUCCESS)
+            return i;
+    }
+
+    return -1;
+}
+
 bool wp_cuda_get_suggested_block_size(
     void* context, void* kernel, int shared_memory_bytes, int* block_size_out, int* min_grid_size_out
 )
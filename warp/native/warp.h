@@ -88,11 +88,13 @@ WP_API bool wp_memset_device(void* context, void* dest, int value, size_t n, voi
 WP_API void wp_memtile_host(void* dest, const void* src, size_t srcsize, size_t n);
 WP_API void wp_memtile_device(void* context, void* dest, const void* src, size_t srcsize, size_t n);
 
-WP_API uint64_t
-wp_bvh_create_host(wp::vec3* lowers, wp::vec3* uppers, int num_items, int constructor_type, int* groups, int leaf_size);
+// num_threads > 1 builds SAH and median BVHs with multiple threads (<= 0 uses all hardware threads)
+WP_API uint64_t wp_bvh_create_host(
+    wp::vec3* lowers, wp::vec3* uppers, int num_items, int constructor_type, int* groups, int leaf_size, int num_threads
+);
 WP_API void wp_bvh_destroy_host(uint64_t id);
 WP_API void wp_bvh_refit_host(uint64_t id);
-WP_API void wp_bvh_rebuild_host(uint64_t id, int constructor_type);
+WP_API void wp_bvh_rebuild_host(uint64_t id, int constructor_type, int num_threads);
 
 WP_API uint64_t wp_bvh_create_device(
     void* context, wp::vec3* lowers, wp::vec3* uppers, int num_items, int constructor_type, int* groups, int leaf_size
@@ -112,7 +114,8 @@ WP_API uint64_t wp_mesh_create_host(
     int support_winding_number,
     int constructor_type,
     int* groups,
-    int bvh_leaf_size
+    int bvh_leaf_size,
+    int num_threads
 );
 WP_API void wp_mesh_destroy_host(uint64_t id);
 WP_API void wp_mesh_refit_host(uint64_t id);
@@ -141,7 +144,17 @@ WP_API void wp_mesh_set_velocities_device(uint64_t id, wp::array_t<wp::vec3> vel
 // Hash grid (type: 0=float16, 1=float32, 2=float64)
 WP_API uint64_t wp_hash_grid_create_host(int type, int dim_x, int dim_y, int dim_z);
 WP_API void wp_hash_grid_destroy_host(uint64_t id, int type);
-WP_API void wp_hash_grid_update_host(uint64_t id, int type, double cell_width, const void* points, const void* groups);
+// stats: optional hash_grid_build_stats_t receiving the statistics of the build, see hashgrid.cpp
+WP_API void wp_hash_grid_update_host(
+    uint64_t id,
+    int type,
+    double cell_width,
+    const void* points,
+    const void* groups,
+    int num_threads,
+    bool incremental,
+    void* stats
+);
 WP_API void wp_hash_grid_reserve_host(uint64_t id, int type, int num_points, bool with_groups);
 
 WP_API uint64_t wp_hash_grid_create_device(void* context, int type, int dim_x, int dim_y, int dim_z);
@@ -880,6 +893,30 @@ WP_API bool wp_cuda_compile_solver(
 
 // CPU kernel launch with optional APIC recording
 WP_API void wp_cpu_launch_kernel(void* func, void* bounds, void* args, void* adj_args, const APICLaunchInfo* apic_info);
+// Multithreaded CPU kernel launch over a kernel's range entry point
+WP_API void wp_cpu_launch_kernel_range(
+    void* func, void* bounds, void* args, void* adj_args, size_t size, int num_threads, size_t chunk_size
+);
+WP_API int wp_cpu_get_hardware_concurrency();
+
+// A kernel launch submitted as part of a batch by wp_cpu_launch_kernel_batch() or
+// wp_cuda_launch_kernel_batch(). Mirrored by launch_command_t in warp/_src/context.py.
+struct launch_command_t {
+    void* kernel;  // CPU entry point or CUDA function
+    void* kernel_range;  // CPU range entry point for multithreaded launches, may be null
+    void* bounds;  // CPU launch bounds
+    void* args;  // CPU args struct, or array of CUDA parameter addresses
+    void* adj_args;  // CPU adjoint args struct, null for forward launches
+    size_t dim;  // total number of work items
+    int max_blocks;
+    int block_dim;
+    int grid_stride;
+    int cluster_dim;
+    int shared_memory_bytes;
+};
+
+// Execute a sequence of CPU kernel launches in order
+WP_API void wp_cpu_launch_kernel_batch(const launch_command_t* commands, int count, int num_threads, size_t chunk_size);
 
 WP_API void* wp_cuda_load_module(void* context, const char* ptx);
 WP_API void wp_cuda_unload_module(void* context, void* module);
@@ -897,6 +934,9 @@ WP_API size_t wp_cuda_launch_kernel(
     void* stream,
     const APICLaunchInfo* apic_info
 );
+// Launch a sequence of CUDA kernels in order on the same stream. Returns the index of
+// the first launch that failed, or -1 if all launches were issued.
+WP_API int wp_cuda_launch_kernel_batch(void* context, const launch_command_t* commands, int count, void* stream);
 WP_API int wp_cuda_get_max_shared_memory(void* context);
 WP_API bool wp_cuda_configure_kernel_shared_memory(void* kernel, int size);
 // Set CUDA Thread Block Cluster attributes on a loaded kernel function.
@@ -932,7 +972,11 @@ WP_API int wp_cuda_timing_get_result_count();
 WP_API void wp_cuda_timing_end(timing_result_t* results, int size);
 
 // graph coloring
-WP_API int wp_graph_coloring(int num_nodes, wp::array_t<int> edges, int algorithm, wp::array_t<int> node_colors);
+WP_API int
+wp_graph_coloring(int num_nodes, wp::array_t<int> edges, int algorithm, wp::array_t<int> node_colors, int num_threads);
+WP_API int wp_graph_coloring_repair(
+    int num_nodes, wp::array_t<int> edges, wp::array_t<int> changed_edges, wp::array_t<int> node_colors, int num_threads
+);
 WP_API float wp_balance_coloring(
     int num_nodes, wp::array_t<int> edges, int num_colors, float target_max_min_ratio, wp::array_t<int> node_colors
 );
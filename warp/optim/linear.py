@@ -10,12 +10,15 @@ residual (CR), and generalized minimal residual (GMRES) methods.
 
 # isort: skip_file
 
+from warp._src.optim.amg import AMG as AMG
 from warp._src.optim.linear import BiCGSTAB as BiCGSTAB
 from warp._src.optim.linear import CG as CG
 from warp._src.optim.linear import CR as CR
 from warp._src.optim.linear import GMRES as GMRES
 from warp._src.optim.linear import LinearOperator as LinearOperator
 from warp._src.optim.linear import LinearSolverState as LinearSolverState
+from warp._src.optim.refinement import MixedPrecisionRefinement as MixedPrecisionRefinement
+from warp._src.optim.cholesky import SparseCholesky as SparseCholesky
 from warp._src.optim.linear import aslinearoperator as aslinearoperator
 from warp._src.optim.linear import bicgstab as bicgstab
 from warp._src.optim.linear import cg as cg
@@ -24,11 +24,15 @@ See Also:
 
 # isort: skip_file
 
+from warp._src.sparse import bsr_axpy_plan as bsr_axpy_plan
 from warp._src.sparse import bsr_axpy_work_arrays as bsr_axpy_work_arrays
+from warp._src.sparse import bsr_mm_plan as bsr_mm_plan
 from warp._src.sparse import bsr_mm_work_arrays as bsr_mm_work_arrays
+from warp._src.sparse import bsr_transpose_plan as bsr_transpose_plan
 from warp._src.sparse import BSR_STATUS_ROW_CAPACITY_EXCEEDED as BSR_STATUS_ROW_CAPACITY_EXCEEDED
 from warp._src.sparse import BSR_STATUS_SUCCESS as BSR_STATUS_SUCCESS
 from warp._src.sparse import BsrMatrix as BsrMatrix
+from warp._src.sparse import BsrSellLayout as BsrSellLayout
 from warp._src.sparse import bsr_assign as bsr_assign
 from warp._src.sparse import bsr_axpy as bsr_axpy
 from warp._src.sparse import bsr_block_index as bsr_block_index
@@ -41,6 +45,9 @@ from warp._src.sparse import bsr_identity as bsr_identity
 from warp._src.sparse import bsr_matrix_t as bsr_matrix_t
 from warp._src.sparse import bsr_mm as bsr_mm
 from warp._src.sparse import bsr_mv as bsr_mv
+from warp._src.sparse import bsr_permute as bsr_permute
+from warp._src.sparse import bsr_permute_vector as bsr_permute_vector
+from warp._src.sparse import bsr_reordering as bsr_reordering
 from warp._src.sparse import bsr_row_index as bsr_row_index
 from warp._src.sparse import bsr_scale as bsr_scale
 from warp._src.sparse import bsr_set_diag as bsr_set_diag
@@ -212,25 +212,45 @@ def test_mempool_access_exceptions_cpu(test, _):
 
 
 @unittest.skipUnless(wp.is_cpu_available(), "Requires a CPU device")
-def test_mempool_cpu_unsupported(test, _):
-    """CPU does not expose a CUDA-style memory pool: support/enabled are ``False`` and the pool
-    query/toggle APIs raise ``ValueError`` (the public mempool API is CUDA-only)."""
+def test_mempool_cpu(test, _):
+    """CPU has a caching memory pool, disabled by default, queried and configured through the
+    same API as CUDA pools. Disabling it returns its cached blocks to the system."""
     device = wp.get_device("cpu")
+    pool = device.mempool_allocator
 
-    test.assertFalse(wp.is_mempool_supported(device))
-    test.assertFalse(device.is_mempool_supported)
+    test.assertTrue(wp.is_mempool_supported(device))
+    test.assertTrue(device.is_mempool_supported)
     test.assertFalse(wp.is_mempool_enabled(device))
 
-    with test.assertRaises(ValueError):
+    saved_threshold = wp.get_mempool_release_threshold(device)
+    try:
         wp.set_mempool_enabled(device, True)
-    with test.assertRaises(ValueError):
-        wp.set_mempool_release_threshold(device, 42000)
-    with test.assertRaises(ValueError):
-        wp.get_mempool_release_threshold(device)
-    with test.assertRaises(ValueError):
-        wp.get_mempool_used_mem_current(device)
-    with test.assertRaises(ValueError):
-        wp.get_mempool_used_mem_high(device)
+        test.assertTrue(wp.is_mempool_enabled(device))
+
+        wp.set_mempool_release_threshold(device, 1 << 20)
+        test.assertEqual(wp.get_mempool_release_threshold(device), 1 << 20)
+
+        used_before = wp.get_mempool_used_mem_current(device)
+        a = wp.zeros(1000, dtype=float, device=device)
+        test.assertGreaterEqual(wp.get_mempool_used_mem_current(device), used_before + a.capacity)
+        test.assertGreaterEqual(wp.get_mempool_used_mem_high(device), wp.get_mempool_used_mem_current(device))
+
+        # freed blocks are cached for reuse
+        ptr = a.ptr
+        del a
+        test.assertEqual(wp.get_mempool_used_mem_current(device), used_before)
+        test.assertGreater(pool.reserved_mem_current, pool.used_mem_current)
+        b = wp.zeros(1000, dtype=float, device=device)
+        test.assertEqual(b.ptr, ptr)
+
+        # disabling the pool releases the cached blocks, and blocks freed afterwards are not cached
+        wp.set_mempool_enabled(device, False)
+        test.assertEqual(pool.reserved_mem_current, pool.used_mem_current)
+        del b
+        test.assertEqual(pool.reserved_mem_current, pool.used_mem_current)
+    finally:
+        wp.set_mempool_enabled(device, False)
+        wp.set_mempool_release_threshold(device, saved_threshold)
 
 
 @unittest.skipUnless(wp.is_cpu_available(), "Requires a CPU device")
@@ -257,8 +277,8 @@ class TestMempool(unittest.TestCase):
     pass
 
 
-# CUDA-only mempool semantics (threshold/usage/self-access). CPU has no memory pool, so it is
-# excluded here and covered by test_mempool_exceptions / test_mempool_cpu_unsupported instead.
+# CUDA mempool semantics (threshold/usage/self-access). The CPU pool caches host blocks instead
+# of using CUDA memory pools, so it is excluded here and covered by test_mempool_cpu instead.
 cuda_devices_with_mempools = get_cuda_test_devices_with_mempool()
 devices_without_mempools = [d for d in get_test_devices() if not d.is_mempool_supported]
 
@@ -271,8 +291,8 @@ add_function_test(
 )
 add_function_test(TestMempool, "test_mempool_access_self", test_mempool_access_self, devices=cuda_devices_with_mempools)
 
-# CPU has no CUDA-style mempool; it uses a separate graph-capture allocation capability.
-add_function_test(TestMempool, "test_mempool_cpu_unsupported", test_mempool_cpu_unsupported)
+# CPU has its own caching pool, and a separate graph-capture allocation capability.
+add_function_test(TestMempool, "test_mempool_cpu", test_mempool_cpu)
 add_function_test(TestMempool, "test_graph_capture_allocation_capability", test_graph_capture_allocation_capability)
 
 # test devices without mempool support
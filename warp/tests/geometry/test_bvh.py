@@ -294,6 +294,69 @@ def compute_num_contact_with_checksums(
     check_sums[tid] = check_sum
 
 
+@wp.kernel
+def bvh_query_aabb_order(
+    bvh_id: wp.uint64,
+    lowers: wp.array[wp.vec3],
+    uppers: wp.array[wp.vec3],
+    hits: wp.array2d[int],
+):
+    tid = wp.tid()
+
+    query = wp.bvh_query_aabb(bvh_id, lowers[tid], uppers[tid])
+    count = int(0)
+    index = int(0)
+    while wp.bvh_query_next(query, index):
+        if count < hits.shape[1]:
+            hits[tid, count] = index
+        count += 1
+
+
+def test_bvh_build_threads(test, device):
+    # multithreaded CPU builds must produce the same tree as serial builds, which
+    # shows up as the same traversal order for every query
+    rng = np.random.default_rng(42)
+    lowers_np, uppers_np = get_random_aabbs(20000, np.zeros(3), 10.0, 0.2, rng)
+    query_lowers_np, query_uppers_np = get_random_aabbs(256, np.zeros(3), 10.0, 1.0, rng)
+
+    lowers = wp.array(lowers_np, dtype=wp.vec3, device=device)
+    uppers = wp.array(uppers_np, dtype=wp.vec3, device=device)
+    query_lowers = wp.array(query_lowers_np, dtype=wp.vec3, device=device)
+    query_uppers = wp.array(query_uppers_np, dtype=wp.vec3, device=device)
+
+    def traversal_order(bvh):
+        hits = wp.full((256, 64), -1, dtype=int, device=device)
+        wp.launch(bvh_query_aabb_order, dim=256, inputs=[bvh.id, query_lowers, query_uppers, hits], device=device)
+        return hits.numpy()
+
+    saved_num_threads = wp.config.cpu_num_threads
+    try:
+        for constructor in ("sah", "median"):
+            wp.config.cpu_num_threads = 1
+            serial_bvh = wp.Bvh(lowers, uppers, constructor=constructor)
+            expected = traversal_order(serial_bvh)
+            test.assertGreater(np.count_nonzero(expected >= 0), 0)
+
+            for num_threads in (2, 4, 0):
+                wp.config.cpu_num_threads = num_threads
+                bvh = wp.Bvh(lowers, uppers, constructor=constructor)
+                assert_np_equal(traversal_order(bvh), expected)
+
+                # rebuild after moving the boxes, and compare against a serial rebuild
+                lowers.assign(lowers_np[::-1].copy())
+                uppers.assign(uppers_np[::-1].copy())
+                bvh.rebuild(constructor)
+                wp.config.cpu_num_threads = 1
+                serial_bvh.rebuild(constructor)
+                assert_np_equal(traversal_order(bvh), traversal_order(serial_bvh))
+
+                lowers.assign(lowers_np)
+                uppers.assign(uppers_np)
+                serial_bvh.rebuild(constructor)
+    finally:
+        wp.config.cpu_num_threads = saved_num_threads
+
+
 def test_capture_bvh_rebuild(test, device):
     with wp.ScopedDevice(device):
         rng = np.random.default_rng(123)
@@ -844,6 +907,7 @@ add_function_test(
     test_bvh_ray_query_inside_and_outside_bounds,
     devices=devices,
 )
+add_function_test(TestBvh, "test_bvh_build_threads", test_bvh_build_threads, devices=["cpu"])
 add_function_test(TestBvh, "test_bvh_refit_root_leaves", test_bvh_refit_root_leaves, devices=cuda_devices)
 add_function_test(TestBvh, "test_tile_bvh_query_aabb", test_tile_bvh_query, devices=cuda_devices)
 add_function_test(TestBvh, "test_tile_bvh_query_ray", test_tile_bvh_query_ray, devices=cuda_devices)
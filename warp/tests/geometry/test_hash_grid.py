@@ -969,6 +969,145 @@ def test_hashgrid_negative_wrapping(test, device):
     test.assertEqual(counts_np[1], 2)  # B finds self + A
 
 
+@wp.kernel
+def hashgrid_sorted_point_ids(grid: wp.uint64, ids: wp.array[int]):
+    tid = wp.tid()
+    ids[tid] = wp.hash_grid_point_id(grid, tid)
+
+
+def hashgrid_build_result(grid, points, radius, groups=None):
+    """Sorted point order and neighbor counts of a built grid."""
+    device = points.device
+    num_points = points.shape[0]
+
+    ids = wp.empty(num_points, dtype=int, device=device)
+    wp.launch(hashgrid_sorted_point_ids, dim=num_points, inputs=[grid.id, ids], device=device)
+
+    counts = wp.zeros(num_points, dtype=int, device=device)
+    if groups is None:
+        wp.launch(count_neighbors_f32, dim=num_points, inputs=[grid.id, radius, points, counts], device=device)
+    else:
+        wp.launch(
+            count_neighbors_grouped, dim=num_points, inputs=[grid.id, radius, points, groups, counts], device=device
+        )
+
+    return ids.numpy(), counts.numpy()
+
+
+def test_hashgrid_incremental_build(test, device):
+    rng = np.random.default_rng(123)
+    num_points = 50000
+    radius = 0.25
+
+    positions = rng.random((num_points, 3), dtype=np.float32) * 10.0
+    groups_np = rng.integers(0, 3, size=num_points, dtype=np.int32)
+
+    saved_num_threads = wp.config.cpu_num_threads
+    try:
+        for num_threads in (1, 4):
+            wp.config.cpu_num_threads = num_threads
+            for groups in (None, wp.array(groups_np, dtype=int, device=device)):
+                grid = wp.HashGrid(32, 32, 32, device)
+                points = wp.array(positions, dtype=wp.vec3, device=device)
+
+                # the first incremental build has no previous build to start from
+                grid.build(points, radius, groups, incremental=True)
+                test.assertFalse(grid.build_stats.incremental)
+                test.assertEqual(grid.build_stats.moved_points, num_points)
+
+                moved = positions.copy()
+                for _ in range(3):
+                    moved += rng.normal(scale=0.005, size=moved.shape).astype(np.float32)
+                    points = wp.array(moved, dtype=wp.vec3, device=device)
+
+                    grid.build(points, radius, groups, incremental=True)
+                    stats = grid.build_stats
+                    test.assertTrue(stats.incremental)
+                    test.assertGreater(stats.moved_points, 0)
+                    test.assertLess(stats.moved_points, num_points // 8)
+
+                    reference = wp.HashGrid(32, 32, 32, device)
+                    reference.build(points, radius, groups)
+                    test.assertEqual(stats.occupied_cells, reference.build_stats.occupied_cells)
+                    test.assertEqual(stats.max_cell_points, reference.build_stats.max_cell_points)
+
+                    ids, counts = hashgrid_build_result(grid, points, radius, groups)
+                    reference_ids, reference_counts = hashgrid_build_result(reference, points, radius, groups)
+                    assert_np_equal(ids, reference_ids)
+                    assert_np_equal(counts, reference_counts)
+
+                # rebuilding unchanged points moves nothing
+                grid.build(points, radius, groups, incremental=True)
+                test.assertTrue(grid.build_stats.incremental)
+                test.assertEqual(grid.build_stats.moved_points, 0)
+                assert_np_equal(hashgrid_build_result(grid, points, radius, groups)[0], ids)
+
+                # too many moved points fall back to a full build
+                points = wp.array(rng.random((num_points, 3), dtype=np.float32) * 10.0, dtype=wp.vec3, device=device)
+                grid.build(points, radius, groups, incremental=True)
+                test.assertFalse(grid.build_stats.incremental)
+                reference.build(points, radius, groups)
+                assert_np_equal(
+                    hashgrid_build_result(grid, points, radius, groups)[1],
+                    hashgrid_build_result(reference, points, radius, groups)[1],
+                )
+
+                # a different radius or number of points requires a full build
+                grid.build(points, radius * 2.0, groups, incremental=True)
+                test.assertFalse(grid.build_stats.incremental)
+                grid.build(points[: num_points // 2], radius * 2.0, None, incremental=True)
+                test.assertFalse(grid.build_stats.incremental)
+
+                # a non-incremental build discards the state of the previous incremental ones
+                grid.build(points, radius)
+                grid.build(points, radius, incremental=True)
+                test.assertFalse(grid.build_stats.incremental)
+    finally:
+        wp.config.cpu_num_threads = saved_num_threads
+
+
+def test_hashgrid_build_stats(test, device):
+    points = wp.array(
+        [[0.1, 0.1, 0.1], [0.2, 0.3, 0.4], [0.9, 0.5, 0.5], [1.5, 0.5, 0.5], [3.5, 3.5, 3.5]],
+        dtype=wp.vec3,
+        device=device,
+    )
+
+    grid = wp.HashGrid(8, 8, 8, device)
+    test.assertIsNone(grid.build_stats)
+
+    grid.build(points, 1.0)
+    if device.is_cpu:
+        test.assertEqual(grid.build_stats, wp.HashGrid.BuildStats(5, 3, 3, 5, False))
+    else:
+        test.assertIsNone(grid.build_stats)
+
+
+def test_hashgrid_build_num_threads(test, device):
+    rng = np.random.default_rng(7)
+    num_points = 100000
+    radius = 0.2
+    points = wp.array(rng.random((num_points, 3), dtype=np.float32) * 8.0, dtype=wp.vec3, device=device)
+    groups = wp.array(rng.integers(-5, 5, size=num_points, dtype=np.int32), dtype=int, device=device)
+
+    saved_num_threads = wp.config.cpu_num_threads
+    try:
+        for group_arg in (None, groups):
+            results = []
+            for num_threads in (1, 3, 8):
+                wp.config.cpu_num_threads = num_threads
+                grid = wp.HashGrid(64, 64, 64, device)
+                grid.build(points, radius, group_arg)
+                results.append((grid.build_stats, hashgrid_build_result(grid, points, radius, group_arg)))
+
+            for stats, (ids, counts) in results[1:]:
+                test.assertEqual(stats, results[0][0])
+                assert_np_equal(ids, results[0][1][0])
+                assert_np_equal(counts, results[0][1][1])
+    finally:
+        wp.config.cpu_num_threads = saved_num_threads
+
+
 devices = get_test_devices()
 cuda_devices = get_cuda_test_devices()
 
@@ -1252,6 +1391,19 @@ add_function_test(TestHashGrid, "test_hashgrid_cell_count_overflow", test_hashgr
 add_function_test(TestHashGrid, "test_hashgrid_dtype_validation", test_hashgrid_dtype_validation, devices=devices)
 add_function_test(TestHashGrid, "test_hashgrid_edge_cases", test_hashgrid_edge_cases, devices=devices)
 add_function_test(TestHashGrid, "test_hashgrid_negative_wrapping", test_hashgrid_negative_wrapping, devices=devices)
+add_function_test(
+    TestHashGrid,
+    "test_hashgrid_incremental_build",
+    test_hashgrid_incremental_build,
+    devices=[d for d in devices if d.is_cpu],
+)
+add_function_test(TestHashGrid, "test_hashgrid_build_stats", test_hashgrid_build_stats, devices=devices)
+add_function_test(
+    TestHashGrid,
+    "test_hashgrid_build_num_threads",
+    test_hashgrid_build_num_threads,
+    devices=[d for d in devices if d.is_cpu],
+)
 
 
 if __name__ == "__main__":
@@ -972,6 +972,81 @@ def test_set_mesh_points(test, device):
             test.assertTrue(((query_results_min_dist1.numpy() - query_results_min_dist2.numpy()) < 1e-5).all())
 
 
+def uv_sphere(num_rings, num_segments):
+    """Closed triangulated unit sphere."""
+    theta = np.linspace(0.0, np.pi, num_rings + 1)[1:-1]
+    phi = np.linspace(0.0, 2.0 * np.pi, num_segments, endpoint=False)
+    theta, phi = np.meshgrid(theta, phi, indexing="ij")
+    points = np.stack([np.sin(theta) * np.cos(phi), np.sin(theta) * np.sin(phi), np.cos(theta)], axis=-1)
+    points = np.concatenate([[[0.0, 0.0, 1.0]], points.reshape(-1, 3), [[0.0, 0.0, -1.0]]])
+
+    def ring(i, j):
+        return 1 + i * num_segments + j % num_segments
+
+    south = len(points) - 1
+    indices = []
+    for j in range(num_segments):
+        indices += [0, ring(0, j), ring(0, j + 1)]
+        indices += [south, ring(num_rings - 2, j + 1), ring(num_rings - 2, j)]
+        for i in range(num_rings - 2):
+            indices += [ring(i, j), ring(i + 1, j), ring(i + 1, j + 1)]
+            indices += [ring(i, j), ring(i + 1, j + 1), ring(i, j + 1)]
+
+    return points.astype(np.float32), np.array(indices, dtype=np.int32)
+
+
+def test_mesh_query_points_batched(test, device):
+    sphere_points, sphere_indices = uv_sphere(24, 32)
+    mesh = wp.Mesh(
+        points=wp.array(sphere_points, dtype=wp.vec3, device=device),
+        indices=wp.array(sphere_indices, dtype=int, device=device),
+        support_winding_number=True,
+    )
+
+    # enough queries to be reordered, inside and outside the sphere
+    rng = np.random.default_rng(42)
+    query_count = 5000
+    query_points = wp.array(rng.uniform(-1.5, 1.5, size=(query_count, 3)), dtype=wp.vec3, device=device)
+
+    faces = wp.empty(query_count, dtype=int, device=device)
+    signs = wp.empty(query_count, dtype=float, device=device)
+    dist = wp.empty(query_count, dtype=float, device=device)
+    wp.launch(sample_mesh_query_no_sign, dim=query_count, inputs=[mesh.id, query_points, faces, dist], device=device)
+
+    for reorder in (True, False):
+        hits = mesh.query_points(query_points, max_dist=10012.0, reorder=reorder)
+        test.assertIsNone(hits.sign)
+        test.assertTrue(np.all(hits.hit.numpy()))
+        assert_np_equal(hits.face.numpy(), faces.numpy())
+        assert_np_equal(hits.distance.numpy(), dist.numpy(), tol=1.0e-5)
+        assert_np_equal(np.linalg.norm(hits.point.numpy() - query_points.numpy(), axis=1), dist.numpy(), tol=1.0e-5)
+
+    sign_kernels = {
+        "parity": sample_mesh_query_sign_parity,
+        "normal": sample_mesh_query_sign_normal,
+        "winding_number": sample_mesh_query_sign_winding_number,
+    }
+    for sign_method, kernel in sign_kernels.items():
+        wp.launch(kernel, dim=query_count, inputs=[mesh.id, query_points, faces, signs, dist], device=device)
+        hits = mesh.query_points(query_points, max_dist=10012.0, sign_method=sign_method)
+        assert_np_equal(hits.face.numpy(), faces.numpy())
+        assert_np_equal(hits.sign.numpy(), np.where(signs.numpy() < 0.0, -1.0, 1.0).astype(np.float32))
+
+    # points farther than max_dist are reported as misses
+    hits = mesh.query_points(query_points, max_dist=0.1)
+    missed = dist.numpy() >= 0.1
+    test.assertTrue(np.any(missed))
+    assert_np_equal(hits.hit.numpy(), ~missed)
+    assert_np_equal(hits.face.numpy()[missed], np.full(np.count_nonzero(missed), -1, dtype=np.int32))
+
+    test.assertEqual(mesh.query_points(wp.empty(0, dtype=wp.vec3, device=device)).face.shape, (0,))
+
+    with test.assertRaisesRegex(ValueError, "sign method"):
+        mesh.query_points(query_points, sign_method="unknown")
+    with test.assertRaisesRegex(TypeError, "wp.vec3"):
+        mesh.query_points(wp.empty(4, dtype=wp.vec2, device=device))
+
+
 devices = get_test_devices()
 
 
@@ -1003,6 +1078,7 @@ add_function_test(TestMeshQueryPoint, "test_mesh_query_point", test_mesh_query_p
 add_function_test(TestMeshQueryPoint, "test_mesh_query_furthest_point", test_mesh_query_furthest_point, devices=devices)
 add_function_test(TestMeshQueryPoint, "test_adj_mesh_query_point", test_adj_mesh_query_point, devices=devices)
 add_function_test(TestMeshQueryPoint, "test_set_mesh_points", test_set_mesh_points, devices=devices)
+add_function_test(TestMeshQueryPoint, "test_mesh_query_points_batched", test_mesh_query_points_batched, devices=devices)
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
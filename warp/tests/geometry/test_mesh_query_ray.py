@@ -842,6 +842,82 @@ def test_mesh_query_ray_parallel_slab_boundaries(test, device):
             test.assertEqual(anyhit_np[i], 1, f"[{constructor}] {label}: expected any-hit query to hit")
 
 
+@wp.kernel
+def mesh_query_ray_all_results(
+    mesh: wp.uint64,
+    ray_starts: wp.array[wp.vec3],
+    ray_directions: wp.array[wp.vec3],
+    max_t: float,
+    hits: wp.array[wp.bool],
+    ts: wp.array[float],
+    faces: wp.array[int],
+    us: wp.array[float],
+    vs: wp.array[float],
+    normals: wp.array[wp.vec3],
+):
+    tid = wp.tid()
+
+    query = wp.mesh_query_ray(mesh, ray_starts[tid], ray_directions[tid], max_t)
+    hits[tid] = query.result
+    faces[tid] = -1
+    if query.result:
+        ts[tid] = query.t
+        faces[tid] = query.face
+        us[tid] = query.u
+        vs[tid] = query.v
+        normals[tid] = query.normal
+
+
+def test_mesh_query_rays_batched(test, device):
+    rng = np.random.default_rng(123)
+
+    # random triangle soup in the unit cube
+    num_tris = 2000
+    centers = rng.uniform(0.0, 1.0, size=(num_tris, 1, 3))
+    points = (centers + rng.uniform(-0.05, 0.05, size=(num_tris, 3, 3))).reshape(-1, 3)
+    mesh = wp.Mesh(
+        points=wp.array(points, dtype=wp.vec3, device=device),
+        indices=wp.array(np.arange(3 * num_tris), dtype=int, device=device),
+    )
+
+    # rays from a few sensors towards random targets, enough to be reordered
+    ray_count = 6000
+    sensors = rng.uniform(-1.0, 2.0, size=(4, 3))
+    starts_np = sensors[rng.integers(0, len(sensors), size=ray_count)]
+    directions_np = rng.uniform(0.0, 1.0, size=(ray_count, 3)) - starts_np
+    directions_np /= np.linalg.norm(directions_np, axis=1, keepdims=True)
+    starts = wp.array(starts_np, dtype=wp.vec3, device=device)
+    directions = wp.array(directions_np, dtype=wp.vec3, device=device)
+    max_t = 2.5
+
+    expected = wp.Mesh.RayHits(
+        hit=wp.empty(ray_count, dtype=wp.bool, device=device),
+        t=wp.zeros(ray_count, dtype=float, device=device),
+        face=wp.empty(ray_count, dtype=int, device=device),
+        u=wp.zeros(ray_count, dtype=float, device=device),
+        v=wp.zeros(ray_count, dtype=float, device=device),
+        normal=wp.zeros(ray_count, dtype=wp.vec3, device=device),
+    )
+    wp.launch(
+        mesh_query_ray_all_results,
+        dim=ray_count,
+        inputs=[mesh.id, starts, directions, max_t],
+        outputs=list(expected),
+        device=device,
+    )
+    test.assertTrue(0 < np.count_nonzero(expected.hit.numpy()) < ray_count)
+
+    for reorder in (True, False):
+        hits = mesh.query_rays(starts, directions, max_t=max_t, reorder=reorder)
+        for name in wp.Mesh.RayHits._fields:
+            assert_np_equal(getattr(hits, name).numpy(), getattr(expected, name).numpy())
+
+    test.assertEqual(mesh.query_rays(starts[:0], directions[:0]).t.shape, (0,))
+
+    with test.assertRaisesRegex(RuntimeError, "same length"):
+        mesh.query_rays(starts, directions[:10])
+
+
 devices = get_test_devices()
 
 
@@ -876,6 +952,7 @@ add_function_test(
     devices=devices,
 )
 add_function_test(TestMeshQueryRay, "test_mesh_query_ray_and_groups", test_mesh_query_ray_and_groups, devices=devices)
+add_function_test(TestMeshQueryRay, "test_mesh_query_rays_batched", test_mesh_query_rays_batched, devices=devices)
 
 
 if __name__ == "__main__":
@@ -197,6 +197,102 @@ def test_adam_set_params_migrates_state(test, device):
     test.assertIs(opt.v[1], unmoved_v)
 
 
+def test_adam_multi_tensor(test, device):
+    """Verify the fused multi-tensor step matches the per-array step for mixed parameter dtypes."""
+    rng = np.random.default_rng(42)
+    with wp.ScopedDevice(device):
+        shapes_dtypes = [(5, wp.float32), (0, wp.float32), (33, wp.vec3), (130, wp.float32), (7, wp.float16)]
+
+        params = []
+        grads = []
+        for n, dtype in shapes_dtypes:
+            shape = (n, 3) if dtype == wp.vec3 else (n,)
+            params.append(wp.array(rng.standard_normal(shape), dtype=dtype))
+            grads.append(wp.array(rng.standard_normal(shape), dtype=dtype))
+        fused_params = [wp.clone(p) for p in params]
+
+        opt = warp.optim.Adam(params, lr=0.01)
+        fused_opt = warp.optim.Adam(fused_params, lr=0.01, multi_tensor=True)
+        test.assertEqual(len(fused_opt.m), len(params))
+        test.assertEqual(fused_opt.v[2].dtype, wp.vec3)
+        test.assertEqual(fused_opt.m[4].dtype, wp.float32)
+
+        for _ in range(4):
+            opt.step(grads)
+            fused_opt.step(grads)
+
+        test.assertEqual(fused_opt.step_count.numpy()[0], 4)
+        for p, fused_p, m, fused_m in zip(params, fused_params, opt.m, fused_opt.m, strict=True):
+            tol = 1e-3 if p.dtype == wp.float16 else 1e-6
+            assert_np_equal(fused_p.numpy().astype(np.float32), p.numpy().astype(np.float32), tol=tol)
+            assert_np_equal(fused_m.numpy(), m.numpy(), tol=1e-6)
+
+        # the state is kept on the device, so resetting restarts the bias correction
+        fused_opt.reset_internal_state()
+        test.assertEqual(fused_opt.step_count.numpy()[0], 0)
+        test.assertEqual(np.abs(fused_opt.m[3].numpy()).max(), 0.0)
+
+
+def test_adam_multi_tensor_grad_clipping(test, device):
+    """Verify gradients are scaled to the global norm limit, including for bf16 parameters."""
+    # bfloat16 requires arch >= 80
+    dtypes = [wp.float32, wp.float16]
+    if not device.is_cuda or device.arch >= 80:
+        dtypes.append(wp.bfloat16)
+    with wp.ScopedDevice(device):
+        for dtype in dtypes:
+            params = [wp.zeros(3, dtype=dtype), wp.zeros(4, dtype=dtype)]
+            grads = [wp.full(3, 2.0, dtype=dtype), wp.full(4, 2.0, dtype=dtype)]
+            opt = warp.optim.Adam(params, lr=0.1, multi_tensor=True, max_grad_norm=1.0)
+            opt.step(grads)
+
+            # the first moment holds (1 - beta1) times the clipped gradient
+            clip = 1.0 / (2.0 * np.sqrt(7.0))
+            assert_np_equal(opt.m[0].numpy(), np.full(3, 0.1 * 2.0 * clip), tol=1e-5)
+            assert_np_equal(opt.m[1].numpy(), np.full(4, 0.1 * 2.0 * clip), tol=1e-5)
+
+            # the clipping norm can be changed between steps
+            opt.reset_internal_state()
+            opt.max_grad_norm = None
+            opt.step(grads)
+            assert_np_equal(opt.m[0].numpy(), np.full(3, 0.1 * 2.0), tol=1e-5)
+
+        with test.assertRaisesRegex(ValueError, "multi_tensor=True"):
+            warp.optim.Adam([params[0]], max_grad_norm=1.0)
+
+        opt = warp.optim.Adam([wp.zeros(3, dtype=float)])
+        opt.max_grad_norm = 1.0
+        with test.assertRaisesRegex(ValueError, "multi_tensor=True"):
+            opt.step([wp.ones(3, dtype=float)])
+
+
+def test_adam_multi_tensor_capture(test, device):
+    """Verify the device step counter advances when a captured multi-tensor step is replayed."""
+    rng = np.random.default_rng(7)
+    with wp.ScopedDevice(device):
+        params = [wp.array(rng.standard_normal(n), dtype=float) for n in (16, 3)]
+        grads = [wp.array(rng.standard_normal(n), dtype=float) for n in (16, 3)]
+        expected_params = [wp.clone(p) for p in params]
+
+        opt = warp.optim.Adam(params, lr=0.05, multi_tensor=True, max_grad_norm=0.5)
+        expected_opt = warp.optim.Adam(expected_params, lr=0.05, multi_tensor=True, max_grad_norm=0.5)
+
+        # the first step loads the modules and uploads the gradient pointers
+        opt.step(grads)
+        expected_opt.step(grads)
+
+        with wp.ScopedCapture(apic=device.is_cpu) as capture:
+            opt.step(grads)
+
+        for _ in range(3):
+            wp.capture_launch(capture.graph)
+            expected_opt.step(grads)
+
+        test.assertEqual(opt.step_count.numpy()[0], 4)
+        for p, expected_p in zip(params, expected_params, strict=True):
+            assert_np_equal(p.numpy(), expected_p.numpy(), tol=1e-6)
+
+
 devices = get_test_devices()
 
 
@@ -217,6 +313,17 @@ add_function_test(
     devices=get_cuda_test_devices(),
 )
 
+add_function_test(TestAdam, "test_adam_multi_tensor", test_adam_multi_tensor, devices=devices)
+add_function_test(
+    TestAdam, "test_adam_multi_tensor_grad_clipping", test_adam_multi_tensor_grad_clipping, devices=devices
+)
+add_function_test(
+    TestAdam,
+    "test_adam_multi_tensor_capture",
+    test_adam_multi_tensor_capture,
+    devices=get_test_devices_with_graph_capture_allocation(),
+)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -296,11 +296,21 @@ class TestCustomAllocator(unittest.TestCase):
             wp.set_device_allocator(dev0, None)
             wp.set_device_allocator(dev1, None)
 
-    @unittest.skipUnless(wp.is_cuda_available(), "CUDA not available")
-    def test_set_device_allocator_cpu_raises(self):
-        """set_device_allocator() raises for CPU devices."""
-        with self.assertRaises(RuntimeError):
-            wp.set_device_allocator("cpu", CountingAllocator(wp.get_device("cuda:0")))
+    def test_set_device_allocator_cpu(self):
+        """set_device_allocator() routes CPU allocations, except pinned ones, through the custom allocator."""
+        cpu = wp.get_device("cpu")
+        alloc = CountingAllocator(cpu)
+        wp.set_device_allocator(cpu, alloc)
+        try:
+            self.assertIs(wp.get_device_allocator(cpu), alloc)
+            a = wp.zeros(100, dtype=wp.float32, device=cpu)
+            self.assertEqual(alloc.alloc_count, 1)
+            del a
+            self.assertEqual(alloc.dealloc_count, 1)
+            self.assertIs(cpu.get_allocator(pinned=True), cpu.pinned_allocator)
+        finally:
+            wp.set_device_allocator(cpu, None)
+        self.assertIs(wp.get_device_allocator(cpu), cpu.default_allocator)
 
 
 def test_set_cuda_allocator(test, device):
@@ -474,6 +484,81 @@ add_function_test(
     devices=cuda_test_devices,
 )
 
+# -- CPU memory pool --------------------------------------------------------
+
+
+class TestCpuMempoolAllocator(unittest.TestCase):
+    def test_size_classes(self):
+        """Requests are rounded up to four size classes per power of two."""
+        block_size = warp_context._cpu_mempool_block_size
+        self.assertEqual(block_size(1), 256)
+        self.assertEqual(block_size(256), 256)
+        self.assertEqual([block_size(s) for s in (257, 321, 385, 449, 513)], [320, 384, 448, 512, 640])
+        for size in (1000, 4097, 123456, 10**7):
+            self.assertGreaterEqual(block_size(size), size)
+            self.assertLessEqual(block_size(size), 1.25 * size)
+
+    def test_block_reuse_and_statistics(self):
+        """Freed blocks are reused by allocations of the same size class and tracked in the statistics."""
+        cpu = wp.get_device("cpu")
+        pool = wp.CpuMempoolAllocator(cpu)
+        self.assertIsInstance(pool, Allocator)
+
+        with wp.ScopedAllocator(cpu, pool):
+            a = wp.empty(1000, dtype=wp.float32, device=cpu)
+            ptr = a.ptr
+            self.assertEqual(a.memory_kind, wp.MemoryKind.HOST)
+            self.assertEqual(wp.get_mempool_used_mem_current(cpu), 4096)
+            del a
+            self.assertEqual(wp.get_mempool_used_mem_current(cpu), 0)
+            self.assertEqual(pool.reserved_mem_current, 4096)
+
+            b = wp.zeros(1020, dtype=wp.float32, device=cpu)
+            self.assertEqual(b.ptr, ptr)
+            c = wp.full(2000, 1.0, dtype=wp.float32, device=cpu)
+            self.assertNotEqual(c.ptr, ptr)
+            np.testing.assert_array_equal(b.numpy(), 0.0)
+            np.testing.assert_array_equal(c.numpy(), 1.0)
+            self.assertEqual(wp.get_mempool_used_mem_current(cpu), 4096 + 8192)
+            self.assertEqual(wp.get_mempool_used_mem_high(cpu), 4096 + 8192)
+            del b, c
+            self.assertEqual(wp.get_mempool_used_mem_high(cpu), 4096 + 8192)
+            self.assertEqual(pool.reserved_mem_current, 4096 + 8192)
+
+            # lowering the threshold releases the cached blocks
+            wp.set_mempool_release_threshold(cpu, 4096)
+            self.assertEqual(wp.get_mempool_release_threshold(cpu), 4096)
+            self.assertEqual(pool.reserved_mem_current, 4096)
+            d = wp.empty(4000, dtype=wp.float32, device=cpu)
+            del d
+            self.assertEqual(pool.reserved_mem_current, 4096)
+            pool.release()
+            self.assertEqual(pool.reserved_mem_current, 0)
+
+    def test_scoped_mempool(self):
+        """ScopedMempool switches the CPU device to its built-in pool."""
+        cpu = wp.get_device("cpu")
+        self.assertTrue(wp.is_mempool_supported(cpu))
+        was_enabled = wp.is_mempool_enabled(cpu)
+
+        with wp.ScopedMempool(cpu, True):
+            self.assertTrue(wp.is_mempool_enabled(cpu))
+            self.assertIs(wp.get_device_allocator(cpu), cpu.mempool_allocator)
+            used = wp.get_mempool_used_mem_current(cpu)
+            a = wp.zeros(64, dtype=wp.float32, device=cpu)
+            self.assertEqual(wp.get_mempool_used_mem_current(cpu), used + 256)
+            self.assertGreaterEqual(wp.get_mempool_used_mem_high(cpu), used + 256)
+
+        self.assertEqual(wp.is_mempool_enabled(cpu), was_enabled)
+        b = wp.zeros(64, dtype=wp.float32, device=cpu)
+        self.assertIs(b._allocator, wp.get_device_allocator(cpu))
+
+        # arrays outlive the scope and return their blocks to the pool they came from
+        used = wp.get_mempool_used_mem_current(cpu)
+        del a
+        self.assertEqual(wp.get_mempool_used_mem_current(cpu), used - 256)
+
+
 # -- RMM allocator ----------------------------------------------------------
 
 
@@ -394,6 +394,104 @@ class TestColoring(unittest.TestCase):
         for i, group in enumerate(color_groups_2):
             self.assertGreater(len(group), 0, f"Color group {i} in graph 2 should not be empty")
 
+    def test_coloring_parallel(self):
+        """Test speculative parallel coloring against the serial degree-ordered greedy coloring."""
+        vs, fs = create_lattice_grid(60)
+        edges = construct_trimesh_graph_edges(build_trimesh_edges_from_faces(fs), return_wp_array=True)
+        edges_np = edges.numpy()
+
+        colors_greedy = wp.empty(shape=(len(vs),), dtype=wp.int32, device="cpu")
+        num_colors_greedy = wp.utils.graph_coloring_assign(edges, colors_greedy, wp.utils.GraphColoringAlgorithm.GREEDY)
+
+        saved_num_threads = wp.config.cpu_num_threads
+        try:
+            # a single thread has no conflicts and visits nodes in the greedy order
+            wp.config.cpu_num_threads = 1
+            colors = wp.empty(shape=(len(vs),), dtype=wp.int32, device="cpu")
+            num_colors = wp.utils.graph_coloring_assign(edges, colors, wp.utils.GraphColoringAlgorithm.PARALLEL)
+            self.assertEqual(num_colors, num_colors_greedy)
+            assert_np_equal(colors.numpy(), colors_greedy.numpy())
+
+            for num_threads in (2, 4, 0):
+                wp.config.cpu_num_threads = num_threads
+                num_colors = wp.utils.graph_coloring_assign(edges, colors, wp.utils.GraphColoringAlgorithm.PARALLEL)
+                colors_np = colors.numpy()
+                self.assertEqual(validate_graph_coloring(edges_np, colors_np), 0)
+                self.assertEqual(num_colors, colors_np.max() + 1)
+
+                wp.utils.graph_coloring_balance(edges, colors, num_colors, 1.1)
+                self.assertEqual(validate_graph_coloring(edges_np, colors.numpy()), 0)
+        finally:
+            wp.config.cpu_num_threads = saved_num_threads
+
+    def test_coloring_repair(self):
+        """Test repairing a coloring after adding edges and nodes."""
+        vs, fs = create_lattice_grid(40)
+        edges_np = construct_trimesh_graph_edges(build_trimesh_edges_from_faces(fs))
+        num_nodes = len(vs)
+
+        colors = wp.empty(shape=(num_nodes,), dtype=wp.int32, device="cpu")
+        num_colors = wp.utils.graph_coloring_assign(
+            wp.array(edges_np, dtype=wp.int32, device="cpu"), colors, wp.utils.GraphColoringAlgorithm.MCS
+        )
+        wp.utils.graph_coloring_balance(wp.array(edges_np, dtype=wp.int32, device="cpu"), colors, num_colors, 1.1)
+
+        # add edges between random nodes, plus two new nodes connected to the grid
+        rng = np.random.default_rng(42)
+        random_edges = rng.integers(0, num_nodes, size=(50, 2))
+        random_edges = random_edges[random_edges[:, 0] != random_edges[:, 1]]
+        new_node_edges = np.array([[num_nodes, 0], [num_nodes + 1, num_nodes], [num_nodes + 1, 1]])
+        changed_edges_np = np.concatenate((random_edges, new_node_edges)).astype(np.int32)
+        all_edges_np = np.concatenate((edges_np, changed_edges_np)).astype(np.int32)
+
+        colors_before_np = np.concatenate((colors.numpy(), [-1, -1])).astype(np.int32)
+        conflicts = validate_graph_coloring(random_edges, colors_before_np)
+
+        all_edges = wp.array(all_edges_np, dtype=wp.int32, device="cpu")
+        changed_edges = wp.array(changed_edges_np, dtype=wp.int32, device="cpu")
+
+        saved_num_threads = wp.config.cpu_num_threads
+        try:
+            for num_threads in (1, 4):
+                wp.config.cpu_num_threads = num_threads
+
+                colors = wp.array(colors_before_np, dtype=wp.int32, device="cpu")
+                num_colors = wp.utils.graph_coloring_repair(all_edges, colors, changed_edges)
+                colors_np = colors.numpy()
+
+                self.assertEqual(validate_graph_coloring(all_edges_np, colors_np), 0)
+                self.assertEqual(num_colors, colors_np.max() + 1)
+
+                # only the new nodes and at most one node per conflicting edge are recolored
+                changed = np.flatnonzero(colors_np != colors_before_np)
+                self.assertTrue(np.all(colors_np[num_nodes:] >= 0))
+                self.assertLessEqual(len(changed), conflicts + 2)
+                self.assertTrue(np.all(np.isin(changed, changed_edges_np)))
+
+                # checking every edge gives a valid coloring as well
+                colors = wp.array(colors_before_np, dtype=wp.int32, device="cpu")
+                num_colors = wp.utils.graph_coloring_repair(all_edges, colors)
+                self.assertEqual(validate_graph_coloring(all_edges_np, colors.numpy()), 0)
+
+                wp.utils.graph_coloring_balance(all_edges, colors, num_colors, 1.1)
+                self.assertEqual(validate_graph_coloring(all_edges_np, colors.numpy()), 0)
+        finally:
+            wp.config.cpu_num_threads = saved_num_threads
+
+        # a valid coloring is left untouched
+        colors = wp.array(colors_np, dtype=wp.int32, device="cpu")
+        wp.utils.graph_coloring_repair(all_edges, colors)
+        assert_np_equal(colors.numpy(), colors_np)
+
+        with self.assertRaises(RuntimeError):
+            wp.utils.graph_coloring_repair(all_edges, colors, wp.array([0, 1], dtype=wp.int32, device="cpu"))
+
+        # edges referencing nodes out of range are rejected and leave the coloring untouched
+        for node in (-1, colors.shape[0]):
+            with self.assertRaises(RuntimeError):
+                wp.utils.graph_coloring_repair(all_edges, colors, wp.array([[0, node]], dtype=wp.int32, device="cpu"))
+        assert_np_equal(colors.numpy(), colors_np)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -0,0 +1,286 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
+# SPDX-License-Identifier: Apache-2.0
+
+import json
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import warp as wp
+from warp.tests.unittest_utils import *
+
+
+@wp.kernel
+def scale_kernel(x: wp.array[float], y: wp.array[float]):
+    i = wp.tid()
+    y[i] = 2.0 * x[i] * x[i]
+
+
+@wp.kernel
+def histogram_kernel(values: wp.array[int], counts: wp.array[int], total: wp.array[float]):
+    i = wp.tid()
+    wp.atomic_add(counts, values[i], 1)
+    wp.atomic_add(total, 0, 1.0)
+    wp.atomic_max(counts, 16, values[i])
+
+
+@wp.kernel
+def sum_kernel(x: wp.array[float], loss: wp.array[float]):
+    i = wp.tid()
+    wp.atomic_add(loss, 0, x[i] * x[i])
+
+
+@wp.kernel
+def tile_sum_kernel(x: wp.array2d[float], out: wp.array[float]):
+    i = wp.tid()
+    t = wp.tile_load(x[i], shape=8)
+    s = wp.tile_sum(t)
+    wp.tile_store(out, s, offset=i)
+
+
+@wp.kernel(
+    module="unique",
+    module_options={"deterministic": wp.DeterministicMode.RUN_TO_RUN, "deterministic_max_records": 1},
+)
+def deterministic_scatter_kernel(values: wp.array[float], indices: wp.array[int], out: wp.array[float]):
+    i = wp.tid()
+    wp.atomic_add(out, indices[i], values[i])
+
+
+@wp.kernel
+def accumulate_kernel(x: wp.array[float], y: wp.array[float]):
+    i = wp.tid()
+    y[i] = y[i] + x[i]
+
+
+class ScopedCpuThreads:
+    def __init__(self, num_threads, chunk_size=0):
+        self.num_threads = num_threads
+        self.chunk_size = chunk_size
+
+    def __enter__(self):
+        self.saved = (wp.config.cpu_num_threads, wp.config.cpu_chunk_size)
+        wp.config.cpu_num_threads = self.num_threads
+        wp.config.cpu_chunk_size = self.chunk_size
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        wp.config.cpu_num_threads, wp.config.cpu_chunk_size = self.saved
+
+
+def test_cpu_threads_forward(test, device):
+    n = 10007
+    x = wp.array(np.linspace(-1.0, 1.0, n, dtype=np.float32), device=device)
+    y = wp.zeros(n, dtype=float, device=device)
+
+    for num_threads, chunk_size in ((4, 0), (3, 1), (0, 100)):
+        with ScopedCpuThreads(num_threads, chunk_size):
+            y.zero_()
+            wp.launch(scale_kernel, dim=n, inputs=[x], outputs=[y], device=device)
+            assert_np_equal(y.numpy(), 2.0 * x.numpy() ** 2)
+
+            hooks = scale_kernel.module.load(device).get_kernel_hooks(scale_kernel)
+            test.assertIsNotNone(hooks.forward_range)
+
+
+def test_cpu_threads_atomics(test, device):
+    n = 20000
+    rng = np.random.default_rng(42)
+    values_np = rng.integers(0, 16, size=n, dtype=np.int32)
+    values = wp.array(values_np, device=device)
+
+    with ScopedCpuThreads(4, 16):
+        counts = wp.zeros(17, dtype=int, device=device)
+        total = wp.zeros(1, dtype=float, device=device)
+        wp.launch(histogram_kernel, dim=n, inputs=[values, counts, total], device=device)
+
+    expected = np.bincount(values_np, minlength=17)
+    expected[16] = values_np.max()
+    assert_np_equal(counts.numpy(), expected)
+    test.assertEqual(total.numpy()[0], float(n))
+
+
+def test_cpu_threads_backward(test, device):
+    n = 4096
+    x = wp.array(np.linspace(0.0, 1.0, n, dtype=np.float32), dtype=float, device=device, requires_grad=True)
+
+    with ScopedCpuThreads(4):
+        loss = wp.zeros(1, dtype=float, device=device, requires_grad=True)
+        tape = wp.Tape()
+        with tape:
+            wp.launch(sum_kernel, dim=n, inputs=[x, loss], device=device)
+        tape.backward(loss=loss)
+
+        hooks = sum_kernel.module.load(device).get_kernel_hooks(sum_kernel)
+        test.assertIsNotNone(hooks.backward_range)
+
+    assert_np_equal(x.grad.numpy(), 2.0 * x.numpy(), tol=1.0e-6)
+    assert_np_equal(loss.numpy(), np.array([np.sum(x.numpy() ** 2)]), tol=1.0e-2)
+
+
+def test_cpu_threads_tile_fallback(test, device):
+    n = 64
+    x_np = np.arange(n * 8, dtype=np.float32).reshape(n, 8)
+    x = wp.array(x_np, dtype=float, device=device)
+    out = wp.zeros(n, dtype=float, device=device)
+
+    with ScopedCpuThreads(4):
+        wp.launch_tiled(tile_sum_kernel, dim=n, inputs=[x], outputs=[out], block_dim=1, device=device)
+
+        # tile kernels keep running serially
+        hooks = tile_sum_kernel.module.load(device, block_dim=1).get_kernel_hooks(tile_sum_kernel)
+        test.assertIsNone(hooks.forward_range)
+
+    assert_np_equal(out.numpy(), x_np.sum(axis=1))
+
+
+def test_cpu_threads_serial_default(test, device):
+    # the default configuration does not generate range entry points
+    test.assertEqual(wp.config.cpu_num_threads, 1)
+
+    @wp.kernel(module="unique")
+    def serial_kernel(x: wp.array[float]):
+        i = wp.tid()
+        x[i] = float(i)
+
+    x = wp.zeros(100, dtype=float, device=device)
+    wp.launch(serial_kernel, dim=100, inputs=[x], device=device)
+    assert_np_equal(x.numpy(), np.arange(100, dtype=np.float32))
+
+    hooks = serial_kernel.module.load(device).get_kernel_hooks(serial_kernel)
+    test.assertIsNone(hooks.forward_range)
+    test.assertIsNone(hooks.backward_range)
+
+
+def capture_graph_replay_workload(device, n):
+    """Capture a CPU graph that mixes independent launches, dependent launches, and other operations."""
+    x = [wp.array(np.linspace(-1.0, 1.0, n, dtype=np.float32) + k, device=device) for k in range(4)]
+    y = [wp.zeros(n, dtype=float, device=device) for _ in range(4)]
+    rows = wp.array(np.arange(n * 8, dtype=np.float32).reshape(n, 8), dtype=float, device=device)
+    row_sums = wp.zeros(n, dtype=float, device=device)
+
+    wp.load_module(device=device)
+    wp.load_module(tile_sum_kernel.module, device=device, block_dim=1)
+    with wp.ScopedCapture(device=device, apic=True, force_module_load=False) as capture:
+        # independent launches
+        for k in range(4):
+            wp.launch(scale_kernel, dim=n, inputs=[x[k]], outputs=[y[k]], device=device)
+        # a chain of launches that depend on each other and on the launches above
+        for k in range(3):
+            wp.launch(accumulate_kernel, dim=n, inputs=[y[k], y[k + 1]], device=device)
+        # a tile kernel runs on its own
+        wp.launch_tiled(tile_sum_kernel, dim=n, inputs=[rows], outputs=[row_sums], block_dim=1, device=device)
+        # launches recorded after a memset see its result
+        y[0].zero_()
+        wp.launch(accumulate_kernel, dim=n, inputs=[x[0], y[0]], device=device)
+
+    expected = [2.0 * a.numpy() ** 2 for a in x]
+    for k in range(3):
+        expected[k + 1] += expected[k]
+    expected[0] = x[0].numpy()
+
+    return capture.graph, [*y, row_sums], [*expected, rows.numpy().sum(axis=1)]
+
+
+def test_cpu_graph_concurrent_replay(test, device):
+    n = 1000
+
+    with ScopedCpuThreads(4):
+        graph, outputs, expected = capture_graph_replay_workload(device, n)
+
+        for serial in (False, True, False):
+            saved = wp.config.cpu_graph_serial_replay
+            wp.config.cpu_graph_serial_replay = serial
+            try:
+                for a in outputs:
+                    a.fill_(-1.0)
+                wp.capture_launch(graph)
+            finally:
+                wp.config.cpu_graph_serial_replay = saved
+
+            for a, ref in zip(outputs, expected, strict=True):
+                assert_np_equal(a.numpy(), ref, tol=1.0e-5)
+
+
+def test_cpu_graph_concurrent_replay_loaded(test, device):
+    n = 1000
+
+    with ScopedCpuThreads(4):
+        graph, outputs, expected = capture_graph_replay_workload(device, n)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "concurrent_replay")
+            wp.capture_save(graph, path, outputs={f"out{k}": a for k, a in enumerate(outputs)})
+
+            loaded = wp.capture_load(path, device=device)
+            wp.capture_launch(loaded)
+
+            for k, ref in enumerate(expected):
+                result = wp.empty(n, dtype=float, device=device)
+                loaded.get_param(f"out{k}", result)
+                assert_np_equal(result.numpy(), ref, tol=1.0e-5)
+
+
+def test_cpu_graph_loaded_serial_kernels(test, device):
+    n = 1000
+
+    with ScopedCpuThreads(4):
+        values = wp.array(np.arange(n, dtype=np.float32), device=device)
+        indices = wp.array(np.arange(n) % 4, dtype=int, device=device)
+        sums = wp.zeros(4, dtype=float, device=device)
+        rows = wp.array(np.ones((n, 8), dtype=np.float32), device=device)
+        row_sums = wp.zeros(n, dtype=float, device=device)
+
+        for kernel, block_dim in ((deterministic_scatter_kernel, 256), (tile_sum_kernel, 1)):
+            kernel.module.load(device, block_dim=block_dim)
+
+        with wp.ScopedCapture(device, apic=True) as capture:
+            wp.launch(deterministic_scatter_kernel, dim=n, inputs=[values, indices, sums], device=device)
+            wp.launch_tiled(tile_sum_kernel, dim=n, inputs=[rows], outputs=[row_sums], block_dim=1, device=device)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "serial_kernels")
+            wp.capture_save(capture.graph, path, outputs={"sums": sums, "row_sums": row_sums})
+
+            # kernels that Module.load() runs serially are recorded as such for replay
+            threaded = {}
+            for filename in os.listdir(path + "_modules"):
+                if filename.endswith(".meta"):
+                    with open(os.path.join(path + "_modules", filename)) as meta_file:
+                        meta = json.load(meta_file)
+                    threaded.update({k: v for k, v in meta.items() if k.endswith("_cpu_kernel_threaded")})
+            for kernel in (deterministic_scatter_kernel, tile_sum_kernel):
+                test.assertFalse(threaded[kernel.get_mangled_name() + "_cpu_kernel_threaded"])
+
+            loaded = wp.capture_load(path, device=device)
+            wp.capture_launch(loaded)
+
+            result = wp.empty(4, dtype=float, device=device)
+            loaded.get_param("sums", result)
+            assert_np_equal(result.numpy(), np.arange(n).reshape(-1, 4).sum(axis=0).astype(np.float32))
+
+
+class TestCpuThreads(unittest.TestCase):
+    pass
+
+
+devices = [d for d in get_test_devices() if d.is_cpu]
+
+add_function_test(TestCpuThreads, "test_cpu_threads_forward", test_cpu_threads_forward, devices=devices)
+add_function_test(TestCpuThreads, "test_cpu_threads_atomics", test_cpu_threads_atomics, devices=devices)
+add_function_test(TestCpuThreads, "test_cpu_threads_backward", test_cpu_threads_backward, devices=devices)
+add_function_test(TestCpuThreads, "test_cpu_threads_tile_fallback", test_cpu_threads_tile_fallback, devices=devices)
+add_function_test(TestCpuThreads, "test_cpu_threads_serial_default", test_cpu_threads_serial_default, devices=devices)
+add_function_test(TestCpuThreads, "test_cpu_graph_concurrent_replay", test_cpu_graph_concurrent_replay, devices=devices)
+add_function_test(
+    TestCpuThreads, "test_cpu_graph_concurrent_replay_loaded", test_cpu_graph_concurrent_replay_loaded, devices=devices
+)
+add_function_test(
+    TestCpuThreads, "test_cpu_graph_loaded_serial_kernels", test_cpu_graph_loaded_serial_kernels, devices=devices
+)
+
+
+if __name__ == "__main__":
+    wp.clear_kernel_cache()
+    unittest.main(verbosity=2)
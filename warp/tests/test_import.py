@@ -1,8 +1,12 @@
 # SPDX-FileCopyrightText: Copyright (c) 2022 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import json
 import os
+import subprocess
 import sys
+import tempfile
+import textwrap
 import unittest
 
 import warp as wp
@@ -24,6 +28,63 @@ def test_import_func():
 devices = get_test_devices()
 
 
+# prints the registered built-ins with the arguments of their overloads and the exported names
+_BUILTIN_TABLE_SCRIPT = textwrap.dedent(
+    """
+    import json
+    import warp as wp
+    from warp._src.context import builtin_functions
+
+    pending = len(builtin_functions.pending)
+    table = {
+        key: [list(f.input_types) for f in getattr(func, "overloads", [func])]
+        for key, func in builtin_functions.items()
+    }
+    exported = sorted(key for key in table if key in dir(wp))
+    print(json.dumps({"lazy": wp.config.lazy_builtins, "pending": pending, "table": table, "exported": exported}))
+    """
+)
+
+# uses a few built-ins from kernels and from Python without enumerating the table
+_LAZY_LAUNCH_SCRIPT = textwrap.dedent(
+    """
+    import json
+    import warp as wp
+    from warp._src.context import builtin_functions
+
+    @wp.kernel
+    def k(x: wp.array(dtype=float), y: wp.array(dtype=float)):
+        i = wp.tid()
+        y[i] = wp.sin(x[i]) + wp.max(x[i], 0.5)
+
+    x = wp.array([0.0, 1.0, 2.0], dtype=float, device="cpu")
+    y = wp.zeros(3, dtype=float, device="cpu")
+    wp.launch(k, dim=3, inputs=[x], outputs=[y], device="cpu")
+    print(json.dumps({
+        "lazy": wp.config.lazy_builtins,
+        "y": y.numpy().tolist(),
+        "sqrt": wp.sqrt(4.0),
+        "pending_sin": "sin" in builtin_functions.pending,
+        "pending_cos": "cos" in builtin_functions.pending,
+    }))
+    """
+)
+
+
+def _run_script(script, lazy):
+    env = dict(os.environ)
+    env["WARP_LAZY_BUILTINS"] = "1" if lazy else "0"
+
+    # kernels need their source on disk
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "lazy_builtins_script.py")
+        with open(path, "w") as f:
+            f.write(script)
+        result = subprocess.run([sys.executable, path], env=env, check=True, capture_output=True, text=True)
+
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
 class TestImport(unittest.TestCase):
     def test_normalize_direct_test_sys_path(self):
         """Direct test execution should not shadow top-level packages."""
@@ -40,6 +101,29 @@ class TestImport(unittest.TestCase):
         finally:
             sys.path[:] = original_sys_path
 
+    def test_lazy_builtins_match_eager(self):
+        """Built-ins registered on demand end up identical to eager registration."""
+        eager = _run_script(_BUILTIN_TABLE_SCRIPT, lazy=False)
+        lazy = _run_script(_BUILTIN_TABLE_SCRIPT, lazy=True)
+
+        self.assertFalse(eager["lazy"])
+        self.assertEqual(eager["pending"], 0)
+        self.assertTrue(lazy["lazy"])
+        self.assertGreater(lazy["pending"], 0)
+
+        self.assertEqual(lazy["table"], eager["table"])
+        self.assertEqual(lazy["exported"], eager["exported"])
+
+    def test_lazy_builtins_launch(self):
+        """Kernels and Python calls register the built-ins they use."""
+        result = _run_script(_LAZY_LAUNCH_SCRIPT, lazy=True)
+
+        self.assertTrue(result["lazy"])
+        np.testing.assert_allclose(result["y"], [np.sin(0.0) + 0.5, np.sin(1.0) + 1.0, np.sin(2.0) + 2.0], rtol=1e-6)
+        self.assertEqual(result["sqrt"], 2.0)
+        self.assertFalse(result["pending_sin"])
+        self.assertTrue(result["pending_cos"])
+
 
 add_kernel_test(TestImport, kernel=test_import_func, name="test_import_func", dim=1, devices=devices)
 
@@ -4,10 +4,13 @@
 import json
 import os
 import tempfile
+import time
 import unittest
 from unittest.mock import patch
 
+import warp
 import warp._src.build
+import warp._src.kernel_cache
 import warp.config
 
 
@@ -18,6 +21,8 @@ class TestKernelCache(unittest.TestCase):
 
     def tearDown(self):
         warp.config.kernel_cache_dir = self._original_cache_dir
+        warp.config.kernel_cache_max_bytes = None
+        warp.config.kernel_cache_backend = None
         if self._original_env is None:
             os.environ.pop("WARP_CACHE_PATH", None)
         else:
@@ -216,6 +221,250 @@ class TestKernelCache(unittest.TestCase):
         self.assertEqual(healed_meta, {lto_symbol: shared_memory_bytes})
         self.assertEqual(healed_lto_data, b"rebuilt")
 
+    def _make_module_dir(self, cache_dir, name, size, age):
+        module_dir = os.path.join(cache_dir, name)
+        os.makedirs(module_dir)
+        with open(os.path.join(module_dir, f"{name}.o"), "wb") as f:
+            f.write(b"x" * size)
+        timestamp = time.time() - age
+        os.utime(module_dir, (timestamp, timestamp))
+        return module_dir
+
+    def test_cache_index_tracks_module_sizes(self):
+        """Storing a module records its directory size in the shared index."""
+        with tempfile.TemporaryDirectory() as tmp:
+            module_dir = self._make_module_dir(tmp, "wp_module_a", 100, age=0)
+            warp._src.kernel_cache.record_store(module_dir, [])
+
+            with open(os.path.join(tmp, warp._src.kernel_cache._INDEX_NAME)) as f:
+                index = json.load(f)
+
+        self.assertEqual(index["wp_module_a"]["size"], 100)
+
+    def test_cache_lru_eviction(self):
+        """Exceeding the byte budget evicts the least recently used module directories."""
+        with tempfile.TemporaryDirectory() as tmp:
+            self._make_module_dir(tmp, "wp_oldest", 400, age=3000)
+            self._make_module_dir(tmp, "wp_older", 400, age=2000)
+            self._make_module_dir(tmp, "wp_recent", 400, age=1000)
+            # build directories of other processes are never evicted
+            self._make_module_dir(tmp, "wp_building_p123_t456", 400, age=5000)
+
+            warp.config.kernel_cache_max_bytes = 1000
+            new_dir = self._make_module_dir(tmp, "wp_new", 400, age=0)
+            warp._src.kernel_cache.record_store(new_dir, [])
+
+            remaining = sorted(os.listdir(tmp))
+
+        self.assertNotIn("wp_oldest", remaining)
+        self.assertNotIn("wp_older", remaining)
+        self.assertIn("wp_recent", remaining)
+        self.assertIn("wp_new", remaining)
+        self.assertIn("wp_building_p123_t456", remaining)
+
+    def test_cache_eviction_respects_recent_hits(self):
+        """A cache hit refreshes a module's access time, protecting it from eviction."""
+        # initialize first, initialization resets the cache directory
+        warp.init()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            warp.config.kernel_cache_dir = tmp
+            self._make_module_dir(tmp, "wp_module_a", 400, age=2000)
+            module_b = self._make_module_dir(tmp, "wp_module_b", 400, age=3000)
+            warp.trim_kernel_cache(max_bytes=None)
+
+            warp._src.kernel_cache.record_hit(module_b)
+            warp.trim_kernel_cache(max_bytes=500, grace_period=0.0)
+
+            remaining = sorted(os.listdir(tmp))
+
+        self.assertNotIn("wp_module_a", remaining)
+        self.assertIn("wp_module_b", remaining)
+
+    def test_trim_kernel_cache_uses_config_budget(self):
+        """trim_kernel_cache() enforces kernel_cache_max_bytes without compiling a module."""
+        warp.init()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            warp.config.kernel_cache_dir = tmp
+            self._make_module_dir(tmp, "wp_module_a", 400, age=3000)
+            self._make_module_dir(tmp, "wp_module_b", 400, age=2000)
+            self._make_module_dir(tmp, "wp_module_c", 400, age=0)
+
+            warp.config.kernel_cache_max_bytes = 500
+            warp.trim_kernel_cache()
+
+            remaining = sorted(os.listdir(tmp))
+
+        # the recently used module is within the grace period and survives over budget
+        self.assertNotIn("wp_module_a", remaining)
+        self.assertNotIn("wp_module_b", remaining)
+        self.assertIn("wp_module_c", remaining)
+
+    def test_kernel_cache_stats(self):
+        """kernel_cache_stats() reports hit/miss counts and the on-disk usage."""
+        # initialize first, initialization resets the cache directory
+        warp.init()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            warp.config.kernel_cache_dir = tmp
+            stats_before = warp.kernel_cache_stats()
+
+            module_dir = self._make_module_dir(tmp, "wp_module_a", 300, age=0)
+            warp._src.kernel_cache.record_store(module_dir, [])
+            warp._src.kernel_cache.record_hit(module_dir)
+            self._make_module_dir(tmp, "wp_module_b", 200, age=0)
+
+            stats = warp.kernel_cache_stats()
+
+        self.assertEqual(stats["hits"] - stats_before["hits"], 1)
+        self.assertEqual(stats["misses"] - stats_before["misses"], 1)
+        self.assertEqual(stats["entries"], 2)
+        self.assertEqual(stats["bytes"], 500)
+        self.assertIsNone(stats["max_bytes"])
+
+    def test_reference_recipes_round_trip(self):
+        """Reference recipes are written to the cache directory and read back by later processes."""
+        warp.init()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            warp.config.kernel_cache_dir = tmp
+            key = warp._src.kernel_cache.reference_recipe_key("def f():\n    pass\n")
+            self.assertIsNone(warp._src.kernel_cache.get_reference_recipe("file.py", key))
+
+            warp._src.kernel_cache.put_reference_recipe("file.py", key, [[0, False], [3, True]], 2)
+            warp._src.kernel_cache.flush_reference_recipes()
+
+            # simulate a new process, which only sees the recipes on disk
+            warp._src.kernel_cache._reference_shards.clear()
+            recipe = warp._src.kernel_cache.get_reference_recipe("file.py", key)
+            self.assertEqual(recipe, {"nodes": [[0, False], [3, True]], "kernel_dim": 2})
+
+            # malformed recipes are cache misses
+            (shard_name,) = os.listdir(os.path.join(tmp, "references"))
+            with open(os.path.join(tmp, "references", shard_name), "w") as f:
+                json.dump({key: {"nodes": [[0]], "kernel_dim": 2}}, f)
+            warp._src.kernel_cache._reference_shards.clear()
+            self.assertIsNone(warp._src.kernel_cache.get_reference_recipe("file.py", key))
+
+            warp._src.kernel_cache.reset_references(tmp)
+            self.assertFalse(os.path.exists(os.path.join(tmp, "references")))
+
+        # recipes depend on the Warp version
+        with patch.object(warp.config, "version", "0.0.1"):
+            other_key = warp._src.kernel_cache.reference_recipe_key("def f():\n    pass\n")
+        self.assertNotEqual(other_key, key)
+
+    def test_kernel_cache_stats_timings(self):
+        """kernel_cache_stats() accumulates the time spent in each phase of module loads."""
+
+        @warp.kernel(module="unique")
+        def timed_kernel(x: warp.array[float]):
+            x[warp.tid()] = 1.0
+
+        warp.init()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            warp.config.kernel_cache_dir = tmp
+            stats_before = warp.kernel_cache_stats()
+            timed_kernel.module.load("cpu")
+            stats = warp.kernel_cache_stats()
+
+        for phase in ("hash", "codegen", "compile", "load"):
+            self.assertGreaterEqual(stats[f"{phase}_time"], stats_before[f"{phase}_time"])
+        self.assertGreater(stats["load_time"], stats_before["load_time"])
+
+    def test_local_directory_backend(self):
+        """LocalDirectoryCacheBackend stores entries by key and honors read-only mode."""
+        entry_dir = f"{warp.config.version}/{'ab' * 32}"
+        with tempfile.TemporaryDirectory() as tmp:
+            backend = warp.LocalDirectoryCacheBackend(tmp)
+            self.assertIsNone(backend.get(f"{entry_dir}/wp_module_abababa.o"))
+
+            backend.put(f"{entry_dir}/wp_module_abababa.o", b"binary")
+            self.assertEqual(backend.get(f"{entry_dir}/wp_module_abababa.o"), b"binary")
+            self.assertEqual(os.listdir(os.path.join(tmp, *entry_dir.split("/"))), ["wp_module_abababa.o"])
+
+            read_only = warp.LocalDirectoryCacheBackend(tmp, read_only=True)
+            read_only.put(f"{entry_dir}/wp_module_abababa.meta", b"{}")
+            self.assertIsNone(read_only.get(f"{entry_dir}/wp_module_abababa.meta"))
+            self.assertEqual(read_only.get(f"{entry_dir}/wp_module_abababa.o"), b"binary")
+
+            for key in ("../outside", f"{entry_dir}/../outside", f"{entry_dir}//wp_module_abababa.o", "outside"):
+                with self.assertRaises(ValueError):
+                    backend.get(key)
+
+    def test_backend_round_trip(self):
+        """Compiled modules are stored into the backend and fetched back on a local miss."""
+        with tempfile.TemporaryDirectory() as cache_tmp, tempfile.TemporaryDirectory() as backend_tmp:
+            warp.config.kernel_cache_backend = warp.LocalDirectoryCacheBackend(backend_tmp)
+
+            module_dir = self._make_module_dir(cache_tmp, "wp_module_a", 10, age=0)
+            with open(os.path.join(module_dir, "wp_module_a.meta"), "w") as f:
+                f.write("{}")
+            module_hash = bytes(range(32))
+            warp._src.kernel_cache.record_store(module_dir, ["wp_module_a.o", "wp_module_a.meta"], module_hash)
+            self.assertEqual(
+                sorted(os.listdir(os.path.join(backend_tmp, warp.config.version, module_hash.hex()))),
+                ["wp_module_a.meta", "wp_module_a.o"],
+            )
+
+            other_cache_dir = os.path.join(cache_tmp, "other")
+            os.makedirs(other_cache_dir)
+            fetched_dir = os.path.join(other_cache_dir, "wp_module_a")
+            self.assertTrue(
+                warp._src.kernel_cache.fetch_from_backend(
+                    fetched_dir, ["wp_module_a.o", "wp_module_a.meta"], module_hash
+                )
+            )
+            with open(os.path.join(fetched_dir, "wp_module_a.o"), "rb") as f:
+                self.assertEqual(f.read(), b"x" * 10)
+
+            # an incomplete entry is a miss and leaves nothing behind
+            missing_dir = os.path.join(other_cache_dir, "wp_module_b")
+            self.assertFalse(warp._src.kernel_cache.fetch_from_backend(missing_dir, ["wp_module_b.o"], module_hash))
+            self.assertFalse(os.path.exists(missing_dir))
+
+    def test_backend_keys_include_version(self):
+        """Entries stored by one Warp version are never fetched by another."""
+        with tempfile.TemporaryDirectory() as cache_tmp, tempfile.TemporaryDirectory() as backend_tmp:
+            warp.config.kernel_cache_backend = warp.LocalDirectoryCacheBackend(backend_tmp)
+            module_hash = bytes(range(32))
+
+            module_dir = self._make_module_dir(cache_tmp, "wp_module_a", 10, age=0)
+            with patch.object(warp.config, "version", "0.0.1"):
+                warp._src.kernel_cache.record_store(module_dir, ["wp_module_a.o"], module_hash)
+
+            fetched_dir = os.path.join(cache_tmp, "other", "wp_module_a")
+            os.makedirs(os.path.dirname(fetched_dir))
+            with patch.object(warp.config, "version", "0.0.2"):
+                self.assertFalse(warp._src.kernel_cache.fetch_from_backend(fetched_dir, ["wp_module_a.o"], module_hash))
+            self.assertFalse(os.path.exists(fetched_dir))
+
+            with patch.object(warp.config, "version", "0.0.1"):
+                # modules whose hashes only share a prefix are distinct entries
+                other_hash = module_hash[:4] + bytes(28)
+                self.assertFalse(warp._src.kernel_cache.fetch_from_backend(fetched_dir, ["wp_module_a.o"], other_hash))
+                self.assertTrue(warp._src.kernel_cache.fetch_from_backend(fetched_dir, ["wp_module_a.o"], module_hash))
+
+    def test_backend_errors_are_cache_misses(self):
+        """A failing backend produces a warning and falls back to compilation."""
+
+        class FailingBackend(warp.KernelCacheBackend):
+            def get(self, key):
+                raise OSError("unreachable")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            warp.config.kernel_cache_backend = FailingBackend()
+            with patch("warp._src.logger.log_warning") as mock_warn:
+                fetched = warp._src.kernel_cache.fetch_from_backend(
+                    os.path.join(tmp, "wp_module_a"), ["wp_module_a.o"], bytes(32)
+                )
+
+        self.assertFalse(fetched)
+        mock_warn.assert_called_once()
+        self.assertIn("unreachable", mock_warn.call_args[0][0])
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -1,6 +1,7 @@
 # SPDX-FileCopyrightText: Copyright (c) 2022 NVIDIA CORPORATION & AFFILIATES. All rights reserved.
 # SPDX-License-Identifier: Apache-2.0
 
+import ctypes
 import unittest
 
 import numpy as np
@@ -243,6 +244,39 @@ def arange(out: wp.array[int]):
     out[tid] = tid
 
 
+def test_launch_cmd_set_param_in_place(test, device):
+    n = 4
+
+    values = wp.array(np.arange(n), dtype=int, device=device)
+    out = wp.zeros(n, dtype=int, device=device)
+
+    cmd = wp.launch(kernel_mul, dim=n, inputs=[values, 1], outputs=[out], device=device, record_cmd=True)
+
+    # updates are written into the recorded parameter slots instead of replacing them
+    slots = list(cmd.params)
+    addresses = [ctypes.addressof(p) for p in slots]
+
+    for step in range(1, 4):
+        values = wp.array(np.arange(n) + step, dtype=int, device=device)
+        cmd.set_param_by_name("values", values)
+        cmd.set_param_by_name("coeff", step)
+        cmd.launch()
+
+        assert_np_equal(out.numpy(), (np.arange(n) + step) * step)
+
+        test.assertEqual(cmd.params[2].value, step)
+        test.assertEqual(cmd.params[1].data, values.ptr)
+
+    for p, slot, address in zip(cmd.params, slots, addresses, strict=True):
+        test.assertIs(p, slot)
+        test.assertEqual(ctypes.addressof(p), address)
+
+    # raw ctypes updates go through the same slots
+    cmd.set_param_at_index_from_ctype(1, 5)
+    cmd.launch()
+    assert_np_equal(out.numpy(), (np.arange(n) + 3) * 5)
+
+
 def test_launch_cmd_set_dim(test, device):
     n = 10
 
@@ -346,6 +380,102 @@ def test_launch_cmd_adjoint_empty(test, device):
     assert_np_equal(input_arr_updated_grad.numpy(), np.array([8.0, 10.0, 12.0, 14.0]))
 
 
+def test_launch_batch(test, device):
+    n = 10
+
+    ref = np.arange(0, n, dtype=int)
+    values = wp.zeros(n, dtype=int, device=device)
+    out = wp.zeros(n, dtype=int, device=device)
+    out_params = wp.zeros(1, dtype=int, device=device)
+
+    params = Params()
+    params.i = 2
+    params.f = 2.0
+    v = wp.vec3(params.f, params.f, params.f)
+    m = wp.mat33(params.f, 0.0, 0.0, 0.0, params.f, 0.0, 0.0, 0.0, params.f)
+
+    # launches run in order, the second one reads the output of the first one
+    cmds = [
+        wp.launch(arange, dim=n, inputs=[values], device=device, record_cmd=True),
+        wp.launch(kernel_mul, dim=n, inputs=[values, 3, out], device=device, record_cmd=True),
+        wp.launch(
+            kernel_cmd, dim=1, inputs=[params, params.i, params.f, v, m, out_params], device=device, record_cmd=True
+        ),
+    ]
+    wp.launch_batch([])
+    wp.launch_batch(cmds)
+    assert_np_equal(out.numpy(), ref * 3)
+    assert_np_equal(out_params.numpy(), np.array([2]))
+
+    # parameter and dimension updates are picked up by the next batch
+    out_params = wp.zeros(1, dtype=int, device=device)
+    cmds[0].set_dim(5)
+    cmds[1].set_param_by_name("coeff", 4)
+    cmds[2].set_param_by_name("out", out_params)
+
+    values.zero_()
+    wp.launch_batch(cmds)
+    assert_np_equal(out.numpy()[0:5], ref[0:5] * 4)
+    assert_np_equal(out.numpy()[5:], np.zeros(5))
+    assert_np_equal(out_params.numpy(), np.array([2]))
+
+    # struct members changed through the wp.struct instance are reflected without updating the command
+    params.a = wp.zeros(1, dtype=int, device=device)
+    cmd = wp.launch(kernel_struct_store, dim=1, inputs=[params], device=device, record_cmd=True)
+    wp.launch_batch([cmd])
+    assert_np_equal(params.a.numpy(), np.array([2]))
+
+    params.i = 7
+    wp.launch_batch([cmd])
+    assert_np_equal(params.a.numpy(), np.array([7]))
+
+    # repeated launches of the same command
+    counter = wp.zeros(1, dtype=int, device=device)
+    cmd = wp.launch(kernel_increment, dim=1, inputs=[counter], device=device, record_cmd=True)
+    wp.launch_batch([cmd] * 5)
+    assert_np_equal(counter.numpy(), np.array([5]))
+
+
+def test_launch_batch_adjoint(test, device):
+    input_arr = wp.array([1.0, 2.0, 3.0], dtype=float, requires_grad=True, device=device)
+    output_arr = wp.empty_like(input_arr)
+    output_arr.grad.fill_(1.0)
+
+    fwd = wp.launch(square_kernel, dim=input_arr.size, inputs=[input_arr, output_arr], device=device, record_cmd=True)
+    adj = wp.launch(
+        square_kernel,
+        dim=input_arr.size,
+        inputs=[input_arr, output_arr],
+        adj_inputs=[None, None],
+        adjoint=True,
+        device=device,
+        record_cmd=True,
+    )
+
+    wp.launch_batch([fwd, adj])
+
+    assert_np_equal(output_arr.numpy(), np.array([1.0, 4.0, 9.0]))
+    assert_np_equal(input_arr.grad.numpy(), np.array([2.0, 4.0, 6.0]))
+
+
+def test_launch_batch_devices(test, device):
+    cpu_cmd = wp.launch(noop_kernel, dim=1, device="cpu", record_cmd=True)
+    cuda_cmd = wp.launch(noop_kernel, dim=1, device=device, record_cmd=True)
+
+    with test.assertRaisesRegex(ValueError, "same device"):
+        wp.launch_batch([cpu_cmd, cuda_cmd])
+
+
+@wp.kernel
+def kernel_struct_store(params: Params):
+    params.a[0] = params.i
+
+
+@wp.kernel
+def kernel_increment(counter: wp.array[int]):
+    counter[0] = counter[0] + 1
+
+
 @wp.kernel
 def kernel_mul(values: wp.array[int], coeff: int, out: wp.array[int]):
     tid = wp.tid()
@@ -516,11 +646,16 @@ add_function_test(TestLaunch, "test_launch_4d", test4d, devices=devices)
 add_function_test(TestLaunch, "test_launch_cmd", test_launch_cmd, devices=devices)
 add_function_test(TestLaunch, "test_launch_cmd_set_param", test_launch_cmd_set_param, devices=devices)
 add_function_test(TestLaunch, "test_launch_cmd_set_ctype", test_launch_cmd_set_ctype, devices=devices)
+add_function_test(TestLaunch, "test_launch_cmd_set_param_in_place", test_launch_cmd_set_param_in_place, devices=devices)
 add_function_test(TestLaunch, "test_launch_cmd_set_dim", test_launch_cmd_set_dim, devices=devices)
 add_function_test(TestLaunch, "test_launch_cmd_empty", test_launch_cmd_empty, devices=devices)
 add_function_test(TestLaunch, "test_launch_cmd_adjoint", test_launch_cmd_adjoint, devices=devices)
 add_function_test(TestLaunch, "test_launch_cmd_adjoint_empty", test_launch_cmd_adjoint_empty, devices=devices)
 
+add_function_test(TestLaunch, "test_launch_batch", test_launch_batch, devices=devices)
+add_function_test(TestLaunch, "test_launch_batch_adjoint", test_launch_batch_adjoint, devices=devices)
+add_function_test(TestLaunch, "test_launch_batch_devices", test_launch_batch_devices, devices=get_cuda_test_devices())
+
 add_function_test(TestLaunch, "test_launch_tuple_args", test_launch_tuple_args, devices=devices)
 
 add_function_test(TestLaunch, "test_launch_bounds_none", test_launch_bounds_none, devices=devices)
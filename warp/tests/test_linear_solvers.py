@@ -8,7 +8,21 @@ import numpy as np
 
 import warp as wp
 from warp._src.optim.linear import TiledDot, _run_solver_loop
-from warp.optim.linear import CG, CR, GMRES, BiCGSTAB, aslinearoperator, bicgstab, cg, cr, gmres, preconditioner
+from warp.optim.linear import (
+    AMG,
+    CG,
+    CR,
+    GMRES,
+    BiCGSTAB,
+    MixedPrecisionRefinement,
+    SparseCholesky,
+    aslinearoperator,
+    bicgstab,
+    cg,
+    cr,
+    gmres,
+    preconditioner,
+)
 from warp.tests.unittest_utils import *
 
 
@@ -278,6 +292,62 @@ def test_batched_nonuniform(test, device, dtype=wp.float32):
     _run_batched_spd_solver(test, device, cg, seed_base=300, dtype=dtype, batch_sizes=[8, 15, 10, 12])
 
 
+def test_batched_per_system_convergence(test, device):
+    # an identity block converging in one iteration, a harder SPD block, and a zero right-hand side
+    batch_sizes = [6, 20, 5]
+    rows = sum(batch_sizes)
+    A_np = np.zeros((rows, rows), dtype=np.float64)
+    b_np = np.zeros(rows, dtype=np.float64)
+    A_np[:6, :6] = 2.0 * np.eye(6)
+    b_np[:6] = np.arange(1, 7)
+    A_1, b_1 = _make_spd_system(20, seed=42, dtype=wp.float64, device="cpu")
+    A_np[6:26, 6:26] = A_1.numpy()
+    b_np[6:26] = b_1.numpy()
+    A_np[26:, 26:] = np.eye(5)
+
+    A = aslinearoperator(
+        wp.array(A_np, dtype=wp.float64, device=device), batch_offsets=_batch_offsets(batch_sizes, device)
+    )
+    b = wp.array(b_np, dtype=wp.float64, device=device)
+    tol = 1.0e-8
+
+    for solver, check_every in ((cg, 1), (cg, 0), (cr, 1), (bicgstab, 0)):
+        x = wp.zeros_like(b)
+        state = solver(A, b, x, tol=tol, maxiter=200, check_every=check_every, use_cuda_graph=False, run=False)
+        state()
+
+        iterations = state.batch_iterations.numpy()
+        test.assertEqual(iterations[0], 1)
+        test.assertGreater(iterations[1], iterations[0])
+        test.assertEqual(iterations[2], 0)
+
+        x_np = x.numpy()
+        residuals = np.abs(A_np @ x_np - b_np)
+        offsets = np.concatenate([[0], np.cumsum(batch_sizes)])
+        for i, (start, end) in enumerate(itertools.pairwise(offsets)):
+            norm = np.linalg.norm(residuals[start:end])
+            test.assertLessEqual(norm, 10.0 * tol * max(np.linalg.norm(b_np[start:end]), 1.0))
+            test.assertAlmostEqual(state.batch_residual_norms.numpy()[i], norm, delta=1.0e-6)
+
+        # converged subproblems are left untouched by later iterations
+        np.testing.assert_allclose(x_np[:6], b_np[:6] / 2.0, rtol=1.0e-12)
+        np.testing.assert_array_equal(x_np[26:], 0.0)
+
+    # unbatched systems do not report per-subproblem statistics
+    x = wp.zeros_like(b)
+    state = cg(wp.array(A_np, dtype=wp.float64, device=device), b, x, run=False)
+    test.assertIsNone(state.batch_iterations)
+    test.assertIsNone(state.batch_residual_norms)
+
+    # GMRES reports statistics for its restart cycles
+    x = wp.zeros_like(b)
+    state = gmres(A, b, x, tol=tol, maxiter=200, restart=4, check_every=4, use_cuda_graph=False, run=False)
+    state()
+    iterations = state.batch_iterations.numpy()
+    test.assertEqual(iterations[2], 0)
+    test.assertEqual(iterations[1] % 4, 0)
+
+
 def test_batched_vector_offsets(test, device):
     diag = wp.array(((2.0, 2.0), (5.0, 5.0)), dtype=wp.vec2, device=device)
     b = wp.array(((2.0, 4.0), (10.0, 15.0)), dtype=wp.vec2, device=device)
@@ -529,6 +599,350 @@ def test_functor_compat_errors(test, device):
             bic_state(M=M2)
 
 
+def _make_sparse_grid_system(n: int, block_size: int, dtype, device, symmetric: bool = True, seed: int = 123):
+    """Block 5-point Laplacian on an ``n x n`` grid, returned as a BSR matrix and its dense counterpart."""
+    rng = np.random.default_rng(seed)
+
+    B = rng.uniform(low=-0.2, high=0.2, size=(block_size, block_size))
+    B = B @ B.T + np.eye(block_size)
+
+    ij = np.arange(n * n).reshape(n, n)
+    rows = [ij.flatten()]
+    cols = [ij.flatten()]
+    blocks = [np.broadcast_to(4.0 * B + 0.01 * np.eye(block_size), (n * n, block_size, block_size))]
+    for src, dst in ((ij[1:], ij[:-1]), (ij[:-1], ij[1:]), (ij[:, 1:], ij[:, :-1]), (ij[:, :-1], ij[:, 1:])):
+        rows.append(src.flatten())
+        cols.append(dst.flatten())
+        scale = np.where(dst.flatten() > src.flatten(), 1.3, 1.0) if not symmetric else np.ones(src.size)
+        blocks.append(-scale[:, np.newaxis, np.newaxis] * np.eye(block_size))
+
+    rows = np.concatenate(rows)
+    cols = np.concatenate(cols)
+    blocks = np.concatenate(blocks)
+
+    dense = np.zeros((n * n * block_size, n * n * block_size))
+    for r, c, block in zip(rows, cols, blocks, strict=True):
+        dense[r * block_size : (r + 1) * block_size, c * block_size : (c + 1) * block_size] += block
+
+    if block_size == 1:
+        values = wp.array(blocks[:, 0, 0], dtype=dtype, device=device)
+        vec_type = dtype
+    else:
+        values = wp.array(blocks, dtype=wp.types.matrix(shape=(block_size, block_size), dtype=dtype), device=device)
+        vec_type = wp.types.vector(length=block_size, dtype=dtype)
+
+    A = wp.sparse.bsr_from_triplets(
+        n * n, n * n, wp.array(rows, dtype=int, device=device), wp.array(cols, dtype=int, device=device), values
+    )
+    b = wp.array(
+        rng.uniform(low=-1.0, high=1.0, size=(n * n, block_size)).squeeze(-1 if block_size == 1 else ()),
+        dtype=vec_type,
+        device=device,
+    )
+
+    return A, b, dense
+
+
+def test_preconditioner_types(test, device):
+    for block_size, dtype in ((1, wp.float64), (3, wp.float64), (2, wp.float32)):
+        A, b, dense = _make_sparse_grid_system(n=12, block_size=block_size, dtype=dtype, device=device)
+        tol = 1.0e-8 if dtype == wp.float64 else 1.0e-4
+
+        iterations = {}
+        for ptype in ("diag", "block_diag", "ilu0", "ic0", "chebyshev"):
+            M = preconditioner(A, ptype)
+            x = wp.zeros_like(b)
+            niter, err, atol = cg(A, b, x, M=M, tol=tol, maxiter=1000, check_every=1)
+            test.assertLessEqual(err, atol)
+
+            residual = dense @ x.numpy().flatten() - b.numpy().flatten()
+            test.assertLessEqual(np.linalg.norm(residual), 32.0 * atol)
+            iterations[ptype] = niter
+
+        for ptype in ("ilu0", "ic0", "chebyshev"):
+            test.assertLess(iterations[ptype], iterations["diag"])
+
+    # non-symmetric system
+    A, b, dense = _make_sparse_grid_system(n=10, block_size=2, dtype=wp.float64, device=device, symmetric=False)
+    M = preconditioner(A, "diag")
+    x = wp.zeros_like(b)
+    niter_diag, _, _ = bicgstab(A, b, x, M=M, tol=1.0e-8, maxiter=1000, check_every=1)
+
+    M = preconditioner(A, "ilu0")
+    for func in (bicgstab, gmres):
+        x = wp.zeros_like(b)
+        niter, err, atol = func(A, b, x, M=M, tol=1.0e-8, maxiter=1000, check_every=1)
+        test.assertLessEqual(err, atol)
+        residual = dense @ x.numpy().flatten() - b.numpy().flatten()
+        test.assertLessEqual(np.linalg.norm(residual), 2.0 * atol)
+    test.assertLess(niter, niter_diag)
+
+    with test.assertRaises(ValueError):
+        preconditioner(dense, "ilu0")
+    with test.assertRaises(ValueError):
+        preconditioner(A, "chebyshev", degree=0)
+
+
+def test_preconditioner_incomplete_factorization_exact(test, device):
+    # tridiagonal matrices have no fill-in, so their incomplete factorizations are exact
+    n = 20
+    for block_size in (1, 3):
+        rng = np.random.default_rng(42)
+        rows = np.concatenate((np.arange(n), np.arange(1, n), np.arange(n - 1)))
+        cols = np.concatenate((np.arange(n), np.arange(n - 1), np.arange(1, n)))
+        blocks = rng.uniform(low=-1.0, high=1.0, size=(rows.shape[0], block_size, block_size))
+        # symmetric diagonal blocks, as expected by IC(0)
+        blocks[:n] = blocks[:n] + blocks[:n].transpose(0, 2, 1) + 8.0 * np.eye(block_size)
+
+        dense = np.zeros((n * block_size, n * block_size))
+        for r, c, block in zip(rows, cols, blocks, strict=True):
+            dense[r * block_size : (r + 1) * block_size, c * block_size : (c + 1) * block_size] = block
+
+        if block_size == 1:
+            values = wp.array(blocks[:, 0, 0], dtype=wp.float64, device=device)
+        else:
+            values = wp.array(
+                blocks, dtype=wp.types.matrix(shape=(block_size, block_size), dtype=wp.float64), device=device
+            )
+
+        A = wp.sparse.bsr_from_triplets(
+            n, n, wp.array(rows, dtype=int, device=device), wp.array(cols, dtype=int, device=device), values
+        )
+        x_np = rng.uniform(low=-1.0, high=1.0, size=n * block_size)
+        y_np = rng.uniform(low=-1.0, high=1.0, size=n * block_size)
+
+        M = preconditioner(A, "ilu0")
+        x = wp.array(x_np, dtype=wp.float64, device=device)
+        z = wp.array(y_np, dtype=wp.float64, device=device)
+        M.matvec(x, z, z, 2.0, 0.5)
+        assert_np_equal(z.numpy(), 2.0 * np.linalg.solve(dense, x_np) + 0.5 * y_np, tol=1.0e-10)
+
+        # in-place application
+        M.matvec(x, x, x, 1.0, 0.0)
+        assert_np_equal(x.numpy(), np.linalg.solve(dense, x_np), tol=1.0e-10)
+
+        # IC(0) only reads the diagonal and strictly lower blocks
+        block_rows = np.arange(n * block_size) // block_size
+        strict_lower = np.where(block_rows[:, np.newaxis] > block_rows[np.newaxis, :], dense, 0.0)
+        block_diag = np.where(block_rows[:, np.newaxis] == block_rows[np.newaxis, :], dense, 0.0)
+        symmetric = strict_lower + block_diag + strict_lower.T
+
+        M = preconditioner(A, "ic0")
+        x = wp.array(x_np, dtype=wp.float64, device=device)
+        z = wp.empty_like(x)
+        M.matvec(x, z, z, 1.0, 0.0)
+        assert_np_equal(z.numpy(), np.linalg.solve(symmetric, x_np), tol=1.0e-10)
+
+
+def test_preconditioner_capture(test, device):
+    A, b, _ = _make_sparse_grid_system(n=8, block_size=2, dtype=wp.float32, device=device)
+
+    for ptype in ("block_diag", "ilu0", "chebyshev"):
+        M = preconditioner(A, ptype)
+        expected = wp.zeros_like(b)
+        M.matvec(b, expected, expected, 1.0, 0.0)
+
+        z = wp.zeros_like(b)
+        with wp.ScopedDevice(device):
+            with wp.ScopedCapture(apic=device.is_cpu) as capture:
+                M.matvec(b, z, z, 1.0, 0.0)
+            wp.capture_launch(capture.graph)
+
+        assert_np_equal(z.numpy(), expected.numpy(), tol=1.0e-6)
+
+    # the Chebyshev preconditioner can be built inside a capture as well
+    z = wp.zeros_like(b)
+    with wp.ScopedDevice(device):
+        with wp.ScopedCapture(apic=device.is_cpu) as capture:
+            M = preconditioner(A, "chebyshev")
+            M.matvec(b, z, z, 1.0, 0.0)
+        wp.capture_launch(capture.graph)
+
+    assert_np_equal(z.numpy(), expected.numpy(), tol=1.0e-6)
+
+
+def test_amg(test, device):
+    for block_size, dtype in ((1, wp.float64), (3, wp.float64), (2, wp.float32)):
+        tol = 1.0e-8 if dtype == wp.float64 else 1.0e-4
+
+        iterations = {}
+        for n in (16, 32):
+            A, b, dense = _make_sparse_grid_system(n=n, block_size=block_size, dtype=dtype, device=device)
+
+            x = wp.zeros_like(b)
+            niter_diag, _, _ = cg(A, b, x, M=preconditioner(A, "diag"), tol=tol, maxiter=1000, check_every=1)
+
+            for smoother in ("jacobi", "chebyshev"):
+                M = AMG(A, smoother=smoother, coarse_size=16)
+                test.assertGreater(M.num_levels, 2)
+                test.assertEqual(M.level_shapes[0], A.shape)
+
+                x = wp.zeros_like(b)
+                niter, err, atol = cg(A, b, x, M=M, tol=tol, maxiter=1000, check_every=1)
+                test.assertLessEqual(err, atol)
+                test.assertLess(3 * niter, niter_diag)
+
+                residual = dense @ x.numpy().flatten() - b.numpy().flatten()
+                test.assertLessEqual(np.linalg.norm(residual), 32.0 * atol)
+                iterations[(n, smoother)] = niter
+
+        # iteration counts should not grow much with the problem size
+        for smoother in ("jacobi", "chebyshev"):
+            test.assertLessEqual(iterations[(32, smoother)], iterations[(16, smoother)] + 3)
+
+    M = preconditioner(A, "amg")
+    test.assertIsInstance(M, AMG)
+
+
+def test_amg_update(test, device):
+    A, b, _ = _make_sparse_grid_system(n=16, block_size=2, dtype=wp.float64, device=device)
+
+    for smoother in ("jacobi", "chebyshev"):
+        M = AMG(A, smoother=smoother, coarse_size=16)
+
+        # new values with the same sparsity pattern
+        B, _, _ = _make_sparse_grid_system(n=16, block_size=2, dtype=wp.float64, device=device, seed=321)
+        wp.sparse.bsr_scale(B, 2.0)
+        M.update(B)
+        expected = AMG(B, smoother=smoother, coarse_size=16)
+        test.assertEqual(M.level_shapes, expected.level_shapes)
+
+        z = wp.zeros_like(b)
+        z_expected = wp.zeros_like(b)
+        M.matvec(b, z, z, 1.0, 0.0)
+        expected.matvec(b, z_expected, z_expected, 1.0, 0.0)
+        assert_np_equal(z.numpy(), z_expected.numpy(), tol=1.0e-10)
+
+        # in-place update of the original matrix values
+        wp.sparse.bsr_axpy(B, A, alpha=1.0, beta=0.0, topology="masked")
+        M.update(A)
+        M.update()
+        M.matvec(b, z, z, 1.0, 0.0)
+        assert_np_equal(z.numpy(), z_expected.numpy(), tol=1.0e-10)
+
+        A, b, _ = _make_sparse_grid_system(n=16, block_size=2, dtype=wp.float64, device=device)
+
+
+def test_amg_capture(test, device):
+    A, b, _ = _make_sparse_grid_system(n=16, block_size=2, dtype=wp.float32, device=device)
+
+    for smoother in ("jacobi", "chebyshev"):
+        M = AMG(A, smoother=smoother, coarse_size=16)
+        expected = wp.zeros_like(b)
+        M.matvec(b, expected, expected, 1.0, 0.0)
+
+        z = wp.array(b)
+        with wp.ScopedDevice(device):
+            with wp.ScopedCapture(apic=device.is_cpu) as capture:
+                M.matvec(b, z, z, 2.0, -1.0)
+            wp.capture_launch(capture.graph)
+
+        assert_np_equal(z.numpy(), 2.0 * expected.numpy() - b.numpy(), tol=1.0e-5)
+
+
+def test_mixed_precision_refinement(test, device):
+    A, b, dense = _make_sparse_grid_system(n=16, block_size=2, dtype=wp.float64, device=device)
+    tol = 1.0e-12
+
+    def check_solution(x, atol):
+        residual = dense @ x.numpy().flatten() - b.numpy().flatten()
+        test.assertLessEqual(np.linalg.norm(residual), 2.0 * atol)
+
+    for solver, inner_dtype in ((cg, wp.float32), (cg, wp.float16), (gmres, wp.float32)):
+        x = wp.zeros_like(b)
+        state = solver(A, b, x, tol=tol, inner_dtype=inner_dtype, run=False)
+        test.assertIsInstance(state, MixedPrecisionRefinement)
+        test.assertEqual(state.inner_matrix.scalar_type, inner_dtype)
+
+        niter, err, atol = state()
+        test.assertGreater(niter, 0)
+        test.assertGreater(state.refinement_count, 1)
+        test.assertLessEqual(err, atol)
+        check_solution(x, atol)
+
+    # refreshing the inner matrix after changing the values
+    A.scalar_values.assign(2.0 * A.scalar_values.numpy())
+    state.update()
+    x = wp.zeros_like(b)
+    _, err, atol = state(x=x)
+    test.assertLessEqual(err, atol)
+    residual = 2.0 * dense @ x.numpy().flatten() - b.numpy().flatten()
+    test.assertLessEqual(np.linalg.norm(residual), 2.0 * atol)
+    A.scalar_values.assign(0.5 * A.scalar_values.numpy())
+
+    # sparse preconditioners are refreshed along with the inner matrix
+    M = wp.sparse.bsr_copy(A)
+    state = cg(A, b, wp.zeros_like(b), tol=tol, M=M, inner_dtype=wp.float32, run=False)
+    wp.sparse.bsr_scale(M, 0.5)
+    state.update()
+    assert_np_equal(state._inner_preconditioner_matrix.scalar_values.numpy(), M.scalar_values.numpy(), tol=1.0e-6)
+
+    # double-precision preconditioners and generic operators are applied through conversions
+    x = wp.zeros_like(b)
+    _, err, atol = cg(A, b, x, tol=tol, M=preconditioner(A, "diag"), inner_dtype=wp.float32)
+    test.assertLessEqual(err, atol)
+    check_solution(x, atol)
+
+    op = aslinearoperator(A)
+    x = wp.zeros_like(b)
+    state = cg(op, b, x, tol=tol, inner_dtype=wp.float32, run=False)
+    test.assertIsNone(state.inner_matrix)
+    _, err, atol = state()
+    test.assertLessEqual(err, atol)
+    check_solution(x, atol)
+
+    # dense matrices
+    A_dense, b_dense = _make_spd_system(n=24, seed=7, dtype=wp.float64, device=device)
+    x = wp.zeros_like(b_dense)
+    _, err, atol = cg(A_dense, b_dense, x, tol=tol, maxiter=200, inner_dtype=wp.float32)
+    test.assertLessEqual(err, atol)
+
+    with test.assertRaisesRegex(ValueError, "float64"):
+        cg(
+            aslinearoperator(A_dense),
+            wp.zeros(24, dtype=wp.float32, device=device),
+            wp.zeros(24, device=device),
+            inner_dtype=wp.float32,
+        )
+    with test.assertRaisesRegex(ValueError, "sparse"):
+        cg(A_dense, b_dense, x, inner_dtype=wp.float16)
+
+
+def test_sparse_cholesky(test, device):
+    for block_size, dtype in ((1, wp.float64), (3, wp.float64)):
+        A, b, dense = _make_sparse_grid_system(n=12, block_size=block_size, dtype=dtype, device=device)
+        expected = np.linalg.solve(dense, b.numpy().flatten())
+
+        for ordering in ("nested_dissection", "rcm", None):
+            M = SparseCholesky(A, ordering=ordering)
+            test.assertGreaterEqual(M.factor_nnz, (A.nnz + A.nrow) // 2)
+            assert_np_equal(M.solve(b).numpy().flatten(), expected, tol=1.0e-10)
+
+        # fill-reducing orderings shorten the elimination tree
+        test.assertLess(SparseCholesky(A).level_count, SparseCholesky(A, ordering=None).level_count)
+
+        # as a preconditioner, CG converges after a single iteration
+        x = wp.zeros_like(b)
+        niter, err, atol = cg(A, b, x, M=preconditioner(A, "cholesky"), tol=1.0e-10, check_every=1)
+        test.assertLessEqual(err, atol)
+        test.assertLessEqual(niter, 2)
+
+        # z = alpha A^-1 x + beta y, with aliased z and y
+        z = wp.array(b)
+        M.matvec(b, z, z, 2.0, -1.0)
+        assert_np_equal(z.numpy().flatten(), 2.0 * expected - b.numpy().flatten(), tol=1.0e-10)
+
+    # numerical refactorization with new values and the same sparsity pattern
+    M = SparseCholesky(A)
+    B, _, dense_B = _make_sparse_grid_system(n=12, block_size=block_size, dtype=dtype, device=device, seed=321)
+    wp.sparse.bsr_scale(B, 2.0)
+    M.update(B)
+    assert_np_equal(M.solve(b).numpy().flatten(), np.linalg.solve(2.0 * dense_B, b.numpy().flatten()), tol=1.0e-10)
+
+    with test.assertRaisesRegex(ValueError, "ordering"):
+        SparseCholesky(A, ordering="amd")
+
+
 class TestLinearSolvers(unittest.TestCase):
     pass
 
@@ -554,6 +968,9 @@ add_function_test(TestLinearSolvers, "test_batched_gmres_f32", test_batched_gmre
 add_function_test(TestLinearSolvers, "test_batched_gmres_f64", test_batched_gmres, devices=devices, dtype=wp.float64)
 add_function_test(TestLinearSolvers, "test_batched_gmres_nonuniform", test_batched_gmres_nonuniform, devices=devices)
 add_function_test(TestLinearSolvers, "test_batched_nonuniform", test_batched_nonuniform, devices=devices)
+add_function_test(
+    TestLinearSolvers, "test_batched_per_system_convergence", test_batched_per_system_convergence, devices=devices
+)
 add_function_test(TestLinearSolvers, "test_batched_vector_offsets", test_batched_vector_offsets, devices=devices)
 add_function_test(TestLinearSolvers, "test_batched_inactive_tail", test_batched_inactive_tail, devices=devices)
 add_function_test(
@@ -577,6 +994,28 @@ add_function_test(
 add_function_test(TestLinearSolvers, "test_functor_reuse", test_functor_reuse, devices=devices)
 add_function_test(TestLinearSolvers, "test_functor_preconditioner", test_functor_preconditioner, devices=devices)
 add_function_test(TestLinearSolvers, "test_functor_compat_errors", test_functor_compat_errors, devices=devices)
+add_function_test(TestLinearSolvers, "test_preconditioner_types", test_preconditioner_types, devices=devices)
+add_function_test(
+    TestLinearSolvers,
+    "test_preconditioner_incomplete_factorization_exact",
+    test_preconditioner_incomplete_factorization_exact,
+    devices=devices,
+)
+add_function_test(
+    TestLinearSolvers,
+    "test_preconditioner_capture",
+    test_preconditioner_capture,
+    devices=devices_with_graph_capture_allocation,
+)
+add_function_test(TestLinearSolvers, "test_amg", test_amg, devices=devices)
+add_function_test(TestLinearSolvers, "test_amg_update", test_amg_update, devices=devices)
+add_function_test(
+    TestLinearSolvers, "test_amg_capture", test_amg_capture, devices=devices_with_graph_capture_allocation
+)
+add_function_test(
+    TestLinearSolvers, "test_mixed_precision_refinement", test_mixed_precision_refinement, devices=devices
+)
+add_function_test(TestLinearSolvers, "test_sparse_cholesky", test_sparse_cholesky, devices=devices)
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
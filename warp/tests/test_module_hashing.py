@@ -382,6 +382,80 @@ class TestModuleHashing(unittest.TestCase):
         self.assertIn("before True True", result.stdout)
         self.assertIn("after False False", result.stdout)
 
+    def test_block_dim_variant_reuses_digests(self):
+        """Hashing another ``block_dim`` variant reuses the kernel digests and matches a fresh hash."""
+        m = load_code_as_module(FUNC_OVERLOAD_1, "block_dim_variant")
+        block_dim = m.options["block_dim"]
+
+        m.get_module_hash(block_dim)
+        variant_hash = m.get_module_hash(1)
+        self.assertIs(m.hashers[1].kernel_hashes[m.kernels["k"]], m.hashers[block_dim].kernel_hashes[m.kernels["k"]])
+
+        # a fresh hasher for the variant produces the same hash
+        m.mark_modified()
+        self.assertEqual(m.get_module_hash(1), variant_hash)
+
+    def test_references_recorded_across_processes(self):
+        """A warm process start resolves the recorded references and still sees rebound constants."""
+        script = (
+            "import os\n"
+            "import warp as wp\n"
+            "SCALE = float(os.environ['TEST_SCALE'])\n"
+            "@wp.func\n"
+            "def scale(x: float):\n"
+            "    return x * SCALE\n"
+            "@wp.kernel\n"
+            "def k(a: wp.array(dtype=float)):\n"
+            "    i = wp.tid()\n"
+            "    a[i] = scale(a[i]) + scale(SCALE)\n"
+            "wp.config.log_level = wp.LOG_WARNING\n"
+            "wp.init()\n"
+            "h = wp.get_module(__name__).get_module_hash()\n"
+            "s = wp.kernel_cache_stats()\n"
+            "print('RESULT', h.hex(), s['reference_hits'], s['reference_misses'])\n"
+        )
+
+        with tempfile.TemporaryDirectory() as tmp:
+            script_path = os.path.join(tmp, "references_script.py")
+            with open(script_path, "w") as f:
+                f.write(script)
+
+            def run(scale):
+                env = dict(os.environ, WARP_CACHE_PATH=os.path.join(tmp, "cache"), TEST_SCALE=scale)
+                result = subprocess.run(
+                    [sys.executable, script_path], capture_output=True, text=True, check=False, env=env
+                )
+                self.assertEqual(result.returncode, 0, result.stderr)
+                line = next(line for line in result.stdout.splitlines() if line.startswith("RESULT"))
+                _, module_hash, hits, misses = line.split()
+                return module_hash, int(hits), int(misses)
+
+            cold_hash, cold_hits, cold_misses = run("2.0")
+            warm_hash, warm_hits, warm_misses = run("2.0")
+            rebound_hash, rebound_hits, rebound_misses = run("3.0")
+
+        self.assertEqual((cold_hits, cold_misses), (0, 2))
+        self.assertEqual((warm_hits, warm_misses), (2, 0))
+        self.assertEqual(warm_hash, cold_hash)
+
+        # the recipes are reused, but the constant is resolved again
+        self.assertEqual((rebound_hits, rebound_misses), (2, 0))
+        self.assertNotEqual(rebound_hash, cold_hash)
+
+    def test_references_from_recipe(self):
+        """Resolving the nodes of a recipe finds the same references as a full scan."""
+        m = load_code_as_module(FUNC_OVERLOAD_1, "references_from_recipe")
+        adj = m.kernels["k"].adj
+
+        def check():
+            expected = adj.get_references()
+            recipe = []
+            self.assertEqual(adj.get_references(recipe=recipe), expected)
+            self.assertLess(len(recipe), len(adj.reference_nodes()))
+            self.assertEqual(adj.get_references_from_recipe(recipe, adj.kernel_dim), expected)
+
+        wp._src.codegen.run_with_codegen_locks(m, check)
+
 
 devices = get_test_devices()
 
@@ -7,11 +7,13 @@ wp.force_load() and wp.load_module().
 
 import os
 import tempfile
+import threading
 import unittest
 import uuid
 from importlib import util
 
 import warp as wp
+from warp._src.codegen import run_with_codegen_locks
 
 # Chain of shared ``@wp.func`` helpers used by
 # ``TestParallelLoadSharedHelper`` below. Multiple helpers calling each
@@ -174,8 +176,8 @@ class TestParallelLoadSharedHelper(unittest.TestCase):
     calls ``adj.build`` on each helper, which mutates per-Adjoint state
     (``adj.blocks``, ``adj.deferred_static_expressions``, ...). When
     two modules that reference the *same* helper build concurrently
-    (e.g., via ``wp.force_load(max_workers > 1)``), without
-    ``_codegen_lock`` around the codegen window the threads interleave
+    (e.g., via ``wp.force_load(max_workers > 1)``), without the
+    per-module codegen locks around the codegen window the threads interleave
     their writes to the shared adjoint and the emitted .cu file has
     corrupt sections -- one helper's body emitted inside another, or
     references to ``var_*`` / ``_idx`` / ``dim`` that were never
@@ -249,7 +251,7 @@ class TestParallelLoadSharedHelper(unittest.TestCase):
             except Exception as e:
                 self.fail(
                     f"attempt {attempt}: parallel build raised {type(e).__name__}: {e}. "
-                    "Check the ``_codegen_lock`` window in warp._src.context.Module._compile."
+                    "Check the codegen lock window in warp._src.context.Module._compile."
                 )
             _assert_modules_loaded_on_cuda(self, modules, device)
 
@@ -271,5 +273,77 @@ class TestParallelLoadSharedHelper(unittest.TestCase):
             _assert_modules_loaded_on_cuda(self, modules, device)
 
 
+def _make_shared_helper_kernel(idx: int):
+    @wp.kernel(module="unique")
+    def k(out: wp.array[float]):
+        tid = wp.tid()
+        out[tid] = _race_helper(float(tid), idx)
+
+    return k
+
+
+class TestParallelCodegenLocks(unittest.TestCase):
+    """Codegen of modules without shared dependencies is not serialized."""
+
+    def test_independent_modules_run_concurrently(self):
+        """Hashing a module must not wait for codegen of an unrelated module."""
+        module_a, module_b = _generate_modules(2)
+        hashed = threading.Event()
+        errors = []
+
+        def hash_b():
+            try:
+                module_b.hash_module()
+                hashed.set()
+            except Exception as e:
+                errors.append(e)
+
+        def codegen_a():
+            # holds the codegen lock of module_a while module_b is hashed on another thread
+            thread = threading.Thread(target=hash_b)
+            thread.start()
+            done = hashed.wait(timeout=60.0)
+            thread.join()
+            return done
+
+        self.assertTrue(run_with_codegen_locks(module_a, codegen_a))
+        self.assertEqual(errors, [])
+
+    def test_unlisted_dependency_is_added(self):
+        """Reaching a module outside of the locked scope restarts codegen with a larger scope."""
+        module_a, module_b = _generate_modules(2)
+        calls = []
+
+        def codegen_a():
+            calls.append(None)
+            return run_with_codegen_locks(module_b, lambda: 42)
+
+        self.assertEqual(run_with_codegen_locks(module_a, codegen_a), 42)
+        self.assertEqual(len(calls), 2)
+        self.assertIn(module_b, module_a.codegen_dependencies)
+
+        # the dependency is remembered for later codegen
+        calls.clear()
+        self.assertEqual(run_with_codegen_locks(module_a, codegen_a), 42)
+        self.assertEqual(len(calls), 1)
+
+    def test_force_load_parallel_with_shared_func_cpu(self):
+        """Modules sharing ``@wp.func`` helpers load in parallel on the CPU and produce correct results."""
+        kernels = [_make_shared_helper_kernel(5000 + i) for i in range(4)]
+        modules = []
+        for k in kernels:
+            k.module.mark_modified()
+            if k.module not in modules:
+                modules.append(k.module)
+
+        wp.force_load(device="cpu", modules=modules, max_workers=len(modules))
+        _assert_modules_loaded_on_cpu(self, modules)
+
+        for k in kernels:
+            out = wp.zeros(4, dtype=float, device="cpu")
+            wp.launch(k, dim=4, outputs=[out], device="cpu")
+            self.assertTrue(all(v != 0.0 for v in out.numpy()))
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
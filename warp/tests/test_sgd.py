@@ -238,6 +238,59 @@ def test_sgd_set_params_migrates_state(test, device):
     test.assertIs(opt.b[1], unmoved_b)
 
 
+def test_sgd_multi_tensor(test, device):
+    """Verify the fused multi-tensor step matches the per-array step."""
+    rng = np.random.default_rng(42)
+    with wp.ScopedDevice(device):
+        params = [
+            wp.array(rng.standard_normal(5), dtype=float),
+            wp.array(rng.standard_normal((33, 3)), dtype=wp.vec3),
+            wp.array(rng.standard_normal(130), dtype=float),
+        ]
+        grads = [wp.array(rng.standard_normal(p.numpy().shape), dtype=p.dtype) for p in params]
+        fused_params = [wp.clone(p) for p in params]
+
+        kwargs = {"lr": 0.05, "momentum": 0.9, "weight_decay": 0.01, "nesterov": True}
+        opt = warp.optim.SGD(params, **kwargs)
+        fused_opt = warp.optim.SGD(fused_params, multi_tensor=True, **kwargs)
+
+        for _ in range(4):
+            opt.step(grads)
+            fused_opt.step(grads)
+
+        test.assertEqual(fused_opt.step_count.numpy()[0], 4)
+        for p, fused_p, b, fused_b in zip(params, fused_params, opt.b, fused_opt.b, strict=True):
+            assert_np_equal(fused_p.numpy(), p.numpy(), tol=1e-6)
+            assert_np_equal(fused_b.numpy(), b.numpy(), tol=1e-6)
+
+
+def half_to_float32(a):
+    values = a.numpy()
+    if a.dtype == wp.bfloat16 and values.dtype == np.uint16:
+        # ml_dtypes not installed: manual bit-level conversion to float32
+        return (values.astype(np.uint32) << 16).view(np.float32)
+    return values.astype(np.float32)
+
+
+def test_sgd_multi_tensor_half(test, device):
+    """Verify fp16 and bf16 parameters accumulate momentum in fp32 and support gradient clipping."""
+    # bfloat16 requires arch >= 80
+    dtypes = (wp.float16, wp.bfloat16) if not device.is_cuda or device.arch >= 80 else (wp.float16,)
+    with wp.ScopedDevice(device):
+        for dtype in dtypes:
+            params = [wp.ones(4, dtype=dtype)]
+            grads = [wp.full(4, 3.0, dtype=dtype)]
+            opt = warp.optim.SGD(params, lr=0.01, momentum=0.5, multi_tensor=True, max_grad_norm=2.0)
+            test.assertEqual(opt.b[0].dtype, wp.float32)
+
+            opt.step(grads)
+            opt.step(grads)
+
+            # the clipped gradient is 1.0 per entry, so the momentum after two steps is 1.0 + 0.5 * 1.0
+            assert_np_equal(opt.b[0].numpy(), np.full(4, 1.5), tol=1e-6)
+            assert_np_equal(half_to_float32(params[0]), np.full(4, 1.0 - 0.01 * 2.5), tol=4e-3)
+
+
 devices = get_test_devices()
 
 
@@ -259,6 +312,9 @@ add_function_test(
     devices=get_cuda_test_devices(),
 )
 
+add_function_test(TestSGD, "test_sgd_multi_tensor", test_sgd_multi_tensor, devices=devices)
+add_function_test(TestSGD, "test_sgd_multi_tensor_half", test_sgd_multi_tensor_half, devices=devices)
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
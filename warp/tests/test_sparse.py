@@ -7,12 +7,15 @@ import unittest
 import numpy as np
 
 import warp as wp
+from warp.optim.linear import aslinearoperator
 from warp.sparse import (
     BSR_STATUS_ROW_CAPACITY_EXCEEDED,
     BSR_STATUS_SUCCESS,
     BsrMatrix,
+    BsrSellLayout,
     bsr_assign,
     bsr_axpy,
+    bsr_axpy_plan,
     bsr_axpy_work_arrays,
     bsr_compress,
     bsr_copy,
@@ -21,12 +24,17 @@ from warp.sparse import (
     bsr_get_diag,
     bsr_identity,
     bsr_mm,
+    bsr_mm_plan,
     bsr_mm_work_arrays,
     bsr_mv,
+    bsr_permute,
+    bsr_permute_vector,
+    bsr_reordering,
     bsr_scale,
     bsr_set_from_triplets,
     bsr_set_transpose,
     bsr_set_zero,
+    bsr_transpose_plan,
     bsr_transposed,
     bsr_zeros,
 )
@@ -972,6 +980,244 @@ def test_bsr_mm_max_new_nnz(test, device):
     test.assertRegex(output, r"exceeded")
 
 
+def _random_bsr(rng, nrow, ncol, block_shape, scalar_type, nnz, device):
+    rows = wp.array(rng.integers(0, high=nrow, size=nnz, dtype=int), dtype=int, device=device)
+    cols = wp.array(rng.integers(0, high=ncol, size=nnz, dtype=int), dtype=int, device=device)
+    vals = wp.array(rng.random(size=(nnz, *block_shape)), dtype=scalar_type, device=device)
+    block_type = scalar_type if block_shape == (1, 1) else wp.types.matrix(shape=block_shape, dtype=scalar_type)
+    bsr = bsr_zeros(nrow, ncol, block_type, device=device)
+    bsr_set_from_triplets(
+        bsr, rows, cols, vals.reshape((nnz, *block_shape)) if block_shape != (1, 1) else vals.flatten()
+    )
+    return bsr
+
+
+def _randomize_bsr_values(rng, bsr):
+    values = rng.random(size=(bsr.nnz, *bsr.block_shape))
+    wp.copy(dest=bsr.scalar_values, src=wp.array(values, dtype=bsr.scalar_type, device=bsr.device))
+
+
+def make_test_bsr_plans(block_shape, scalar_type):
+    def test_bsr_plans(test, device):
+        rng = np.random.default_rng(123)
+        tol = 1.0e-4 if scalar_type == wp.float32 else 1.0e-10
+
+        x = _random_bsr(rng, 12, 9, block_shape, scalar_type, 40, device)
+        y = _random_bsr(rng, 9, 10, block_shape[::-1], scalar_type, 30, device)
+
+        # product
+        plan = bsr_mm_plan(x, y)
+        assert_np_equal(_bsr_to_dense(plan.result), _bsr_to_dense(x) @ _bsr_to_dense(y), tol)
+        test.assertGreaterEqual(plan.pair_count, plan.result.nnz)
+
+        _randomize_bsr_values(rng, x)
+        _randomize_bsr_values(rng, y)
+        z = plan.execute()
+        test.assertIs(z, plan.result)
+        assert_np_equal(_bsr_to_dense(z), _bsr_to_dense(x) @ _bsr_to_dense(y), tol)
+
+        z_copy = bsr_copy(z)
+        ref = -2.0 * _bsr_to_dense(x) @ _bsr_to_dense(y) + 0.5 * _bsr_to_dense(z)
+        plan.execute(x, 2.0 * y, z_copy, alpha=-1.0, beta=0.5)
+        assert_np_equal(_bsr_to_dense(z_copy), ref, tol)
+
+        # addition
+        w = _random_bsr(rng, 12, 9, block_shape, scalar_type, 25, device)
+        axpy_plan = bsr_axpy_plan(x, w)
+        assert_np_equal(_bsr_to_dense(axpy_plan.result), _bsr_to_dense(x) + _bsr_to_dense(w), tol)
+
+        _randomize_bsr_values(rng, w)
+        axpy_plan.execute(alpha=2.0, beta=-1.0)
+        assert_np_equal(_bsr_to_dense(axpy_plan.result), 2.0 * _bsr_to_dense(x) - _bsr_to_dense(w), tol)
+
+        with test.assertRaisesRegex(ValueError, "alias"):
+            axpy_plan.execute(z=x)
+
+        # transpose
+        transpose_plan = bsr_transpose_plan(x)
+        assert_np_equal(_bsr_to_dense(transpose_plan.result), _bsr_to_dense(x).T, tol)
+
+        _randomize_bsr_values(rng, x)
+        transpose_plan.execute(-x)
+        assert_np_equal(_bsr_to_dense(transpose_plan.result), -_bsr_to_dense(x).T, tol)
+
+        # executing the plans only performs kernel launches
+        with wp.ScopedDevice(device):
+            with wp.ScopedCapture(apic=device.is_cpu) as capture:
+                plan.execute()
+                axpy_plan.execute()
+                transpose_plan.execute()
+
+            _randomize_bsr_values(rng, x)
+            _randomize_bsr_values(rng, y)
+            wp.capture_launch(capture.graph)
+
+        assert_np_equal(_bsr_to_dense(plan.result), _bsr_to_dense(x) @ _bsr_to_dense(y), tol)
+        assert_np_equal(_bsr_to_dense(axpy_plan.result), _bsr_to_dense(x) + _bsr_to_dense(w), tol)
+        assert_np_equal(_bsr_to_dense(transpose_plan.result), _bsr_to_dense(x).T, tol)
+
+        # the plans reject operands whose topology changed since they were built
+        bsr_set_zero(x)
+        for execute in (plan.execute, axpy_plan.execute, transpose_plan.execute):
+            with test.assertRaisesRegex(ValueError, "sparsity pattern"):
+                execute()
+
+    return test_bsr_plans
+
+
+def test_bsr_reordering(test, device):
+    rng = np.random.default_rng(123)
+
+    # shuffled 5-point stencil on a n x n grid
+    n = 16
+    block_shape = (2, 2)
+    ij = rng.permutation(n * n)[np.arange(n * n).reshape(n, n)]
+    rows = [ij.flatten()]
+    cols = [ij.flatten()]
+    for src, dst in ((ij[1:], ij[:-1]), (ij[:-1], ij[1:]), (ij[:, 1:], ij[:, :-1]), (ij[:, :-1], ij[:, 1:])):
+        rows.append(src.flatten())
+        cols.append(dst.flatten())
+    rows = np.concatenate(rows)
+    cols = np.concatenate(cols)
+    values = rng.random(size=(rows.shape[0], *block_shape)) + np.where(rows == cols, 4.0, 0.0)[:, None, None] * np.eye(
+        2
+    )
+
+    A = bsr_from_triplets(
+        n * n,
+        n * n,
+        wp.array(rows, dtype=int, device=device),
+        wp.array(cols, dtype=int, device=device),
+        wp.array(values, dtype=wp.float64, device=device),
+    )
+    dense = _bsr_to_dense(A)
+
+    def block_bandwidth(bsr):
+        return np.max(np.abs(bsr.uncompress_rows().numpy() - bsr.columns.numpy()[: bsr.nnz]))
+
+    def cholesky_fill(mat):
+        sym = mat + mat.T
+        return np.count_nonzero(np.abs(np.linalg.cholesky(sym)) > 1.0e-12)
+
+    for method in ("rcm", "nested_dissection"):
+        permutation, inverse_permutation = bsr_reordering(A, method)
+        perm = permutation.numpy()
+        assert_np_equal(np.sort(perm), np.arange(n * n))
+        assert_np_equal(inverse_permutation.numpy()[perm], np.arange(n * n))
+
+        B = bsr_permute(A, permutation)
+        scalar_perm = (perm[:, None] * block_shape[0] + np.arange(block_shape[0])).flatten()
+        assert_np_equal(_bsr_to_dense(B), dense[np.ix_(scalar_perm, scalar_perm)], 1.0e-12)
+
+        if method == "rcm":
+            test.assertLessEqual(block_bandwidth(B), n)
+            test.assertGreater(block_bandwidth(A), 4 * n)
+        else:
+            test.assertLess(cholesky_fill(_bsr_to_dense(B)), cholesky_fill(dense))
+
+        # in-place permutation
+        C = bsr_copy(A)
+        bsr_permute(C, permutation, dest=C)
+        assert_np_equal(_bsr_to_dense(C), _bsr_to_dense(B))
+
+        # vectors of blocks and of scalars, and scattering back
+        x = wp.array(rng.random(size=(n * n, 2)), dtype=wp.vec2d, device=device)
+        y = bsr_permute_vector(x, permutation)
+        assert_np_equal(y.numpy(), x.numpy()[perm])
+        assert_np_equal(bsr_permute_vector(y, inverse_permutation).numpy(), x.numpy())
+
+        x_flat = wp.array(x.numpy().flatten(), dtype=wp.float64, device=device)
+        bsr_permute_vector(x_flat, permutation, dest=x_flat)
+        assert_np_equal(x_flat.numpy(), y.numpy().flatten())
+
+        # permuted products match
+        assert_np_equal((B @ y).numpy(), bsr_permute_vector(A @ x, permutation).numpy(), 1.0e-12)
+
+    with test.assertRaisesRegex(ValueError, "square"):
+        bsr_reordering(bsr_zeros(3, 2, wp.float32, device=device))
+
+
+def make_test_bsr_sell_layout(block_shape, scalar_type):
+    def test_bsr_sell_layout(test, device):
+        rng = np.random.default_rng(123)
+        tol = 1.0e-4 if scalar_type == wp.float32 else 1.0e-10
+
+        # power-law row lengths, rows not sorted by length
+        nrow, ncol = 300, 200
+        lengths = np.minimum(ncol, (rng.pareto(1.5, size=nrow) + 1.0).astype(int))
+        lengths[rng.permutation(nrow)[:20]] = 0
+        rows = np.repeat(np.arange(nrow), lengths)
+        cols = np.concatenate([rng.choice(ncol, size=length, replace=False) for length in lengths])
+        values = rng.random(size=(rows.shape[0], *block_shape))
+        A = bsr_from_triplets(
+            nrow,
+            ncol,
+            wp.array(rows, dtype=int, device=device),
+            wp.array(cols, dtype=int, device=device),
+            wp.array(values, dtype=scalar_type, device=device),
+        )
+        sell = BsrSellLayout(A, chunk_size=4, sigma=nrow)
+        test.assertTrue(sell.use_sell)
+        test.assertGreaterEqual(sell.padding_ratio, 1.0)
+        assert_np_equal(np.sort(sell.row_permutation.numpy()), np.arange(nrow))
+
+        x = wp.array(rng.random(size=ncol * block_shape[1]), dtype=scalar_type, device=device)
+        y = wp.array(rng.random(size=nrow * block_shape[0]), dtype=scalar_type, device=device)
+        ref = 2.0 * _bsr_to_dense(A) @ x.numpy() - 0.5 * y.numpy()
+        bsr_mv(sell, x, y, alpha=2.0, beta=-0.5)
+        assert_np_equal(y.numpy(), ref, tol)
+
+        # transposed products fall back to the compressed rows
+        z = bsr_mv(sell, y, transpose=True)
+        assert_np_equal(z.numpy(), _bsr_to_dense(A).T @ y.numpy(), tol)
+
+        # values are synchronized explicitly, which can be captured
+        with wp.ScopedDevice(device):
+            with wp.ScopedCapture(apic=device.is_cpu) as capture:
+                sell.sync_values()
+                bsr_mv(sell, x, y)
+
+            _randomize_bsr_values(rng, A)
+            wp.capture_launch(capture.graph)
+        assert_np_equal(y.numpy(), _bsr_to_dense(A) @ x.numpy(), tol)
+
+        # as a linear operator
+        op = aslinearoperator(sell)
+        test.assertEqual(op.shape, A.shape)
+        y.zero_()
+        op.matvec(x, y, y, alpha=1.0, beta=0.0)
+        assert_np_equal(y.numpy(), _bsr_to_dense(A) @ x.numpy(), tol)
+
+        # regular row lengths keep the compressed rows by default
+        B = _random_bsr(rng, nrow, ncol, block_shape, scalar_type, 0, device)
+        regular_rows = np.repeat(np.arange(nrow), 4)
+        regular_cols = (regular_rows[:, None] + np.arange(4)[None, :]).flatten()[: regular_rows.shape[0]] % ncol
+        bsr_set_from_triplets(
+            B,
+            wp.array(regular_rows, dtype=int, device=device),
+            wp.array(np.sort(regular_cols.reshape(nrow, 4), axis=1).flatten(), dtype=int, device=device),
+            wp.array(rng.random(size=(regular_rows.shape[0], *block_shape)), dtype=scalar_type, device=device),
+        )
+        test.assertFalse(BsrSellLayout(B).use_sell)
+        assert_np_equal(bsr_mv(BsrSellLayout(B), x).numpy(), _bsr_to_dense(B) @ x.numpy(), tol)
+
+        forced = BsrSellLayout(B, chunk_size=4, use_sell=True)
+        test.assertTrue(forced.use_sell)
+        test.assertEqual(forced.padding_ratio, 1.0)
+        assert_np_equal(bsr_mv(forced, x).numpy(), _bsr_to_dense(B) @ x.numpy(), tol)
+
+        # topology changes require an update
+        sell.matrix = B
+        sell.update()
+        test.assertFalse(sell.use_sell)
+        assert_np_equal(bsr_mv(sell, x).numpy(), _bsr_to_dense(B) @ x.numpy(), tol)
+
+        with test.assertRaisesRegex(ValueError, "multiple"):
+            BsrSellLayout(A, chunk_size=8, sigma=12)
+
+    return test_bsr_sell_layout
+
+
 def test_capturability(test, device):
     """Test that BSR operations are graph-capturable"""
 
@@ -1295,6 +1541,7 @@ def test_bsr_alloc(test, device):
 devices = get_test_devices()
 cuda_test_devices = get_selected_cuda_test_devices()
 cuda_test_devices_with_mempool = get_selected_cuda_test_devices_with_mempool()
+devices_with_graph_capture_allocation = get_test_devices_with_graph_capture_allocation()
 
 
 class TestSparse(unittest.TestCase):
@@ -1360,10 +1607,41 @@ add_function_test(
     devices=cuda_test_devices,
 )
 
+add_function_test(
+    TestSparse, "test_csr_plans", make_test_bsr_plans((1, 1), wp.float32), devices=devices_with_graph_capture_allocation
+)
+add_function_test(
+    TestSparse,
+    "test_bsr_plans_1_3",
+    make_test_bsr_plans((1, 3), wp.float32),
+    devices=devices_with_graph_capture_allocation,
+)
+add_function_test(
+    TestSparse,
+    "test_bsr_plans_3_3",
+    make_test_bsr_plans((3, 3), wp.float64),
+    devices=devices_with_graph_capture_allocation,
+)
+
 add_function_test(TestSparse, "test_csr_mv", make_test_bsr_mv((1, 1), wp.float32), devices=devices)
 add_function_test(TestSparse, "test_bsr_mv_1_3", make_test_bsr_mv((1, 3), wp.float32), devices=devices)
 add_function_test(TestSparse, "test_bsr_mv_3_3", make_test_bsr_mv((3, 3), wp.float64), devices=devices)
 
+add_function_test(TestSparse, "test_bsr_reordering", test_bsr_reordering, devices=devices)
+
+add_function_test(
+    TestSparse,
+    "test_csr_sell_layout",
+    make_test_bsr_sell_layout((1, 1), wp.float32),
+    devices=devices_with_graph_capture_allocation,
+)
+add_function_test(
+    TestSparse,
+    "test_bsr_sell_layout_2_3",
+    make_test_bsr_sell_layout((2, 3), wp.float64),
+    devices=devices_with_graph_capture_allocation,
+)
+
 add_function_test(TestSparse, "test_capturability", test_capturability, devices=cuda_test_devices_with_mempool)
 add_function_test(
     TestSparse,
@@ -3,6 +3,8 @@
 
 import contextlib
 import io
+import json
+import threading
 import unittest
 import warnings
 
@@ -564,6 +566,12 @@ def parenthesized_multiline_lambda():
 devices = get_test_devices()
 
 
+@wp.kernel
+def timing_scale_kernel(values: wp.array(dtype=wp.float32), scale: wp.float32):
+    i = wp.tid()
+    values[i] = values[i] * scale
+
+
 class TestUtils(unittest.TestCase):
     def test_create_warp_function_parenthesized_multiline_lambda(self):
         original_fn = parenthesized_multiline_lambda()
@@ -736,6 +744,189 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(result.filter, wp.TIMING_MEMCPY)
         self.assertGreaterEqual(result.elapsed, 0.0)
 
+    def test_timing_cpu(self):
+        device = wp.get_device("cpu")
+        src = wp.ones(16, dtype=wp.float32, device=device)
+        dst = wp.zeros_like(src)
+
+        wp.load_module(device=device)
+
+        wp.timing_begin(cuda_filter=wp.TIMING_KERNEL | wp.TIMING_MEMCPY)
+        wp.launch(timing_scale_kernel, dim=16, inputs=[src, 2.0], device=device)
+        cmd = wp.launch(timing_scale_kernel, dim=(4, 4), inputs=[src, 0.5], device=device, record_cmd=True)
+        cmd.launch()
+        wp.copy(dst, src)
+        results = wp.timing_end()
+
+        self.assertEqual(
+            [(r.name, r.filter, r.dim) for r in results],
+            [
+                ("forward kernel timing_scale_kernel", wp.TIMING_KERNEL, (16,)),
+                ("forward kernel timing_scale_kernel", wp.TIMING_KERNEL, (4, 4)),
+                ("memcpy HtoH", wp.TIMING_MEMCPY, None),
+            ],
+        )
+        for result in results:
+            self.assertEqual(result.device, device)
+            self.assertGreaterEqual(result.elapsed, 0.0)
+            self.assertGreaterEqual(result.start, 0.0)
+        self.assertEqual(results[0].module, timing_scale_kernel.module.name)
+        self.assertLessEqual(results[0].start + results[0].elapsed, results[1].start)
+
+        # CPU activities are filtered independently of CUDA ones
+        wp.timing_begin(cuda_filter=wp.TIMING_ALL, cpu_filter=wp.TIMING_MEMCPY)
+        wp.launch(timing_scale_kernel, dim=16, inputs=[src, 2.0], device=device)
+        wp.copy(dst, src)
+        results = wp.timing_end()
+        self.assertEqual([r.name for r in results if r.device.is_cpu], ["memcpy HtoH"])
+
+    def test_timing_cpu_nested(self):
+        device = wp.get_device("cpu")
+        src = wp.ones(16, dtype=wp.float32, device=device)
+        wp.load_module(device=device)
+
+        # only the innermost timing session records activities
+        wp.timing_begin(cpu_filter=wp.TIMING_KERNEL)
+        wp.launch(timing_scale_kernel, dim=16, inputs=[src, 2.0], device=device)
+        wp.timing_begin(cpu_filter=wp.TIMING_KERNEL)
+        wp.launch(timing_scale_kernel, dim=8, inputs=[src, 2.0], device=device)
+        inner = wp.timing_end()
+        wp.launch(timing_scale_kernel, dim=4, inputs=[src, 2.0], device=device)
+        outer = wp.timing_end()
+
+        self.assertEqual([r.dim for r in inner if r.device.is_cpu], [(8,)])
+        self.assertEqual([r.dim for r in outer if r.device.is_cpu], [(16,), (4,)])
+
+    def test_timing_cpu_launch_batch(self):
+        device = wp.get_device("cpu")
+        src = wp.ones(16, dtype=wp.float32, device=device)
+        wp.load_module(device=device)
+
+        cmds = [
+            wp.launch(timing_scale_kernel, dim=16, inputs=[src, 2.0], device=device, record_cmd=True),
+            wp.launch(timing_scale_kernel, dim=8, inputs=[src, 0.5], device=device, record_cmd=True),
+        ]
+
+        # each kernel of a CPU batch gets its own record
+        wp.timing_begin(cpu_filter=wp.TIMING_KERNEL)
+        wp.launch_batch(cmds)
+        results = wp.timing_end()
+
+        cpu_results = [r for r in results if r.device.is_cpu]
+        self.assertEqual([r.dim for r in cpu_results], [(16,), (8,)])
+        np.testing.assert_array_equal(src.numpy(), np.array([1.0] * 8 + [2.0] * 8, dtype=np.float32))
+
+        # CPU results are not reported under the CUDA headings
+        with contextlib.redirect_stdout(io.StringIO()) as f:
+            wp.timing_print(cpu_results)
+        self.assertIn("Activity timeline:", f.getvalue())
+        self.assertNotIn("CUDA timeline:", f.getvalue())
+
+    def test_timing_export_chrome_trace(self):
+        device = wp.get_device("cpu")
+        cuda_device = wp.get_device("cuda:0") if wp.is_cuda_available() else device
+        results = [
+            wp.TimingResult(device, "forward kernel a", wp.TIMING_KERNEL, 1.5, start=2.0, dim=(8, 2), module="m"),
+            wp.TimingResult(cuda_device, "memcpy HtoD", wp.TIMING_MEMCPY, 0.25),
+            wp.TimingResult(cuda_device, "memcpy DtoH", wp.TIMING_MEMCPY, 0.5),
+        ]
+
+        with io.StringIO() as f:
+            wp.timing_export_chrome_trace(results, f)
+            trace = json.loads(f.getvalue())
+
+        events = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+        self.assertEqual([e["name"] for e in events], ["forward kernel a", "memcpy HtoD", "memcpy DtoH"])
+        self.assertEqual(events[0]["ts"], 2000.0)
+        self.assertEqual(events[0]["dur"], 1500.0)
+        self.assertEqual(events[0]["args"], {"filter": wp.TIMING_KERNEL, "dim": [8, 2], "module": "m"})
+
+        # activities without start times are laid out end to end on their device
+        self.assertEqual(events[2]["ts"], events[1]["ts"] + events[1]["dur"])
+        self.assertEqual(events[2]["tid"], events[1]["tid"])
+
+        thread_names = {e["tid"]: e["args"]["name"] for e in trace["traceEvents"] if e["ph"] == "M"}
+        self.assertEqual(thread_names[events[0]["tid"]], "cpu")
+
+    def test_launch_stats(self):
+        device = wp.get_device("cpu")
+        values = wp.ones(16, dtype=wp.float32, device=device)
+        wp.load_module(device=device)
+
+        saved_collect_launch_stats = wp.config.collect_launch_stats
+        try:
+            wp.reset_launch_stats()
+
+            wp.config.collect_launch_stats = False
+            wp.launch(timing_scale_kernel, dim=16, inputs=[values, 1.0], device=device)
+            self.assertEqual(wp.get_launch_stats(), [])
+
+            wp.config.collect_launch_stats = True
+            for _ in range(3):
+                wp.launch(timing_scale_kernel, dim=16, inputs=[values, 1.0], device=device)
+            cmd = wp.launch(timing_scale_kernel, dim=(2, 4), inputs=[values, 1.0], device=device, record_cmd=True)
+            cmd.launch()
+            cmd.launch()
+
+            stats = wp.get_launch_stats()
+            self.assertEqual(len(stats), 1)
+            s = stats[0]
+            self.assertEqual(s.kernel, timing_scale_kernel.key)
+            self.assertEqual(s.module, timing_scale_kernel.module.name)
+            self.assertEqual(s.device, "cpu")
+            self.assertEqual(s.launches, 5)
+            self.assertEqual(s.threads, 3 * 16 + 2 * 8)
+            self.assertEqual(s.timed_launches, 5)
+            self.assertGreater(s.pack_time, 0.0)
+            self.assertGreater(s.kernel_time, 0.0)
+
+            d = s.to_dict()
+            self.assertEqual(d["launches"], 5)
+            self.assertEqual(json.loads(json.dumps(d)), d)
+
+            with contextlib.redirect_stdout(io.StringIO()) as f:
+                wp.print_launch_stats()
+            lines = f.getvalue().splitlines()
+            self.assertEqual(len(lines), 3)
+            self.assertRegex(lines[2], rf"^\s+5 \|\s+64 \| .* \| cpu     \| {timing_scale_kernel.key}$")
+
+            wp.reset_launch_stats()
+            self.assertEqual(wp.get_launch_stats(), [])
+        finally:
+            wp.config.collect_launch_stats = saved_collect_launch_stats
+            wp.reset_launch_stats()
+
+    def test_launch_stats_launch_batch(self):
+        device = wp.get_device("cpu")
+        values = wp.ones(16, dtype=wp.float32, device=device)
+        wp.load_module(device=device)
+
+        cmds = [
+            wp.launch(timing_scale_kernel, dim=16, inputs=[values, 1.0], device=device, record_cmd=True),
+            wp.launch(timing_scale_kernel, dim=8, inputs=[values, 1.0], device=device, record_cmd=True),
+        ]
+
+        saved_collect_launch_stats = wp.config.collect_launch_stats
+        try:
+            wp.reset_launch_stats()
+            wp.config.collect_launch_stats = True
+
+            # batched launches are counted individually, also from concurrent threads
+            threads = [threading.Thread(target=wp.launch_batch, args=(cmds,)) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+            stats = wp.get_launch_stats()
+            self.assertEqual(len(stats), 1)
+            self.assertEqual(stats[0].launches, 4 * 2)
+            self.assertEqual(stats[0].threads, 4 * (16 + 8))
+            self.assertEqual(stats[0].timed_launches, 4 * 2)
+        finally:
+            wp.config.collect_launch_stats = saved_collect_launch_stats
+            wp.reset_launch_stats()
+
 
 add_function_test(TestUtils, "test_array_scan", test_array_scan, devices=devices)
 add_function_test(TestUtils, "test_array_scan_vector", test_array_scan_vector, devices=devices)
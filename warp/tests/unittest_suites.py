@@ -174,6 +174,7 @@ def default_suite(test_loader: unittest.TestLoader = unittest.defaultTestLoader)
     from warp.tests.test_context import TestContext
     from warp.tests.test_copy import TestCopy
     from warp.tests.test_cpu_precompiled_headers import TestCpuPrecompiledHeaders
+    from warp.tests.test_cpu_threads import TestCpuThreads
     from warp.tests.test_ctypes import TestCTypes
     from warp.tests.test_cuda_profiler import TestCudaProfiler
     from warp.tests.test_dense import TestDense
@@ -213,6 +214,7 @@ def default_suite(test_loader: unittest.TestLoader = unittest.defaultTestLoader)
     from warp.tests.test_module_hashing import TestModuleHashing
     from warp.tests.test_module_parallel_load import (
         TestModuleParallelLoad,
+        TestParallelCodegenLocks,
         TestParallelLoadSharedHelper,
     )
     from warp.tests.test_modules_lite import TestModuleLite
@@ -316,6 +318,7 @@ def default_suite(test_loader: unittest.TestLoader = unittest.defaultTestLoader)
         TestContext,
         TestCopy,
         TestCpuPrecompiledHeaders,
+        TestCpuThreads,
         TestCTypes,
         TestCudaArchSuffix,
         TestCudaProfiler,
@@ -392,6 +395,7 @@ def default_suite(test_loader: unittest.TestLoader = unittest.defaultTestLoader)
         TestOperators,
         TestOptions,
         TestOverwrite,
+        TestParallelCodegenLocks,
         TestParallelLoadSharedHelper,
         TestPeer,
         TestPinned,